@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Export de sauvegarde : écriture série (deflate partout) vs compression parallèle + stockage des PDF/images."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Racine du dépôt (scripts/ → parent)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.etacomp.io import backup as backup_mod
+from src.etacomp.io.backup import export_backup, format_bytes
+
+
+class _SlowFile:
+    """Fichier de destination bridé à `rate` octets/s (clé USB lente simulée)."""
+
+    def __init__(self, fh, rate: float):
+        self._fh = fh
+        self._rate = rate
+        self._due = time.perf_counter()
+
+    def write(self, data) -> int:
+        # Échéance cumulée : attente par paquets de 5 ms (cache d'écriture du support)
+        now = time.perf_counter()
+        self._due = max(self._due, now) + len(data) / self._rate
+        if self._due - now > 0.005:
+            time.sleep(self._due - now)
+        return self._fh.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fh, name)
+
+
+def _throttled_writer(rate: float):
+    base = backup_mod._ZipWriter
+
+    class SlowZipWriter(base):
+        def __init__(self, fh):
+            super().__init__(_SlowFile(fh, rate))
+
+    return SlowZipWriter
+
+
+def _make_data_dir(root: Path, n_sessions: int, n_pdfs: int) -> None:
+    rng = random.Random(1)
+    (root / "sessions").mkdir(parents=True)
+    (root / "exports").mkdir()
+    (root / "comparators").mkdir()
+    for i in range(n_sessions):
+        readings = [round(rng.uniform(-0.01, 0.01), 4) for _ in range(88)]
+        (root / "sessions" / f"C{i % 300:03d}_{i:05d}.json").write_text(
+            json.dumps({"operator": "bench", "comparator_ref": f"C{i % 300:03d}", "readings": readings}, indent=2),
+            encoding="utf-8",
+        )
+    for i in range(n_pdfs):
+        (root / "exports" / f"C{i % 300:03d}_{i:05d}.pdf").write_bytes(b"%PDF-1.4\n" + os.urandom(40_000))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=9000, help="Sessions JSON du dossier simulé")
+    parser.add_argument("--pdfs", type=int, default=1000, help="PDF exportés du dossier simulé")
+    parser.add_argument("--usb-mbps", type=float, default=20.0, help="Débit simulé de la cible en Mo/s (0 : sans bridage)")
+    parser.add_argument("--target", type=Path, help="Dossier cible réel (ex. clé USB montée) au lieu du dossier temporaire")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data = Path(tmp) / "data"
+        _make_data_dir(data, args.sessions, args.pdfs)
+        target = args.target or Path(tmp) / "usb"
+        target.mkdir(parents=True, exist_ok=True)
+        if args.usb_mbps > 0 and args.target is None:
+            backup_mod._ZipWriter = _throttled_writer(args.usb_mbps * 1024 * 1024)
+
+        store = backup_mod.STORE_EXTENSIONS
+        runs = (
+            ("série, deflate partout", dict(workers=1), frozenset()),
+            ("parallèle + stockage PDF", dict(workers=None), store),
+        )
+        if args.target is not None:
+            cible = f"réelle ({target})"
+        else:
+            cible = f"{args.usb_mbps:g} Mo/s simulés" if args.usb_mbps > 0 else "sans bridage"
+        print(f"{args.sessions + args.pdfs} fichiers ; cible {cible}")
+        print("mode                        durée (s)   archive")
+        for label, kwargs, store_ext in runs:
+            backup_mod.STORE_EXTENSIONS = store_ext
+            archive = target / "bench_backup.zip"
+            t = time.perf_counter()
+            export_backup(archive, ["sessions", "exports"], data_dir=data, **kwargs)
+            dt = time.perf_counter() - t
+            print(f"{label:<26} {dt:10.2f}   {format_bytes(archive.stat().st_size)}")
+            archive.unlink()
+        backup_mod.STORE_EXTENSIONS = store
+        if args.target is None:
+            shutil.rmtree(target, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
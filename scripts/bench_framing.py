@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Débit du découpage en lignes : algorithme historique (SerialReaderThread) vs LineFramer."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Racine du dépôt (scripts/ → parent)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.etacomp.io.framing import LineFramer
+
+
+def _legacy_lines(buf: bytearray, chunk: bytes, out: list) -> bytearray:
+    """Copie de l'ancien _emit_lines_from_buffer (replace + parcours octet par octet)."""
+    buf.extend(chunk)
+    data = buf.replace(b"\r\n", b"\n")
+    start = 0
+    for i, b in enumerate(data):
+        if b in (0x0A, 0x0D):
+            if i > start:
+                out.append(data[start:i])
+            start = i + 1
+    return bytearray(data[start:] if start < len(data) else b"")
+
+
+def _stream(total: int) -> bytes:
+    lines = [f"{'+' if i % 2 else '-'}{i % 10}.{i % 1000:03d}".encode() for i in range(1000)]
+    eols = [b"\r\n", b"\n", b"\r"]
+    parts = []
+    size = 0
+    i = 0
+    while size < total:
+        p = lines[i % 1000] + eols[i % 3]
+        parts.append(p)
+        size += len(p)
+        i += 1
+    return b"".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=4.0, help="Volume du flux simulé (Mo)")
+    args = parser.parse_args()
+    data = _stream(int(args.mb * 1024 * 1024))
+    print("morceau   historique (Mo/s)   LineFramer (Mo/s)   lignes")
+    for size in (16, 256, 4096):
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+
+        out_old: list = []
+        buf = bytearray()
+        t = time.perf_counter()
+        for c in chunks:
+            buf = _legacy_lines(buf, c, out_old)
+        dt_old = time.perf_counter() - t
+
+        out_new: list = []
+        framer = LineFramer()
+        t = time.perf_counter()
+        for c in chunks:
+            out_new.extend(framer.feed(c))
+        dt_new = time.perf_counter() - t
+
+        assert [bytes(x) for x in out_old] == out_new
+        mb = len(data) / 1024 / 1024
+        print(f"{size:7d}   {mb / dt_old:17.1f}   {mb / dt_new:17.1f}   {len(out_new)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Export PDF : temps par document et taille de fichier, courbe Matplotlib (PNG) vs vectorielle."""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Racine du dépôt (scripts/ → parent)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.etacomp.config.export_config import ExportConfig
+from src.etacomp.core.calculation_engine import CalculationEngine
+from src.etacomp.core.session_adapter import build_session_from_runtime
+from src.etacomp.io.pdf_exporter import PLOT_BACKENDS, ExportContext, export_pdf
+from src.etacomp.models.session import MeasureSeries, Session
+
+
+def _session(n_targets: int) -> Session:
+    targets = [i * 10.0 / (n_targets - 1) for i in range(n_targets)]
+    series = [
+        MeasureSeries(target=t, readings=[t + 0.001 * ((i + k) % 5 - 2) for k in range(4)])
+        for i, t in enumerate(targets)
+    ]
+    return Session(operator="bench", date=datetime(2025, 6, 2, 10, 30), comparator_ref="BENCH",
+                   series_count=2, measures_per_series=n_targets, series=series)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20, help="Documents par rendu")
+    parser.add_argument("--targets", type=int, default=11, help="Cibles par session")
+    args = parser.parse_args()
+
+    rt = _session(args.targets)
+    results = CalculationEngine().compute(build_session_from_runtime(rt))
+    cfg = ExportConfig(entite="Bench", document_title="Rapport de vérification", document_reference="BENCH")
+    context = ExportContext()
+    print("rendu        ms/document (médiane)   taille (Ko)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in PLOT_BACKENDS[::-1]:
+            out = Path(tmp) / backend
+            out.mkdir()
+            # Premier document hors mesure (imports, polices)
+            export_pdf(rt, cfg, results, None, 0, output_dir=out, context=context, plot_backend=backend)
+            times = []
+            for i in range(args.docs):
+                t = time.perf_counter()
+                path = export_pdf(rt, cfg, results, None, i + 1, output_dir=out, context=context,
+                                  plot_backend=backend)
+                times.append(time.perf_counter() - t)
+            size_kb = path.stat().st_size / 1024
+            print(f"{backend:<12} {statistics.median(times) * 1000:21.1f}   {size_kb:11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare les modes de lecture TESA "poll" et "event" (CPU au repos, latence de trame) sur un pty Linux."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Racine du dépôt (scripts/ → parent)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.etacomp.io.serialio import SerialConnection
+from src.etacomp.io.tesa_reader import TesaSerialReader
+
+
+def _bench(mode: str, idle_s: float, frames: int, silence_ms: int) -> dict:
+    master, slave = os.openpty()
+    conn = SerialConnection()
+    conn.open(os.ttyname(slave), baudrate=4800)
+    got = threading.Event()
+    stamps: list[float] = []
+
+    def _on_value(*_):
+        stamps.append(time.perf_counter())
+        got.set()
+
+    reader = TesaSerialReader(conn, on_value=_on_value, silence_ms=silence_ms, read_mode=mode)
+    reader.start()
+    try:
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        time.sleep(idle_s)
+        idle_cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0)
+
+        latencies = []
+        for i in range(frames):
+            got.clear()
+            t0 = time.perf_counter()
+            os.write(master, f"+{i % 10}.012\r\n".encode())
+            if not got.wait(2.0):
+                continue
+            latencies.append((stamps[-1] - t0) * 1000.0 - silence_ms)
+            time.sleep(0.02)
+    finally:
+        reader.stop()
+        conn.close()
+        os.close(master)
+        os.close(slave)
+    latencies.sort()
+    return {
+        "idle_cpu_pct": idle_cpu * 100.0,
+        "frames": len(latencies),
+        "latency_ms_p50": statistics.median(latencies) if latencies else float("nan"),
+        "latency_ms_max": latencies[-1] if latencies else float("nan"),
+        "jitter_ms": statistics.pstdev(latencies) if latencies else float("nan"),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--idle", type=float, default=3.0, help="Durée de mesure CPU au repos (s)")
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--silence-ms", type=int, default=120)
+    args = parser.parse_args()
+    if not sys.platform.startswith("linux"):
+        print("Banc pty : Linux uniquement.")
+        return 1
+    print("mode   CPU repos   trames   latence p50 / max au-delà du silence   gigue")
+    for mode in ("poll", "event"):
+        r = _bench(mode, args.idle, args.frames, args.silence_ms)
+        print(f"{mode:<6} {r['idle_cpu_pct']:6.2f} %   {r['frames']:4d}     "
+              f"{r['latency_ms_p50']:6.2f} / {r['latency_ms_max']:6.2f} ms"
+              f"                  {r['jitter_ms']:5.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Débit et pertes de trames de bout en bout (instrument virtuel → lecteur) à cadence croissante, pty Linux."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Racine du dépôt (scripts/ → parent)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.etacomp.io.serialio import SerialConnection, SerialReaderThread
+from src.etacomp.io.tesa_reader import TesaSerialReader
+from src.etacomp.tools.virtual_tesa import ComparatorErrorModel, VirtualTesa, campaign_readings, format_frame
+
+
+def _frames(count: int, parity_bit: bool) -> tuple[list[bytes], list[float]]:
+    model = ComparatorErrorModel(gain_error=0.0005, periodic_amplitude=0.002, noise_std=0.0005, seed=1)
+    targets = [i * 0.5 for i in range(21)]
+    values: list[float] = []
+    while len(values) < count:
+        values += [v for _, _, v in campaign_readings(targets, model)]
+    values = values[:count]
+    return [format_frame(v, parity_bit=parity_bit) for v in values], values
+
+
+def _bench(reader_kind: str, rate_hz: float, count: int, baudrate: int | None) -> dict:
+    frames, values = _frames(count, parity_bit=reader_kind == "tesa")
+    received: list[float] = []
+    last = threading.Event()
+
+    def _on(value):
+        received.append(value)
+        if len(received) >= count:
+            last.set()
+
+    inst = VirtualTesa(frames=frames, interval_s=1.0 / rate_hz if rate_hz else 0.0,
+                       baudrate=baudrate, drop_on_full=True).open()
+    conn = SerialConnection()
+    conn.open(inst.device, baudrate=baudrate or 115200)
+    if reader_kind == "tesa":
+        reader = TesaSerialReader(conn, on_value=lambda v, *_: _on(v), frame_mode="eol", eol="CRLF")
+    else:
+        reader = SerialReaderThread(conn, on_line=lambda _raw, v: _on(v))
+    reader.start()
+    try:
+        inst.start()
+        inst.wait_done(count / rate_hz * 2 + 10 if rate_hz else 60)
+        last.wait(1.0)
+        elapsed = time.perf_counter() - inst.started_at
+    finally:
+        reader.stop()
+        conn.close()
+        inst.stop()
+    ok = sum(1 for a, b in zip(received, values) if a is not None and abs(a - b) < 1e-9)
+    return {
+        "sent": inst.frames_sent,
+        "received": len(received),
+        "lost": count - ok,
+        "dropped_bytes": inst.bytes_dropped,
+        "frames_per_s": len(received) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--rates", default="100,1000,0", help="Trames/s (0 : sans pause)")
+    parser.add_argument("--baudrate", type=int, default=None, help="Cadence octet de la ligne (défaut : sans)")
+    args = parser.parse_args()
+    if not sys.platform.startswith("linux"):
+        print("Banc pty : Linux uniquement.")
+        return 1
+    print("lecteur  cadence    envoyées  reçues  perdues  octets perdus   trames/s")
+    for kind in ("tesa", "ascii"):
+        for rate in (float(r) for r in args.rates.split(",")):
+            r = _bench(kind, rate, args.count, args.baudrate)
+            label = f"{rate:.0f}/s" if rate else "max"
+            print(f"{kind:<8} {label:>8}   {r['sent']:7d} {r['received']:7d} {r['lost']:8d}"
+                  f" {r['dropped_bytes']:13d} {r['frames_per_s']:10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
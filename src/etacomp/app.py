@@ -1,10 +1,13 @@
+import time
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from .ui.main_window import MainWindow
 from .ui.themes import load_theme_qss
 from .config.prefs import load_prefs
 from .package_resources import first_existing_path
-from .io.serial_manager import serial_manager
+from .io.serial_hub import serial_hub
 
 
 def _apply_app_icon(app: QApplication) -> None:
@@ -24,9 +27,28 @@ def _apply_app_icon(app: QApplication) -> None:
         pass
 
 
+def _report_startup(stamps: dict, app: QApplication) -> None:
+    """Mode --startup-profile (processus enfant) : relevé sur stdout puis fermeture."""
+    import json
+    from .tools.startup_profile import MARKER
+
+    stamps["shown"] = time.time()
+    print(MARKER + json.dumps(stamps), flush=True)
+    app.quit()
+
+
 def run():
     import sys
     import logging
+    stamps = {"run": time.time()}
+    if "--startup-profile" in sys.argv[1:]:
+        from .tools.startup_profile import main as startup_profile
+        args = [a for a in sys.argv[1:] if a != "--startup-profile"]
+        sys.exit(startup_profile(args))
+    from .tools.startup_profile import CHILD_FLAG
+    profiling = CHILD_FLAG in sys.argv[1:]
+    if profiling:
+        sys.argv.remove(CHILD_FLAG)
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -36,7 +58,7 @@ def run():
 
     def _release_serial_port() -> None:
         try:
-            serial_manager.close()
+            serial_hub.close_all()
         except Exception:
             pass
 
@@ -48,12 +70,16 @@ def run():
         app.setStyleSheet(qss)
 
     _apply_app_icon(app)
+    stamps["qapp"] = time.time()
 
     window = MainWindow()
+    stamps["window"] = time.time()
     window.showMaximized()
     try:
         window.raise_()
         window.activateWindow()
     except Exception:
         pass
+    if profiling:
+        QTimer.singleShot(0, lambda: _report_startup(stamps, app))
     sys.exit(app.exec())
@@ -1,4 +1,4 @@
-"""Lanceur autonome — sauvegarde / restauration EtaComp."""
+"""Lanceur autonome — sauvegarde / restauration EtaComp (`etacomp-backup verify ARCHIVE` : vérification)."""
 from __future__ import annotations
 
 import logging
@@ -30,6 +30,12 @@ def _apply_app_icon(app: QApplication) -> None:
 
 
 def run() -> None:
+    # `etacomp-backup verify ARCHIVE` : contrôle en ligne de commande, sans interface
+    if sys.argv[1:2] == ["verify"]:
+        from .io.backup_verify import main as verify_main
+
+        sys.exit(verify_main(sys.argv[2:]))
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -8,6 +8,7 @@ import json
 from pydantic import BaseModel, Field
 
 from .paths import get_data_dir
+from ..io.atomic_write import atomic_write
 
 EXPORT_CONFIG_FILE = "export_config.json"
 
@@ -39,5 +40,5 @@ def load_export_config() -> ExportConfig:
 def save_export_config(cfg: ExportConfig) -> Path:
     path = _config_path()
     get_data_dir().mkdir(parents=True, exist_ok=True)
-    path.write_text(cfg.model_dump_json(indent=2), encoding="utf-8")
+    atomic_write(path, cfg.model_dump_json(indent=2))
     return path
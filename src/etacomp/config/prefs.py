@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from .defaults import DEFAULT_THEME
 from .paths import get_data_dir
+from ..io.atomic_write import atomic_write
 
 
 class Preferences(BaseModel):
@@ -45,5 +46,5 @@ def load_prefs() -> Preferences:
 
 def save_prefs(p: Preferences) -> Path:
     cfg = _config_path()
-    cfg.write_text(p.model_dump_json(indent=2), encoding="utf-8")
+    atomic_write(cfg, p.model_dump_json(indent=2))
     return cfg
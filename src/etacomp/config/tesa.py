@@ -5,11 +5,14 @@ from typing import Literal
 import json
 
 from .paths import get_data_dir
+from ..io.atomic_write import atomic_write
 
 
 TesaDecimalDisplay = Literal["dot", "comma"]
 TesaFrameMode = Literal["silence", "eol"]
 TesaEol = Literal["CR", "LF", "CRLF"]
+TesaReadMode = Literal["event", "poll"]
+TesaAcquisition = Literal["thread", "process"]
 
 
 DEFAULT_TESA_CONFIG = {
@@ -22,6 +25,27 @@ DEFAULT_TESA_CONFIG = {
     "value_regex": r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+",
     "decimals": 3,
     "decimal_display": "dot",                # "dot" | "comma"
+    "read_mode": "event",                    # "event" (attente bloquante) | "poll" (sleep 5–10 ms)
+    "acquisition": "thread",                 # "thread" | "process" (lecteur dans un processus dédié)
+}
+
+# Profil TESA ASCII (envoi / parse) : non enregistré, valeurs initiales de l'onglet Paramètres
+DEFAULT_SEND_CONFIG = {
+    "mode": "Manuel (opérateur)",            # "Manuel (opérateur)" | "À la demande"
+    "trigger_text": "",
+    "eol_mode": "CR (\\r)",
+}
+DEFAULT_ASCII_CONFIG = {
+    "regex_pattern": r"^\s*[+-]?\s*(?:\d*[.,]\d+|\d+)\s*$",
+    "decimal_comma": False,
+}
+
+# Clés propres à un port du SerialHub (en plus des clés TESA ci-dessus, surchargeables par port)
+DEFAULT_PORT_CONFIG = {
+    "device": "",                            # "COM3", "/dev/ttyUSB0"…
+    "baudrate": 4800,
+    "regex_pattern": r"^\s*[+-]?\s*(?:\d*[.,]\d+|\d+)\s*$",   # parse ASCII (lecteur TESA désactivé)
+    "decimal_comma": False,
 }
 
 
@@ -44,10 +68,34 @@ def load_tesa_config() -> dict:
 
 
 def save_tesa_config(cfg: dict) -> Path:
-    """Sauvegarde la configuration TESA."""
+    """Sauvegarde la configuration TESA (les sections "ports" déjà enregistrées sont conservées)."""
     path = _tesa_path()
     # Merge avant sauvegarde pour garantir cohérence
     data = {**DEFAULT_TESA_CONFIG, **(cfg or {})}
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if "ports" not in (cfg or {}):
+        ports = load_tesa_config().get("ports")
+        if ports:
+            data["ports"] = ports
+    atomic_write(path, json.dumps(data, indent=2))
     return path
 
+
+def load_port_config(port_id: str) -> dict:
+    """
+    Configuration effective d'un port nommé : défauts du port, puis configuration TESA
+    globale, puis surcharges enregistrées sous "ports" → port_id.
+    """
+    cfg = load_tesa_config()
+    ports = cfg.pop("ports", None) or {}
+    override = ports.get(port_id) if isinstance(ports, dict) else None
+    return {**DEFAULT_PORT_CONFIG, **cfg, **(override or {})}
+
+
+def save_port_config(port_id: str, cfg: dict) -> Path:
+    """Enregistre les surcharges d'un port (seules les clés fournies sont conservées)."""
+    data = load_tesa_config()
+    ports = dict(data.get("ports") or {})
+    ports[port_id] = dict(cfg or {})
+    data["ports"] = ports
+    return save_tesa_config(data)
+
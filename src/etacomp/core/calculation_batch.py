@@ -0,0 +1,323 @@
+"""
+Calcul vectorisé (NumPy) de N sessions — mêmes résultats que CalculationEngine.compute.
+
+Les sessions sont empaquetées en tableaux (N, K, 2, T) : K occurrences par cible et
+par sens (= cycles pour une session issue du runtime), 2 sens (montée, descente),
+T cibles ; NaN pour les mesures absentes. Les moyennes reproduisent sum() dans l'ordre
+des occurrences (compensation de Neumaier depuis Python 3.12) : résultats identiques
+au bit près au moteur scalaire.
+"""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..models.session import Direction, SeriesKind, SessionV2
+from .campaign_cycles import clamp_series_count
+from .critical_point import TOL
+
+UP, DOWN = 0, 1
+# sum() des flottants : compensation de Neumaier depuis Python 3.12, simple cumul avant
+COMPENSATED_SUM = sys.version_info >= (3, 12)
+_DIR_NAMES = ("up", "down")
+
+
+@dataclass
+class PackedSessions:
+    """Sessions empaquetées pour le calcul vectorisé."""
+    values: np.ndarray          # (N, K, 2, T) mesures, NaN si absentes
+    targets: np.ndarray         # (N, T) cibles, NaN au-delà de n_targets
+    n_targets: np.ndarray       # (N,) nombre de cibles par session
+    fidelity: List[List[tuple]]  # par session : [(target, direction, [valeurs])] dans l'ordre des séries
+
+
+def _pack_v2(sess: SessionV2) -> tuple:
+    """(cibles, bloc (K, 2, T) en listes, séries de fidélité) d'une SessionV2."""
+    targets: List[float] = []
+    for s in sess.series:
+        if s.kind == SeriesKind.MAIN and s.targets_mm:
+            targets = list(s.targets_mm)
+            break
+    cols: Dict[float, List[int]] = {}
+    for j, t in enumerate(targets):
+        cols.setdefault(t, []).append(j)
+    block: List[List[List[Optional[float]]]] = []
+    counts: Dict[tuple, int] = {}
+    fid: List[tuple] = []
+    for s in sess.series:
+        if s.kind == SeriesKind.MAIN:
+            for m in s.measurements:
+                t = m.target_mm
+                c = cols.get(t)
+                if c is None:
+                    continue
+                d = UP if m.direction == Direction.UP else DOWN
+                k = counts.get((d, t), 0)
+                counts[(d, t)] = k + 1
+                while len(block) <= k:
+                    block.append([[None] * len(targets), [None] * len(targets)])
+                for j in c:
+                    block[k][d][j] = m.value_mm
+        elif s.kind == SeriesKind.FIDELITY:
+            first_t = s.measurements[0].target_mm if s.measurements else 0.0
+            fid.append((first_t, s.direction.value, [(m.target_mm, m.value_mm) for m in s.measurements]))
+    return targets, block, fid
+
+
+def _pack_runtime(rt) -> Optional[tuple]:
+    """
+    Même empaquetage directement depuis la Session runtime (readings[pos],
+    pos = (cycle-1)*2 + sens), sans construire de SessionV2 — voir
+    build_session_from_runtime. None si des cibles sont dupliquées (cas rare
+    traité par l'adaptateur).
+    """
+    series = rt.series or []
+    targets = [float(ms.target) for ms in series]
+    if len(set(targets)) != len(targets):
+        return None
+    cycles, _ = clamp_series_count(max(1, int(rt.series_count or 1)))
+    width = 2 * cycles
+    rows = []
+    for ms in series:
+        r = list(ms.readings or [])[:width]
+        rows.append(r + [None] * (width - len(r)))
+    # (T, cycles, 2) → (cycles, 2, T) ; None → NaN
+    block = np.array(rows, dtype=float).reshape(len(targets), cycles, 2).transpose(1, 2, 0) if targets else []
+    fid: List[tuple] = []
+    f = getattr(rt, "fidelity", None)
+    if f and f.samples:
+        t = float(f.target)
+        direction = "up" if str(f.direction).lower().startswith("u") else "down"
+        fid.append((t, direction, [(t, float(v)) for v in f.samples[:5]]))
+    return targets, block, fid
+
+
+def pack_sessions(sessions: Sequence) -> PackedSessions:
+    """
+    Regroupe les mesures des séries principales par (occurrence, sens, cible).
+    Accepte des SessionV2 ou des Session runtime (empaquetées sans conversion).
+    """
+    from .session_adapter import build_session_from_runtime
+
+    n = len(sessions)
+    packed: List[tuple] = []
+    for sess in sessions:
+        item = _pack_v2(sess) if isinstance(sess, SessionV2) else _pack_runtime(sess)
+        if item is None:
+            item = _pack_v2(build_session_from_runtime(sess))
+        packed.append(item)
+    max_t = max([1] + [len(t) for t, _, _ in packed])  # au moins une colonne (NaN)
+    max_k = max([1] + [len(b) for _, b, _ in packed])
+
+    values = np.full((n, max_k, 2, max_t), np.nan)
+    tgt = np.full((n, max_t), np.nan)
+    n_targets = np.zeros(n, dtype=np.int64)
+    for i, (targets, block, _) in enumerate(packed):
+        nt = len(targets)
+        n_targets[i] = nt
+        if nt:
+            tgt[i, :nt] = targets
+            if len(block):
+                values[i, :len(block), :, :nt] = np.asarray(block, dtype=float)
+    return PackedSessions(values=values, targets=tgt, n_targets=n_targets, fidelity=[f for _, _, f in packed])
+
+
+def _seq_mean(x: np.ndarray, axis: int, compensated: bool = COMPENSATED_SUM) -> np.ndarray:
+    """
+    Moyenne en ignorant NaN le long de `axis` : sum(valeurs présentes) / n au bit près,
+    valeurs prises dans l'ordre des mesures (même algorithme que sum() de CPython).
+    """
+    x = np.moveaxis(x, axis, 0)
+    acc = np.zeros(x.shape[1:])
+    comp = np.zeros(x.shape[1:])
+    cnt = np.zeros(x.shape[1:], dtype=np.int64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        for row in x:
+            ok = ~np.isnan(row)
+            v = np.where(ok, row, 0.0)
+            t = acc + v
+            if compensated:
+                c = np.where(np.abs(acc) >= np.abs(v), (acc - t) + v, (v - t) + acc)
+                comp = np.where(ok, comp + c, comp)
+            acc = np.where(ok, t, acc)
+            cnt += ok
+        if compensated:
+            acc = np.where((comp != 0.0) & np.isfinite(comp), acc + comp, acc)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(cnt > 0, acc / np.maximum(cnt, 1), np.nan)
+
+
+def _first_argmax_strict(x: np.ndarray) -> tuple:
+    """(max, index du premier max) par ligne ; NaN ignorés ; max <= 0 → (0.0, -1) comme `d > best`."""
+    filled = np.where(np.isnan(x), -np.inf, x)
+    idx = np.argmax(filled, axis=1)
+    best = filled[np.arange(filled.shape[0]), idx]
+    found = best > 0.0
+    return np.where(found, best, 0.0), np.where(found, idx, -1)
+
+
+def _py_rows(x: np.ndarray) -> list:
+    """Tableau 2D → listes de floats Python, NaN remplacés par None."""
+    obj = x.astype(object)
+    obj[np.isnan(x)] = None
+    return obj.tolist()
+
+
+def compute_packed(packed: PackedSessions, *, details: bool = True) -> list:
+    """
+    Calcule les CalculatedResults de toutes les sessions empaquetées.
+    details=False laisse calibration_points vide (suffisant pour un verdict).
+    """
+    from .calculation_engine import CalculatedResults, fidelity_stats
+
+    values, targets = packed.values, packed.targets
+    n, _, _, t_max = values.shape
+    if n == 0:
+        return []
+    rows = np.arange(n)
+
+    means = _seq_mean(values, axis=1)                 # (N, 2, T)
+    errors = means - targets[:, None, :]              # NaN si moyenne ou cible absente
+    up_m, dn_m = means[:, UP], means[:, DOWN]
+    up_e, dn_e = errors[:, UP], errors[:, DOWN]
+
+    # Hystérésis
+    hyst = np.abs(up_m - dn_m)
+    hyst_max, hyst_idx = _first_argmax_strict(hyst)
+
+    # Erreur locale : variations entre erreurs successives présentes (cibles sans erreur sautées)
+    def _local(err: np.ndarray) -> tuple:
+        valid = ~np.isnan(err)
+        pos = np.where(valid, np.arange(t_max)[None, :], -1)
+        last = np.maximum.accumulate(pos, axis=1)
+        prev = np.concatenate([np.full((n, 1), -1), last[:, :-1]], axis=1)
+        has_prev = valid & (prev >= 0)
+        prev_err = np.take_along_axis(err, np.maximum(prev, 0), axis=1)
+        steps = np.where(has_prev, np.abs(err - prev_err), np.nan)
+        best, idx = _first_argmax_strict(steps)
+        return best, idx, prev
+
+    up_step, up_idx, up_prev = _local(up_e)
+    dn_step, dn_idx, dn_prev = _local(dn_e)
+
+    # Point critique : candidats ordonnés (cible, montée/descente), tie-break de find_critical_point
+    abs_e = np.abs(errors).transpose(0, 2, 1)                       # (N, T, 2)
+    other = np.where(np.isnan(abs_e[..., ::-1]), 0.0, abs_e[..., ::-1])
+    cand_t = np.broadcast_to(targets[:, :, None], abs_e.shape)
+    valid = ~np.isnan(abs_e)
+    k1 = np.where(valid, abs_e, -np.inf).reshape(n, -1)
+    k2 = np.where(valid, other, -np.inf).reshape(n, -1)
+    k3 = np.where(valid, cand_t, -np.inf).reshape(n, -1)
+    has_crit = valid.reshape(n, -1).any(axis=1)
+    mask = k1 == k1.max(axis=1, initial=-np.inf, keepdims=True)
+    k2 = np.where(mask, k2, -np.inf)
+    mask &= k2 == k2.max(axis=1, initial=-np.inf, keepdims=True)
+    k3 = np.where(mask, k3, -np.inf)
+    mask &= k3 == k3.max(axis=1, initial=-np.inf, keepdims=True)
+    crit_flat = np.argmax(mask, axis=1)
+    crit_t_idx, crit_dir = crit_flat // 2, crit_flat % 2
+
+    # Fidélité : série 5 correspondant au point critique, σ (ddof=0) comme le moteur scalaire
+    crit_target = targets[rows, crit_t_idx]
+    fid_samples: List[Optional[List[float]]] = [None] * n
+    for i in range(n):
+        if not has_crit[i]:
+            continue
+        ct, cd = crit_target[i], _DIR_NAMES[crit_dir[i]]
+        for first_t, direction, meas in packed.fidelity[i]:
+            d = "up" if str(direction).lower().startswith("u") else "down"
+            if not (abs(float(first_t) - ct) < TOL and d == cd):
+                continue
+            samples = [v for mt, v in meas if abs(mt - ct) < 1e-9]
+            if len(samples) >= 2:
+                fid_samples[i] = samples
+                break
+    fid_stats = [fidelity_stats(s) if s else None for s in fid_samples]
+
+    # Sélections vectorisées des emplacements
+    crit_signed = errors[rows, crit_dir, crit_t_idx]
+    crit_measured = means[rows, crit_dir, crit_t_idx]
+    choose_up = up_step >= dn_step
+    local_err = np.where(choose_up, up_step, dn_step)
+    local_idx = np.where(choose_up, up_idx, dn_idx)
+    safe_idx = np.maximum(local_idx, 0)
+    local_prev = np.where(choose_up, up_prev[rows, safe_idx], dn_prev[rows, safe_idx])
+    safe_h = np.maximum(hyst_idx, 0)
+    hyst_up, hyst_dn, hyst_val = up_m[rows, safe_h], dn_m[rows, safe_h], hyst[rows, safe_h]
+
+    # Conversion en CalculatedResults (floats Python, None pour les absences)
+    if details:
+        um_l, dm_l, ue_l, de_l, hy_l = (_py_rows(a) for a in (up_m, dn_m, up_e, dn_e, hyst))
+    tl_all = targets.tolist()
+    nt_l = packed.n_targets.tolist()
+    has_crit_l, crit_t_l, crit_d_l = has_crit.tolist(), crit_t_idx.tolist(), crit_dir.tolist()
+    crit_signed_l, crit_measured_l = crit_signed.tolist(), crit_measured.tolist()
+    local_err_l, local_idx_l, local_prev_l = local_err.tolist(), local_idx.tolist(), local_prev.tolist()
+    hyst_max_l, hyst_idx_l = hyst_max.tolist(), hyst_idx.tolist()
+    hyst_up_l, hyst_dn_l, hyst_val_l = hyst_up.tolist(), hyst_dn.tolist(), hyst_val.tolist()
+    out = []
+    for i in range(n):
+        nt = nt_l[i]
+        tl = tl_all[i]
+        calib_rows = [] if not details else [
+            {
+                "target_mm": t,
+                "up_mean_mm": um,
+                "down_mean_mm": dm,
+                "up_error_mm": ue,
+                "down_error_mm": de,
+                "hysteresis_mm": h,
+            }
+            for t, um, dm, ue, de, h in zip(tl[:nt], um_l[i], dm_l[i], ue_l[i], de_l[i], hy_l[i])
+        ]
+
+        hysteresis_loc: Dict = {}
+        j = hyst_idx_l[i]
+        if j >= 0:
+            hysteresis_loc = {"target_mm": tl[j], "up_mm": hyst_up_l[i], "down_mm": hyst_dn_l[i], "hysteresis_mm": hyst_val_l[i]}
+
+        total_loc: Dict = {}
+        total_error_mm = 0.0
+        if has_crit_l[i]:
+            j = crit_t_l[i]
+            total_error_mm = crit_signed_l[i]
+            total_loc = {
+                "target_mm": tl[j],
+                "direction": _DIR_NAMES[crit_d_l[i]],
+                "measured_mm": crit_measured_l[i],
+                "reference_mm": tl[j],
+                "error_mm": total_error_mm,
+            }
+
+        local_loc: Dict = {}
+        j = local_idx_l[i]
+        if j >= 0:
+            local_loc = {"target_a": tl[local_prev_l[i]], "target_b": tl[j], "delta_error_mm": local_err_l[i]}
+
+        fidelity_std = None
+        fidelity_ctx = None
+        if fid_stats[i] is not None:
+            fid_mean, fidelity_std = fid_stats[i]
+            fidelity_ctx = {
+                "target_mm": tl[crit_t_l[i]],
+                "direction": _DIR_NAMES[crit_d_l[i]],
+                "samples": fid_samples[i],
+                "mean_mm": fid_mean,
+                "std_mm": fidelity_std,
+            }
+
+        out.append(CalculatedResults(
+            total_error_mm=abs(total_error_mm),
+            total_error_location=total_loc,
+            local_error_mm=local_err_l[i],
+            local_error_location=local_loc,
+            hysteresis_max_mm=hyst_max_l[i],
+            hysteresis_location=hysteresis_loc,
+            fidelity_std_mm=fidelity_std,
+            fidelity_context=fidelity_ctx,
+            calibration_points=calib_rows,
+        ))
+    return out
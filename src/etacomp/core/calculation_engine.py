@@ -1,13 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Sequence, Tuple, Optional
 import math
 
 from ..models.session import SessionV2, SeriesKind, Direction
 from .critical_point import CriticalPoint, find_critical_point, fidelity_matches_critical
 
 
+def mean_of(values: List[float]) -> Optional[float]:
+    """Moyenne, None si vide."""
+    return sum(values) / len(values) if values else None
+
+
+def fidelity_stats(samples: List[float]) -> Tuple[float, float]:
+    """(moyenne, écart-type ddof=0) des mesures de la série 5."""
+    mean_s = sum(samples) / len(samples)
+    var = sum((x - mean_s) ** 2 for x in samples) / len(samples)  # ddof=0
+    return mean_s, math.sqrt(var)
+
+
+# Série 5 : (cible de la 1re mesure, sens "up"/"down", [(cible, valeur)])
+FidelityInput = Tuple[float, str, List[Tuple[float, float]]]
+
+
 @dataclass
 class CalculatedResults:
     total_error_mm: float
@@ -31,15 +47,34 @@ class CalculationEngine:
     - Hystérésis = |mean_up - mean_down| par cible; on garde le max
     - Erreur locale = max des variations entre erreurs successives sur la courbe up et sur la courbe down
     - Fidélité = écart‑type (ddof=0) des 5 mesures sur le point critique si S5 existe
+
+    `compute_batch` applique les mêmes règles à N sessions en vectorisé (NumPy).
     """
+    def compute_batch(self, sessions: Sequence, *, details: bool = True) -> List[CalculatedResults]:
+        """
+        Résultats de plusieurs sessions (SessionV2 ou Session runtime), identiques
+        à `compute` appliqué à chacune. details=False : calibration_points vides.
+        """
+        from .calculation_batch import compute_packed, pack_sessions
+
+        return compute_packed(pack_sessions(sessions), details=details)
+
     def compute(self, session: SessionV2) -> CalculatedResults:
         # Organiser données des séries principales
         # target -> lists for up, down
         up_vals: Dict[float, List[float]] = {}
         down_vals: Dict[float, List[float]] = {}
         targets: List[float] = []
+        fidelity: List[FidelityInput] = []
 
         for s in session.series:
+            if s.kind == SeriesKind.FIDELITY:
+                fidelity.append((
+                    s.measurements[0].target_mm if s.measurements else 0.0,
+                    s.direction.value,
+                    [(m.target_mm, m.value_mm) for m in s.measurements],
+                ))
+                continue
             if s.kind != SeriesKind.MAIN:
                 continue
             if not targets and s.targets_mm:
@@ -50,10 +85,25 @@ class CalculationEngine:
                 else:
                     down_vals.setdefault(m.target_mm, []).append(m.value_mm)
 
-        # Moyennes par cible
-        def mean(lst: List[float]) -> Optional[float]:
-            return sum(lst) / len(lst) if lst else None
+        return self.compute_from_means(
+            targets,
+            {t: mean_of(v) for t, v in up_vals.items()},
+            {t: mean_of(v) for t, v in down_vals.items()},
+            fidelity,
+        )
 
+    def compute_from_means(
+        self,
+        targets: List[float],
+        up_mean_by_target: Dict[float, Optional[float]],
+        down_mean_by_target: Dict[float, Optional[float]],
+        fidelity: Iterable[FidelityInput] = (),
+    ) -> CalculatedResults:
+        """
+        Suite du calcul à partir des moyennes par cible (montée/descente).
+        Point d'entrée commun à `compute` et à IncrementalCalculation.
+        fidelity : séries 5 (cible de la 1re mesure, sens, [(cible, valeur)]).
+        """
         calib_rows: List[Dict] = []
         up_errors: List[Tuple[float, float]] = []
         down_errors: List[Tuple[float, float]] = []
@@ -64,8 +114,8 @@ class CalculationEngine:
         hysteresis_loc: Dict = {}
 
         for t in targets:
-            up_m = mean(up_vals.get(t, []))
-            down_m = mean(down_vals.get(t, []))
+            up_m = up_mean_by_target.get(t)
+            down_m = down_mean_by_target.get(t)
             up_err = (up_m - t) if up_m is not None else None
             down_err = (down_m - t) if down_m is not None else None
 
@@ -132,19 +182,12 @@ class CalculationEngine:
         if critical:
             crit_target = critical.target_mm
             crit_dir = critical.direction
-            for s in session.series:
-                if s.kind != SeriesKind.FIDELITY:
-                    continue
-                if not fidelity_matches_critical(
-                    critical, target_mm=s.measurements[0].target_mm if s.measurements else 0.0,
-                    direction=s.direction.value,
-                ):
+            for first_target, direction, measurements in fidelity:
+                if not fidelity_matches_critical(critical, target_mm=first_target, direction=direction):
                     continue
-                samples = [m.value_mm for m in s.measurements if abs(m.target_mm - crit_target) < 1e-9]
+                samples = [v for t, v in measurements if abs(t - crit_target) < 1e-9]
                 if len(samples) >= 2:
-                    mean_s = sum(samples) / len(samples)
-                    var = sum((x - mean_s) ** 2 for x in samples) / len(samples)  # ddof=0
-                    std = math.sqrt(var)
+                    mean_s, std = fidelity_stats(samples)
                     fidelity_std = std
                     fidelity_ctx = {
                         "target_mm": crit_target,
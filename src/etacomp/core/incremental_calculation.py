@@ -0,0 +1,134 @@
+"""Calcul des erreurs tenu à jour lecture par lecture (session runtime en cours)."""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from ..models.session import FidelitySeries, MeasureSeries, Session as RuntimeSession
+from .calculation_engine import CalculatedResults, CalculationEngine, FidelityInput, mean_of
+from .campaign_cycles import clamp_series_count
+
+
+def _fidelity_input(fid: Optional[FidelitySeries]) -> List[FidelityInput]:
+    """Série 5 telle que construite par build_session_from_runtime (5 premières mesures)."""
+    if not fid or not fid.samples:
+        return []
+    t = float(fid.target)
+    direction = "up" if str(fid.direction).lower().startswith("u") else "down"
+    return [(t, direction, [(t, float(v)) for v in fid.samples[:5]])]
+
+
+class IncrementalCalculation:
+    """
+    Résultats de la session runtime sans reconstruire de SessionV2.
+
+    - Une case par (cible, sens, cycle) et la moyenne par (cible, sens) : `set_reading`
+      ne recalcule que la moyenne de la cible touchée (au plus MAX_CAMPAIGN_CYCLES valeurs).
+    - Erreurs, hystérésis, erreur locale, point critique et fidélité sont recalculés
+      paresseusement au premier `results()` après une modification (O(cibles)),
+      via CalculationEngine.compute_from_means : mêmes résultats que
+      CalculationEngine.compute(build_session_from_runtime(rt)).
+    - `sync(rt)` reconstruit l'état si la session, ses objets séries, le nombre de
+      cycles ou la série 5 ont été remplacés hors de `set_reading`/`set_fidelity`.
+
+    Cibles dupliquées (session importée atypique) : repli sur le calcul complet.
+    """
+
+    def __init__(self, rt: Optional[RuntimeSession] = None):
+        self._engine = CalculationEngine()
+        self.version = 0
+        self.reset(rt)
+
+    @classmethod
+    def from_runtime(cls, rt: RuntimeSession) -> "IncrementalCalculation":
+        return cls(rt)
+
+    # ----- état -----
+    def reset(self, rt: Optional[RuntimeSession]) -> None:
+        """Reconstruit entièrement l'état depuis la session runtime (O(mesures))."""
+        self._rt = rt
+        series: List[MeasureSeries] = list(rt.series or []) if rt is not None else []
+        self._series_ref: Tuple[MeasureSeries, ...] = tuple(series)
+        self._fid_ref = rt.fidelity if rt is not None else None
+        self._cycles, _ = clamp_series_count(max(1, int(rt.series_count or 1))) if rt is not None else (1, False)
+        self._targets: List[float] = [float(ms.target) for ms in series]
+        self._index = {t: j for j, t in enumerate(self._targets)}
+        self._exact = len(self._index) == len(self._targets)
+        self._slots: List[List[List[Optional[float]]]] = [
+            [[None] * self._cycles, [None] * self._cycles] for _ in self._targets
+        ]
+        self._means: List[List[Optional[float]]] = [[None, None] for _ in self._targets]
+        for j, ms in enumerate(series):
+            for pos, val in enumerate(ms.readings or []):
+                if val is not None and pos // 2 < self._cycles:
+                    self._slots[j][pos % 2][pos // 2] = float(val)
+            for d in (0, 1):
+                self._means[j][d] = mean_of([v for v in self._slots[j][d] if v is not None])
+        self._fidelity = _fidelity_input(self._fid_ref)
+        self._results: Optional[CalculatedResults] = None
+        self.version += 1
+
+    def is_synced(self, rt: Optional[RuntimeSession]) -> bool:
+        if rt is not self._rt:
+            return False
+        if rt is None:
+            return True
+        series = rt.series or []
+        if len(series) != len(self._series_ref) or any(a is not b for a, b in zip(series, self._series_ref)):
+            return False
+        cycles, _ = clamp_series_count(max(1, int(rt.series_count or 1)))
+        return cycles == self._cycles and rt.fidelity is self._fid_ref
+
+    def sync(self, rt: Optional[RuntimeSession]) -> "IncrementalCalculation":
+        if not self.is_synced(rt):
+            self.reset(rt)
+        return self
+
+    # ----- mises à jour O(1) -----
+    def set_reading(self, target: float, pos: int, value: Optional[float]) -> None:
+        """
+        Lecture ajoutée, remplacée (ou effacée avec None) en readings[pos] de la cible.
+        KeyError si la cible est inconnue : appeler reset().
+        """
+        j = self._index[float(target)]
+        cyc, d = divmod(int(pos), 2)
+        if cyc >= self._cycles:
+            return  # au-delà des cycles de la campagne : ignorée comme par l'adaptateur
+        slots = self._slots[j][d]
+        slots[cyc] = float(value) if value is not None else None
+        self._means[j][d] = mean_of([v for v in slots if v is not None])
+        self._results = None
+        self.version += 1
+
+    def set_fidelity(self, fid: Optional[FidelitySeries]) -> None:
+        self._fid_ref = fid
+        self._fidelity = _fidelity_input(fid)
+        self._results = None
+        self.version += 1
+
+    # ----- lecture -----
+    @property
+    def targets(self) -> List[float]:
+        return list(self._targets)
+
+    def mean(self, target: float, direction: str) -> Optional[float]:
+        """Moyenne (mm) des lectures de la cible dans le sens "up"/"down", None si aucune."""
+        j = self._index.get(float(target))
+        if j is None:
+            return None
+        return self._means[j][0 if direction == "up" else 1]
+
+    def results(self) -> CalculatedResults:
+        """Résultats complets, recalculés seulement si une lecture a changé."""
+        if self._results is None:
+            if not self._exact and self._rt is not None:
+                from .session_adapter import build_session_from_runtime
+
+                self._results = self._engine.compute(build_session_from_runtime(self._rt))
+            else:
+                self._results = self._engine.compute_from_means(
+                    self._targets,
+                    {t: self._means[j][0] for j, t in enumerate(self._targets)},
+                    {t: self._means[j][1] for j, t in enumerate(self._targets)},
+                    self._fidelity,
+                )
+        return self._results
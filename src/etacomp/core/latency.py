@@ -0,0 +1,154 @@
+"""
+Latence octet → cellule de la chaîne de mesure.
+
+Chaque lecture instrumentée est un `TracedReading` (float portant ses horodatages
+monotones, time.perf_counter) qui traverse la chaîne sans changer les signatures :
+lecteur série → SerialManager → MeasuresTab → cellule → moyennes → bip.
+"""
+from __future__ import annotations
+
+import csv
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Étapes dans l'ordre de la chaîne ; la latence d'une étape est l'écart avec la précédente
+STAGES: Tuple[str, ...] = ("rx", "decode", "signal", "slot", "dispatch", "cell", "means", "beep")
+STAGE_LABELS: Dict[str, str] = {
+    "rx": "Dernier octet reçu",
+    "decode": "Trame découpée et décodée (lecteur)",
+    "signal": "Émission SerialManager",
+    "slot": "Réception MeasuresTab (file Qt)",
+    "dispatch": "Traitement différé (singleShot)",
+    "cell": "Cellule écrite",
+    "means": "Moyennes recalculées",
+    "beep": "Bip",
+}
+TOTAL = "total"
+
+# Budget de retour opérateur (bouton TESA → valeur affichée + bip)
+BUDGET_MS = 50.0
+MAX_SAMPLES = 10000
+
+
+class TracedReading(float):
+    """Valeur lue + horodatages par étape (s, perf_counter)."""
+
+    def __new__(cls, value: float, stamps: Optional[Dict[str, float]] = None):
+        obj = super().__new__(cls, value)
+        obj.stamps = dict(stamps or {})
+        obj.recorded = False
+        return obj
+
+    def __reduce__(self):
+        return (TracedReading, (float(self), self.stamps))
+
+
+class LatencyTracker:
+    """
+    Collecte les échantillons terminés (fenêtre glissante de MAX_SAMPLES) et fournit
+    percentiles et histogrammes par étape. Désactivé par défaut (ETACOMP_LATENCY=1 ou
+    `enabled = True`) : les lecteurs émettent alors des float ordinaires.
+    """
+
+    def __init__(self, max_samples: int = MAX_SAMPLES):
+        self.enabled = os.environ.get("ETACOMP_LATENCY", "") not in ("", "0")
+        self._samples: Deque[Dict[str, float]] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    # --------- INSTRUMENTATION ---------
+    def start(self, value: float, *, rx: Optional[float] = None) -> float:
+        """Début de trace côté lecteur : étapes rx (si connue) et decode (maintenant)."""
+        if not self.enabled or value is None:
+            return value
+        now = perf_counter()
+        return TracedReading(value, {"rx": now if rx is None else rx, "decode": now})
+
+    @staticmethod
+    def mark(value, stage: str) -> None:
+        stamps = getattr(value, "stamps", None)
+        if stamps is not None and stage not in stamps:
+            stamps[stage] = perf_counter()
+
+    def finish(self, value, stage: str = "beep") -> None:
+        """Dernière étape : l'échantillon est enregistré (une seule fois par lecture)."""
+        stamps = getattr(value, "stamps", None)
+        if stamps is None or value.recorded:
+            return
+        self.mark(value, stage)
+        value.recorded = True
+        with self._lock:
+            self._samples.append(dict(stamps))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    # --------- ANALYSE ---------
+    def durations_ms(self) -> Dict[str, np.ndarray]:
+        """Par étape : écart (ms) avec l'étape précédente présente ; TOTAL : première → dernière."""
+        with self._lock:
+            samples = list(self._samples)
+        out: Dict[str, List[float]] = {s: [] for s in STAGES[1:]}
+        out[TOTAL] = []
+        for stamps in samples:
+            prev = None
+            for stage in STAGES:
+                t = stamps.get(stage)
+                if t is None:
+                    continue
+                if prev is not None:
+                    out[stage].append((t - prev) * 1000.0)
+                prev = t
+            present = [stamps[s] for s in STAGES if s in stamps]
+            if len(present) >= 2:
+                out[TOTAL].append((present[-1] - present[0]) * 1000.0)
+        return {k: np.asarray(v, dtype=float) for k, v in out.items()}
+
+    def summary(self) -> List[Dict]:
+        """Lignes {stage, n, p50, p95, p99, max} en ms (étapes sans mesure omises)."""
+        rows = []
+        for stage, d in self.durations_ms().items():
+            if d.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(d, [50, 95, 99])
+            row = {"stage": stage, "n": int(d.size), "p50": float(p50), "p95": float(p95),
+                   "p99": float(p99), "max": float(d.max())}
+            if stage == TOTAL:
+                row["over_budget"] = int((d > BUDGET_MS).sum())
+            rows.append(row)
+        return rows
+
+    def histogram(self, stage: str = TOTAL, bins: Optional[List[float]] = None) -> List[Tuple[float, float, int]]:
+        """(borne basse, borne haute, effectif) en ms ; bornes par défaut jusqu'au budget et au-delà."""
+        d = self.durations_ms().get(stage)
+        if d is None or d.size == 0:
+            return []
+        edges = bins or [0, 1, 2, 5, 10, 20, 30, 40, BUDGET_MS, 100, 200, max(500.0, float(d.max()) + 1)]
+        counts, edges = np.histogram(d, bins=edges)
+        return [(float(edges[i]), float(edges[i + 1]), int(c)) for i, c in enumerate(counts)]
+
+    def export_csv(self, path: Path) -> Path:
+        """Échantillons bruts : horodatages (ms, relatifs à la première étape) par étape."""
+        path = Path(path)
+        with self._lock:
+            samples = list(self._samples)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f, delimiter=";")
+            w.writerow(["index", *[f"{s}_ms" for s in STAGES]])
+            for i, stamps in enumerate(samples):
+                t0 = min(stamps.values())
+                w.writerow([i, *[f"{(stamps[s] - t0) * 1000.0:.3f}" if s in stamps else "" for s in STAGES]])
+        return path
+
+
+# Singleton global
+latency_tracker = LatencyTracker()
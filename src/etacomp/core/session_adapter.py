@@ -7,7 +7,7 @@ from ..models.session import (
     Session as RuntimeSession,
     SessionV2, Series, SeriesKind, Direction, Measurement
 )
-from ..io.storage import list_comparators
+from ..io.storage import get_comparator
 from .campaign_cycles import MAX_CAMPAIGN_CYCLES, clamp_series_count
 from .datetime_utils import runtime_created_iso, utc_now_iso, utc_session_id_suffix
 
@@ -18,18 +18,18 @@ def capture_comparator_snapshot(ref: Optional[str]) -> Optional[dict]:
     """Capture le profil comparateur depuis la bibliothèque (à la sauvegarde / changement de ref)."""
     if not ref:
         return None
-    for c in list_comparators():
-        if c.reference == ref:
-            return {
-                "reference": c.reference,
-                "manufacturer": getattr(c, "manufacturer", None),
-                "description": getattr(c, "description", None),
-                "graduation": c.graduation,
-                "course": c.course,
-                "range_type": getattr(c.range_type, "value", None),
-                "targets": list(c.targets),
-            }
-    return None
+    c = get_comparator(ref)
+    if c is None:
+        return None
+    return {
+        "reference": c.reference,
+        "manufacturer": getattr(c, "manufacturer", None),
+        "description": getattr(c, "description", None),
+        "graduation": c.graduation,
+        "course": c.course,
+        "range_type": getattr(c.range_type, "value", None),
+        "targets": list(c.targets),
+    }
 
 
 def _snapshot_is_usable(snap: dict) -> bool:
@@ -40,6 +40,12 @@ def _snapshot_is_usable(snap: dict) -> bool:
     )
 
 
+def uses_library_profile(rt: RuntimeSession) -> bool:
+    """True si le profil de calcul vient de la bibliothèque (snapshot absent ou incomplet)."""
+    snap = getattr(rt, "comparator_snapshot", None) or {}
+    return not (isinstance(snap, dict) and _snapshot_is_usable(snap))
+
+
 def resolve_comparator_snapshot(rt: RuntimeSession) -> dict:
     """
     Profil pour calcul / verdict : snapshot session prioritaire, bibliothèque en secours.
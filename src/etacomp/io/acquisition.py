@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Trame décodée : (value, display, raw_hex, raw_ascii, ts) — signature de TesaSerialReader.on_value
+Frame = Tuple[float, str, str, str, float]
+
+# En-tête : capacity, write_seq, read_seq, overruns (u64)
+_HEADER = struct.Struct("<QQQQ")
+# Emplacement : seq, ts, value, display, raw_hex, raw_ascii, seq (seq en tête et en fin : lecture cohérente)
+_SLOT = struct.Struct("<Qdd24s96s32sQ")
+_SEQ = struct.Struct("<Q")
+_OFF_WRITE, _OFF_READ, _OFF_OVERRUNS = 8, 16, 24
+
+DEFAULT_CAPACITY = 1024
+
+
+def _text(data: bytes) -> str:
+    return data.rstrip(b"\0").decode("utf-8", errors="replace")
+
+
+class FrameRing:
+    """
+    Anneau de trames décodées en mémoire partagée, un producteur (processus d'acquisition)
+    et un consommateur (interface). Le producteur ne bloque jamais : anneau plein → la plus
+    ancienne trame non lue est écrasée et `overruns` incrémenté.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        self.capacity = _HEADER.unpack_from(self._buf, 0)[0]
+        self.lost = 0   # côté consommateur : trames écrasées avant lecture
+
+    @classmethod
+    def create(cls, capacity: int = DEFAULT_CAPACITY) -> "FrameRing":
+        capacity = max(2, int(capacity))
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + capacity * _SLOT.size)
+        _HEADER.pack_into(shm.buf, 0, capacity, 0, 0, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameRing":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _u64(self, offset: int) -> int:
+        return _SEQ.unpack_from(self._buf, offset)[0]
+
+    def _set_u64(self, offset: int, value: int) -> None:
+        _SEQ.pack_into(self._buf, offset, value)
+
+    @property
+    def written(self) -> int:
+        return self._u64(_OFF_WRITE)
+
+    @property
+    def overruns(self) -> int:
+        return self._u64(_OFF_OVERRUNS)
+
+    # --------- PRODUCTEUR ---------
+    def push(self, value: float, display: str, raw_hex: str, raw_ascii: str, ts: float) -> None:
+        w = self._u64(_OFF_WRITE)
+        if w - self._u64(_OFF_READ) >= self.capacity:
+            self._set_u64(_OFF_OVERRUNS, self._u64(_OFF_OVERRUNS) + 1)
+        off = _HEADER.size + (w % self.capacity) * _SLOT.size
+        seq = w + 1
+        # seq de fin invalidée d'abord : un lecteur concurrent verra l'emplacement incohérent
+        _SEQ.pack_into(self._buf, off + _SLOT.size - 8, 0)
+        _SLOT.pack_into(self._buf, off, seq, ts, value,
+                        display.encode()[:24], raw_hex.encode()[:96], raw_ascii.encode()[:32], seq)
+        self._set_u64(_OFF_WRITE, seq)
+
+    # --------- CONSOMMATEUR ---------
+    def drain(self) -> List[Frame]:
+        """Trames écrites depuis le dernier appel (les trames écrasées sont comptées dans `lost`)."""
+        w = self._u64(_OFF_WRITE)
+        r = self._u64(_OFF_READ)
+        if w - r > self.capacity:
+            self.lost += w - r - self.capacity
+            r = w - self.capacity
+        out: List[Frame] = []
+        for s in range(r, w):
+            off = _HEADER.size + (s % self.capacity) * _SLOT.size
+            head, ts, value, display, raw_hex, raw_ascii, tail = _SLOT.unpack_from(self._buf, off)
+            if head != s + 1 or tail != s + 1:
+                self.lost += 1
+                continue
+            out.append((value, _text(display), _text(raw_hex), _text(raw_ascii), ts))
+        self._set_u64(_OFF_READ, w)
+        return out
+
+    def close(self) -> None:
+        self._buf = None
+        try:
+            self._shm.close()
+        except Exception:
+            pass
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _acquisition_main(shm_name: str, port: str, baudrate: int, reader_kwargs: dict,
+                      stop_evt, notify, commands) -> None:
+    """Processus d'acquisition : port série + TesaSerialReader → anneau partagé."""
+    from .serialio import SerialConnection
+    from .tesa_reader import TesaSerialReader
+
+    ring = FrameRing.attach(shm_name)
+    conn = SerialConnection()
+    try:
+        conn.open(port, baudrate=baudrate)
+    except Exception as exc:
+        notify.send(("e", f"Ouverture {port} impossible : {exc}"))
+        notify.send(("x", None))
+        ring.close()
+        return
+
+    def _on_value(value, display, raw_hex, raw_ascii, ts):
+        ring.push(value, display, raw_hex, raw_ascii, ts)
+        notify.send(("f", None))
+
+    reader = TesaSerialReader(
+        conn,
+        on_value=_on_value,
+        on_debug=lambda m: notify.send(("d", m)),
+        on_error=lambda m: notify.send(("e", m)),
+        **reader_kwargs,
+    )
+    notify.send(("r", None))
+    reader.start()
+    try:
+        while not stop_evt.is_set():
+            if commands.poll(0.1):
+                try:
+                    conn.write_bytes(commands.recv_bytes())
+                except EOFError:
+                    break
+    finally:
+        reader.stop()
+        conn.close()
+        try:
+            notify.send(("x", None))
+        except Exception:
+            pass
+        ring.close()
+
+
+class AcquisitionProcess:
+    """
+    Lecteur TESA dans un processus séparé : l'assemblage des trames (silence inter-octets)
+    ne dépend plus de l'activité de l'interface (export PDF, sauvegarde, recalculs).
+
+    Interface identique à TesaSerialReader (start/stop, callbacks), plus write() pour le
+    mode « À la demande » et stats(). Les callbacks sont appelés depuis un thread de
+    vidage léger, réveillé par un tube de notification.
+    """
+
+    IDLE_WAIT_S = 0.25
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int,
+        *,
+        on_value: Callable[[float, str, str, str, float], None],
+        on_debug: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        **reader_kwargs,
+    ):
+        self._port = port
+        self._baudrate = int(baudrate)
+        self._on_value = on_value
+        self._on_debug = on_debug
+        self._on_error = on_error
+        self._capacity = capacity
+        self._reader_kwargs = reader_kwargs
+
+        self._ring: Optional[FrameRing] = None
+        self._proc = None
+        self._stop_evt = None
+        self._notify = None
+        self._commands = None
+        self._stop = threading.Event()
+        self._th: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self.delivered = 0
+
+    # --------- CYCLE DE VIE ---------
+    def start(self):
+        if self._proc is not None and self._proc.is_alive():
+            return
+        ctx = mp.get_context("spawn")   # pas de fork d'un processus Qt
+        self._ring = FrameRing.create(self._capacity)
+        notify_recv, notify_send = ctx.Pipe(duplex=False)
+        cmd_recv, cmd_send = ctx.Pipe(duplex=False)
+        self._stop_evt = ctx.Event()
+        self._proc = ctx.Process(
+            target=_acquisition_main,
+            args=(self._ring.name, self._port, self._baudrate, self._reader_kwargs,
+                  self._stop_evt, notify_send, cmd_recv),
+            name="EtaCompAcquisition",
+            daemon=True,
+        )
+        self._proc.start()
+        notify_send.close()
+        cmd_recv.close()
+        self._notify, self._commands = notify_recv, cmd_send
+        self._stop.clear()
+        self._ready.clear()
+        self._th = threading.Thread(target=self._drain_loop, daemon=True)
+        self._th.start()
+        self._dbg(f"Acquisition process started (pid {self._proc.pid})")
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Vrai quand le port est ouvert dans le processus d'acquisition."""
+        return self._ready.wait(timeout)
+
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.is_alive()
+
+    def stop(self):
+        self._stop.set()
+        if self._stop_evt is not None:
+            self._stop_evt.set()
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            proc.join(timeout=3.0)
+            if proc.is_alive():
+                logger.warning("Processus d'acquisition non arrêté dans le délai imparti, terminaison")
+                proc.terminate()
+                proc.join(timeout=1.0)
+        if self._th is not None:
+            self._th.join(timeout=1.0)
+            self._th = None
+        for c in (self._notify, self._commands):
+            if c is not None:
+                try:
+                    c.close()
+                except Exception:
+                    pass
+        self._notify = self._commands = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        self._dbg("Acquisition process stopped")
+
+    # --------- ENVOI ---------
+    def write(self, data: bytes) -> None:
+        if self._commands is None:
+            return
+        try:
+            self._commands.send_bytes(bytes(data))
+        except Exception as exc:
+            self._err(f"envoi vers le processus d'acquisition : {exc!r}")
+
+    # --------- DIAG ---------
+    def stats(self) -> Dict[str, int]:
+        """written : trames produites ; overruns : écrasées avant lecture (producteur) ; lost : côté lecteur."""
+        ring = self._ring
+        if ring is None:
+            return {"written": 0, "delivered": self.delivered, "overruns": 0, "lost": 0}
+        return {"written": ring.written, "delivered": self.delivered,
+                "overruns": ring.overruns, "lost": ring.lost}
+
+    # --------- INTERNE ---------
+    def _dbg(self, m: str):
+        if self._on_debug:
+            try: self._on_debug(m)
+            except Exception: pass
+
+    def _err(self, m: str):
+        if self._on_error:
+            try: self._on_error(m)
+            except Exception: pass
+
+    def _drain_loop(self):
+        notify, ring = self._notify, self._ring
+        running = True
+        while running and not self._stop.is_set():
+            try:
+                if not notify.poll(self.IDLE_WAIT_S):
+                    continue
+                while notify.poll(0):
+                    kind, payload = notify.recv()
+                    if kind == "d":
+                        self._dbg(payload)
+                    elif kind == "e":
+                        self._err(payload)
+                    elif kind == "r":
+                        self._ready.set()
+                    elif kind == "x":
+                        running = False
+                        break
+            except (EOFError, OSError):
+                running = False
+            for frame in ring.drain():
+                self.delivered += 1
+                try:
+                    self._on_value(*frame)
+                except Exception as e:
+                    self._err(f"on_value failed: {e!r}")
+        if not self._stop.is_set():
+            self._err("Processus d'acquisition arrêté")
@@ -5,17 +5,41 @@ import os
 from pathlib import Path
 
 
-def atomic_write(path: Path, content: str, *, encoding: str = "utf-8") -> None:
+def atomic_write(path: Path, content: str, *, encoding: str = "utf-8", fsync: bool = False) -> None:
     """
     Écrit le contenu de façon atomique : fichier .tmp puis renommage.
 
     En cas d'échec avant le replace, le fichier cible existant est conservé.
+    Avec fsync=True, le .tmp est forcé sur disque avant le renommage (survit à une coupure).
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_name(f"{path.name}.tmp")
     try:
-        tmp_path.write_text(content, encoding=encoding)
+        if fsync:
+            with open(tmp_path, "w", encoding=encoding) as fh:
+                fh.write(content)
+                fh.flush()
+                os.fsync(fh.fileno())
+        else:
+            tmp_path.write_text(content, encoding=encoding)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Variante binaire d'atomic_write : le fichier cible est remplacé (nouvel inode), jamais réécrit sur place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(data)
         os.replace(tmp_path, path)
     except Exception:
         if tmp_path.exists():
@@ -0,0 +1,233 @@
+"""Journal d'autosave en ajout seul (write-ahead) : une ligne JSON par modification de session."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, IO, List, Optional
+
+from ..models.session import FidelitySeries, MeasureSeries, Session
+from .atomic_write import atomic_write
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "autosave_session.journal"
+
+# Champs de métadonnées rejoués par un enregistrement "meta"
+META_FIELDS = (
+    "operator", "temperature_c", "humidity_pct", "comparator_ref", "comparator_snapshot",
+    "holder_ref", "banc_ref", "series_count", "measures_per_series", "observations",
+)
+
+
+def meta_record(s: Session) -> Dict:
+    return {"op": "meta", **{k: getattr(s, k) for k in META_FIELDS}}
+
+
+def series_record(series: List[MeasureSeries]) -> Dict:
+    return {"op": "series", "series": [{"target": ms.target, "readings": list(ms.readings)} for ms in series]}
+
+
+def reading_record(target: float, pos: int, value: Optional[float], *, override: bool = False) -> Dict:
+    rec = {"op": "reading", "target": float(target), "pos": int(pos), "value": value}
+    if override:
+        rec["override"] = True
+    return rec
+
+
+def fidelity_record(fidelity: Optional[FidelitySeries]) -> Dict:
+    return {"op": "fidelity", "fidelity": fidelity.model_dump() if fidelity else None}
+
+
+def apply_record(s: Session, rec: Dict) -> None:
+    """
+    Rejoue un enregistrement sur la session.
+
+    Tous les enregistrements sont des affectations absolues (pas d'incréments) :
+    rejouer un journal déjà intégré à l'instantané redonne le même état.
+    """
+    op = rec.get("op")
+    if op == "meta":
+        for k in META_FIELDS:
+            if k in rec:
+                setattr(s, k, rec[k])
+    elif op == "series":
+        s.series = [MeasureSeries.model_construct(target=float(d["target"]), readings=list(d["readings"])) for d in rec["series"]]
+    elif op == "reading":
+        target, pos, value = float(rec["target"]), int(rec["pos"]), rec["value"]
+        ms = next((m for m in s.series if m.target == target), None)
+        if ms is None:
+            ms = MeasureSeries(target=target, readings=[])
+            s.series.append(ms)
+        while len(ms.readings) <= pos:
+            ms.readings.append(None)
+        ms.readings[pos] = value
+        while ms.readings and ms.readings[-1] is None:
+            ms.readings.pop()
+    elif op == "fidelity":
+        fid = rec.get("fidelity")
+        s.fidelity = FidelitySeries.model_validate(fid) if fid else None
+    else:
+        raise ValueError(f"Enregistrement de journal inconnu : {op!r}")
+
+
+class AutosaveJournal:
+    """
+    Autosave incrémental de la session en cours dans `autosave/`.
+
+    - `autosave_session.json` : instantané complet (format inchangé), réécrit seulement
+      à la compaction (premier changement, tous les `compact_every` enregistrements,
+      fermeture propre).
+    - `autosave_session.journal` : un enregistrement JSON par lecture, correction,
+      série de fidélité ou changement de métadonnées, ajouté puis flushé.
+      fsync groupé : tous les `fsync_every` enregistrements, après `fsync_interval_s`
+      ou à l'appel de `sync()` (minuterie autosave).
+    - La présence du journal au démarrage signale un arrêt non propre : `recover()`
+      rejoue le journal sur l'instantané.
+
+    Rien n'est écrit tant que la session n'a pas de mesures (comme l'ancien autosave).
+    """
+
+    def __init__(
+        self,
+        directory: Callable[[], Path],
+        snapshot_name: str,
+        *,
+        fsync_every: int = 32,
+        fsync_interval_s: float = 1.0,
+        compact_every: int = 1000,
+    ):
+        self._directory = directory
+        self._snapshot_name = snapshot_name
+        self.fsync_every = fsync_every
+        self.fsync_interval_s = fsync_interval_s
+        self.compact_every = compact_every
+        self._fh: Optional[IO[str]] = None
+        self._records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # ----- chemins -----
+    @property
+    def snapshot_path(self) -> Path:
+        return self._directory() / self._snapshot_name
+
+    @property
+    def journal_path(self) -> Path:
+        return self._directory() / JOURNAL_FILENAME
+
+    @property
+    def started(self) -> bool:
+        """True si un journal est ouvert pour la session en cours."""
+        return self._fh is not None
+
+    @property
+    def pending_records(self) -> int:
+        """Enregistrements écrits depuis la dernière compaction."""
+        return self._records
+
+    # ----- écriture -----
+    def append(self, record: Dict, session: Session) -> None:
+        """Journalise une modification déjà appliquée à `session`."""
+        if not session.has_measures():
+            return
+        if self._fh is None:
+            # Premier changement : l'instantané inclut déjà cette modification
+            self.compact(session)
+            return
+        self._fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._fh.flush()
+        self._records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval_s:
+            self.sync()
+        if self._records >= self.compact_every:
+            self.compact(session)
+
+    def sync(self) -> int:
+        """Force les enregistrements en attente sur disque. Retourne leur nombre."""
+        n = self._unsynced
+        if self._fh is not None and n:
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        return n
+
+    def compact(self, session: Session) -> Path:
+        """Réécrit l'instantané complet puis repart d'un journal vide."""
+        path = self.snapshot_path
+        atomic_write(path, session.model_dump_json(indent=2), fsync=True)
+        # Crash entre les deux étapes : l'ancien journal rejoué sur le nouvel instantané est sans effet
+        self._close_fh()
+        self._fh = open(self.journal_path, "w", encoding="utf-8")
+        self._records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        return path
+
+    def reset(self) -> None:
+        """Nouvelle session : abandonne le journal (l'instantané précédent est conservé)."""
+        self._close_fh()
+        self.discard()
+
+    def close(self, session: Session) -> None:
+        """Fermeture propre : intègre le journal à l'instantané puis le supprime."""
+        if self._fh is not None:
+            if self._records:
+                self.compact(session)
+            self._close_fh()
+        self.discard()
+
+    def _close_fh(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+        self._records = 0
+        self._unsynced = 0
+
+    # ----- reprise après incident -----
+    def has_pending(self) -> bool:
+        """True si un journal subsiste (dernière exécution non fermée proprement)."""
+        return self._fh is None and self.journal_path.exists()
+
+    def discard(self) -> None:
+        try:
+            self.journal_path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Journal autosave non supprimé : %s", exc)
+
+    def recover(self) -> Optional[Session]:
+        """
+        Instantané + rejeu du journal. Une dernière ligne tronquée (coupure pendant
+        l'écriture) est ignorée ; le rejeu s'arrête à la première ligne invalide.
+        """
+        snap = self.snapshot_path
+        session: Optional[Session] = None
+        if snap.exists():
+            try:
+                session = Session.model_validate(json.loads(snap.read_text(encoding="utf-8")))
+            except Exception as exc:
+                logger.error("Instantané autosave illisible %s : %s", snap, exc)
+        jp = self.journal_path
+        if not jp.exists():
+            return session
+        if session is None:
+            session = Session(operator="")
+        replayed = 0
+        with open(jp, "r", encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.endswith("\n"):
+                    logger.warning("Journal autosave : ligne %d tronquée ignorée", lineno)
+                    break
+                try:
+                    apply_record(session, json.loads(line))
+                except Exception as exc:
+                    logger.warning("Journal autosave : rejeu arrêté ligne %d : %s", lineno, exc)
+                    break
+                replayed += 1
+        logger.info("Journal autosave : %d enregistrement(s) rejoué(s)", replayed)
+        return session
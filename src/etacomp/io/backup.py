@@ -1,25 +1,54 @@
-"""Sauvegarde et restauration des données utilisateur (~/.EtaComp2K25/)."""
+"""
+Sauvegarde et restauration des données utilisateur (~/.EtaComp2K25/).
+
+Le manifeste (version 2) enregistre taille, mtime et SHA-256 de chaque fichier et l'archive
+qui en contient le contenu. Une sauvegarde incrémentale (`base=` archive précédente, même
+dossier) ne stocke que les fichiers dont l'empreinte a changé ; son manifeste ne liste que
+ces différences (entrées modifiées, fichiers supprimés) et désigne l'archive parente.
+`resolve_entries` reconstitue l'état complet en remontant la chaîne : restaurer n'importe
+quelle archive de la chaîne restitue les données à cette date.
+"""
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
+import struct
 import subprocess
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Iterator, Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
 
 import getpass
 
 from .. import __version__
 from ..config.export_config import EXPORT_CONFIG_FILE
 from ..config.paths import APP_DIRNAME, get_data_dir
-from .atomic_write import atomic_write
+from .atomic_write import atomic_write, atomic_write_bytes
 
-BACKUP_VERSION = 1
+BACKUP_VERSION = 2
 MANIFEST_NAME = "manifest.json"
+HASH_CHUNK = 1024 * 1024
+
+# Compression : formats déjà compressés stockés tels quels, le reste (JSON…) en deflate
+STORE_EXTENSIONS = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".gif", ".wav", ".mp3", ".ogg", ".zip", ".gz"})
+DEFAULT_COMPRESSLEVEL = 6
+# Fichiers compressés en parallèle (zlib / hashlib libèrent le GIL) ; au-delà de LARGE_FILE,
+# écriture en flux dans le thread d'écriture (pas de copie complète en mémoire)
+MAX_PACK_WORKERS = 4
+PACK_WINDOW_BYTES = 64 * 1024 * 1024   # octets lus et pas encore écrits dans l'archive
+PACK_WINDOW_PER_WORKER = 8             # vérification : membres en attente par thread
+LARGE_FILE = 32 * 1024 * 1024
+# Instantané avant restauration : toujours copiés (journal d'autosave complété sur place)
+SNAPSHOT_COPY_PREFIXES = ("autosave/",)
+FICLONE = 0x40049409  # ioctl Linux : copie par référence (btrfs, XFS)
 
 
 @dataclass(frozen=True)
@@ -98,6 +127,8 @@ class ExportResult:
     file_count: int
     total_bytes: int
     categories: list[str]
+    stored_count: int = 0  # fichiers réellement écrits dans l'archive (incrémental : modifiés)
+    parent: Optional[Path] = None
 
 
 @dataclass
@@ -105,6 +136,36 @@ class RestoreResult:
     categories: list[str]
     file_count: int
     safety_backup_path: Optional[Path] = None
+    skipped_count: int = 0  # fichiers déjà identiques à l'archive, non réécrits
+
+
+@dataclass(frozen=True)
+class BackupEntry:
+    """Fichier de l'état sauvegardé ; archive="" : contenu stocké dans l'archive du manifeste."""
+    size: int
+    mtime_ns: int
+    sha256: str
+    archive: str = ""
+    path: str = ""  # nom du membre ZIP dans `archive`
+
+    def to_dict(self) -> dict:
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "sha256": self.sha256,
+            "archive": self.archive,
+            "path": self.path,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BackupEntry":
+        return cls(
+            size=int(data.get("size", 0)),
+            mtime_ns=int(data.get("mtime_ns", 0)),
+            sha256=str(data.get("sha256", "")),
+            archive=str(data.get("archive") or ""),
+            path=str(data.get("path") or ""),
+        )
 
 
 @dataclass
@@ -114,7 +175,14 @@ class BackupManifest:
     backup_version: int
     created_at: str
     categories: list[str]
-    files: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)  # sauvegarde complète uniquement
+    entries: dict[str, BackupEntry] = field(default_factory=dict)  # incrémentale : différences
+    parent: Optional[str] = None  # archive précédente de la chaîne (même dossier)
+    removed: list[str] = field(default_factory=list)  # supprimés depuis l'archive parente
+
+    @property
+    def incremental(self) -> bool:
+        return self.parent is not None
 
     def to_dict(self) -> dict:
         return {
@@ -124,6 +192,9 @@ class BackupManifest:
             "created_at": self.created_at,
             "categories": self.categories,
             "files": self.files,
+            "parent": self.parent,
+            "removed": self.removed,
+            "entries": {name: e.to_dict() for name, e in self.entries.items()},
         }
 
     @classmethod
@@ -135,6 +206,9 @@ class BackupManifest:
             created_at=str(data.get("created_at", "")),
             categories=list(data.get("categories") or []),
             files=list(data.get("files") or []),
+            entries={str(k): BackupEntry.from_dict(v) for k, v in (data.get("entries") or {}).items()},
+            parent=data.get("parent") or None,
+            removed=list(data.get("removed") or []),
         )
 
 
@@ -330,54 +404,440 @@ def _collect_files(data_dir: Path, category_ids: Iterable[str]) -> list[tuple[Pa
     return unique
 
 
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _compress_type(name: str) -> int:
+    return zipfile.ZIP_STORED if Path(name).suffix.lower() in STORE_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+class _ZipWriter:
+    """
+    Écriture séquentielle d'une archive ZIP (en-têtes locaux, répertoire central, ZIP64 si besoin).
+    Les membres arrivent déjà compressés des threads de préparation : CRC et tailles sont connus
+    avant l'en-tête, sans recompression dans le thread d'écriture. Relecture via zipfile.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        self._fh = fh
+        self._offset = 0
+        self._central: list[bytes] = []
+
+    def _write(self, data: bytes) -> None:
+        self._fh.write(data)
+        self._offset += len(data)
+
+    @staticmethod
+    def _dos_datetime(date_time: tuple) -> tuple[int, int]:
+        y, mo, d, h, mi, sec = date_time[:6]
+        y = min(max(y, 1980), 2107)
+        return (h << 11) | (mi << 5) | (sec // 2), ((y - 1980) << 9) | (mo << 5) | d
+
+    @staticmethod
+    def _encode(name: str) -> tuple[bytes, int]:
+        try:
+            return name.encode("ascii"), 0
+        except UnicodeEncodeError:
+            return name.encode("utf-8"), 0x800
+
+    def _local_header(self, raw_name: bytes, flags: int, method: int, dostime: int, dosdate: int,
+                      crc: int, csize: int, usize: int, zip64: bool) -> None:
+        extra = b""
+        if zip64:
+            extra = struct.pack("<HHQQ", 0x0001, 16, usize, csize)
+            csize = usize = 0xFFFFFFFF
+        version = 45 if zip64 else 20
+        self._write(struct.pack("<IHHHHHIIIHH", 0x04034B50, version, flags, method, dostime, dosdate,
+                                crc, csize, usize, len(raw_name), len(extra)))
+        self._write(raw_name + extra)
+
+    def _add_central(self, raw_name: bytes, flags: int, method: int, dostime: int, dosdate: int,
+                     crc: int, csize: int, usize: int, offset: int, external_attr: int) -> None:
+        values: list[int] = []
+        if usize > zipfile.ZIP64_LIMIT:
+            values.append(usize)
+            usize = 0xFFFFFFFF
+        if csize > zipfile.ZIP64_LIMIT:
+            values.append(csize)
+            csize = 0xFFFFFFFF
+        if offset > zipfile.ZIP64_LIMIT:
+            values.append(offset)
+            offset = 0xFFFFFFFF
+        extra = struct.pack(f"<HH{len(values)}Q", 0x0001, 8 * len(values), *values) if values else b""
+        version = 45 if values else 20
+        self._central.append(
+            struct.pack("<IBBHHHHHIIIHHHHHII", 0x02014B50, version, 3, version, flags, method, dostime,
+                        dosdate, crc, csize, usize, len(raw_name), len(extra), 0, 0, 0, external_attr,
+                        offset)
+            + raw_name + extra
+        )
+
+    def write_member(self, name: str, date_time: tuple, external_attr: int, method: int,
+                     crc: int, usize: int, payload: bytes) -> None:
+        """Membre dont les données (`payload`, compressées selon `method`) sont déjà prêtes."""
+        raw_name, flags = self._encode(name)
+        dostime, dosdate = self._dos_datetime(date_time)
+        offset = self._offset
+        zip64 = max(usize, len(payload)) > zipfile.ZIP64_LIMIT
+        self._local_header(raw_name, flags, method, dostime, dosdate, crc, len(payload), usize, zip64)
+        self._write(payload)
+        self._add_central(raw_name, flags, method, dostime, dosdate, crc, len(payload), usize, offset,
+                          external_attr)
+
+    def write_stream(self, name: str, date_time: tuple, external_attr: int, method: int,
+                     src: BinaryIO, zip64: bool, compresslevel: int = DEFAULT_COMPRESSLEVEL) -> str:
+        """
+        Membre lu en flux depuis `src` (fichier volumineux) : CRC et tailles inconnus à l'en-tête,
+        reportés dans le descripteur de données. Retourne le SHA-256 des données lues.
+        """
+        raw_name, flags = self._encode(name)
+        flags |= 0x08
+        dostime, dosdate = self._dos_datetime(date_time)
+        offset = self._offset
+        self._local_header(raw_name, flags, method, dostime, dosdate, 0, 0, 0, zip64)
+        co = zlib.compressobj(compresslevel, zlib.DEFLATED, -15) if method == zipfile.ZIP_DEFLATED else None
+        h = hashlib.sha256()
+        crc = usize = csize = 0
+        for chunk in iter(lambda: src.read(HASH_CHUNK), b""):
+            h.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            usize += len(chunk)
+            out = co.compress(chunk) if co is not None else chunk
+            csize += len(out)
+            self._write(out)
+        if co is not None:
+            out = co.flush()
+            csize += len(out)
+            self._write(out)
+        if zip64:
+            self._write(struct.pack("<IIQQ", 0x08074B50, crc, csize, usize))
+        else:
+            self._write(struct.pack("<IIII", 0x08074B50, crc, csize, usize))
+        self._add_central(raw_name, flags, method, dostime, dosdate, crc, csize, usize, offset,
+                          external_attr)
+        return h.hexdigest()
+
+    def close(self) -> None:
+        """Répertoire central et fin d'archive (enregistrements ZIP64 si nécessaire)."""
+        start = self._offset
+        for record in self._central:
+            self._write(record)
+        size = self._offset - start
+        count = len(self._central)
+        if count > 0xFFFF or start > zipfile.ZIP64_LIMIT or size > zipfile.ZIP64_LIMIT:
+            end64 = self._offset
+            self._write(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0, count, count, size, start))
+            self._write(struct.pack("<IIQI", 0x07064B50, 0, end64, 1))
+            count, size, start = min(count, 0xFFFF), min(size, 0xFFFFFFFF), min(start, 0xFFFFFFFF)
+        self._write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, size, start, 0))
+
+
+def _file_attrs(fp: Path) -> tuple[tuple, int]:
+    """Date de modification et attributs Unix d'un fichier, tels que zipfile les enregistre."""
+    info = zipfile.ZipInfo.from_file(fp)
+    return info.date_time, info.external_attr
+
+
+def _store_file(zw: _ZipWriter, fp: Path, name: str, compresslevel: int = DEFAULT_COMPRESSLEVEL) -> str:
+    """Ajoute fp à l'archive en flux, en une seule lecture ; retourne son SHA-256."""
+    date_time, attrs = _file_attrs(fp)
+    zip64 = fp.stat().st_size > zipfile.ZIP64_LIMIT // 2  # marge : fichier qui grossit pendant la lecture
+    with open(fp, "rb") as src:
+        return zw.write_stream(name, date_time, attrs, _compress_type(name), src, zip64, compresslevel)
+
+
+@dataclass
+class _Packed:
+    """Membre préparé par un thread : empreinte et, si à écrire, données déjà compressées."""
+    sha256: str
+    size: int
+    crc: int = 0
+    compress_type: int = zipfile.ZIP_STORED
+    payload: Optional[bytes] = None  # None : contenu connu (chaîne) ou fichier volumineux
+
+
+def _pack(fp: Path, name: str, compresslevel: int, known: frozenset[str]) -> _Packed:
+    """Lecture, SHA-256, CRC et compression d'un fichier (exécuté dans le pool de threads)."""
+    if fp.stat().st_size > LARGE_FILE:
+        return _Packed(sha256="", size=-1)
+    data = fp.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in known:
+        return _Packed(digest, len(data))
+    ctype = _compress_type(name)
+    payload = data
+    if ctype == zipfile.ZIP_DEFLATED:
+        co = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        payload = co.compress(data) + co.flush()
+        if len(payload) >= len(data):
+            ctype, payload = zipfile.ZIP_STORED, data
+    return _Packed(digest, len(data), zlib.crc32(data), ctype, payload)
+
+
+def _write_packed(zw: _ZipWriter, fp: Path, name: str, packed: _Packed) -> None:
+    """Écrit un membre préparé par _pack (données déjà compressées)."""
+    date_time, attrs = _file_attrs(fp)
+    zw.write_member(name, date_time, attrs, packed.compress_type, packed.crc, packed.size, packed.payload)
+
+
+def _pack_ordered(
+    items: list[tuple[Path, str]],
+    compresslevel: int,
+    known: frozenset[str],
+    workers: int,
+    window_bytes: int = PACK_WINDOW_BYTES,
+) -> Iterator[tuple[Path, str, _Packed]]:
+    """
+    Préparation en parallèle, restituée dans l'ordre des fichiers. Fenêtre bornée en octets :
+    les fichiers soumis et pas encore écrits totalisent au plus `window_bytes` (au moins un fichier).
+    """
+    if workers <= 1:
+        for fp, name in items:
+            yield fp, name, _pack(fp, name, compresslevel, known)
+        return
+
+    def _cost(fp: Path) -> int:
+        size = fp.stat().st_size
+        return size if size <= LARGE_FILE else 0   # fichier volumineux : rien en mémoire (flux)
+
+    pending: deque = deque()
+    buffered = 0
+    source = iter(items)
+    nxt = next(source, None)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backup-pack") as pool:
+        try:
+            while pending or nxt is not None:
+                while nxt is not None:
+                    cost = _cost(nxt[0])
+                    if pending and buffered + cost > window_bytes:
+                        break
+                    fp, name = nxt
+                    pending.append((fp, name, cost, pool.submit(_pack, fp, name, compresslevel, known)))
+                    buffered += cost
+                    nxt = next(source, None)
+                fp, name, cost, fut = pending.popleft()
+                packed = fut.result()
+                buffered -= cost
+                yield fp, name, packed
+        finally:
+            for _fp, _name, _cost_, fut in pending:
+                fut.cancel()
+
+
+class _ByteProgress:
+    """Progression en octets relayée au ProgressCallback, au plus une fois par pour-cent."""
+
+    def __init__(self, total: int, progress: Optional[ProgressCallback]):
+        self.total = max(total, 1)
+        self.done = 0
+        self._progress = progress
+        self._last_pct = -1
+
+    def advance(self, nbytes: int, name: str) -> None:
+        self.done += nbytes
+        if self._progress is None:
+            return
+        pct = min(100, self.done * 100 // self.total)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress(f"{format_bytes(self.done)} / {format_bytes(self.total)} ({pct} %) — {name}")
+
+
+def resolve_entries(archive_path: Path, manifest: Optional[BackupManifest] = None) -> dict[str, BackupEntry]:
+    """
+    État complet d'une archive version 2 : manifestes de la chaîne appliqués du plus ancien
+    au plus récent. Chaque entrée désigne par son nom l'archive qui contient le contenu.
+    """
+    archive_path = Path(archive_path)
+    chain: list[tuple[str, BackupManifest]] = []
+    seen: set[str] = set()
+    name, current = archive_path.name, manifest or read_manifest(archive_path)
+    while True:
+        chain.append((name, current))
+        seen.add(name)
+        if current.parent is None:
+            break
+        name = current.parent
+        if name in seen:
+            raise ValueError(f"Chaîne de sauvegardes circulaire : {name}")
+        parent_path = archive_path.parent / name
+        if not parent_path.is_file():
+            raise ValueError(f"Archive(s) de la chaîne introuvable(s) : {name}")
+        current = read_manifest(parent_path)
+    if chain[-1][1].backup_version < 2:
+        raise ValueError(f"Archive sans empreintes (version {chain[-1][1].backup_version}) : "
+                         "faites d'abord une sauvegarde complète")
+
+    state: dict[str, BackupEntry] = {}
+    for archive_name, m in reversed(chain):
+        for removed in m.removed:
+            state.pop(removed, None)
+        for n, e in m.entries.items():
+            state[n] = e if e.archive else BackupEntry(e.size, e.mtime_ns, e.sha256, archive_name, e.path or n)
+    return state
+
+
+def find_latest_backup(directory: Path, *, exclude: Optional[Path] = None) -> Optional[Path]:
+    """Archive la plus récente du dossier utilisable comme base incrémentale (manifeste v2)."""
+    best: Optional[tuple[str, int, Path]] = None
+    skip = Path(exclude).resolve() if exclude is not None else None
+    for fp in Path(directory).glob("*.zip"):
+        if skip is not None and fp.resolve() == skip:
+            continue
+        try:
+            manifest = read_manifest(fp)
+            mtime = fp.stat().st_mtime_ns
+        except Exception:
+            continue
+        if manifest.backup_version < 2:
+            continue
+        key = (manifest.created_at, mtime, fp)
+        if best is None or key[:2] > best[:2]:
+            best = key
+    return best[2] if best else None
+
+
 def export_backup(
     archive_path: Path,
     category_ids: Iterable[str],
     *,
     data_dir: Optional[Path] = None,
+    base: Optional[Path] = None,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    workers: Optional[int] = None,
     progress: Optional[ProgressCallback] = None,
 ) -> ExportResult:
-    base = data_dir or get_data_dir()
+    """
+    Sauvegarde complète, ou incrémentale si `base` (archive précédente du même dossier) :
+    seuls les fichiers dont le SHA-256 diffère de l'état de `base` sont stockés. Taille et
+    mtime inchangés ⇒ empreinte reprise sans relire le fichier.
+
+    Les membres sont lus, hachés et compressés dans un pool de `workers` threads (défaut :
+    min(MAX_PACK_WORKERS, CPU)) puis écrits dans l'ordre ; STORE_EXTENSIONS stockés sans
+    compression, le reste en deflate `compresslevel`. Progression rapportée en octets.
+    """
+    base_dir = data_dir or get_data_dir()
     categories = list(category_ids)
     if not categories:
         raise ValueError("Aucune catégorie sélectionnée")
 
-    files = _collect_files(base, categories)
+    files = _collect_files(base_dir, categories)
     archive_path = Path(archive_path)
     archive_path.parent.mkdir(parents=True, exist_ok=True)
 
-    manifest = BackupManifest(
-        app=APP_DIRNAME,
-        app_version=__version__,
-        backup_version=BACKUP_VERSION,
-        created_at=datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
-        categories=categories,
-        files=[name for _, name in files],
-    )
+    previous: dict[str, BackupEntry] = {}
+    by_hash: dict[str, BackupEntry] = {}
+    parent_name: Optional[str] = None
+    if base is not None:
+        base = Path(base)
+        if base.resolve().parent != archive_path.resolve().parent:
+            raise ValueError("L'archive de base doit être dans le même dossier que la nouvelle sauvegarde")
+        if base.resolve() == archive_path.resolve():
+            raise ValueError("L'archive de base ne peut pas être remplacée par la sauvegarde incrémentale")
+        previous = resolve_entries(base)
+        parent_name = base.name
+        for e in previous.values():
+            by_hash.setdefault(e.sha256, e)
 
     if progress:
-        progress(f"Création de {archive_path.name}…")
+        kind = f"incrémentale (base : {parent_name})" if parent_name else "complète"
+        progress(f"Création de {archive_path.name} — sauvegarde {kind}…")
 
+    entries: dict[str, BackupEntry] = {}
     total_bytes = 0
-    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(MANIFEST_NAME, json.dumps(manifest.to_dict(), indent=2))
-        for fp, name in files:
-            if progress:
-                progress(f"Ajout : {name}")
-            zf.write(fp, arcname=name)
-            total_bytes += fp.stat().st_size
+    stored = 0
+    todo: list[tuple[Path, str]] = []
+    for fp, name in files:
+        st = fp.stat()
+        total_bytes += st.st_size
+        prev = previous.get(name)
+        if prev is not None and prev.size == st.st_size and prev.mtime_ns == st.st_mtime_ns:
+            continue
+        todo.append((fp, name))
+
+    if workers is None:
+        workers = min(MAX_PACK_WORKERS, os.cpu_count() or 1)
+    meter = _ByteProgress(sum(fp.stat().st_size for fp, _ in todo), progress)
+    with open(archive_path, "wb") as fh:
+        zw = _ZipWriter(fh)
+        for fp, name, packed in _pack_ordered(todo, compresslevel, frozenset(by_hash), workers):
+            st = fp.stat()
+            if packed.size < 0:
+                digest = _sha256_file(fp) if previous else None
+            else:
+                digest = packed.sha256
+            same = by_hash.get(digest) if previous and digest else None
+            if same is not None:
+                # Contenu déjà présent dans la chaîne (mtime seul modifié, fichier copié / renommé)
+                entries[name] = BackupEntry(st.st_size, st.st_mtime_ns, digest, same.archive, same.path)
+                meter.advance(st.st_size, name)
+                continue
+            size = st.st_size
+            if packed.payload is not None:
+                _write_packed(zw, fp, name, packed)
+                size = packed.size
+            else:
+                digest = _store_file(zw, fp, name, compresslevel)
+            entries[name] = BackupEntry(size, st.st_mtime_ns, digest, "", name)
+            by_hash.setdefault(digest, BackupEntry(size, st.st_mtime_ns, digest, archive_path.name, name))
+            stored += 1
+            meter.advance(size, name)
+
+        names = {name for _, name in files}
+        manifest = BackupManifest(
+            app=APP_DIRNAME,
+            app_version=__version__,
+            backup_version=BACKUP_VERSION,
+            created_at=datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
+            categories=categories,
+            files=[] if parent_name else [name for _, name in files],
+            entries=entries,
+            parent=parent_name,
+            removed=sorted(n for n in previous if n not in names),
+        )
+        data = json.dumps(manifest.to_dict(), indent=2).encode("utf-8")
+        co = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        zw.write_member(MANIFEST_NAME, datetime.now().timetuple()[:6], 0o600 << 16, zipfile.ZIP_DEFLATED,
+                        zlib.crc32(data), len(data), co.compress(data) + co.flush())
+        zw.close()
 
     if progress:
-        progress(f"Terminé — {len(files)} fichier(s).")
+        if parent_name:
+            progress(f"Terminé — {stored} fichier(s) nouveau(x) ou modifié(s), "
+                     f"{len(files) - stored} référencé(s) dans la chaîne.")
+        else:
+            progress(f"Terminé — {len(files)} fichier(s).")
 
     return ExportResult(
         archive_path=archive_path,
         file_count=len(files),
         total_bytes=total_bytes,
         categories=categories,
+        stored_count=stored,
+        parent=base,
     )
 
 
+def export_incremental_backup(
+    archive_path: Path,
+    category_ids: Iterable[str],
+    *,
+    data_dir: Optional[Path] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> ExportResult:
+    """Sauvegarde incrémentale sur la dernière archive du dossier de destination (complète s'il n'y en a pas)."""
+    archive_path = Path(archive_path)
+    base = None
+    if archive_path.parent.is_dir():
+        base = find_latest_backup(archive_path.parent, exclude=archive_path)
+    return export_backup(archive_path, category_ids, data_dir=data_dir, base=base, progress=progress)
+
+
 def _validate_json_file(path: Path) -> None:
     json.loads(path.read_text(encoding="utf-8"))
 
@@ -387,6 +847,67 @@ def _safety_backup_path(data_dir: Path) -> Path:
     return data_dir.parent / f".{APP_DIRNAME}.pre_restore_{stamp}"
 
 
+def _file_matches(path: Path, info: zipfile.ZipInfo) -> bool:
+    """Fichier identique au membre d'archive : taille puis CRC-32 du répertoire ZIP (sans décompresser)."""
+    try:
+        if path.stat().st_size != info.file_size:
+            return False
+        crc = 0
+        with open(path, "rb") as fh:
+            while chunk := fh.read(HASH_CHUNK):
+                crc = zlib.crc32(chunk, crc)
+    except OSError:
+        return False
+    return crc == info.CRC
+
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    """Copie src → dst ; reflink (blocs partagés, copie sur écriture) si le système de fichiers le permet."""
+    try:
+        import fcntl
+
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copy2(src, dst)
+
+
+def _snapshot_before_restore(
+    base: Path,
+    category_ids: Iterable[str],
+    replaced: set[str],
+    progress: Optional[ProgressCallback] = None,
+) -> Path:
+    """
+    Instantané des catégories restaurées : copie (reflink si possible) des fichiers sur le point
+    d'être remplacés, lien physique pour les autres. La restauration comme les enregistrements
+    de l'application (atomic_write) remplacent les fichiers (nouvel inode) sans les réécrire
+    sur place : les liens conservent le contenu d'origine.
+    """
+    safety_path = _safety_backup_path(base)
+    if progress:
+        progress(f"Sauvegarde de sécurité : {safety_path.name}")
+    copied = linked = 0
+    for fp, name in _collect_files(base, category_ids):
+        dst = safety_path / name
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if name not in replaced and not name.startswith(SNAPSHOT_COPY_PREFIXES):
+            try:
+                os.link(fp, dst)
+                linked += 1
+                continue
+            except OSError:
+                pass  # autre volume, système de fichiers sans liens : copie
+        _clone_or_copy(fp, dst)
+        copied += 1
+    if progress:
+        progress(f"Sauvegarde de sécurité : {copied} fichier(s) copié(s), {linked} lié(s)")
+    return safety_path
+
+
 def restore_backup(
     archive_path: Path,
     category_ids: Optional[Iterable[str]] = None,
@@ -395,6 +916,11 @@ def restore_backup(
     create_safety_backup: bool = True,
     progress: Optional[ProgressCallback] = None,
 ) -> RestoreResult:
+    """
+    Restaure les catégories choisies. Les fichiers déjà identiques à l'archive (taille et CRC-32)
+    ne sont pas réécrits ; la sauvegarde de sécurité ne porte que sur les catégories restaurées
+    et n'est créée que si au moins un fichier existant va être remplacé.
+    """
     base = data_dir or get_data_dir()
     archive_path = Path(archive_path)
     manifest = read_manifest(archive_path)
@@ -410,43 +936,75 @@ def restore_backup(
             raise ValueError(f"Catégorie inconnue : {cid}")
         allowed_prefixes.update(cat.paths)
 
+    def _allowed(name: str) -> bool:
+        return any(name == p or name.startswith(p.rstrip("/") + "/") for p in allowed_prefixes)
+
+    # Chaîne incrémentale : toutes les archives référencées doivent être présentes avant d'écrire
+    state: Optional[dict[str, BackupEntry]] = None
+    if manifest.backup_version >= 2:
+        state = {n: e for n, e in resolve_entries(archive_path, manifest).items() if _allowed(n)}
+        missing = sorted({e.archive for e in state.values() if not (archive_path.parent / e.archive).is_file()})
+        if missing:
+            raise ValueError("Archive(s) de la chaîne introuvable(s) : " + ", ".join(missing))
+
+    restored = skipped = 0
     safety_path: Optional[Path] = None
-    if create_safety_backup and base.exists() and any(base.iterdir()):
-        safety_path = _safety_backup_path(base)
-        if progress:
-            progress(f"Sauvegarde de sécurité : {safety_path.name}")
-        shutil.copytree(base, safety_path)
+    with ExitStack() as stack:
+        zf = stack.enter_context(zipfile.ZipFile(archive_path, "r"))
+        opened: dict[str, zipfile.ZipFile] = {archive_path.name: zf}
+
+        def _source(entry: BackupEntry) -> zipfile.ZipFile:
+            if entry.archive not in opened:
+                opened[entry.archive] = stack.enter_context(
+                    zipfile.ZipFile(archive_path.parent / entry.archive, "r")
+                )
+            return opened[entry.archive]
+
+        # (nom, entrée du manifeste, archive source, membre) ; version 1 : contenu intégral, sans empreintes
+        if state is not None:
+            items = [(n, e, _source(e), _source(e).getinfo(e.path or n)) for n, e in state.items()]
+        else:
+            items = [
+                (i.filename, None, zf, i)
+                for i in zf.infolist()
+                if i.filename != MANIFEST_NAME and not i.is_dir() and _allowed(i.filename)
+            ]
+
+        # Planification : seuls les fichiers absents ou différents sont écrits
+        todo = []
+        for item in items:
+            if _file_matches(base / item[0], item[3]):
+                skipped += 1
+            else:
+                todo.append(item)
+        replaced = {name for name, *_ in todo if (base / name).exists()}
 
-    restored = 0
-    with zipfile.ZipFile(archive_path, "r") as zf:
-        names = [
-            n
-            for n in zf.namelist()
-            if n != MANIFEST_NAME and not n.endswith("/")
-        ]
-        for name in names:
-            if not any(name == p or name.startswith(p.rstrip("/") + "/") for p in allowed_prefixes):
-                continue
+        if create_safety_backup and replaced:
+            safety_path = _snapshot_before_restore(base, selected, replaced, progress)
+
+        for name, entry, source, info in todo:
             if progress:
                 progress(f"Restauration : {name}")
+            data = source.read(info)
+            if entry is not None and hashlib.sha256(data).hexdigest() != entry.sha256:
+                raise ValueError(f"Empreinte SHA-256 invalide : {name} ({entry.archive})")
             dest = base / name
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            data = zf.read(name)
             if name.endswith(".json"):
                 text = data.decode("utf-8")
                 json.loads(text)
                 atomic_write(dest, text)
             else:
-                dest.write_bytes(data)
+                atomic_write_bytes(dest, data)
             restored += 1
 
     if progress:
-        progress(f"Restauration terminée — {restored} fichier(s).")
+        progress(f"Restauration terminée — {restored} fichier(s), {skipped} déjà à jour.")
 
     return RestoreResult(
         categories=selected,
         file_count=restored,
         safety_backup_path=safety_path,
+        skipped_count=skipped,
     )
 
 
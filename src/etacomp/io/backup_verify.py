@@ -0,0 +1,252 @@
+"""
+Vérification d'une archive de sauvegarde (`etacomp-backup verify`) avant de l'emporter hors site.
+
+Chaque membre nécessaire à la restauration (toute la chaîne pour une archive incrémentale)
+est relu en flux par blocs : CRC-32 contrôlé par zipfile en fin de lecture, taille et SHA-256
+comparés au manifeste (version 2), membres JSON analysés en mémoire sans rien écrire sur disque.
+Les membres sont répartis sur un pool de threads (décompression et hachage libèrent le GIL),
+avec une fenêtre bornée : la mémoire ne dépend pas de la taille de l'archive.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .backup import (
+    HASH_CHUNK,
+    MANIFEST_NAME,
+    MAX_PACK_WORKERS,
+    PACK_WINDOW_PER_WORKER,
+    BackupEntry,
+    ProgressCallback,
+    _ByteProgress,
+    format_bytes,
+    read_manifest,
+    resolve_entries,
+)
+
+# Au-delà, un membre JSON n'est pas analysé (seuls CRC et empreinte sont contrôlés)
+JSON_VALIDATE_MAX = 16 * 1024 * 1024
+
+# (archive, membre ZIP, nom restauré, entrée du manifeste ou None pour une archive version 1)
+Member = Tuple[str, str, str, Optional[BackupEntry]]
+
+
+@dataclass
+class VerifyReport:
+    """Bilan de vérification d'une archive."""
+    archive_path: Path
+    archives: List[str] = field(default_factory=list)   # archives relues (chaîne incluse)
+    checked: int = 0
+    total_bytes: int = 0                                  # octets décompressés relus
+    failures: List[Tuple[str, str]] = field(default_factory=list)   # (membre, motif)
+    json_unchecked: int = 0                               # JSON trop volumineux pour être analysés
+    workers: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    @property
+    def throughput(self) -> float:
+        """Octets décompressés vérifiés par seconde."""
+        return self.total_bytes / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary_lines(self) -> List[str]:
+        lines = [
+            f"Archive : {self.archive_path.name}"
+            + (f" (chaîne : {', '.join(self.archives)})" if len(self.archives) > 1 else ""),
+            f"Fichiers vérifiés : {self.checked} — erreurs : {len(self.failures)}",
+            f"Durée : {self.elapsed_s:.2f} s — {format_bytes(self.total_bytes)} "
+            f"({format_bytes(int(self.throughput))}/s, {self.workers} thread(s))",
+        ]
+        if self.json_unchecked:
+            lines.append(f"JSON non analysés (> {format_bytes(JSON_VALIDATE_MAX)}) : {self.json_unchecked}")
+        for name, reason in self.failures:
+            lines.append(f"  ERREUR {name} : {reason}")
+        lines.append("Archive valide." if self.ok else "Archive INVALIDE : ne pas l'utiliser comme seule copie.")
+        return lines
+
+
+class _Readers:
+    """Un ZipFile par thread et par archive : lectures concurrentes sans verrou partagé."""
+
+    def __init__(self, folder: Path):
+        self._folder = folder
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stacks: List[ExitStack] = []
+
+    def get(self, archive: str) -> zipfile.ZipFile:
+        opened = getattr(self._local, "opened", None)
+        if opened is None:
+            opened = self._local.opened = {}
+            stack = self._local.stack = ExitStack()
+            with self._lock:
+                self._stacks.append(stack)
+        if archive not in opened:
+            opened[archive] = self._local.stack.enter_context(zipfile.ZipFile(self._folder / archive, "r"))
+        return opened[archive]
+
+    def close(self) -> None:
+        with self._lock:
+            for stack in self._stacks:
+                stack.close()
+            self._stacks.clear()
+
+
+def _check_member(readers: _Readers, member: Member) -> Tuple[int, Optional[str], bool]:
+    """Relit un membre en flux ; retourne (octets lus, erreur ou None, JSON non analysé)."""
+    archive, path, name, entry = member
+    digest = hashlib.sha256()
+    size = 0
+    is_json = name.endswith(".json")
+    parts: Optional[List[bytes]] = [] if is_json else None
+    try:
+        with readers.get(archive).open(path, "r") as fh:   # BadZipFile si le CRC-32 diffère
+            while chunk := fh.read(HASH_CHUNK):
+                size += len(chunk)
+                digest.update(chunk)
+                if parts is not None:
+                    if size > JSON_VALIDATE_MAX:
+                        parts = None
+                    else:
+                        parts.append(chunk)
+    except KeyError:
+        return size, f"absent de {archive}", False
+    except (zipfile.BadZipFile, OSError, EOFError, zlib.error) as exc:
+        return size, str(exc) or type(exc).__name__, False
+    if entry is not None:
+        if size != entry.size:
+            return size, f"taille {size} au lieu de {entry.size}", False
+        if digest.hexdigest() != entry.sha256:
+            return size, "empreinte SHA-256 différente du manifeste", False
+    if parts is not None:
+        try:
+            json.loads(b"".join(parts).decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as exc:
+            return size, f"JSON invalide : {exc}", False
+    return size, None, is_json and parts is None
+
+
+def _members(archive_path: Path, report: VerifyReport) -> Tuple[List[Member], Dict[str, int]]:
+    """Membres à relire et taille attendue de chacun ; archives manquantes de la chaîne → erreurs."""
+    manifest = read_manifest(archive_path)
+    folder = archive_path.parent
+    members: List[Member] = []
+    sizes: Dict[str, int] = {}
+    if manifest.backup_version >= 2:
+        state = resolve_entries(archive_path, manifest)
+        archives = sorted({e.archive for e in state.values()}, key=lambda a: (a != archive_path.name, a))
+        report.archives = [a for a in archives if (folder / a).is_file()]
+        for missing in sorted(set(archives) - set(report.archives)):
+            report.failures.append((missing, "archive de la chaîne introuvable"))
+        for name, e in state.items():
+            if e.archive in report.archives:
+                members.append((e.archive, e.path or name, name, e))
+                sizes[name] = e.size
+    else:
+        # Archive version 1 : pas d'empreintes, CRC-32 et JSON seulement
+        report.archives = [archive_path.name]
+        with zipfile.ZipFile(archive_path, "r") as zf:
+            for info in zf.infolist():
+                if info.filename != MANIFEST_NAME and not info.is_dir():
+                    members.append((archive_path.name, info.filename, info.filename, None))
+                    sizes[info.filename] = info.file_size
+    return members, sizes
+
+
+def verify_backup(
+    archive_path: Path,
+    *,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> VerifyReport:
+    """
+    Vérifie une archive (et sa chaîne incrémentale) sans rien extraire.
+    `workers` : threads de lecture (défaut : min(CPU, MAX_PACK_WORKERS)).
+    Lève ValueError si le manifeste est absent ou illisible.
+    """
+    t0 = time.perf_counter()
+    archive_path = Path(archive_path)
+    n = max(1, workers or min(os.cpu_count() or 1, MAX_PACK_WORKERS))
+    report = VerifyReport(archive_path=archive_path, workers=n)
+    members, sizes = _members(archive_path, report)
+    meter = _ByteProgress(sum(sizes.values()), progress)
+    readers = _Readers(archive_path.parent)
+
+    def _record(member: Member, outcome: Tuple[int, Optional[str], bool]) -> None:
+        size, error, json_unchecked = outcome
+        report.checked += 1
+        report.total_bytes += size
+        report.json_unchecked += json_unchecked
+        if error is not None:
+            report.failures.append((member[2], error))
+        meter.advance(size, member[2])
+
+    try:
+        if n == 1:
+            for m in members:
+                _record(m, _check_member(readers, m))
+        else:
+            window = n * PACK_WINDOW_PER_WORKER
+            pending: deque = deque()
+            with ThreadPoolExecutor(max_workers=n, thread_name_prefix="backup-verify") as pool:
+                for m in members:
+                    pending.append((m, pool.submit(_check_member, readers, m)))
+                    if len(pending) >= window:
+                        done, fut = pending.popleft()
+                        _record(done, fut.result())
+                while pending:
+                    done, fut = pending.popleft()
+                    _record(done, fut.result())
+    finally:
+        readers.close()
+
+    report.elapsed_s = time.perf_counter() - t0
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI : `etacomp-backup verify ARCHIVE`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="etacomp-backup verify",
+        description="Relit toute l'archive (CRC-32, empreintes SHA-256 du manifeste, JSON) sans l'extraire",
+    )
+    parser.add_argument("archive", type=Path, help="Archive EtaComp_backup_*.zip")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Threads de lecture (défaut : nombre de CPU, au plus {MAX_PACK_WORKERS})")
+    parser.add_argument("--quiet", action="store_true", help="Sans progression")
+    args = parser.parse_args(argv)
+
+    if not args.archive.is_file():
+        print(f"Archive introuvable : {args.archive}")
+        return 2
+    try:
+        report = verify_backup(args.archive, workers=args.workers,
+                               progress=None if args.quiet else lambda m: print(f"  {m}"))
+    except (ValueError, zipfile.BadZipFile) as exc:
+        print(f"Archive illisible : {exc}")
+        return 2
+    print("\n".join(report.summary_lines()))
+    return 0 if report.ok else 3
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""Registre mémoire des comparateurs (référence → profil), invalidé par fichier."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from ..models.comparator import Comparator
+
+logger = logging.getLogger(__name__)
+
+# (st_mtime_ns, st_size) — suffisant pour détecter une réécriture du fichier
+_StatKey = Tuple[int, int]
+
+
+class ComparatorRegistry(QObject):
+    """
+    Index process-wide des profils de la bibliothèque `comparators/`.
+
+    - Chargement unique, puis revalidation fichier par fichier (mtime/taille) :
+      seuls les JSON modifiés sont relus et revalidés par pydantic.
+    - Le répertoire est rescanné si son propre mtime a changé (ajout, suppression,
+      remplacement atomique — toutes les écritures de l'application passent par
+      atomic_write) ; sinon `get()` ne re-stat que le fichier de la référence demandée
+      (relu seul s'il a été édité en place) et `all()` chaque fichier. Une référence
+      inconnue reste inconnue tant que le mtime du répertoire ne change pas : aucun
+      balayage par appel (rescan complet : `refresh(force=True)`).
+    - Les écritures passant par `io/storage` mettent le registre à jour directement.
+    - `changed` est émis dès que le contenu de la bibliothèque a changé.
+
+    Les profils retournés sont partagés : ne pas les modifier en place.
+    """
+
+    changed = Signal()
+
+    def __init__(self, directory: Callable[[], Path]):
+        super().__init__()
+        self._directory = directory
+        self._lock = threading.RLock()
+        self._dir: Optional[Path] = None
+        self._dir_key: Optional[_StatKey] = None
+        self._files: Dict[str, Tuple[_StatKey, Optional[Comparator]]] = {}
+        self._by_ref: Dict[str, Comparator] = {}
+        self._file_by_ref: Dict[str, str] = {}
+
+    # ----- lecture -----
+    def get(self, reference: Optional[str]) -> Optional[Comparator]:
+        """Profil de la référence donnée, ou None."""
+        if not reference:
+            return None
+        with self._lock:
+            changed = self._ensure_fresh()
+            name = self._file_by_ref.get(reference)
+            if name is not None and self._file_changed(name):
+                # Édition en place (même inode, mtime du répertoire inchangé) : ce fichier seul
+                self._reload_file(name)
+                changed = True
+            comp = self._by_ref.get(reference)
+        if changed:
+            self.changed.emit()
+        return comp
+
+    def __contains__(self, reference: object) -> bool:
+        return isinstance(reference, str) and self.get(reference) is not None
+
+    def all(self) -> List[Comparator]:
+        """Profils valides, triés par nom de fichier (ordre historique de list_comparators)."""
+        with self._lock:
+            changed = self._ensure_fresh(force=True)
+            comps = [c for _, (_, c) in sorted(self._files.items()) if c is not None]
+        if changed:
+            self.changed.emit()
+        return comps
+
+    def references(self) -> List[str]:
+        return [c.reference for c in self.all()]
+
+    # ----- invalidation -----
+    def refresh(self, *, force: bool = False) -> bool:
+        """
+        Revalide la bibliothèque. Avec force=True, tous les fichiers sont re-stat
+        même si le répertoire n'a pas changé (comme le fait `all()`).
+        Retourne True si le contenu a changé.
+        """
+        with self._lock:
+            changed = self._ensure_fresh(force=force)
+        if changed:
+            self.changed.emit()
+        return changed
+
+    def invalidate(self) -> None:
+        """Oublie tout : le prochain accès recharge la bibliothèque complète."""
+        with self._lock:
+            self._dir = None
+            self._dir_key = None
+            self._files.clear()
+            self._by_ref.clear()
+            self._file_by_ref.clear()
+
+    def notify_saved(self, path: Path) -> None:
+        """Prend en compte un fichier écrit par l'application (sans rescanner le répertoire)."""
+        with self._lock:
+            if self._dir is None or Path(path).parent != self._dir:
+                self.invalidate()
+            else:
+                self._load_file(Path(path))
+                self._dir_key = self._stat_key(self._dir)
+                self._rebuild_index()
+        self.changed.emit()
+
+    def notify_deleted(self, path: Path) -> None:
+        """Retire un fichier supprimé par l'application."""
+        with self._lock:
+            if self._dir is None or Path(path).parent != self._dir:
+                self.invalidate()
+            else:
+                self._files.pop(Path(path).name, None)
+                self._dir_key = self._stat_key(self._dir)
+                self._rebuild_index()
+        self.changed.emit()
+
+    # ----- interne -----
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[_StatKey]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _ensure_fresh(self, *, force: bool = False) -> bool:
+        """Resynchronise le cache (verrou tenu) ; `changed` est émis par l'appelant, hors verrou."""
+        d = self._directory()
+        dir_key = self._stat_key(d)
+        if not force and d == self._dir and dir_key is not None and dir_key == self._dir_key:
+            return False
+        if d != self._dir:
+            self._files.clear()
+        changed = self._rescan(d)
+        self._dir = d
+        self._dir_key = dir_key
+        if changed:
+            self._rebuild_index()
+        return changed
+
+    def _reload_file(self, name: str) -> None:
+        fp = self._dir / name
+        if self._stat_key(fp) is None:
+            self._files.pop(name, None)
+        else:
+            self._load_file(fp)
+        self._rebuild_index()
+
+    def _file_changed(self, name: str) -> bool:
+        cached = self._files.get(name)
+        return cached is None or self._dir is None or self._stat_key(self._dir / name) != cached[0]
+
+    def _rescan(self, d: Path) -> bool:
+        """Compare le répertoire au cache ; ne relit que les fichiers nouveaux ou modifiés."""
+        seen: set[str] = set()
+        changed = False
+        try:
+            entries = list(os.scandir(d))
+        except OSError as exc:
+            logger.warning("Bibliothèque comparateurs illisible (%s) : %s", d, exc)
+            entries = []
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            seen.add(entry.name)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._files.get(entry.name)
+            if cached is not None and cached[0] == key:
+                continue
+            self._load_file(Path(entry.path), key)
+            changed = True
+        for name in [n for n in self._files if n not in seen]:
+            del self._files[name]
+            changed = True
+        return changed
+
+    def _load_file(self, fp: Path, key: Optional[_StatKey] = None) -> None:
+        if key is None:
+            key = self._stat_key(fp) or (0, 0)
+        try:
+            data = json.loads(fp.read_text(encoding="utf-8"))
+            comp: Optional[Comparator] = Comparator.model_validate(data)
+        except Exception as exc:
+            logger.warning("Comparateur ignoré (%s) : %s", fp.name, exc)
+            comp = None
+        self._files[fp.name] = (key, comp)
+
+    def _rebuild_index(self) -> None:
+        by_ref: Dict[str, Comparator] = {}
+        file_by_ref: Dict[str, str] = {}
+        for name, (_, comp) in sorted(self._files.items()):
+            if comp is not None and comp.reference not in by_ref:
+                # Premier fichier (ordre alphabétique) prioritaire, comme l'ancien balayage
+                by_ref[comp.reference] = comp
+                file_by_ref[comp.reference] = name
+        self._by_ref = by_ref
+        self._file_by_ref = file_by_ref
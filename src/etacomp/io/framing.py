@@ -0,0 +1,65 @@
+"""Découpage incrémental du flux série (lignes CR/LF/CRLF, trames à terminateur) et masque 7 bits."""
+from __future__ import annotations
+
+from typing import List, Optional
+
+# Table bytes.translate : bit 7 forcé à 0 (afficheurs TESA en 7 bits + parité)
+MASK_7BIT = bytes(b & 0x7F for b in range(256))
+
+
+def mask_7bit(data: bytes) -> bytes:
+    return bytes(data).translate(MASK_7BIT)
+
+
+def hex_dump(data: bytes) -> str:
+    """"2B 30 2E" — même rendu que " ".join(f"{b:02X}" ...)."""
+    return bytes(data).hex(" ").upper()
+
+
+class LineFramer:
+    """
+    Assemble les trames d'un flux reçu par morceaux.
+
+    - eol=None : lignes séparées par CR, LF ou CRLF (séparateur exclu, lignes vides ignorées) ;
+    - eol=b"\\r\\n" / b"\\r" / b"\\n" : trames terminées exactement par eol (terminateur inclus).
+
+    Seuls les octets nouvellement ajoutés sont recherchés (rfind) ; le découpage se fait
+    en C (splitlines / split) et le tampon n'est réécrit qu'une fois par appel, pour
+    retirer les trames consommées.
+    """
+
+    def __init__(self, eol: Optional[bytes] = None):
+        self._eol = bytes(eol) if eol else None
+        self._buf = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def pending(self) -> bytes:
+        """Octets reçus sans terminateur (trame en cours)."""
+        return bytes(self._buf)
+
+    def clear(self) -> None:
+        self._buf.clear()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        buf = self._buf
+        eol = self._eol
+        # Un terminateur multi-octets peut chevaucher l'ancien et le nouveau morceau
+        scan = max(0, len(buf) - (len(eol) - 1 if eol else 0))
+        buf += chunk
+        if eol is None:
+            # Dernier séparateur : recherche arrière, limitée en pratique au morceau reçu
+            last = max(buf.rfind(b"\n", scan), buf.rfind(b"\r", scan))
+            if last < 0:
+                return []
+            end = last + 1
+            out = [line for line in bytes(buf[:end]).splitlines() if line]
+        else:
+            last = buf.rfind(eol, scan)
+            if last < 0:
+                return []
+            end = last + len(eol)
+            out = [part + eol for part in bytes(buf[:last]).split(eol)]
+        del buf[:end]
+        return out
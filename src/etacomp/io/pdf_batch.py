@@ -0,0 +1,269 @@
+"""
+Export PDF par lots (`etacomp-export`) : rapports de vérification d'une sélection de
+sessions archivées (dossier, période, comparateurs, détenteur).
+
+Les documents sont rendus dans un pool de processus ; chaque processus charge une seule
+fois la configuration d'export, les règles de tolérances et les données de référence
+(bancs étalon, détenteurs), puis enchaîne les sessions qui lui sont confiées.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dtime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# En dessous, le rendu reste dans le processus courant (démarrage du pool plus coûteux)
+PARALLEL_MIN_DOCS = 4
+
+# (session, n° de document, dossier de sortie, métadonnées fixes)
+Job = Tuple[str, int, Optional[str], bool]
+# (session, PDF produit ou None, erreur ou None)
+Outcome = Tuple[str, Optional[str], Optional[str]]
+
+# Contexte du processus : chargé une fois par _init_worker
+_worker: Dict[str, object] = {}
+
+
+@dataclass
+class BatchReport:
+    """Bilan d'un export par lots."""
+    exported: List[Tuple[Path, Path]] = field(default_factory=list)   # (session, PDF)
+    failures: List[Tuple[Path, str]] = field(default_factory=list)    # (session, motif)
+    workers: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.exported) + len(self.failures)
+
+    @property
+    def throughput(self) -> float:
+        """Documents produits par seconde."""
+        return len(self.exported) / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary_lines(self) -> List[str]:
+        mode = f"{self.workers} processus" if self.workers else "processus courant"
+        lines = [
+            f"Sessions : {self.total} — PDF générés : {len(self.exported)} — échecs : {len(self.failures)}",
+            f"Durée : {self.elapsed_s:.2f} s ({self.throughput:.2f} document(s)/s, {mode})",
+        ]
+        for path, reason in self.failures:
+            lines.append(f"  ÉCHEC {path.name} : {reason}")
+        return lines
+
+
+def _init_worker() -> None:
+    """Chargement unique par processus : configuration d'export, règles, bancs et détenteurs."""
+    from ..config.export_config import load_export_config
+    from ..rules.tolerances import get_default_rules_path
+    from ..rules.tolerance_engine import ToleranceRuleEngine
+    from .pdf_exporter import ExportContext
+
+    rules = None
+    try:
+        path = get_default_rules_path()
+        if path.exists():
+            rules = ToleranceRuleEngine.load(path)
+    except Exception as exc:
+        logger.warning("Export par lots : règles de tolérances illisibles, verdict omis : %s", exc)
+    _worker.update(config=load_export_config(), rules=rules, context=ExportContext.load())
+
+
+def _export_one(job: Job) -> Outcome:
+    """Rend le PDF d'une session ; l'erreur est renvoyée plutôt que levée."""
+    from ..core.calculation_engine import CalculationEngine
+    from ..core.session_adapter import build_session_from_runtime
+    from ..rules.verdict import evaluate_tolerances
+    from .pdf_exporter import export_pdf
+    from .storage import load_session_file
+
+    src, doc_no, output_dir, deterministic = job
+    if not _worker:
+        _init_worker()
+    try:
+        rt = load_session_file(Path(src))
+        if not rt.has_measures():
+            return src, None, "session sans mesures"
+        v2 = build_session_from_runtime(rt)
+        results = CalculationEngine().compute(v2)
+        verdict = None
+        if _worker["rules"] is not None:
+            verdict = evaluate_tolerances(v2.comparator_snapshot or {}, results, _worker["rules"])
+        out = export_pdf(
+            rt, _worker["config"], results, verdict, doc_no,
+            output_dir=Path(output_dir) if output_dir else None,
+            context=_worker["context"],
+            deterministic=deterministic,
+        )
+        return src, str(out), None
+    except Exception as exc:
+        return src, None, str(exc) or type(exc).__name__
+
+
+def _run(jobs: Sequence[Job], workers: Optional[int], progress: Optional[Callable[[Outcome], None]]) -> Tuple[List[Outcome], int]:
+    """Rendu des jobs ; retourne (résultats dans l'ordre des jobs, nombre de processus utilisés)."""
+    out: List[Outcome] = []
+    if workers != 0 and len(jobs) >= PARALLEL_MIN_DOCS:
+        n = min(workers or os.cpu_count() or 1, len(jobs))
+        try:
+            with ProcessPoolExecutor(max_workers=n, initializer=_init_worker) as pool:
+                for outcome in pool.map(_export_one, jobs, chunksize=max(1, len(jobs) // (n * 4))):
+                    out.append(outcome)
+                    if progress:
+                        progress(outcome)
+            return out, n
+        except Exception as exc:
+            logger.warning("Export par lots : pool de processus indisponible, rendu local : %s", exc)
+            jobs = jobs[len(out):]
+    _worker.clear()
+    _init_worker()
+    for job in jobs:
+        outcome = _export_one(job)
+        out.append(outcome)
+        if progress:
+            progress(outcome)
+    return out, 0
+
+
+def export_batch(
+    sessions: Iterable[Path],
+    *,
+    output_dir: Optional[Path] = None,
+    first_no: int = 1,
+    workers: Optional[int] = None,
+    deterministic: bool = False,
+    progress: Optional[Callable[[Outcome], None]] = None,
+) -> BatchReport:
+    """
+    Exporte un PDF par session, numérotés à partir de `first_no` dans l'ordre fourni.
+
+    - `output_dir` : dossier des PDF (défaut : exports/ du dossier de données).
+    - `workers` : processus du pool (0 : processus courant, défaut : nombre de CPU) ;
+      en dessous de PARALLEL_MIN_DOCS sessions, tout est rendu dans le processus courant.
+    - `deterministic` : métadonnées PDF fixes (voir export_pdf).
+    Un PDF déjà présent avec la même empreinte de contenu est réutilisé, pas regénéré.
+    """
+    t0 = time.perf_counter()
+    out_dir = str(output_dir) if output_dir is not None else None
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    jobs: List[Job] = [(str(p), first_no + i, out_dir, deterministic) for i, p in enumerate(sessions)]
+    outcomes, used = _run(jobs, workers, progress)
+
+    report = BatchReport(workers=used)
+    for src, pdf, error in outcomes:
+        if error is None:
+            report.exported.append((Path(src), Path(pdf)))
+        else:
+            report.failures.append((Path(src), error))
+    report.elapsed_s = time.perf_counter() - t0
+    return report
+
+
+def select_sessions(
+    *,
+    directory: Optional[Path] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    comparator_refs: Optional[Sequence[str]] = None,
+    holder_ref: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Path]:
+    """
+    Sessions correspondant aux filtres (bornes de date inclusives), de la plus ancienne
+    à la plus récente. `directory` : autre dossier de sessions que celui de l'application
+    (indexé dans un catalogue temporaire).
+    """
+    from .session_catalog import SessionCatalog
+    from .storage import session_catalog
+
+    filters = dict(
+        comparator_refs=list(comparator_refs) if comparator_refs else None,
+        holder_ref=holder_ref,
+        date_from=datetime.combine(date_from, dtime.min) if date_from else None,
+        date_to=datetime.combine(date_to, dtime.max) if date_to else None,
+        limit=limit,
+    )
+    if directory is None:
+        entries = session_catalog.query(**filters)
+    else:
+        with tempfile.TemporaryDirectory(prefix="etacomp-export-") as tmp:
+            catalog = SessionCatalog(lambda: Path(directory), lambda: Path(tmp) / "catalog.sqlite")
+            entries = catalog.query(**filters)
+    return [e.path for e in reversed(entries)]
+
+
+def _parse_date(text: str) -> date:
+    import argparse
+
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date invalide (AAAA-MM-JJ attendu) : {text}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI : export PDF d'une sélection de sessions archivées."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="etacomp-export",
+        description="Génère les rapports de vérification PDF d'une sélection de sessions",
+    )
+    parser.add_argument("--dir", type=Path, help="Dossier de sessions (défaut : sessions de l'application)")
+    parser.add_argument("--from", dest="date_from", type=_parse_date, help="Date de début incluse (AAAA-MM-JJ)")
+    parser.add_argument("--to", dest="date_to", type=_parse_date, help="Date de fin incluse (AAAA-MM-JJ)")
+    parser.add_argument("--comparator", action="append", dest="comparators", metavar="REF",
+                        help="Référence comparateur (option répétable)")
+    parser.add_argument("--detenteur", help="Code ES du détenteur")
+    parser.add_argument("--limit", type=int, help="Nombre maximal de sessions (les plus récentes)")
+    parser.add_argument("--output", type=Path, help="Dossier des PDF (défaut : exports/ des données)")
+    parser.add_argument("--first-no", type=int, default=1, help="Premier n° de document (défaut 1)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processus du pool (0 : aucun, défaut : nombre de CPU)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Métadonnées fixes : mêmes sessions ⇒ mêmes fichiers PDF")
+    parser.add_argument("--dry-run", action="store_true", help="Liste la sélection sans générer de PDF")
+    args = parser.parse_args(argv)
+
+    if args.dir is not None and not args.dir.is_dir():
+        print(f"Dossier introuvable : {args.dir}")
+        return 2
+    sessions = select_sessions(
+        directory=args.dir,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        comparator_refs=args.comparators,
+        holder_ref=args.detenteur.strip().upper() if args.detenteur else None,
+        limit=args.limit,
+    )
+    if not sessions:
+        print("Aucune session ne correspond à la sélection.")
+        return 1
+    if args.dry_run:
+        print("\n".join(str(p) for p in sessions))
+        print(f"{len(sessions)} session(s) sélectionnée(s).")
+        return 0
+
+    def _progress(outcome: Outcome) -> None:
+        src, pdf, error = outcome
+        print(f"  {Path(src).name} → {pdf}" if error is None else f"  {Path(src).name} : {error}")
+
+    report = export_batch(sessions, output_dir=args.output, first_no=args.first_no,
+                          workers=args.workers, deterministic=args.deterministic, progress=_progress)
+    print("\n".join(report.summary_lines()))
+    return 0 if not report.failures else 3
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -1,13 +1,20 @@
 """Export PDF — rapport de vérification EtaComp2K25."""
 from __future__ import annotations
 
+import enum
+import hashlib
 import io
+import json
 import logging
-from datetime import datetime
+import math
+import threading
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 from pathlib import Path
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -34,6 +41,11 @@ PAGE_W, PAGE_H = A4
 CONTENT_W = PAGE_W - 2 * MARGIN_LR
 CONTENT_H = PAGE_H - 2 * MARGIN_TB
 
+# Empreinte de contenu écrite dans les mots-clés du PDF (réexport servi depuis exports/).
+# Incrémenter RENDER_VERSION à chaque changement de mise en page pour invalider les PDF existants.
+RENDER_VERSION = 2
+EXPORT_KEY_PREFIX = "etacomp-export:"
+
 
 def _none_str(val: Any) -> str:
     """Retourne '—' si val est None ou vide."""
@@ -276,6 +288,175 @@ def add_plot_image(
     canvas_obj.drawImage(img, x, y - h, width=w, height=h, mask="auto")
 
 
+PLOT_BACKENDS = ("vector", "matplotlib")
+
+# Couleurs des courbes (identiques aux couleurs par défaut de Matplotlib)
+PLOT_UP_COLOR = colors.HexColor("#1f77b4")
+PLOT_DOWN_COLOR = colors.HexColor("#ff7f0e")
+
+
+def _nice_step(span: float, max_ticks: int = 6) -> float:
+    """Pas de graduation 1/2/5 × 10^n donnant au plus max_ticks intervalles."""
+    if span <= 0:
+        return 1.0
+    raw = span / max_ticks
+    mag = 10 ** math.floor(math.log10(raw))
+    for m in (1, 2, 5, 10):
+        if raw <= m * mag:
+            return m * mag
+    return 10 * mag
+
+
+def _fmt_tick(v: float, step: float) -> str:
+    decimals = max(0, -int(math.floor(math.log10(step)))) if step < 1 else 0
+    return f"{v:.{decimals}f}"
+
+
+def _error_series_um(calibration_points: List[Dict], key: str) -> List[Optional[float]]:
+    return [(p[key] * 1000.0) if p.get(key) is not None else None for p in calibration_points]
+
+
+def draw_error_plot(
+    canvas_obj,
+    x: float,
+    y_top: float,
+    w: float,
+    h: float,
+    calibration_points: List[Dict],
+    emt_limit_mm: Optional[float] = None,
+) -> None:
+    """
+    Trace le graphique des erreurs (µm) en vectoriel dans le rectangle (x, y_top, w, h) :
+    axes, une graduation par cible, courbes montée / descente, zéro et ±Emt.
+    """
+    points = calibration_points or [{"target_mm": 0, "up_error_mm": 0, "down_error_mm": 0}]
+    xs = [float(p["target_mm"]) for p in points]
+    up = _error_series_um(points, "up_error_mm")
+    down = _error_series_um(points, "down_error_mm")
+    emt_um = emt_limit_mm * 1000.0 if emt_limit_mm is not None and emt_limit_mm > 0 else None
+
+    # Échelles : 0, données et ±Emt visibles
+    ys = [v for v in up + down if v is not None] + [0.0]
+    if emt_um is not None:
+        ys += [emt_um, -emt_um]
+    y_min, y_max = min(ys), max(ys)
+    pad = (y_max - y_min) * 0.1 or 1.0
+    step = _nice_step(y_max - y_min + 2 * pad)
+    y_min = math.floor((y_min - pad) / step) * step
+    y_max = math.ceil((y_max + pad) / step) * step
+    x_min, x_max = min(xs), max(xs)
+    if x_max - x_min < 1e-9:
+        x_min, x_max = x_min - 1.0, x_max + 1.0
+    x_pad = (x_max - x_min) * 0.04
+
+    font_size = 6
+    left = x + 10 * mm
+    bottom = y_top - h + 8 * mm
+    pw = w - 10 * mm - 2 * mm
+    ph = h - 8 * mm - 2 * mm
+
+    def px(v: float) -> float:
+        return left + (v - x_min + x_pad) / (x_max - x_min + 2 * x_pad) * pw
+
+    def py(v: float) -> float:
+        return bottom + (v - y_min) / (y_max - y_min) * ph
+
+    c = canvas_obj
+    c.saveState()
+    c.setFont("Helvetica", font_size)
+
+    # Graduations Y + grille légère
+    c.setLineWidth(0.25)
+    n_y = int(round((y_max - y_min) / step))
+    for i in range(n_y + 1):
+        v = y_min + i * step
+        c.setStrokeColor(colors.HexColor("#e0e0e0"))
+        c.line(left, py(v), left + pw, py(v))
+        c.setFillColor(colors.black)
+        c.drawRightString(left - 1 * mm, py(v) - font_size / 3, _fmt_tick(v, step))
+
+    # Graduations X : une par cible (étiquettes espacées si trop serrées)
+    label_w = max(c.stringWidth(f"{v:.1f}", "Helvetica", font_size) for v in xs) + 1 * mm
+    last_label_x = None
+    c.setStrokeColor(colors.black)
+    for v in xs:
+        c.line(px(v), bottom, px(v), bottom - 1 * mm)
+        if last_label_x is None or px(v) - last_label_x >= label_w:
+            c.drawCentredString(px(v), bottom - 1 * mm - font_size, f"{v:.1f}")
+            last_label_x = px(v)
+
+    # Cadre et titres d'axes
+    c.setLineWidth(0.5)
+    c.rect(left, bottom, pw, ph, fill=0, stroke=1)
+    c.drawCentredString(left + pw / 2, y_top - h + 0.5 * mm, "Cible (mm)")
+    c.saveState()
+    c.translate(x + 2 * mm, bottom + ph / 2)
+    c.rotate(90)
+    c.drawCentredString(0, 0, "Erreur (µm)")
+    c.restoreState()
+
+    # Zéro et ±Emt
+    c.setLineWidth(0.5)
+    c.setStrokeColor(colors.gray)
+    c.setDash(3, 2)
+    c.line(left, py(0.0), left + pw, py(0.0))
+    if emt_um is not None:
+        c.setStrokeColor(colors.red)
+        c.setDash(1, 1.5)
+        for v in (emt_um, -emt_um):
+            c.line(left, py(v), left + pw, py(v))
+    c.setDash()
+
+    # Courbes : segments entre points consécutifs renseignés
+    marker = 1.3
+    for values, color, square in ((up, PLOT_UP_COLOR, False), (down, PLOT_DOWN_COLOR, True)):
+        c.setStrokeColor(color)
+        c.setFillColor(color)
+        c.setLineWidth(0.9)
+        path = c.beginPath()
+        pen_down = False
+        for xv, yv in zip(xs, values):
+            if yv is None:
+                pen_down = False
+                continue
+            if pen_down:
+                path.lineTo(px(xv), py(yv))
+            else:
+                path.moveTo(px(xv), py(yv))
+                pen_down = True
+        c.drawPath(path, stroke=1, fill=0)
+        for xv, yv in zip(xs, values):
+            if yv is None:
+                continue
+            if square:
+                c.rect(px(xv) - marker, py(yv) - marker, 2 * marker, 2 * marker, stroke=0, fill=1)
+            else:
+                c.circle(px(xv), py(yv), marker, stroke=0, fill=1)
+
+    # Légende (coin supérieur droit)
+    c.setFillColor(colors.white)
+    c.setStrokeColor(colors.HexColor("#c0c0c0"))
+    c.setLineWidth(0.3)
+    leg_w, leg_h = 24 * mm, 8 * mm
+    leg_x, leg_y = left + pw - leg_w - 1 * mm, bottom + ph - leg_h - 1 * mm
+    c.rect(leg_x, leg_y, leg_w, leg_h, fill=1, stroke=1)
+    for i, (label, color, square) in enumerate((("Montée (µm)", PLOT_UP_COLOR, False),
+                                                ("Descente (µm)", PLOT_DOWN_COLOR, True))):
+        ly = leg_y + leg_h - (i + 1) * 3.5 * mm + 0.8 * mm
+        c.setStrokeColor(color)
+        c.setFillColor(color)
+        c.setLineWidth(0.9)
+        c.line(leg_x + 1.5 * mm, ly + font_size / 3, leg_x + 5.5 * mm, ly + font_size / 3)
+        if square:
+            c.rect(leg_x + 3.5 * mm - marker, ly + font_size / 3 - marker, 2 * marker, 2 * marker, stroke=0, fill=1)
+        else:
+            c.circle(leg_x + 3.5 * mm, ly + font_size / 3, marker, stroke=0, fill=1)
+        c.setFillColor(colors.black)
+        c.drawString(leg_x + 7 * mm, ly, label)
+
+    c.restoreState()
+
+
 def _build_error_plot_png(
     calibration_points: List[Dict],
     emt_limit_mm: Optional[float] = None,
@@ -283,7 +464,7 @@ def _build_error_plot_png(
     height_inch: float = 2.5,
     dpi: int = 150,
 ) -> bytes:
-    """Génère le graphique des erreurs en PNG (bytes)."""
+    """Graphique des erreurs en PNG (bytes) via Matplotlib — repli de draw_error_plot."""
     import matplotlib
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt
@@ -325,13 +506,126 @@ def _build_error_plot_png(
     return buf.getvalue()
 
 
-def _get_detenteur_display(holder_ref: Optional[str]) -> str:
+@lru_cache(maxsize=32)
+def _cached_error_plot_png(points: Tuple[Tuple[float, Optional[float], Optional[float]], ...],
+                           emt_limit_mm: Optional[float]) -> bytes:
+    """PNG Matplotlib mis en cache par (points, Emt) : réexport sans nouveau rendu."""
+    return _build_error_plot_png(
+        [{"target_mm": t, "up_error_mm": u, "down_error_mm": d} for t, u, d in points],
+        emt_limit_mm=emt_limit_mm, width_inch=5.0, height_inch=2.5, dpi=150,
+    )
+
+
+# Logos décodés, par (chemin, mtime, taille)
+_logo_cache: Dict[Tuple[str, int, int], Any] = {}
+
+
+def _logo_reader(path: Path):
+    """ImageReader du logo (relu uniquement si le fichier a changé), ou None si absent."""
+    from reportlab.lib.utils import ImageReader
+
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    reader = _logo_cache.get(key)
+    if reader is None:
+        reader = ImageReader(io.BytesIO(path.read_bytes()))
+        _logo_cache.clear()
+        _logo_cache[key] = reader
+    return reader
+
+
+def _file_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class ExportContext:
+    """
+    Données de référence du rapport (bancs étalon, détenteurs), lues une fois et
+    réutilisées pour plusieurs documents (export par lots). Les profils comparateurs
+    passent déjà par le registre process-wide de io/storage.py.
+    """
+    bancs: List[Any] = field(default_factory=list)
+    detenteurs: List[Any] = field(default_factory=list)
+
+    @classmethod
+    def load(cls) -> "ExportContext":
+        from ..io.storage import list_bancs_etalon, list_detenteurs
+        return cls(bancs=list_bancs_etalon(), detenteurs=list_detenteurs())
+
+    @classmethod
+    def cached(cls) -> "ExportContext":
+        """Contexte partagé, relu seulement si bancs_etalon.json / detenteurs.json ont changé."""
+        from ..config.paths import get_data_dir
+        from ..io.storage import BANCS_ETALON_FILE, DETENTEURS_FILE
+
+        d = get_data_dir()
+        key = (str(d), _file_key(d / BANCS_ETALON_FILE), _file_key(d / DETENTEURS_FILE))
+        with _context_lock:
+            hit = _context_cache.get(key)
+            if hit is None:
+                hit = cls.load()
+                _context_cache.clear()
+                _context_cache[key] = hit
+            return hit
+
+    @property
+    def default_banc(self):
+        return next((b for b in self.bancs if b.is_default), None)
+
+    def banc(self, reference: Optional[str]):
+        return next((b for b in self.bancs if b.reference == reference), None)
+
+
+_context_lock = threading.Lock()
+_context_cache: Dict[Tuple, ExportContext] = {}
+
+
+def _canonical(obj: Any) -> Any:
+    """Sérialisation JSON stable des entrées du rapport (modèles pydantic, dataclasses, enums…)."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    return repr(obj)
+
+
+def export_fingerprint(**inputs: Any) -> str:
+    """Empreinte SHA-256 des entrées d'un rapport : identique ⇒ PDF identique (au n° près)."""
+    payload = json.dumps({"render": RENDER_VERSION, **inputs}, default=_canonical,
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _pdf_has_key(path: Path, key: str) -> bool:
+    """Le PDF porte-t-il cette empreinte dans ses mots-clés (dictionnaire /Info non compressé) ?"""
+    try:
+        return (EXPORT_KEY_PREFIX + key).encode("ascii") in path.read_bytes()
+    except OSError:
+        return False
+
+
+def _get_detenteur_display(holder_ref: Optional[str], context: Optional[ExportContext] = None) -> str:
     """Retourne 'code_es — libellé' ou '—'."""
     if not holder_ref or not str(holder_ref).strip():
         return "—"
-    from ..io.storage import list_detenteurs
+    if context is None:
+        from ..io.storage import list_detenteurs
+        detenteurs = list_detenteurs()
+    else:
+        detenteurs = context.detenteurs
     code = str(holder_ref).strip().upper()
-    for d in list_detenteurs():
+    for d in detenteurs:
         if d.code_es.strip().upper() == code:
             return d.display_name()
     return str(holder_ref)
@@ -344,6 +638,12 @@ def export_pdf(
     verdict: Optional["Verdict"],
     doc_no: int,
     output_path: Optional[Path] = None,
+    *,
+    output_dir: Optional[Path] = None,
+    context: Optional[ExportContext] = None,
+    plot_backend: str = "vector",
+    deterministic: bool = False,
+    use_cache: bool = True,
 ) -> Path:
     """
     Exporte un rapport de vérification PDF.
@@ -355,36 +655,64 @@ def export_pdf(
         verdict: Verdict tolérances ou None
         doc_no: Numéro d'ordre du document (saisi par l'utilisateur)
         output_path: Chemin de sortie optionnel
+        output_dir: Dossier de sortie si output_path absent (défaut : exports/ des données)
+        context: Bancs / détenteurs déjà chargés (défaut : relus depuis le disque)
+        plot_backend: "vector" (tracé ReportLab) ou "matplotlib" (image PNG, optionnel)
+        deterministic: Métadonnées fixes (date de création, /ID) : mêmes entrées ⇒ mêmes octets
+        use_cache: Sans output_path, réutilise un PDF de même empreinte déjà présent dans le dossier
 
     Returns:
-        Chemin du fichier PDF généré
+        Chemin du fichier PDF généré (ou réutilisé)
     """
     from ..config.paths import get_data_dir
     from ..core.session_adapter import build_session_from_runtime
-    from ..io.storage import get_default_banc_etalon, list_comparators, list_bancs_etalon
+    from ..io.storage import get_comparator
 
-    logger.info("Export PDF : construction SessionV2")
-    v2 = build_session_from_runtime(rt_session)
+    if plot_backend not in PLOT_BACKENDS:
+        raise ValueError(f"Rendu de courbe inconnu : {plot_backend}")
+    if context is None:
+        context = ExportContext.cached()
     now = datetime.now()
     doc_ref = f"{now.strftime('%y%m%d')}{doc_no:03d}"
     logger.info("Export PDF : n° document %s", doc_ref)
 
-    # Chemin de sortie (ne pas écraser un fichier existant)
+    # Entrées de l'en-tête et du cartouche session (registre comparateurs, contexte en mémoire)
+    comp_ref = getattr(rt_session, "comparator_ref", None)
+    comp = get_comparator(comp_ref)
+    banc = context.default_banc
+    banc_ref_session = getattr(rt_session, "banc_ref", None)
+    banc_obj = banc
+    if banc_ref_session:
+        banc_obj = context.banc(banc_ref_session) or banc
+    detenteur_val = _get_detenteur_display(getattr(rt_session, "holder_ref", None), context)
+    img_path = (export_config.image_path or "").strip()
+    logo_file = Path(img_path) if img_path else None
+
+    key = export_fingerprint(
+        session=rt_session, config=export_config, results=results, verdict=verdict,
+        doc_ref=doc_ref, comparator=comp, banc=banc, banc_session=banc_obj, detenteur=detenteur_val,
+        logo=_file_key(logo_file) if logo_file else None, plot=plot_backend, deterministic=deterministic,
+    )
+
+    # Chemin de sortie (ne pas écraser un fichier existant ; même empreinte ⇒ PDF réutilisé)
     if output_path is None:
-        exports_dir = get_data_dir() / "exports"
+        exports_dir = Path(output_dir) if output_dir is not None else get_data_dir() / "exports"
         exports_dir.mkdir(parents=True, exist_ok=True)
         from .safe_filename import sanitize_filename
-        comp_ref = sanitize_filename(_none_str(rt_session.comparator_ref) or "sans_ref")
-        base_name = f"{comp_ref}_{doc_ref}.pdf"
-        output_path = exports_dir / base_name
+        safe_ref = sanitize_filename(_none_str(comp_ref) or "sans_ref")
+        output_path = exports_dir / f"{safe_ref}_{doc_ref}.pdf"
         suffix = 1
         while output_path.exists():
-            output_path = exports_dir / f"{comp_ref}_{doc_ref}_{suffix}.pdf"
+            if use_cache and _pdf_has_key(output_path, key):
+                logger.info("Export PDF : contenu inchangé, réutilisation de %s", output_path)
+                return output_path
+            output_path = exports_dir / f"{safe_ref}_{doc_ref}_{suffix}.pdf"
             suffix += 1
 
     logger.info("Export PDF : écriture vers %s", output_path)
-    c = canvas.Canvas(str(output_path), pagesize=A4)
+    c = canvas.Canvas(str(output_path), pagesize=A4, invariant=1 if deterministic else 0)
     c.setTitle(export_config.document_title or "Rapport de vérification")
+    c.setKeywords(EXPORT_KEY_PREFIX + key)
 
     # Y courant (coordonnée reportlab : bas = 0)
     y = PAGE_H - MARGIN_TB
@@ -397,20 +725,15 @@ def export_pdf(
     c.rect(MARGIN_LR, y - header_h, CONTENT_W, header_h, fill=1, stroke=1)
     c.setFillColor(colors.black)
 
-    # Logo à gauche : centré en hauteur
-    img_path = (export_config.image_path or "").strip()
+    # Logo à gauche : centré en hauteur (décodage mis en cache)
     logo_w, logo_h = 18 * mm, 18 * mm
     logo_zone_h = logo_h + 6 * mm
     logo_bottom = y - header_h + (header_h - logo_zone_h) / 2
-    if img_path:
+    if logo_file is not None:
         try:
-            p = Path(img_path)
-            if p.exists():
-                from reportlab.lib.utils import ImageReader
-                with open(p, "rb") as f:
-                    logo = ImageReader(f)
+            if logo_file.exists():
                 c.drawImage(
-                    logo, MARGIN_LR + pad, logo_bottom,
+                    _logo_reader(logo_file), MARGIN_LR + pad, logo_bottom,
                     width=logo_w, height=logo_h,
                     mask="auto",
                 )
@@ -438,14 +761,6 @@ def export_pdf(
     y -= header_h
 
     # ---- B. CARTOUCHE SESSION (2 colonnes) ----
-    comp = None
-    comp_ref = getattr(rt_session, "comparator_ref", None)
-    if comp_ref:
-        for c_obj in list_comparators():
-            if c_obj.reference == comp_ref:
-                comp = c_obj
-                break
-
     period = getattr(comp, "periodicite_controle_mois", 12) if comp else 12
     session_date = getattr(rt_session, "date", None) or now
     if hasattr(session_date, "strftime"):
@@ -461,7 +776,6 @@ def export_pdf(
         session_dt = now
     next_check_str = "—"
     try:
-        from datetime import date
         d = session_dt.date() if hasattr(session_dt, "date") else (session_dt if isinstance(session_dt, date) else now.date())
         year, month = d.year, d.month
         month += period
@@ -473,15 +787,7 @@ def export_pdf(
     except Exception:
         pass
 
-    banc = get_default_banc_etalon()
-    banc_ref_session = getattr(rt_session, "banc_ref", None)
     banc_display = _none_str(banc_ref_session) if banc_ref_session else (banc.reference if banc else "—")
-    banc_obj = banc
-    if banc_ref_session:
-        for b in list_bancs_etalon():
-            if b.reference == banc_ref_session:
-                banc_obj = b
-                break
     banc_date_validite = getattr(banc_obj, "date_validite", None) if banc_obj else None
 
     rows_left = [
@@ -497,7 +803,6 @@ def export_pdf(
         ("Référence étalon", banc_display),
         ("Humidité (%)", getattr(rt_session, "humidity_pct", None)),
     ]
-    detenteur_val = _get_detenteur_display(getattr(rt_session, "holder_ref", None))
 
     # Bloc session : rect d'abord, contenu à l'intérieur (éviter texte hors cadre)
     session_pad = 5 * mm
@@ -529,13 +834,6 @@ def export_pdf(
     emt_limit = None
     if verdict and verdict.limits and "Emt" in verdict.limits:
         emt_limit = verdict.limits["Emt"]
-    plot_png = _build_error_plot_png(
-        results.calibration_points or [],
-        emt_limit_mm=emt_limit,
-        width_inch=5.0,
-        height_inch=2.5,
-        dpi=150,
-    )
     plot_h = 45 * mm
     plot_w = min(CONTENT_W, 130 * mm)
     block_c_pad = 4 * mm
@@ -547,7 +845,20 @@ def export_pdf(
     c.drawString(MARGIN_LR + block_c_pad, y_title, "Courbe d'étalonnage")
     y_plot = y_title - 5 * mm
     plot_x = MARGIN_LR + (CONTENT_W - plot_w) / 2
-    add_plot_image(c, plot_x, y_plot, plot_w, plot_h, plot_png)
+    plot_png = None
+    if plot_backend == "matplotlib":
+        try:
+            plot_png = _cached_error_plot_png(
+                tuple((p["target_mm"], p.get("up_error_mm"), p.get("down_error_mm"))
+                      for p in results.calibration_points or []),
+                emt_limit,
+            )
+        except ImportError as exc:
+            logger.warning("Export PDF : Matplotlib indisponible, courbe vectorielle : %s", exc)
+    if plot_png is not None:
+        add_plot_image(c, plot_x, y_plot, plot_w, plot_h, plot_png)
+    else:
+        draw_error_plot(c, plot_x, y_plot, plot_w, plot_h, results.calibration_points or [], emt_limit_mm=emt_limit)
     c.setFont("Helvetica", 7)
     c.drawString(MARGIN_LR + block_c_pad, y_plot - plot_h - 4 * mm, "Montée (•) / Descente (■) — Erreur en µm")
     y -= block_gap
@@ -577,7 +888,9 @@ def export_pdf(
     y -= block_gap
 
     # ---- E. BLOC OBSERVATIONS ----
-    obs = getattr(rt_session, "observations", None) or getattr(v2, "notes", None) or ""
+    obs = getattr(rt_session, "observations", None)
+    if not obs:
+        obs = getattr(build_session_from_runtime(rt_session), "notes", None) or ""
     obs_str = _none_str(obs)
     title_pad = 3 * mm
     y -= title_pad
@@ -644,22 +957,25 @@ def export_pdf(
     return Path(output_path)
 
 
-def _cli_last_session() -> None:
+def _cli_last_session(comparator_ref: Optional[str] = None) -> None:
     """CLI : export avec la dernière session du disque (test manuel)."""
     import sys
     from ..config.export_config import load_export_config
     from ..core.session_adapter import build_session_from_runtime
     from ..core.calculation_engine import CalculationEngine
-    from ..io.storage import list_sessions, load_session_file
+    from ..io.storage import load_session_file, session_catalog
     from ..rules.tolerance_engine import ToleranceRuleEngine
     from ..rules.verdict import evaluate_tolerances
     from ..rules.tolerances import get_default_rules_path
 
-    sessions = list_sessions()
-    if not sessions:
-        print("Aucune session enregistrée. Enregistrez une session depuis l'application.")
+    entry = session_catalog.latest(comparator_ref)
+    if entry is None:
+        if comparator_ref:
+            print(f"Aucune session enregistrée pour le comparateur {comparator_ref}.")
+        else:
+            print("Aucune session enregistrée. Enregistrez une session depuis l'application.")
         sys.exit(1)
-    rt = load_session_file(sessions[0])
+    rt = load_session_file(entry.path)
     if not rt.has_measures():
         print("Dernière session sans mesures.")
         sys.exit(1)
@@ -686,9 +1002,13 @@ def main() -> None:
     """Point d'entrée CLI pour test manuel."""
     import sys
     if "--last-session" in sys.argv:
-        _cli_last_session()
+        comparator_ref = None
+        if "--comparator" in sys.argv:
+            i = sys.argv.index("--comparator")
+            comparator_ref = sys.argv[i + 1] if i + 1 < len(sys.argv) else None
+        _cli_last_session(comparator_ref)
     else:
-        print("Usage: python -m etacomp.io.pdf_exporter --last-session")
+        print("Usage: python -m etacomp.io.pdf_exporter --last-session [--comparator REF]")
 
 
 if __name__ == "__main__":
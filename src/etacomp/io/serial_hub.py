@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+from ..config.tesa import load_port_config
+from .serial_manager import SerialManager, serial_manager
+
+logger = logging.getLogger(__name__)
+
+# Port historique : le singleton serial_manager utilisé par les onglets existants
+DEFAULT_PORT_ID = "principal"
+
+
+class SerialHub(QObject):
+    """
+    Plusieurs instruments série simultanés sur un même poste.
+
+    Chaque port nommé est un SerialManager (connexion + thread lecteur propres, configuration
+    TESA/ASCII propre) : un port lent ou bloqué ne retarde pas les autres. Les signaux des
+    ports sont relayés, préfixés par l'identifiant du port.
+    """
+
+    connected_changed = Signal(str, bool)            # port_id, ouvert
+    line_received = Signal(str, str, object)         # port_id, raw_text, parsed_value (float|None)
+    tesa_value = Signal(str, float, str, str, str, float)  # port_id, value, display, raw_hex, raw_ascii, ts
+    debug = Signal(str, str)                         # port_id, message
+    error = Signal(str, str)                         # port_id, message
+    ports_changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._ports: Dict[str, SerialManager] = {}
+        self._relays: Dict[str, List[Tuple]] = {}   # port_id → [(signal, relais)]
+
+    # --------- PORTS ---------
+    def add_port(self, port_id: str, manager: Optional[SerialManager] = None,
+                 config: Optional[dict] = None) -> SerialManager:
+        """
+        Déclare un port nommé. `config` : dictionnaire TESA/ASCII (défaut : configuration
+        enregistrée pour ce port, cf. config.tesa.load_port_config). Un manager fourni
+        (ex. le singleton historique) garde sa configuration si `config` est omis.
+        """
+        port_id = str(port_id).strip()
+        if not port_id:
+            raise ValueError("Identifiant de port vide")
+        if port_id in self._ports:
+            raise ValueError(f"Port déjà déclaré : {port_id}")
+        if manager is None:
+            manager = SerialManager()
+            if config is None:
+                config = self._load_config(port_id)
+        if config is not None:
+            manager.apply_config(config)
+        self._wire(port_id, manager)
+        self._ports[port_id] = manager
+        self.ports_changed.emit()
+        return manager
+
+    def remove_port(self, port_id: str) -> None:
+        """Ferme le port et cesse de relayer ses signaux."""
+        manager = self._ports.pop(port_id, None)
+        if manager is None:
+            return
+        try:
+            manager.close()
+        except Exception as exc:
+            logger.warning("Fermeture port %s : %s", port_id, exc)
+        # Seuls les relais du hub sont retirés : les abonnés directs du manager restent
+        for sig, relay in self._relays.pop(port_id, []):
+            try:
+                sig.disconnect(relay)
+            except Exception:
+                pass
+        self.ports_changed.emit()
+
+    def port(self, port_id: str) -> SerialManager:
+        """SerialManager du port (KeyError si inconnu)."""
+        return self._ports[port_id]
+
+    def ports(self) -> List[str]:
+        return list(self._ports)
+
+    def __contains__(self, port_id: str) -> bool:
+        return port_id in self._ports
+
+    # --------- CONFIG ---------
+    def configure(self, port_id: str, config: Optional[dict] = None) -> None:
+        """(Re)applique la configuration du port (défaut : configuration enregistrée)."""
+        self.port(port_id).apply_config(config if config is not None else self._load_config(port_id))
+
+    @staticmethod
+    def _load_config(port_id: str) -> dict:
+        try:
+            return load_port_config(port_id)
+        except Exception as exc:
+            logger.warning("Configuration du port %s illisible, valeurs par défaut : %s", port_id, exc)
+            return {}
+
+    # --------- OPEN/CLOSE ---------
+    def open(self, port_id: str, device: Optional[str] = None, baudrate: Optional[int] = None) -> None:
+        """Ouvre le port ; device/baudrate par défaut : ceux de la configuration du port."""
+        manager = self.port(port_id)
+        if device is None or baudrate is None:
+            cfg = self._load_config(port_id)
+            device = device or cfg.get("device") or ""
+            baudrate = int(baudrate or cfg.get("baudrate") or 4800)
+        if not device:
+            raise ValueError(f"Aucun périphérique configuré pour le port {port_id}")
+        manager.open(device, baudrate)
+
+    def close(self, port_id: str) -> None:
+        self.port(port_id).close()
+
+    def close_all(self) -> None:
+        """Ferme tous les ports (idempotent ; une erreur sur un port n'empêche pas les autres)."""
+        for port_id, manager in list(self._ports.items()):
+            try:
+                manager.close()
+            except Exception as exc:
+                logger.warning("Fermeture port %s : %s", port_id, exc)
+
+    def is_open(self, port_id: str) -> bool:
+        manager = self._ports.get(port_id)
+        return bool(manager and manager.is_open())
+
+    def open_ports(self) -> List[str]:
+        return [pid for pid, m in self._ports.items() if m.is_open()]
+
+    # --------- ENVOI ---------
+    def send_text(self, port_id: str, text: str, eol: bytes | None = None) -> None:
+        self.port(port_id).send_text(text, eol)
+
+    # --------- INTERNE ---------
+    def _wire(self, port_id: str, manager: SerialManager) -> None:
+        # Relais direct, dans le thread lecteur du port : les récepteurs QObject d'un autre
+        # thread (UI) reçoivent l'appel en file ; aucun port n'attend la boucle Qt d'un autre.
+        relays = [
+            (manager.connected_changed, lambda opened: self.connected_changed.emit(port_id, opened)),
+            (manager.line_received, lambda raw, val: self.line_received.emit(port_id, raw, val)),
+            (manager.tesa_value, lambda value, display, raw_hex, raw_ascii, ts:
+                self.tesa_value.emit(port_id, value, display, raw_hex, raw_ascii, ts)),
+            (manager.debug, lambda msg: self.debug.emit(port_id, msg)),
+            (manager.error, lambda msg: self.error.emit(port_id, msg)),
+        ]
+        for sig, relay in relays:
+            sig.connect(relay, Qt.ConnectionType.DirectConnection)
+        self._relays[port_id] = relays
+
+
+# Singleton global : le port historique y est déclaré sous DEFAULT_PORT_ID
+serial_hub = SerialHub()
+serial_hub.add_port(DEFAULT_PORT_ID, serial_manager)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+from time import perf_counter
 from typing import Optional, Tuple
 from PySide6.QtCore import QObject, Signal
 
 logger = logging.getLogger(__name__)
 
+from ..core.latency import TracedReading, latency_tracker
+from .acquisition import AcquisitionProcess
 from .serialio import SerialConnection, SerialReaderThread
 from .tesa_reader import TesaSerialReader
 
@@ -45,6 +48,9 @@ class SerialManager(QObject):
         self._tesa_value_regex = r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+"
         self._tesa_decimals = 3
         self._tesa_decimal_display = "dot"
+        self._read_mode = "event"     # 'event' (attente bloquante) | 'poll' (boucle historique)
+        self._acquisition = "thread"  # 'thread' | 'process' (lecteur TESA dans un processus dédié)
+        self._port_args: Optional[Tuple[str, int]] = None   # (port, baudrate) du dernier open()
 
     # --------- CONFIG PARSE ASCII ---------
     def set_ascii_config(self, *, regex_pattern: str, decimal_comma: bool):
@@ -98,13 +104,27 @@ class SerialManager(QObject):
 
     # --------- ÉTAT ---------
     def is_open(self) -> bool:
+        if isinstance(self._reader, AcquisitionProcess):
+            return self._reader.is_alive()
         return self._conn.is_open()
 
+    def acquisition_stats(self) -> dict:
+        """Compteurs du mode processus (trames écrites, livrées, dépassements) ; {} en mode thread."""
+        if isinstance(self._reader, AcquisitionProcess):
+            return self._reader.stats()
+        return {}
+
+    def _use_process(self) -> bool:
+        return self._tesa_enabled and self._acquisition == "process"
+
     # --------- OPEN/CLOSE ---------
     def open(self, port: str, baudrate: int):
-        if self._conn.is_open():
+        if self.is_open():
             return
-        self._conn.open(port=port, baudrate=baudrate)
+        self._port_args = (port, int(baudrate))
+        if not self._use_process():
+            # Mode processus : le port est ouvert par le processus d'acquisition
+            self._conn.open(port=port, baudrate=baudrate)
         self._start_reader()
         self.connected_changed.emit(True)
 
@@ -112,6 +132,7 @@ class SerialManager(QObject):
         """Arrête le thread lecteur et libère le port COM (Windows : débloquer read avant join)."""
         if not self.is_open() and self._reader is None:
             return
+        self._port_args = None
         reader = self._reader
         self._reader = None
         if reader:
@@ -136,6 +157,9 @@ class SerialManager(QObject):
 
     # --------- ENVOI ---------
     def send_text(self, text: str, eol: bytes | None = None):
+        if isinstance(self._reader, AcquisitionProcess):
+            self._reader.write(text.encode() + (eol or b""))
+            return
         self._conn.write_text(text, append_eol=eol)
 
     # --------- DIAG ---------
@@ -144,6 +168,34 @@ class SerialManager(QObject):
 
     # --------- INTERNE ---------
     def _start_reader(self):
+        if self._use_process():
+            if self._port_args is None:
+                return
+            # Le port doit être libre pour le processus d'acquisition (Windows : accès exclusif)
+            self._conn.close()
+            port, baudrate = self._port_args
+            self._reader = AcquisitionProcess(
+                port,
+                baudrate,
+                on_value=self._on_tesa_value,
+                on_debug=self.debug.emit,
+                on_error=self.error.emit,
+                frame_mode=self._tesa_frame_mode,
+                silence_ms=self._tesa_silence_ms,
+                eol=self._tesa_eol,
+                mask_7bit=self._tesa_mask7,
+                strip_chars=self._tesa_strip,
+                value_regex=self._tesa_value_regex,
+                decimals=self._tesa_decimals,
+                decimal_display=self._tesa_decimal_display,
+                read_mode=self._read_mode,
+            )
+            self._reader.start()
+            return
+        if not self._conn.is_open() and self._port_args is not None:
+            # Retour du mode processus : le port est rouvert dans ce processus
+            port, baudrate = self._port_args
+            self._conn.open(port=port, baudrate=baudrate)
         if self._tesa_enabled:
             self._reader = TesaSerialReader(
                 self._conn,
@@ -158,6 +210,7 @@ class SerialManager(QObject):
                 value_regex=self._tesa_value_regex,
                 decimals=self._tesa_decimals,
                 decimal_display=self._tesa_decimal_display,
+                read_mode=self._read_mode,
             )
         else:
             self._reader = SerialReaderThread(
@@ -168,6 +221,7 @@ class SerialManager(QObject):
                 on_raw=(self._on_raw if self._raw_debug_enabled else None),
                 regex_pattern=self._regex_pattern,
                 decimal_comma=self._decimal_comma,
+                read_mode=self._read_mode,
             )
         self._reader.start()
 
@@ -180,7 +234,16 @@ class SerialManager(QObject):
             except Exception as exc:
                 logger.warning("Arrêt lecteur série : %s", exc)
 
+    @staticmethod
+    def _traced(value):
+        """Étape « signal » ; mode processus : float reçu de l'anneau, la trace démarre ici."""
+        if latency_tracker.enabled and value is not None and getattr(value, "stamps", None) is None:
+            return TracedReading(value, {"signal": perf_counter()})
+        latency_tracker.mark(value, "signal")
+        return value
+
     def _on_line(self, raw: str, value: float | None):
+        value = self._traced(value)
         self.line_received.emit(raw, value)
 
     def _on_raw(self, data: bytes):
@@ -192,6 +255,7 @@ class SerialManager(QObject):
 
     def _on_tesa_value(self, value: float, display: str, raw_hex: str, raw_ascii: str, ts: float):
         # Compatibilité: émettre aussi line_received pour l’UI existante (MeasuresTab)
+        value = self._traced(value)
         self.line_received.emit(raw_ascii, value)
         self.tesa_value.emit(value, display, raw_hex, raw_ascii, ts)
 
@@ -208,6 +272,8 @@ class SerialManager(QObject):
         value_regex: str = r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+",
         decimals: int = 3,
         decimal_display: str = "dot",
+        read_mode: str = "event",
+        acquisition: str = "thread",
     ):
         self._tesa_enabled = bool(enabled)
         self._tesa_frame_mode = (frame_mode or "silence").lower()
@@ -218,10 +284,27 @@ class SerialManager(QObject):
         self._tesa_value_regex = value_regex or r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+"
         self._tesa_decimals = int(decimals)
         self._tesa_decimal_display = (decimal_display or "dot")
+        self._read_mode = "poll" if str(read_mode or "").lower() == "poll" else "event"
+        self._acquisition = "process" if str(acquisition or "").lower() == "process" else "thread"
         if self.is_open():
             self._stop_reader()
             self._start_reader()
 
+    def apply_config(self, cfg: dict):
+        """
+        Applique un dictionnaire de configuration (cf. config.tesa.load_port_config) :
+        clés TESA, parse ASCII (regex_pattern, decimal_comma). Un seul redémarrage du lecteur.
+        """
+        cfg = cfg or {}
+        self._regex_pattern = cfg.get("regex_pattern") or self._regex_pattern
+        self._decimal_comma = bool(cfg.get("decimal_comma", self._decimal_comma))
+        keys = ("enabled", "frame_mode", "silence_ms", "eol", "mask_7bit", "strip_chars",
+                "value_regex", "decimals", "decimal_display", "read_mode", "acquisition")
+        tesa = {k: cfg[k] for k in keys if k in cfg}
+        tesa.setdefault("enabled", self._tesa_enabled)
+        # Redémarre le lecteur (une seule fois) si le port est ouvert
+        self.set_tesa_reader_config(**tesa)
+
 
 # Singleton global
 serial_manager = SerialManager()
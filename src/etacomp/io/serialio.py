@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+import select
 import threading
 import time
 from typing import Optional, Callable
@@ -8,8 +10,15 @@ from typing import Optional, Callable
 import serial
 from serial.tools import list_ports
 
+from ..core.latency import latency_tracker
+from .framing import LineFramer
+
 def list_serial_ports() -> list[str]:
-    return [p.device for p in list_ports.comports()]
+    """Ports détectés + ports supplémentaires de ETACOMP_EXTRA_SERIAL_PORTS (ex. instrument virtuel)."""
+    ports = [p.device for p in list_ports.comports()]
+    extra = os.environ.get("ETACOMP_EXTRA_SERIAL_PORTS", "")
+    ports += [p for p in extra.split(os.pathsep) if p and p not in ports]
+    return ports
 
 class SerialConnection:
     """Wrapper pyserial robuste (Windows/Arduino/RS232-friendly)."""
@@ -78,6 +87,45 @@ class SerialConnection:
         except Exception:
             return None
 
+    def read_wait(self, timeout: float) -> Optional[bytes]:
+        """
+        Attend des octets au plus `timeout` s sans attente active, puis retourne tout
+        ce qui est disponible (None si rien reçu dans le délai).
+        - POSIX : select() sur le descripteur du port ;
+        - sans descripteur (Windows, loop://, rfc2217) : lecture bloquante pyserial, timeout
+          de lecture du port réglé sur l'attente demandée.
+        """
+        ser = self._ser
+        if ser is None or not ser.is_open:
+            return None
+        timeout = max(0.0, float(timeout))
+        try:
+            n = ser.in_waiting
+            if n:
+                return ser.read(n)
+            try:
+                fd = ser.fileno()
+            except (OSError, AttributeError):
+                fd = None   # Windows, loop://, rfc2217 : pas de descripteur (UnsupportedOperation)
+            if fd is not None:
+                ready, _, _ = select.select([fd], [], [], timeout)
+                if not ready:
+                    return None
+                n = ser.in_waiting
+                b = ser.read(n or 1)
+                return b if b else None
+            if ser.timeout is None or abs(ser.timeout - timeout) > 1e-3:
+                ser.timeout = timeout
+            b = ser.read(1)
+            if not b:
+                return None
+            n = ser.in_waiting
+            return b + ser.read(n) if n else b
+        except Exception:
+            # Port débranché / fermé pendant l'attente : ne pas boucler à vide
+            time.sleep(min(timeout, 0.05))
+            return None
+
     def write_text(self, s: str, append_eol: Optional[bytes] = None):
         if not self.is_open():
             return
@@ -105,7 +153,10 @@ class SerialReaderThread:
     Lit en continu, assemble des lignes (CR/LF/CRLF), et parse selon config ASCII.
     - on_line(raw_text, parsed_float_or_None)
     - on_debug(msg), on_error(msg)
+    - read_mode "event" : attente bloquante (read_wait) ; "poll" : read_chunk() + sleep
     """
+
+    IDLE_WAIT_S = 0.25
     def __init__(
         self,
         conn: SerialConnection,
@@ -116,6 +167,7 @@ class SerialReaderThread:
         *,
         regex_pattern: str = r"[-+]?\d+(?:[.,]\d+)?",
         decimal_comma: bool = False,
+        read_mode: str = "event",
     ):
         self._conn = conn
         self._on_line = on_line
@@ -124,10 +176,11 @@ class SerialReaderThread:
         self._on_raw = on_raw
         self._stop = threading.Event()
         self._th: Optional[threading.Thread] = None
-        self._buf = bytearray()
+        self._framer = LineFramer()  # CR, LF ou CRLF
         # config ASCII
         self._pattern = re.compile(regex_pattern)
         self._decimal_comma = decimal_comma
+        self._read_mode = (read_mode or "event").lower()
 
     def start(self):
         self._stop.clear()
@@ -154,31 +207,19 @@ class SerialReaderThread:
             try: self._on_error(msg)
             except Exception: pass
 
-    def _emit_lines_from_buffer(self):
-        if not self._buf:
-            return
-        data = self._buf.replace(b"\r\n", b"\n")
-        parts = []
-        start = 0
-        for i, b in enumerate(data):
-            if b in (0x0A, 0x0D):
-                if i > start:
-                    parts.append(data[start:i])
-                start = i + 1
-        remainder = data[start:] if start < len(data) else b""
-        for chunk in parts:
+    def _emit_lines(self, lines: list[bytes], rx: Optional[float] = None):
+        for chunk in lines:
             try:
                 text = chunk.decode(errors="ignore").strip()
             except Exception as e:
                 self._err(f"decode error: {e!r}")
                 text = ""
             if text:
-                val = self._parse_float(text)
+                val = latency_tracker.start(self._parse_float(text), rx=rx)
                 try:
                     self._on_line(text, val)
                 except Exception as e:
                     self._err(f"on_line callback error: {e!r}")
-        self._buf = bytearray(remainder)
 
     def _parse_float(self, text: str) -> Optional[float]:
         # 1) Essai avec le motif configuré
@@ -226,17 +267,20 @@ class SerialReaderThread:
 
     def _run(self):
         try:
+            event = self._read_mode == "event" and hasattr(self._conn, "read_wait")
             while not self._stop.is_set():
-                chunk = self._conn.read_chunk()
+                chunk = self._conn.read_wait(self.IDLE_WAIT_S) if event else self._conn.read_chunk()
                 if chunk:
+                    rx = time.perf_counter()
                     if self._on_raw:
                         try:
                             self._on_raw(chunk)
                         except Exception:
                             pass
-                    self._buf.extend(chunk)
-                    self._emit_lines_from_buffer()
-                else:
+                    lines = self._framer.feed(chunk)
+                    if lines:
+                        self._emit_lines(lines, rx)
+                elif not event:
                     time.sleep(0.01)
         except Exception as e:
             self._err(f"serial thread crash: {e!r}")
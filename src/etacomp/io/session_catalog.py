@@ -0,0 +1,531 @@
+"""Catalogue SQLite des sessions enregistrées (historique sans relire chaque JSON)."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..models.session import Session
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SCHEMA_VERSION = 3
+# Incrémenté quand le calcul du verdict change (verdict.py) : force la réévaluation de la colonne
+VERDICT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    filename         TEXT PRIMARY KEY,
+    mtime_ns         INTEGER NOT NULL,
+    size             INTEGER NOT NULL,
+    comparator_ref   TEXT,
+    holder_ref       TEXT,
+    banc_ref         TEXT,
+    operator         TEXT,
+    date             TEXT,
+    series_count     INTEGER,
+    readings         INTEGER,
+    fidelity_samples INTEGER,
+    emt              REAL,
+    eml              REAL,
+    eh               REAL,
+    ef               REAL,
+    verdict          TEXT,
+    range_type       TEXT,
+    graduation       REAL,
+    course           REAL,
+    library_profile  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_comparator ON sessions(comparator_ref, date);
+CREATE INDEX IF NOT EXISTS idx_sessions_holder ON sessions(holder_ref, date);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(date);
+"""
+
+_COLUMNS = (
+    "filename", "mtime_ns", "size", "comparator_ref", "holder_ref", "banc_ref",
+    "operator", "date", "series_count", "readings", "fidelity_samples",
+    "emt", "eml", "eh", "ef", "verdict",
+    "range_type", "graduation", "course", "library_profile",
+)
+
+
+@dataclass(frozen=True)
+class SessionEntry:
+    """Ligne du catalogue : métadonnées et résultats d'une session enregistrée."""
+    path: Path
+    mtime_ns: int
+    size: int
+    comparator_ref: Optional[str]
+    holder_ref: Optional[str]
+    banc_ref: Optional[str]
+    operator: Optional[str]
+    date: Optional[datetime]
+    series_count: int
+    readings: int
+    fidelity_samples: int
+    emt: Optional[float] = None
+    eml: Optional[float] = None
+    eh: Optional[float] = None
+    ef: Optional[float] = None
+    verdict: Optional[str] = None  # valeur de VerdictStatus, None si non calculé
+    range_type: Optional[str] = None  # profil comparateur utilisé pour le verdict
+    graduation: Optional[float] = None
+    course: Optional[float] = None
+
+
+def _opt_float(v) -> Optional[float]:
+    try:
+        return float(v) if v is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _summarize_many(sessions: List[Session], tol_engine=None) -> List[Dict]:
+    """
+    Métadonnées + Emt/Eml/Eh/Ef/verdict et profil comparateur (famille, graduation,
+    course) de plusieurs sessions (résultats None si incalculables). Les calculs
+    passent par le mode batch vectorisé du moteur ; le verdict est celui de `_verdict`
+    sur ces colonnes (réévaluable sans relire les fichiers).
+    """
+    rows: List[Dict] = []
+    for s in sessions:
+        rows.append({
+            "comparator_ref": s.comparator_ref,
+            "holder_ref": s.holder_ref,
+            "banc_ref": s.banc_ref,
+            "operator": s.operator,
+            "date": s.date.isoformat() if s.date else None,
+            "series_count": int(s.series_count or 0),
+            "readings": s.total_readings(),
+            "fidelity_samples": len(s.fidelity.samples) if s.fidelity else 0,
+            "emt": None, "eml": None, "eh": None, "ef": None, "verdict": None,
+            "range_type": None, "graduation": None, "course": None, "library_profile": 0,
+        })
+    todo = [i for i, s in enumerate(sessions) if s.total_readings() > 0]
+    if not todo:
+        return rows
+    # Imports différés : session_adapter dépend de io.storage
+    from ..core.calculation_engine import CalculationEngine
+    from ..core.session_adapter import resolve_comparator_snapshot, uses_library_profile
+
+    engine = CalculationEngine()
+    try:
+        results = engine.compute_batch([sessions[i] for i in todo], details=False)
+    except Exception as exc:
+        logger.debug("Catalogue : calcul batch impossible, repli session par session : %s", exc)
+        results = []
+        for i in todo:
+            try:
+                results.append(engine.compute_batch([sessions[i]], details=False)[0])
+            except Exception:
+                results.append(None)
+    for i, res in zip(todo, results):
+        if res is None:
+            continue
+        rows[i].update(
+            emt=res.total_error_mm,
+            eml=res.local_error_mm,
+            eh=res.hysteresis_max_mm,
+            ef=res.fidelity_std_mm,
+        )
+        rows[i]["library_profile"] = int(uses_library_profile(sessions[i]))
+        try:
+            profile = resolve_comparator_snapshot(sessions[i])
+        except Exception:
+            continue
+        rows[i].update(
+            range_type=str(profile.get("range_type") or "").lower() or None,
+            graduation=_opt_float(profile.get("graduation")),
+            course=_opt_float(profile.get("course")),
+        )
+        rows[i]["verdict"] = _verdict(tol_engine, *(rows[i][c] for c in _VERDICT_INPUTS))
+    return rows
+
+
+# Colonnes dont dépend le verdict (profil + résultats)
+_VERDICT_INPUTS = ("range_type", "graduation", "course", "emt", "eml", "eh", "ef")
+
+
+def _verdict(tol_engine, range_type, graduation, course, emt, eml, eh, ef) -> Optional[str]:
+    """Statut de verdict à partir des colonnes du catalogue ; None sans règles ou si incalculable."""
+    if tol_engine is None or emt is None:
+        return None
+    from ..core.calculation_engine import CalculatedResults
+    from ..rules.verdict import evaluate_tolerances
+
+    res = CalculatedResults(
+        total_error_mm=emt, total_error_location={},
+        local_error_mm=eml, local_error_location={},
+        hysteresis_max_mm=eh, hysteresis_location={},
+        fidelity_std_mm=ef, fidelity_context=None,
+        calibration_points=[],
+    )
+    profile = {"range_type": range_type or "", "graduation": graduation, "course": course}
+    try:
+        return evaluate_tolerances(profile, res, tol_engine).status.value
+    except Exception:
+        return None
+
+
+def _default_rules_path() -> Path:
+    from ..rules.tolerances import get_default_rules_path
+
+    return get_default_rules_path()
+
+
+def _load_tolerance_engine(path: Optional[Path] = None):
+    """Moteur de règles (défaut : fichier en vigueur), ou None (même tolérance aux erreurs que ResultsProvider)."""
+    from ..rules.tolerance_engine import ToleranceRuleEngine
+
+    try:
+        path = path or _default_rules_path()
+        return ToleranceRuleEngine.load(path) if path.exists() else None
+    except Exception:
+        return None
+
+
+class SessionCatalog:
+    """
+    Index persistant de `sessions/*.json` (SQLite, fichier hors du dossier sessions).
+
+    - `record()` est appelé à chaque enregistrement : une seule ligne mise à jour.
+    - `refresh()` ne relit que les fichiers nouveaux ou modifiés (mtime/taille) et
+      retire les fichiers disparus ; il n'est déclenché par les requêtes que si le
+      mtime du dossier a changé (ajout, suppression, restauration de sauvegarde).
+    - Verdicts : l'empreinte du fichier de règles (chemin, mtime, taille, inode) et
+      VERDICT_VERSION sont gardées dans `meta` ; si elles changent, la colonne verdict
+      est réévaluée depuis les résultats stockés. Si la bibliothèque de comparateurs
+      change, seules les sessions sans snapshot utilisable (`library_profile`) sont relues.
+
+    Le catalogue est un cache : s'il est illisible, il est reconstruit.
+    """
+
+    # Sessions calculées ensemble (CalculationEngine.compute_batch) lors d'un rescan
+    BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        directory: Callable[[], Path],
+        db_path: Callable[[], Path],
+        *,
+        rules_path: Callable[[], Path] = _default_rules_path,
+        comparators_dir: Optional[Callable[[], Path]] = None,
+    ):
+        self._directory = directory
+        self._db_path = db_path
+        self._rules_path = rules_path
+        self._comparators_dir = comparators_dir
+        self._lock = threading.RLock()
+        self._tol_engine_factory: Callable[[], object] = lambda: _load_tolerance_engine(self._rules_path())
+
+    # ----- connexion -----
+    def _connect(self) -> sqlite3.Connection:
+        db = self._db_path()
+        db.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open(db)
+        except sqlite3.DatabaseError as exc:
+            logger.warning("Catalogue sessions illisible (%s) — reconstruction : %s", db, exc)
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                Path(str(db) + suffix).unlink(missing_ok=True)
+            conn = self._open(db)
+        return conn
+
+    @staticmethod
+    def _open(db: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(db), timeout=10.0)
+        try:
+            conn.executescript(_SCHEMA)
+            version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if version is None or int(version[0]) != CATALOG_SCHEMA_VERSION:
+                conn.execute("DELETE FROM sessions")
+                conn.execute("DELETE FROM meta")
+                conn.execute(
+                    "INSERT INTO meta(key, value) VALUES ('schema_version', ?)",
+                    (str(CATALOG_SCHEMA_VERSION),),
+                )
+                conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+
+    def _dir_stamp(self, d: Path) -> str:
+        try:
+            st = d.stat()
+        except OSError:
+            return ""
+        return f"{d}|{st.st_mtime_ns}"
+
+    def _rules_stamp(self) -> str:
+        """Empreinte des règles en vigueur : atomic_write change l'inode à chaque enregistrement."""
+        path = self._rules_path()
+        try:
+            st = path.stat()
+        except OSError:
+            return f"{VERDICT_VERSION}|{path}|absent"
+        return f"{VERDICT_VERSION}|{path}|{st.st_mtime_ns}|{st.st_size}|{st.st_ino}"
+
+    def _library_stamp(self) -> str:
+        return self._dir_stamp(self._comparators_dir()) if self._comparators_dir else ""
+
+    # ----- mise à jour -----
+    def record(self, path: Path, session: Session) -> None:
+        """Indexe (ou réindexe) une session qui vient d'être écrite par l'application."""
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return
+        with self._lock, closing(self._connect()) as conn:
+            row = _summarize_many([session], self._tol_engine_factory())[0]
+            # dir_stamp volontairement inchangé : le prochain refresh() ne fera que des stat()
+            # et prendra en compte d'éventuels fichiers copiés entre-temps.
+            self._upsert(conn, path.name, st.st_mtime_ns, st.st_size, row)
+            conn.commit()
+
+    def refresh(self, *, force: bool = False) -> int:
+        """
+        Synchronise le catalogue avec le dossier sessions, les règles et la bibliothèque.
+        Retourne le nombre de fichiers (ré)indexés ou retirés et de verdicts réévalués modifiés.
+        """
+        d = self._directory()
+        with self._lock, closing(self._connect()) as conn:
+            stamp = self._dir_stamp(d)
+            # Empreintes lues avant le chargement des règles : une modification concurrente
+            # laisse une empreinte périmée, donc une nouvelle réévaluation au prochain appel.
+            rules_stamp = self._rules_stamp()
+            library_stamp = self._library_stamp()
+            rules_changed = self._get_meta(conn, "rules_stamp") != rules_stamp
+            library_changed = self._get_meta(conn, "library_stamp") != library_stamp
+            if (not force and stamp and self._get_meta(conn, "dir_stamp") == stamp
+                    and not rules_changed and not library_changed):
+                return 0
+            known: Dict[str, Tuple[int, int]] = {
+                name: (mtime, size)
+                for name, mtime, size in conn.execute("SELECT filename, mtime_ns, size FROM sessions")
+            }
+            stale: set[str] = set()
+            if library_changed:
+                # Profil issu de la bibliothèque : famille / graduation / course à relire
+                stale = {n for (n,) in conn.execute("SELECT filename FROM sessions WHERE library_profile = 1")}
+            seen: set[str] = set()
+            changed = 0
+            tol_engine = None
+            tol_loaded = False
+            pending: List[Tuple[str, int, int, Session]] = []
+
+            def _flush() -> int:
+                rows = _summarize_many([p[3] for p in pending], tol_engine)
+                for (name, mtime_ns, size, _), row in zip(pending, rows):
+                    self._upsert(conn, name, mtime_ns, size, row)
+                n = len(pending)
+                pending.clear()
+                return n
+
+            for name, mtime_ns, size in self._scan(d):
+                seen.add(name)
+                if name not in stale and known.get(name) == (mtime_ns, size):
+                    continue
+                if not tol_loaded:
+                    tol_engine = self._tol_engine_factory()
+                    tol_loaded = True
+                try:
+                    data = json.loads((d / name).read_text(encoding="utf-8"))
+                    pending.append((name, mtime_ns, size, Session.model_validate(data)))
+                except Exception as exc:
+                    logger.warning("Session ignorée par le catalogue (%s) : %s", name, exc)
+                    conn.execute("DELETE FROM sessions WHERE filename = ?", (name,))
+                    continue
+                if len(pending) >= self.BATCH_SIZE:
+                    changed += _flush()
+            changed += _flush()
+            gone = [name for name in known if name not in seen]
+            conn.executemany("DELETE FROM sessions WHERE filename = ?", ((n,) for n in gone))
+            changed += len(gone)
+            if rules_changed:
+                if not tol_loaded:
+                    tol_engine = self._tol_engine_factory()
+                changed += self._reevaluate_verdicts(conn, tol_engine)
+            self._set_meta(conn, "dir_stamp", stamp)
+            self._set_meta(conn, "rules_stamp", rules_stamp)
+            self._set_meta(conn, "library_stamp", library_stamp)
+            conn.commit()
+        if changed:
+            logger.info("Catalogue sessions : %d fichier(s) mis à jour", changed)
+        return changed
+
+    @staticmethod
+    def _reevaluate_verdicts(conn: sqlite3.Connection, tol_engine) -> int:
+        """Recalcule la colonne verdict depuis les résultats stockés ; retourne le nombre de verdicts modifiés."""
+        updates = [
+            (new, name)
+            for name, old, *inputs in conn.execute(
+                f"SELECT filename, verdict, {', '.join(_VERDICT_INPUTS)} FROM sessions"
+            ).fetchall()
+            if (new := _verdict(tol_engine, *inputs)) != old
+        ]
+        conn.executemany("UPDATE sessions SET verdict = ? WHERE filename = ?", updates)
+        if updates:
+            logger.info("Catalogue sessions : règles de tolérances modifiées, %d verdict(s) mis à jour", len(updates))
+        return len(updates)
+
+    def rebuild(self) -> int:
+        """Vide puis reconstruit entièrement le catalogue."""
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("DELETE FROM sessions")
+            conn.execute("DELETE FROM meta WHERE key = 'dir_stamp'")
+            conn.commit()
+        return self.refresh(force=True)
+
+    @staticmethod
+    def _scan(d: Path) -> Iterable[Tuple[str, int, int]]:
+        try:
+            entries = list(os.scandir(d))
+        except OSError:
+            return []
+        out = []
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            out.append((entry.name, st.st_mtime_ns, st.st_size))
+        return out
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, name: str, mtime_ns: int, size: int, row: Dict) -> None:
+        values = {"filename": name, "mtime_ns": mtime_ns, "size": size, **row}
+        conn.execute(
+            f"INSERT OR REPLACE INTO sessions({', '.join(_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+            [values.get(c) for c in _COLUMNS],
+        )
+
+    # ----- requêtes -----
+    def query(
+        self,
+        *,
+        comparator_refs: Optional[Iterable[str]] = None,
+        holder_ref: Optional[str] = None,
+        banc_ref: Optional[str] = None,
+        operator: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        verdict: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[SessionEntry]:
+        """
+        Sessions correspondant aux filtres, de la plus récente à la plus ancienne.
+        Les bornes de date sont inclusives. Le catalogue est d'abord resynchronisé
+        si le dossier sessions a changé.
+        """
+        self.refresh()
+        clauses: List[str] = []
+        params: List = []
+        if comparator_refs is not None:
+            refs = list(comparator_refs)
+            if not refs:
+                return []
+            clauses.append(f"comparator_ref IN ({', '.join('?' for _ in refs)})")
+            params.extend(refs)
+        for col, val in (("holder_ref", holder_ref), ("banc_ref", banc_ref), ("operator", operator), ("verdict", verdict)):
+            if val is not None:
+                clauses.append(f"{col} = ?")
+                params.append(val)
+        if date_from is not None:
+            clauses.append("date >= ?")
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            clauses.append("date <= ?")
+            params.append(date_to.isoformat())
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date DESC, filename DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        d = self._directory()
+        with self._lock, closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._entry(d, r) for r in rows]
+
+    def results_rows(self) -> List[Tuple]:
+        """
+        Résultats précalculés de toutes les sessions mesurées, en tuples légers
+        (comparator_ref, range_type, graduation, course, emt, eml, eh, ef) —
+        pour réévaluer l'archive sans relire les fichiers (analyse d'impact des règles).
+        """
+        self.refresh()
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT comparator_ref, range_type, graduation, course, emt, eml, eh, ef "
+                "FROM sessions WHERE emt IS NOT NULL"
+            ).fetchall()
+
+    def latest(self, comparator_ref: Optional[str] = None) -> Optional[SessionEntry]:
+        """Dernière session (toutes, ou d'un comparateur donné)."""
+        refs = [comparator_ref] if comparator_ref else None
+        found = self.query(comparator_refs=refs, limit=1)
+        return found[0] if found else None
+
+    def __len__(self) -> int:
+        self.refresh()
+        with self._lock, closing(self._connect()) as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0])
+
+    @staticmethod
+    def _entry(d: Path, r: tuple) -> SessionEntry:
+        v = dict(zip(_COLUMNS, r))
+        date = None
+        if v["date"]:
+            try:
+                date = datetime.fromisoformat(v["date"])
+            except ValueError:
+                date = None
+        return SessionEntry(
+            path=d / v["filename"],
+            mtime_ns=int(v["mtime_ns"]),
+            size=int(v["size"]),
+            comparator_ref=v["comparator_ref"],
+            holder_ref=v["holder_ref"],
+            banc_ref=v["banc_ref"],
+            operator=v["operator"],
+            date=date,
+            series_count=int(v["series_count"] or 0),
+            readings=int(v["readings"] or 0),
+            fidelity_samples=int(v["fidelity_samples"] or 0),
+            emt=v["emt"],
+            eml=v["eml"],
+            eh=v["eh"],
+            ef=v["ef"],
+            verdict=v["verdict"],
+            range_type=v["range_type"],
+            graduation=v["graduation"],
+            course=v["course"],
+        )
@@ -11,7 +11,10 @@ from ..models.detenteur import Detenteur
 from ..models.banc_etalon import BancEtalon
 from ..models.session import Session
 from .atomic_write import atomic_write
+from .autosave_journal import AutosaveJournal
+from .comparator_registry import ComparatorRegistry
 from .safe_filename import sanitize_filename
+from .session_catalog import SessionCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -54,26 +57,30 @@ def list_comparator_files() -> List[Path]:
     return sorted([p for p in d.glob("*.json") if p.is_file()])
 
 
+# Registre process-wide : évite de relire/revalider toute la bibliothèque à chaque appel
+comparator_registry = ComparatorRegistry(lambda: _subdir_path(COMPARATORS_DIR))
+
+
 def list_comparators() -> List[Comparator]:
-    comps: List[Comparator] = []
-    for fp in list_comparator_files():
-        try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-            comps.append(Comparator.model_validate(data))
-        except Exception as exc:
-            logger.warning("Comparateur ignoré (%s) : %s", fp.name, exc)
-            continue
-    return comps
+    return comparator_registry.all()
+
+
+def get_comparator(reference: Optional[str]) -> Optional[Comparator]:
+    """Profil de la bibliothèque pour cette référence (O(1) via le registre)."""
+    return comparator_registry.get(reference)
 
 
 def save_comparator(c: Comparator) -> Path:
-    return save_model(c, COMPARATORS_DIR, _comparator_filename(c.reference))
+    path = save_model(c, COMPARATORS_DIR, _comparator_filename(c.reference))
+    comparator_registry.notify_saved(path)
+    return path
 
 
 def delete_comparator_by_reference(reference: str) -> bool:
     fp = _subdir_path(COMPARATORS_DIR) / _comparator_filename(reference)
     if fp.exists():
         fp.unlink()
+        comparator_registry.notify_deleted(fp)
         return True
     return False
 
@@ -171,6 +178,17 @@ def list_bancs_etalon_for_session() -> List[BancEtalon]:
 SESSIONS_DIR = "sessions"
 AUTOSAVE_DIR = "autosave"
 AUTOSAVE_FILENAME = "autosave_session.json"
+SESSION_CATALOG_FILE = "sessions_catalog.sqlite"
+
+# Autosave incrémental (instantané + journal) — branché sur session_store par la fenêtre principale
+autosave_journal = AutosaveJournal(lambda: _subdir_path(AUTOSAVE_DIR), AUTOSAVE_FILENAME)
+
+# Catalogue d'historique (cache reconstructible, hors du dossier sessions sauvegardé)
+session_catalog = SessionCatalog(
+    lambda: _subdir_path(SESSIONS_DIR),
+    lambda: get_data_dir() / SESSION_CATALOG_FILE,
+    comparators_dir=lambda: _subdir_path(COMPARATORS_DIR),
+)
 
 
 def _default_session_filename(s: Session) -> str:
@@ -184,21 +202,17 @@ def list_sessions() -> List[Path]:
     return sorted(d.glob("*.json"), reverse=True)
 
 
-def save_autosave_session(s: Session) -> Optional[Path]:
-    """Sauvegarde automatique silencieuse (issue #14)."""
-    if not s.has_measures():
-        return None
-    from ..core.session_adapter import sync_comparator_snapshot
-
-    sync_comparator_snapshot(s)
-    return save_model(s, AUTOSAVE_DIR, AUTOSAVE_FILENAME)
-
-
 def save_session_file(s: Session, filename: Optional[str] = None) -> Path:
     if not s.has_measures():
         raise RuntimeError("La session ne contient aucune mesure.")
     name = filename or _default_session_filename(s)
-    return save_model(s, SESSIONS_DIR, name)
+    path = save_model(s, SESSIONS_DIR, name)
+    try:
+        session_catalog.record(path, s)
+    except Exception as exc:
+        # Le fichier session fait foi : le catalogue se resynchronisera au prochain refresh
+        logger.warning("Catalogue sessions non mis à jour (%s) : %s", path.name, exc)
+    return path
 
 
 def load_session_file(path: Path) -> Session:
@@ -5,6 +5,8 @@ import time
 import re
 from typing import Callable, Optional
 
+from ..core.latency import latency_tracker
+from .framing import MASK_7BIT, LineFramer, hex_dump
 from .serialio import SerialConnection
 
 
@@ -12,6 +14,11 @@ class TesaSerialReader:
     """
     Lecteur TESA (mode bouton) avec assemblage de trames par silence inter‑octets ou EOL.
 
+    Lecture :
+    - "event" (défaut) : attente bloquante sur le port (SerialConnection.read_wait) ;
+      en mode silence, la trame se clôt quand l'attente expire après silence_ms.
+    - "poll" : boucle read_chunk() + sleep (comportement historique, connexions sans read_wait).
+
     Callbacks:
     - on_value(value_float, display_str, raw_hex, raw_ascii, timestamp)
     - on_debug(msg)
@@ -32,6 +39,7 @@ class TesaSerialReader:
         value_regex: str = r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+",
         decimals: int = 3,
         decimal_display: str = "dot",          # "dot" | "comma"
+        read_mode: str = "event",              # "event" | "poll"
     ):
         self._conn = conn
         self._on_value = on_value
@@ -46,12 +54,16 @@ class TesaSerialReader:
         self._value_re = re.compile(value_regex)
         self._decimals = int(decimals)
         self._decimal_display = decimal_display
+        self._read_mode = (read_mode or "event").lower()
 
         self._buf = bytearray()
         self._last_rx = 0.0
         self._stop = threading.Event()
         self._th: Optional[threading.Thread] = None
 
+    # Attente max. sans trame en cours (mode event) : borne la réactivité de stop()
+    IDLE_WAIT_S = 0.25
+
     def start(self):
         if self._th and self._th.is_alive():
             return
@@ -81,12 +93,13 @@ class TesaSerialReader:
     def _now(self) -> float:
         return time.perf_counter()
 
-    def _emit_frame(self, data: bytes):
+    def _emit_frame(self, data: bytes, rx: Optional[float] = None):
+        """rx : instant (perf_counter) de réception du dernier octet, pour la trace de latence."""
         if not data:
             return
-        raw_hex = " ".join(f"{b:02X}" for b in data)
+        raw_hex = hex_dump(data)
         if self._mask_7bit:
-            data = bytes((b & 0x7F) for b in data)
+            data = data.translate(MASK_7BIT)
         try:
             raw_ascii = data.decode("ascii", errors="replace")
         except Exception:
@@ -116,6 +129,7 @@ class TesaSerialReader:
             normalized = value
         if (self._decimal_display or "dot") == "comma":
             display = display.replace(".", ",")
+        normalized = latency_tracker.start(normalized, rx=rx)
 
         try:
             self._on_value(normalized, display, raw_hex, txt, ts)
@@ -131,7 +145,21 @@ class TesaSerialReader:
         except Exception as e:
             self._err(f"tesa thread crash: {e!r}")
 
+    def _event_driven(self) -> bool:
+        return self._read_mode == "event" and hasattr(self._conn, "read_wait")
+
+    def _next_chunk(self) -> Optional[bytes]:
+        if self._event_driven():
+            return self._conn.read_wait(self.IDLE_WAIT_S)
+        chunk = self._conn.read_chunk()
+        if not chunk:
+            time.sleep(0.005)
+        return chunk
+
     def _run_silence(self):
+        if self._event_driven():
+            self._run_silence_event()
+            return
         self._buf.clear()
         self._last_rx = 0.0
         while not self._stop.is_set():
@@ -144,10 +172,29 @@ class TesaSerialReader:
                 if self._buf and self._last_rx and (now - self._last_rx) >= self._silence_s:
                     frame = bytes(self._buf)
                     self._buf.clear()
-                    self._emit_frame(frame)
+                    self._emit_frame(frame, self._last_rx)
                 else:
                     time.sleep(0.005)
 
+    def _run_silence_event(self):
+        """Fin de trame = expiration de l'attente bloquante silence_ms après le dernier octet."""
+        self._buf.clear()
+        self._last_rx = 0.0
+        while not self._stop.is_set():
+            if self._buf:
+                wait = self._silence_s - (self._now() - self._last_rx)
+                if wait <= 0:
+                    frame = bytes(self._buf)
+                    self._buf.clear()
+                    self._emit_frame(frame, self._last_rx)
+                    continue
+            else:
+                wait = self.IDLE_WAIT_S
+            chunk = self._conn.read_wait(wait)
+            if chunk:
+                self._buf.extend(chunk)
+                self._last_rx = self._now()
+
     def _eol_bytes(self) -> bytes:
         if self._eol_mode == "CRLF":
             return b"\r\n"
@@ -156,22 +203,14 @@ class TesaSerialReader:
         return b"\n"
 
     def _run_eol(self):
-        self._buf.clear()
-        term = self._eol_bytes()
+        framer = LineFramer(self._eol_bytes())
         while not self._stop.is_set():
-            chunk = self._conn.read_chunk()
+            chunk = self._next_chunk()
             if not chunk:
-                time.sleep(0.005)
                 continue
+            rx = self._now()
             # Appliquer masque si nécessaire avant détection EOL
             if self._mask_7bit:
-                chunk = bytes((b & 0x7F) for b in chunk)
-            self._buf.extend(chunk)
-            while True:
-                idx = self._buf.find(term)
-                if idx < 0:
-                    break
-                frame = bytes(self._buf[:idx+len(term)])
-                del self._buf[:idx+len(term)]
-                self._emit_frame(frame)
-
+                chunk = chunk.translate(MASK_7BIT)
+            for frame in framer.feed(chunk):
+                self._emit_frame(frame, rx)
@@ -89,8 +89,8 @@ def save_profile(path: Path, profile: ComparatorProfile) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        import json
-        path.write_text(profile.model_dump_json(indent=2), encoding="utf-8")
+        from ..io.atomic_write import atomic_write
+        atomic_write(path, profile.model_dump_json(indent=2))
     except Exception as e:
         raise ValueError(f"Impossible de sauvegarder le profil vers {path}: {e}")
 
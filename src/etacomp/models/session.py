@@ -159,9 +159,10 @@ class SessionV2:
 def save_session_v2(path: str | "Path", session: SessionV2) -> None:
     import json
     from pathlib import Path
+    from ..io.atomic_write import atomic_write
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(session.to_dict(), indent=2), encoding="utf-8")
+    atomic_write(p, json.dumps(session.to_dict(), indent=2))
 
 
 def load_session_v2(path: str | "Path") -> SessionV2:
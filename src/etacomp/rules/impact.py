@@ -0,0 +1,209 @@
+"""Impact d'un changement de règles de tolérances sur les verdicts de l'archive."""
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.calculation_engine import CalculatedResults
+from .verdict import VerdictStatus, evaluate_tolerances
+
+logger = logging.getLogger(__name__)
+
+# (comparator_ref, range_type, graduation, course, emt, eml, eh, ef) — cf. SessionCatalog.results_rows
+ResultRow = Tuple[Optional[str], Optional[str], Optional[float], Optional[float],
+                  Optional[float], Optional[float], Optional[float], Optional[float]]
+Transition = Tuple[str, str]
+
+# En dessous, l'évaluation reste dans le processus courant (démarrage du pool plus coûteux)
+PARALLEL_MIN_ROWS = 20000
+CHUNK_ROWS = 5000
+
+_FALLBACK_STATUS = VerdictStatus.INDETERMINE.value
+
+
+@dataclass
+class RuleImpact:
+    """Bilan : transitions de verdict (ancien → nouveau) pour les sessions dont le verdict change."""
+    sessions: int = 0
+    evaluated: int = 0  # sessions réévaluées (profils dont la règle applicable a changé)
+    transitions: Counter = field(default_factory=Counter)
+    by_group: Dict[Tuple[str, Optional[float]], Counter] = field(default_factory=dict)
+    affected_comparators: List[str] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def changed(self) -> int:
+        return sum(self.transitions.values())
+
+    def summary_lines(self) -> List[str]:
+        lines = [
+            f"Sessions archivées : {self.sessions} — verdicts modifiés : {self.changed}"
+            f" ({self.elapsed_s:.2f} s)",
+        ]
+        for (old, new), n in sorted(self.transitions.items()):
+            lines.append(f"  {old} → {new} : {n}")
+        for (family, grad), counts in sorted(self.by_group.items(), key=lambda kv: (kv[0][0], kv[0][1] or 0.0)):
+            detail = ", ".join(f"{o} → {n} : {c}" for (o, n), c in sorted(counts.items()))
+            g = f"{grad:.3f} mm" if grad is not None else "?"
+            lines.append(f"  [{family or '?'} / {g}] {detail}")
+        if self.affected_comparators:
+            lines.append(f"Comparateurs concernés ({len(self.affected_comparators)}) : "
+                         + ", ".join(self.affected_comparators))
+        return lines
+
+
+def _profile(row: ResultRow) -> Dict:
+    return {"range_type": row[1] or "", "graduation": row[2], "course": row[3]}
+
+
+def _rule_key(engine, profile: Dict):
+    """Limites de la règle applicable (None si aucune ; 'error' si configuration ambiguë)."""
+    family = str(profile.get("range_type") or "").lower()
+    graduation = float(profile.get("graduation") or 0.0)
+    course = float(profile.get("course") or 0.0) if family in ("normale", "grande") else None
+    try:
+        rule = engine.match(family, graduation, course)
+    except Exception:
+        return "error"
+    if rule is None:
+        return None
+    return (rule.Emt, getattr(rule, "Eml", None), rule.Ef, rule.Eh)
+
+
+def _status(engine, row: ResultRow) -> str:
+    res = CalculatedResults(
+        total_error_mm=row[4], total_error_location={},
+        local_error_mm=row[5], local_error_location={},
+        hysteresis_max_mm=row[6], hysteresis_location={},
+        fidelity_std_mm=row[7], fidelity_context=None,
+        calibration_points=[],
+    )
+    try:
+        return evaluate_tolerances(_profile(row), res, engine).status.value
+    except Exception:
+        return _FALLBACK_STATUS
+
+
+def _evaluate_chunk(args) -> List[Transition]:
+    """Travail d'un processus du pool : (ancien, nouveau) statut par ligne."""
+    current, proposed, rows = args
+    return [(_status(current, r), _status(proposed, r)) for r in rows]
+
+
+def _run(current, proposed, rows: Sequence[ResultRow], workers: Optional[int]) -> List[Transition]:
+    if workers == 0 or len(rows) < PARALLEL_MIN_ROWS:
+        return _evaluate_chunk((current, proposed, rows))
+    chunks = [rows[i:i + CHUNK_ROWS] for i in range(0, len(rows), CHUNK_ROWS)]
+    try:
+        # spawn : lancé depuis un thread du TaskRunner, pas de fork d'un processus Qt multithread
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+            out: List[Transition] = []
+            for part in pool.map(_evaluate_chunk, [(current, proposed, c) for c in chunks]):
+                out.extend(part)
+            return out
+    except Exception as exc:
+        logger.warning("Analyse d'impact : pool de processus indisponible, calcul local : %s", exc)
+        return _evaluate_chunk((current, proposed, rows))
+
+
+def analyze_rule_change(
+    proposed,
+    current=None,
+    *,
+    rows: Optional[Iterable[ResultRow]] = None,
+    workers: Optional[int] = None,
+) -> RuleImpact:
+    """
+    Réévalue l'archive avec les règles `proposed` et les compare aux règles `current`
+    (fichier de règles en vigueur par défaut ; aucune règle si absent/illisible).
+
+    - `rows` : résultats précalculés (défaut : catalogue des sessions) — aucune relecture JSON.
+    - Seuls les profils (famille, graduation, course) dont la règle applicable change
+      sont réévalués ; ceux-ci le sont dans un pool de processus au-delà de
+      PARALLEL_MIN_ROWS lignes (`workers=0` : tout dans le processus courant).
+    """
+    t0 = time.perf_counter()
+    if current is None:
+        current = _load_current_engine()
+    if rows is None:
+        from ..io.storage import session_catalog
+
+        rows = session_catalog.results_rows()
+    rows = list(rows)
+
+    changed_profiles: Dict[Tuple, bool] = {}
+    todo: List[ResultRow] = []
+    for row in rows:
+        key = (row[1], row[2], row[3])
+        hit = changed_profiles.get(key)
+        if hit is None:
+            profile = _profile(row)
+            hit = _rule_key(current, profile) != _rule_key(proposed, profile)
+            changed_profiles[key] = hit
+        if hit:
+            todo.append(row)
+
+    report = RuleImpact(sessions=len(rows), evaluated=len(todo))
+    affected = set()
+    for row, (old, new) in zip(todo, _run(current, proposed, todo, workers)):
+        if old == new:
+            continue
+        report.transitions[(old, new)] += 1
+        report.by_group.setdefault((row[1] or "", row[2]), Counter())[(old, new)] += 1
+        if row[0]:
+            affected.add(row[0])
+    report.affected_comparators = sorted(affected)
+    report.elapsed_s = time.perf_counter() - t0
+    return report
+
+
+def _load_current_engine():
+    from .tolerance_engine import ToleranceRuleEngine
+    from .tolerances import get_default_rules_path
+
+    try:
+        path = get_default_rules_path()
+        if path.exists():
+            return ToleranceRuleEngine.load(path)
+    except Exception as exc:
+        logger.warning("Analyse d'impact : règles en vigueur illisibles : %s", exc)
+    return ToleranceRuleEngine()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI : impact d'un fichier de règles proposé sur l'archive des sessions."""
+    import argparse
+    from pathlib import Path
+
+    from .tolerance_engine import ToleranceRuleEngine
+
+    parser = argparse.ArgumentParser(
+        prog="etacomp-rules-impact",
+        description="Compte les verdicts de l'archive qui changeraient avec un nouveau fichier de règles",
+    )
+    parser.add_argument("proposed", type=Path, help="Fichier de règles proposé (JSON)")
+    parser.add_argument("--current", type=Path, help="Règles de référence (défaut : règles en vigueur)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processus du pool (0 : aucun, défaut : nombre de CPU)")
+    args = parser.parse_args(argv)
+
+    try:
+        proposed = ToleranceRuleEngine.load(args.proposed)
+        current = ToleranceRuleEngine.load(args.current) if args.current else None
+    except Exception as exc:
+        print(f"Règles invalides : {exc}")
+        return 2
+    report = analyze_rule_change(proposed, current, workers=args.workers)
+    print("\n".join(report.summary_lines()))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Protocol, TypeVar
+import math
+from bisect import bisect_left
+from typing import Dict, List, Optional, Protocol, Tuple, TypeVar
 
 EPS = 1e-6
 
@@ -51,3 +53,262 @@ def detect_course_overlaps(rules_same_grad: List[R], eps: float = EPS) -> bool:
         if nxt.course_min < prev.course_max - eps:
             return True
     return False
+
+
+# --------------------------------------------------------------------------
+# Forme compilée partagée par les deux moteurs de règles
+# --------------------------------------------------------------------------
+
+COURSE_FAMILIES = ("normale", "grande")
+
+
+class RuleList(list):
+    """Liste de règles d'une famille : toute modification invalide l'index compilé."""
+
+    __slots__ = ("_owner",)
+
+    def _touch(self) -> None:
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            owner.version += 1
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._touch()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._touch()
+        return result
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._touch()
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self._touch()
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._touch()
+
+    def pop(self, index=-1):
+        result = super().pop(index)
+        self._touch()
+        return result
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._touch()
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def sort(self, *, key=None, reverse=False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._touch()
+
+
+class RuleSet(dict):
+    """
+    Règles par famille (`engine.rules`). Compteur `version` incrémenté à chaque
+    modification du dict ou d'une de ses listes, y compris `rules[fam].append(...)`.
+    """
+
+    def __init__(self, data=None):
+        super().__init__()
+        self.version = 0
+        for k, v in dict(data or {}).items():
+            self[k] = v
+
+    def __setitem__(self, key, value) -> None:
+        lst = RuleList(value or [])
+        lst._owner = self
+        super().__setitem__(key, lst)
+        self.version += 1
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.version += 1
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def __reduce__(self):
+        return (self.__class__, (dict((k, list(v)) for k, v in self.items()),))
+
+
+class _GradGroup:
+    """
+    Règles d'une même graduation (valeur exacte), triées par (course_max, course_min).
+    Intervalles semi-ouverts de match_course_group_strict, précalculés :
+    la première règle est [min-eps, max+eps], les suivantes (min+eps, max+eps].
+    """
+
+    __slots__ = ("graduation", "rules", "sorted_rules", "highs", "lows", "disjoint", "overlaps")
+
+    def __init__(self, graduation: float, rules: List[R], with_course: bool, eps: float):
+        self.graduation = graduation
+        self.rules = rules
+        self.sorted_rules: List[R] = []
+        self.highs: List[float] = []
+        self.lows: List[Tuple[float, bool]] = []
+        self.disjoint = False
+        self.overlaps: Optional[bool] = None
+        if not with_course:
+            return
+        if any(r.course_min is None or r.course_max is None for r in rules):
+            return  # configuration incomplète : chemin linéaire (comportement historique)
+        self.overlaps = detect_course_overlaps(rules, eps)
+        rules_sorted = sorted(rules, key=lambda r: (r.course_max, r.course_min))
+        prev_high = float("-inf")
+        disjoint = True
+        for i, r in enumerate(rules_sorted):
+            low = r.course_min - eps if i == 0 else r.course_min + eps
+            high = r.course_max + eps
+            if i > 0 and not (low < high):
+                continue  # intervalle vide : ne correspond jamais
+            if low < prev_high:
+                disjoint = False
+            prev_high = high
+            self.sorted_rules.append(r)
+            self.highs.append(high)
+            self.lows.append((low, i == 0))
+        self.disjoint = disjoint
+
+    def course_overlaps(self, eps: float) -> bool:
+        """Chevauchement au sens de detect_course_overlaps (calculé à la compilation si possible)."""
+        return self.overlaps if self.overlaps is not None else detect_course_overlaps(self.rules, eps)
+
+    def match_course(self, course: float, eps: float) -> List[R]:
+        if not self.disjoint:
+            return match_course_group_strict(self.rules, course, eps)
+        k = bisect_left(self.highs, course)
+        if k >= len(self.highs) or not course <= self.highs[k]:
+            return []
+        low, inclusive = self.lows[k]
+        ok = (low <= course) if inclusive else (low < course)
+        return [self.sorted_rules[k]] if ok else []
+
+
+class RuleIndex:
+    """
+    Index compilé des règles : par famille, graduations regroupées en paquets
+    (graduation quantifiée au pas eps), puis recherche par bisect sur les
+    intervalles de course triés. Chevauchements détectés une fois à la compilation.
+    Résultats identiques au filtrage linéaire feq + match_course_group_strict.
+    """
+
+    def __init__(self, rules_by_family: Dict[str, List[R]], eps: float = EPS):
+        self.eps = eps
+        self._families: Dict[str, Dict[int, List[_GradGroup]]] = {}
+        self._groups: Dict[str, List[_GradGroup]] = {}
+        self._rules: Dict[str, List[R]] = {}
+        for fam, items in rules_by_family.items():
+            self._rules[fam] = list(items)
+            by_grad: Dict[float, List[R]] = {}
+            for r in items:
+                by_grad.setdefault(r.graduation, []).append(r)
+            groups = [_GradGroup(g, lst, fam in COURSE_FAMILIES, eps) for g, lst in by_grad.items()]
+            buckets: Dict[int, List[_GradGroup]] = {}
+            for grp in groups:
+                buckets.setdefault(self._key(grp.graduation), []).append(grp)
+            self._families[fam] = buckets
+            self._groups[fam] = groups
+
+    def _key(self, graduation: float) -> int:
+        q = graduation / self.eps
+        return int(math.floor(q)) if math.isfinite(q) else 0
+
+    def groups(self, family: str) -> List[_GradGroup]:
+        """Groupes par graduation exacte, dans l'ordre de première apparition."""
+        return self._groups.get(family, [])
+
+    def _candidates(self, family: str, graduation: float) -> List[_GradGroup]:
+        buckets = self._families.get(family)
+        if not buckets:
+            return []
+        q = graduation / self.eps
+        if not math.isfinite(q):
+            return [g for g in self._groups[family] if feq(g.graduation, graduation, self.eps)]
+        k = int(math.floor(q))
+        found: List[_GradGroup] = []
+        for kk in (k - 2, k - 1, k, k + 1, k + 2):
+            for grp in buckets.get(kk, ()):
+                if feq(grp.graduation, graduation, self.eps):
+                    found.append(grp)
+        return found
+
+    def match(self, family: str, graduation: float, course: float | None) -> List[R]:
+        """Règles correspondantes (plusieurs = configuration ambiguë, à signaler par l'appelant)."""
+        groups = self._candidates(family, graduation)
+        if not groups:
+            return []
+        if len(groups) > 1:
+            # Graduations distinctes à moins de eps : réunion dans l'ordre d'origine
+            same_grad = [r for r in self._rules[family] if feq(r.graduation, graduation, self.eps)]
+        else:
+            same_grad = groups[0].rules
+        if family not in COURSE_FAMILIES:
+            return list(same_grad)
+        if course is None:
+            return []
+        if len(groups) == 1:
+            return groups[0].match_course(course, self.eps)
+        return match_course_group_strict(same_grad, course, self.eps)
+
+
+class CompiledRulesMixin:
+    """
+    `rules` (RuleSet) et index compilé à la demande, recompilé seulement si les
+    règles ont changé depuis (affectation, ajout/remplacement/suppression dans une famille).
+    """
+
+    _rules: RuleSet
+    _index: Optional[RuleIndex] = None
+    _index_version: int = -1
+
+    @property
+    def rules(self) -> RuleSet:
+        return self._rules
+
+    @rules.setter
+    def rules(self, value) -> None:
+        self._rules = value if isinstance(value, RuleSet) else RuleSet(value)
+        self._index = None
+
+    def compiled(self) -> RuleIndex:
+        if self._index is None or self._index_version != self._rules.version:
+            self._index = RuleIndex(self._rules, EPS)
+            self._index_version = self._rules.version
+        return self._index
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import json
 
-from .interval_match import EPS, detect_course_overlaps, feq, match_course_group_strict
+from .interval_match import EPS, CompiledRulesMixin, feq
 
 
 class ConfigurationError(Exception):
@@ -28,14 +28,14 @@ class ToleranceRule:
     course_max: float | None = None
 
 
-class ToleranceRuleEngine:
-    """Moteur de règles basé sur une graduation unique par famille."""
+class ToleranceRuleEngine(CompiledRulesMixin):
+    """Moteur de règles basé sur une graduation unique par famille (index compilé partagé, cf. interval_match)."""
 
     EPS = EPS
     FAMILIES = ("normale", "grande", "faible", "limitee")
 
     def __init__(self, rules: Dict[str, List[ToleranceRule]] | None = None):
-        self.rules: Dict[str, List[ToleranceRule]] = rules or {f: [] for f in self.FAMILIES}
+        self.rules = rules or {f: [] for f in self.FAMILIES}
 
     @classmethod
     def load(cls, path: Path) -> "ToleranceRuleEngine":
@@ -100,13 +100,10 @@ class ToleranceRuleEngine:
 
             # chevauchements (normale/grande): tolérance stricte des intervalles
             if fam in ("normale", "grande"):
-                # Grouper par graduation
-                grads: Dict[float, List[ToleranceRule]] = {}
-                for r in items:
-                    grads.setdefault(r.graduation, []).append(r)
-                for g, lst in grads.items():
-                    if detect_course_overlaps(lst, self.EPS):
-                        raise OverlapError(f"{fam}: chevauchement entre règles (graduation {g:.6f})")
+                # Groupes par graduation de l'index compilé
+                for grp in self.compiled().groups(fam):
+                    if grp.course_overlaps(self.EPS):
+                        raise OverlapError(f"{fam}: chevauchement entre règles (graduation {grp.graduation:.6f})")
             else:
                 # faible/limitée: graduation unique non dupliquée
                 seen: List[float] = []
@@ -119,14 +116,7 @@ class ToleranceRuleEngine:
         """Retourne la règle applicable ou None. Lève OverlapError si plusieurs match."""
         if family not in self.rules:
             return None
-        fam_rules = self.rules[family]
-        same_grad = [r for r in fam_rules if feq(r.graduation, graduation, self.EPS)]
-        if family in ("normale", "grande"):
-            if course is None:
-                return None
-            matches = match_course_group_strict(same_grad, course, self.EPS)
-        else:
-            matches = list(same_grad)
+        matches = self.compiled().match(family, graduation, course)
         if len(matches) > 1:
             raise OverlapError("Plusieurs règles correspondent (graduation/course).")
         return matches[0] if matches else None
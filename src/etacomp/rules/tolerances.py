@@ -5,8 +5,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Literal, Any
 
+from ..io.atomic_write import atomic_write
 from ..models.comparator import RangeType
-from .interval_match import detect_course_overlaps, match_course_group_strict
+from .interval_match import CompiledRulesMixin
 
 
 # Tolérance pour les comparaisons de graduation
@@ -103,11 +104,11 @@ class ConfigurationOverlapError(Exception):
     pass
 
 
-class ToleranceRuleEngine:
-    """Moteur de règles de tolérances selon les nouvelles spécifications."""
+class ToleranceRuleEngine(CompiledRulesMixin):
+    """Moteur de règles de tolérances selon les nouvelles spécifications (index compilé partagé)."""
     
     def __init__(self):
-        self.rules: Dict[str, List[ToleranceRule]] = {
+        self.rules = {
             "normale": [],
             "grande": [],
             "faible": [],
@@ -182,7 +183,7 @@ class ToleranceRuleEngine:
                 data[family].append(rule_dict)
         
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        atomic_write(path, json.dumps(data, indent=2))
 
     def validate(self) -> List[str]:
         """Valide la configuration et retourne les erreurs."""
@@ -197,14 +198,11 @@ class ToleranceRuleEngine:
                     errors.append(f"{get_family_display_name(family)}[{i+1}]: {e}")
             
             if family in ("normale", "grande"):
-                grads: Dict[float, List[ToleranceRule]] = {}
-                for rule in rules_list:
-                    grads.setdefault(rule.graduation, []).append(rule)
-                for g, lst in grads.items():
-                    if detect_course_overlaps(lst, EPS):
+                for grp in self.compiled().groups(family):
+                    if grp.course_overlaps(EPS):
                         errors.append(
                             f"{get_family_display_name(family)}: chevauchement entre règles "
-                            f"(graduation {g:.6f} mm)"
+                            f"(graduation {grp.graduation:.6f} mm)"
                         )
 
             # Vérifications spécifiques par famille
@@ -235,14 +233,7 @@ class ToleranceRuleEngine:
         if family not in self.rules:
             return None
 
-        same_grad = [r for r in self.rules[family] if grad_eq(r.graduation, graduation)]
-        if family in ("normale", "grande"):
-            if course is None:
-                return None
-            matches = match_course_group_strict(same_grad, course, EPS)
-        else:
-            matches = list(same_grad)
-
+        matches = self.compiled().match(family, graduation, course)
         if len(matches) > 1:
             raise ConfigurationOverlapError(
                 f"Plusieurs règles matchent pour {family}, graduation {graduation:.6f} mm"
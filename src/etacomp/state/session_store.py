@@ -1,6 +1,7 @@
 from __future__ import annotations
+import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -8,9 +9,17 @@ from datetime import datetime
 
 from ..models.session import Session, MeasureSeries, FidelitySeries
 from ..config.prefs import load_prefs
+from ..core.calculation_engine import CalculatedResults
 from ..core.campaign_cycles import clamp_series_count, MAX_CAMPAIGN_CYCLES
+from ..core.incremental_calculation import IncrementalCalculation
 from ..core.session_adapter import sync_comparator_snapshot
-from ..io.storage import list_sessions, load_session_file, save_session_file
+from ..io.autosave_journal import (
+    AutosaveJournal, fidelity_record, meta_record, reading_record, series_record,
+)
+from ..io.session_catalog import SessionEntry
+from ..io.storage import load_session_file, save_session_file, session_catalog
+
+logger = logging.getLogger(__name__)
 
 
 class SessionStore(QObject):
@@ -22,6 +31,45 @@ class SessionStore(QObject):
         super().__init__()
         self._current: Session = self._new_session_from_prefs()
         self._cycles_clamped_on_load = False
+        self._journal: Optional[AutosaveJournal] = None
+        self._calc = IncrementalCalculation(self._current)
+
+    # ----- Calcul incrémental -----
+    @property
+    def calculation(self) -> IncrementalCalculation:
+        """Calcul tenu à jour lecture par lecture (resynchronisé si la session a été remplacée)."""
+        return self._calc.sync(self._current)
+
+    def results(self) -> CalculatedResults:
+        """Résultats de la session courante sans recalcul complet."""
+        return self.calculation.results()
+
+    # ----- Journal autosave -----
+    def attach_journal(self, journal: Optional[AutosaveJournal]) -> None:
+        """Active (ou désactive avec None) la journalisation de chaque modification."""
+        if self._journal is not None and self._journal is not journal:
+            self._journal.close(self._current)
+        self._journal = journal
+
+    @property
+    def journal(self) -> Optional[AutosaveJournal]:
+        return self._journal
+
+    def _log(self, record: dict) -> None:
+        """Journalise une modification déjà appliquée ; une erreur disque ne bloque jamais la saisie."""
+        if self._journal is None:
+            return
+        try:
+            self._journal.append(record, self._current)
+        except Exception as exc:
+            logger.warning("Journal autosave : écriture impossible : %s", exc)
+
+    def _reset_journal(self) -> None:
+        if self._journal is not None:
+            try:
+                self._journal.reset()
+            except Exception as exc:
+                logger.warning("Journal autosave : réinitialisation impossible : %s", exc)
 
     def _new_session_from_prefs(self) -> Session:
         prefs = load_prefs()
@@ -35,6 +83,8 @@ class SessionStore(QObject):
     def new_session(self):
         self._current = self._new_session_from_prefs()
         self._current.fidelity = None
+        self._calc.reset(self._current)
+        self._reset_journal()
         self.session_changed.emit(self._current)
 
     @property
@@ -67,15 +117,43 @@ class SessionStore(QObject):
         s.observations = observations
         if ref_changed:
             sync_comparator_snapshot(s)
+        self._log(meta_record(s))
         self.session_changed.emit(s)
 
     def update_observations(self, observations: str | None) -> None:
         """Met à jour les observations (texte libre) et notifie l'UI."""
         self._current.observations = (observations or "").strip() or None
+        self._log(meta_record(self._current))
         self.session_changed.emit(self._current)
 
     def set_series(self, series: List[MeasureSeries]):
         self._current.series = series
+        self._calc.reset(self._current)
+        self._log(series_record(series))
+        self.measures_updated.emit(self._current)
+
+    def record_reading(
+        self,
+        series: List[MeasureSeries],
+        target: float,
+        pos: int,
+        value: float | None,
+        *,
+        override: bool = False,
+    ):
+        """
+        Une lecture acceptée (ou corrigée) à la position `pos` de la cible `target`,
+        déjà écrite dans `series`. Journalisée seule ; la disposition complète des
+        séries n'est journalisée que si les cibles ont changé.
+        """
+        if [ms.target for ms in series] != [ms.target for ms in self._current.series]:
+            self._current.series = series
+            self._calc.reset(self._current)
+            self._log(series_record(series))
+        else:
+            self._current.series = series
+            self.calculation.set_reading(target, pos, value)
+            self._log(reading_record(target, pos, value, override=override))
         self.measures_updated.emit(self._current)
 
     def add_or_replace_series(self, index: int, series: MeasureSeries):
@@ -83,20 +161,17 @@ class SessionStore(QObject):
         while len(cur) <= index:
             cur.append(MeasureSeries(target=0.0, readings=[]))
         cur[index] = series
+        self._calc.reset(self._current)
+        self._log(series_record(cur))
         self.measures_updated.emit(self._current)
 
     # ----- Série de fidélité (S5) -----
     def set_fidelity(self, target: float, direction: str, samples: list[float], timestamps: list[str] | None = None):
         """Enregistre la série de 5 mesures (fidélité) au point critique."""
-        from ..core.session_adapter import build_session_from_runtime
-        from ..core.calculation_engine import CalculationEngine
         from ..core.critical_point import CriticalPoint
 
-        rt = self._current
-        v2 = build_session_from_runtime(rt)
-        v2.series = [s for s in v2.series if s.kind.value != "fidelity"]
-        calc = CalculationEngine().compute(v2)
-        loc = calc.total_error_location or {}
+        # Le point critique ne dépend que de la série principale
+        loc = self.results().total_error_location or {}
         if loc:
             cp = CriticalPoint(
                 target_mm=float(loc["target_mm"]),
@@ -116,10 +191,14 @@ class SessionStore(QObject):
             samples=[float(x) for x in (samples or [])],
             timestamps=list(timestamps or []),
         )
+        self.calculation.set_fidelity(self._current.fidelity)
+        self._log(fidelity_record(self._current.fidelity))
         self.measures_updated.emit(self._current)
 
     def clear_fidelity(self):
         self._current.fidelity = None
+        self.calculation.set_fidelity(None)
+        self._log(fidelity_record(None))
         self.measures_updated.emit(self._current)
 
     def can_save(self) -> bool:
@@ -133,8 +212,9 @@ class SessionStore(QObject):
         self.saved.emit(p)
         return p
 
-    def list_history(self):
-        return list_sessions()
+    def list_history(self, **filters) -> List[SessionEntry]:
+        """Historique via le catalogue (filtres de SessionCatalog.query), plus récent d'abord."""
+        return session_catalog.query(**filters)
 
     def load_from_file(self, path: Path):
         loaded = load_session_file(path)
@@ -143,6 +223,24 @@ class SessionStore(QObject):
         loaded.series_count = cycles
         self._cycles_clamped_on_load = clamped
         self._current = loaded
+        self._calc.reset(self._current)
+        self._reset_journal()
+        self.session_changed.emit(self._current)
+        self.measures_updated.emit(self._current)
+
+    def restore(self, session: Session):
+        """Reprend une session récupérée du journal autosave (après arrêt non propre)."""
+        cycles, clamped = clamp_series_count(session.series_count)
+        session.series_count = cycles
+        self._cycles_clamped_on_load = clamped
+        self._current = session
+        self._calc.reset(self._current)
+        if self._journal is not None:
+            # L'instantané intègre le rejeu : le journal récupéré peut être abandonné
+            try:
+                self._journal.compact(self._current)
+            except Exception as exc:
+                logger.warning("Journal autosave : compaction impossible : %s", exc)
         self.session_changed.emit(self._current)
         self.measures_updated.emit(self._current)
 
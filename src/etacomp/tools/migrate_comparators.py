@@ -18,6 +18,7 @@ from typing import List, Tuple
 # Ajouter le chemin du projet
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from src.etacomp.io.atomic_write import atomic_write
 from src.etacomp.io.storage import list_comparator_files
 from src.etacomp.models.comparator import ComparatorProfile, RangeType
 
@@ -58,7 +59,7 @@ def migrate_file(fp: Path, *, dry_run: bool, backup: bool) -> Tuple[bool, str]:
             shutil.copy2(fp, backup_path)
         
         # Écrire le fichier migré
-        fp.write_text(json.dumps(after, indent=2), encoding="utf-8")
+        atomic_write(fp, json.dumps(after, indent=2))
         return True, f"✅ {fp.name} migré avec succès"
         
     except Exception as e:
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Profil de démarrage de l'application (`etacomp --startup-profile`).
+
+Lance l'application dans un processus neuf sous `python -X importtime`, attend la
+première fenêtre affichée puis la referme, et rapporte :
+- le temps jusqu'à la première fenêtre (depuis le lancement du processus) et ses phases ;
+- la répartition du temps d'import par paquet (PySide6, numpy, matplotlib, etacomp.*…).
+
+Le processus enfant écrit une ligne « ETACOMP_STARTUP {json} » sur stdout (voir app.run).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CHILD_FLAG = "--startup-profile-child"
+MARKER = "ETACOMP_STARTUP "
+TARGET_S = 1.0
+
+# Phases (instants time.time() émis par l'enfant), dans l'ordre
+PHASES = (
+    ("run", "Interpréteur + imports"),
+    ("qapp", "QApplication + thème"),
+    ("window", "Construction MainWindow"),
+    ("shown", "Premier affichage"),
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Lignes « import time: self | cumulative | module » → (module, self_us, cumul_us)."""
+    out: List[Tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumul_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue   # ligne d'en-tête
+        out.append((parts[2].strip(), self_us, cumul_us))
+    return out
+
+
+def _group(module: str, app_package: str) -> str:
+    """Paquet de premier niveau ; sous-paquet pour l'application (etacomp.ui, etacomp.io…)."""
+    if module == app_package or module.startswith(app_package + "."):
+        rest = module[len(app_package) + 1:].split(".")
+        return "etacomp." + rest[0] if rest[0] else "etacomp"
+    return module.split(".")[0]
+
+
+def import_breakdown(entries: Sequence[Tuple[str, int, int]], app_package: str = "etacomp") -> List[Tuple[str, float]]:
+    """Temps d'import propre (ms) cumulé par groupe, trié décroissant."""
+    totals: Dict[str, float] = defaultdict(float)
+    for module, self_us, _cumul in entries:
+        totals[_group(module, app_package)] += self_us / 1000.0
+    return sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+
+
+def _app_package() -> Tuple[str, Path]:
+    """Nom importable du paquet (etacomp ou src.etacomp) et racine à placer dans sys.path."""
+    package = __package__.rsplit(".", 1)[0]
+    init = Path(sys.modules[package].__file__).resolve()
+    return package, init.parents[len(package.split("."))]
+
+
+def run_once(*, offscreen: bool = False, timeout: float = 60.0) -> Dict:
+    package, root = _app_package()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(root), env.get("PYTHONPATH", "")) if p)
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    t_spawn = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", package, CHILD_FLAG],
+        capture_output=True, text=True, env=env, timeout=timeout,
+    )
+    stamps = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(MARKER):
+            stamps = json.loads(line[len(MARKER):])
+    if stamps is None:
+        raise RuntimeError(f"Aucun relevé de démarrage (code {proc.returncode}) :\n{proc.stderr[-2000:]}")
+    phases, prev = {}, t_spawn
+    for key, _label in PHASES:
+        phases[key] = (stamps[key] - prev) * 1000.0
+        prev = stamps[key]
+    return {
+        "total_ms": (stamps["shown"] - t_spawn) * 1000.0,
+        "phases_ms": phases,
+        "imports": import_breakdown(parse_importtime(proc.stderr), package),
+    }
+
+
+def format_report(runs: List[Dict], top: int = 12) -> str:
+    totals = [r["total_ms"] for r in runs]
+    best = min(runs, key=lambda r: r["total_ms"])
+    lines = [
+        f"Première fenêtre : médiane {statistics.median(totals):.0f} ms, min {min(totals):.0f} ms, "
+        f"max {max(totals):.0f} ms sur {len(runs)} lancement(s) — objectif {TARGET_S * 1000:.0f} ms "
+        f"({'atteint' if statistics.median(totals) <= TARGET_S * 1000 else 'dépassé'})",
+        "",
+        "Phases (meilleur lancement) :",
+    ]
+    for key, label in PHASES:
+        lines.append(f"  {label:<28} {best['phases_ms'][key]:8.1f} ms")
+    lines += ["", f"Imports par paquet (temps propre, top {top}) :"]
+    imports = best["imports"]
+    for group, ms in imports[:top]:
+        lines.append(f"  {group:<28} {ms:8.1f} ms")
+    rest = sum(ms for _g, ms in imports[top:])
+    if rest:
+        lines.append(f"  {'(autres)':<28} {rest:8.1f} ms")
+    lines.append(f"  {'Total imports':<28} {sum(ms for _g, ms in imports):8.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="etacomp --startup-profile",
+                                 description="Mesure du démarrage : première fenêtre et imports.")
+    ap.add_argument("--runs", type=int, default=3, help="nombre de lancements (défaut 3)")
+    ap.add_argument("--top", type=int, default=12, help="nombre de paquets listés (défaut 12)")
+    ap.add_argument("--offscreen", action="store_true", help="sans affichage (QT_QPA_PLATFORM=offscreen)")
+    ap.add_argument("--json", action="store_true", help="résultats bruts en JSON")
+    args = ap.parse_args(argv)
+
+    runs = [run_once(offscreen=args.offscreen) for _ in range(max(1, args.runs))]
+    print(json.dumps(runs, indent=2) if args.json else format_report(runs, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
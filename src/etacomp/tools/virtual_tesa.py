@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Instrument TESA virtuel sur un pseudo-terminal Linux (pty), pour tester l'acquisition sans matériel.
+
+Sources :
+- relecture d'une capture brute horodatée (cadence d'origine ou accélérée ×10, ×100…) ;
+- synthèse de lectures à partir d'un modèle d'erreur de comparateur.
+
+Émission continue (cadence fixe) ou « À la demande » : une trame par commande reçue (ex. "M\\r").
+L'application (ou un banc) ouvre `instrument.device` comme un port série ordinaire.
+
+Format de capture (.tcap, texte) : une ligne par morceau reçu, « t_secondes<TAB>OCTETS HEX ».
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Chunk = Tuple[float, bytes]   # (instant relatif en s, octets)
+
+
+# --------- CAPTURES ---------
+def read_capture(path: Path) -> List[Chunk]:
+    """Lit une capture .tcap (lignes vides et commentaires « # » ignorés)."""
+    out: List[Chunk] = []
+    for n, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        t, _, hexdata = line.partition("\t")
+        try:
+            out.append((float(t), bytes.fromhex(hexdata)))
+        except ValueError as exc:
+            raise ValueError(f"{path}:{n} : ligne de capture invalide ({exc})") from exc
+    return out
+
+
+def write_capture(path: Path, chunks: Iterable[Chunk]) -> Path:
+    path = Path(path)
+    lines = ["# capture série EtaComp : t_secondes<TAB>octets hex"]
+    lines += [f"{t:.6f}\t{data.hex(' ').upper()}" for t, data in chunks]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def record_capture(port: str, path: Path, *, baudrate: int = 4800, duration_s: float = 10.0) -> int:
+    """Enregistre le flux brut d'un port réel (horodatage à la réception). Retourne le nombre d'octets."""
+    from ..io.serialio import SerialConnection
+
+    conn = SerialConnection()
+    conn.open(port, baudrate=baudrate)
+    chunks: List[Chunk] = []
+    t0 = time.perf_counter()
+    try:
+        while time.perf_counter() - t0 < duration_s:
+            data = conn.read_wait(0.05)
+            if data:
+                chunks.append((time.perf_counter() - t0, data))
+    finally:
+        conn.close()
+    write_capture(path, chunks)
+    return sum(len(d) for _, d in chunks)
+
+
+# --------- SYNTHÈSE ---------
+@dataclass
+class ComparatorErrorModel:
+    """
+    Erreur simulée d'un comparateur à la cible x (mm) :
+    gain linéaire + erreur périodique + décalage d'hystérésis en descente + bruit de fidélité,
+    puis arrondi à la résolution.
+    """
+    gain_error: float = 0.0          # mm/mm
+    periodic_amplitude: float = 0.0  # mm
+    periodic_period: float = 1.0     # mm (tour de cadran)
+    hysteresis: float = 0.0          # mm ajoutés en descente
+    noise_std: float = 0.0           # mm (écart-type de répétabilité)
+    resolution: float = 0.001        # mm
+    seed: Optional[int] = None
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+
+    def reading(self, target: float, direction: str = "up") -> float:
+        err = self.gain_error * target
+        if self.periodic_amplitude and self.periodic_period:
+            err += self.periodic_amplitude * math.sin(2 * math.pi * target / self.periodic_period)
+        if direction == "down":
+            err += self.hysteresis
+        if self.noise_std:
+            err += self._rng.gauss(0.0, self.noise_std)
+        value = target + err
+        if self.resolution > 0:
+            value = round(value / self.resolution) * self.resolution
+        return value
+
+
+def campaign_readings(
+    targets: Sequence[float], model: ComparatorErrorModel, cycles: int = 1
+) -> Iterator[Tuple[float, str, float]]:
+    """(cible, sens, lecture) dans l'ordre d'un cycle : montée puis descente."""
+    ordered = sorted(float(t) for t in targets)
+    for _ in range(max(1, int(cycles))):
+        for t in ordered:
+            yield t, "up", model.reading(t, "up")
+        for t in reversed(ordered):
+            yield t, "down", model.reading(t, "down")
+
+
+def format_frame(value: float, *, decimals: int = 3, eol: bytes = b"\r\n", parity_bit: bool = False) -> bytes:
+    """Trame TESA ASCII « +0.012\\r\\n » ; parity_bit force le bit 7 (test du masque 7 bits)."""
+    frame = f"{value:+.{decimals}f}".encode("ascii") + eol
+    if parity_bit:
+        frame = bytes(b | 0x80 for b in frame)
+    return frame
+
+
+# --------- INSTRUMENT ---------
+class VirtualTesa:
+    """
+    Instrument virtuel sur pty. Le côté esclave (`device`) est ouvert par le lecteur testé ;
+    l'instrument écrit sur le côté maître depuis son propre thread. open() crée le pty,
+    start() lance l'émission (le lecteur ouvre donc le port avant : SerialConnection.open
+    vide le tampon d'entrée).
+
+    - frames : trames à émettre (synthèse) ; chunks : capture horodatée à relire (`speed`) ;
+    - trigger : commande « À la demande » (ex. b"M") ; une trame par commande reçue,
+      sinon émission continue toutes les `interval_s` ;
+    - baudrate : si fourni, les octets sont espacés comme sur la ligne (10 bits/octet) ;
+    - drop_on_full : tampon pty plein → octets perdus et comptés (dépassement d'UART),
+      au lieu de bloquer l'émission.
+    """
+
+    def __init__(
+        self,
+        *,
+        frames: Optional[Iterable[bytes]] = None,
+        chunks: Optional[Sequence[Chunk]] = None,
+        speed: float = 1.0,
+        interval_s: float = 0.0,
+        trigger: Optional[bytes] = None,
+        baudrate: Optional[int] = None,
+        drop_on_full: bool = False,
+        loop: bool = False,
+    ):
+        if (frames is None) == (chunks is None):
+            raise ValueError("Fournir soit frames (synthèse), soit chunks (capture)")
+        if speed <= 0:
+            raise ValueError("speed doit être > 0")
+        self._frames = list(frames) if frames is not None else None
+        self._chunks = list(chunks) if chunks is not None else None
+        self._speed = float(speed)
+        self._interval_s = max(0.0, float(interval_s))
+        self._trigger = bytes(trigger) if trigger else None
+        self._byte_s = 10.0 / baudrate if baudrate else 0.0
+        self._drop_on_full = bool(drop_on_full)
+        self._loop = bool(loop)
+
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._th: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.done = threading.Event()
+
+        # Compteurs (lecture libre depuis un autre thread)
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.bytes_dropped = 0
+        self.triggers = 0
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    # --------- CYCLE DE VIE ---------
+    @property
+    def device(self) -> str:
+        if self._slave is None:
+            raise RuntimeError("Instrument non ouvert")
+        return os.ttyname(self._slave)
+
+    def open(self) -> "VirtualTesa":
+        """Crée le pty sans émettre : le lecteur peut ouvrir `device` avant start()."""
+        if self._master is not None:
+            return self
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("Instrument virtuel : pty Linux uniquement")
+        import tty
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)   # pas d'écho ni de conversion CR/LF avant l'ouverture par le lecteur
+        if self._drop_on_full:
+            os.set_blocking(self._master, False)
+        return self
+
+    def start(self) -> "VirtualTesa":
+        self.open()
+        self._stop.clear()
+        self.done.clear()
+        self._th = threading.Thread(target=self._run, name="VirtualTesa", daemon=True)
+        self._th.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._th is not None:
+            self._th.join(timeout=2.0)
+            self._th = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+
+    def __enter__(self) -> "VirtualTesa":
+        return self.open()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def wait_done(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+    # --------- ÉMISSION ---------
+    def _write(self, data: bytes) -> None:
+        if self._byte_s:
+            for i in range(len(data)):
+                self._write_now(data[i:i + 1])
+                if self._stop.wait(self._byte_s):
+                    return
+        else:
+            self._write_now(data)
+
+    def _write_now(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view and not self._stop.is_set():
+            try:
+                n = os.write(self._master, view)
+            except BlockingIOError:
+                n = 0
+            except OSError:
+                self._stop.set()
+                return
+            self.bytes_sent += n
+            view = view[n:]
+            if view and self._drop_on_full:
+                self.bytes_dropped += len(view)
+                return
+
+    def _wait_trigger(self, pending: bytearray) -> bool:
+        """Attend la commande de déclenchement ; False si arrêt demandé."""
+        while not self._stop.is_set():
+            i = pending.find(self._trigger)
+            if i >= 0:
+                del pending[:i + len(self._trigger)]
+                self.triggers += 1
+                return True
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if ready:
+                try:
+                    pending += os.read(self._master, 4096)
+                except (BlockingIOError, OSError):
+                    pass
+        return False
+
+    def _run(self) -> None:
+        self.started_at = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                if self._frames is not None:
+                    self._run_frames()
+                else:
+                    self._run_chunks()
+                if not self._loop:
+                    break
+        finally:
+            self.finished_at = time.perf_counter()
+            self.done.set()
+
+    def _run_frames(self) -> None:
+        pending = bytearray()
+        for frame in self._frames:
+            if self._trigger is not None:
+                if not self._wait_trigger(pending):
+                    return
+            elif self.frames_sent and self._interval_s and self._stop.wait(self._interval_s):
+                return
+            if self._stop.is_set():
+                return
+            self._write(frame)
+            self.frames_sent += 1
+
+    def _run_chunks(self) -> None:
+        t0 = time.perf_counter()
+        base = self._chunks[0][0] if self._chunks else 0.0
+        for t, data in self._chunks:
+            delay = t0 + (t - base) / self._speed - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            if self._stop.is_set():
+                return
+            self._write(data)
+            self.frames_sent += 1
+
+
+# --------- CLI ---------
+def _parse_eol(text: str) -> bytes:
+    return {"CR": b"\r", "LF": b"\n", "CRLF": b"\r\n", "AUCUN": b""}[text.upper()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="virtual_tesa",
+        description="Instrument TESA virtuel (pty Linux) : relecture de capture ou synthèse",
+    )
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_rep = sub.add_parser("replay", help="Relit une capture .tcap")
+    p_rep.add_argument("capture", type=Path)
+    p_rep.add_argument("--speed", type=float, default=1.0, help="Accélération (1, 10, 100…)")
+    p_rep.add_argument("--loop", action="store_true")
+
+    p_syn = sub.add_parser("synth", help="Lectures synthétiques d'un modèle d'erreur")
+    p_syn.add_argument("--targets", default="0,1,2,3,4,5,6,7,8,9,10", help="Cibles (mm), séparées par des virgules")
+    p_syn.add_argument("--cycles", type=int, default=3)
+    p_syn.add_argument("--gain", type=float, default=0.0005, help="Erreur de gain (mm/mm)")
+    p_syn.add_argument("--periodic", type=float, default=0.002, help="Amplitude périodique (mm)")
+    p_syn.add_argument("--hysteresis", type=float, default=0.001)
+    p_syn.add_argument("--noise", type=float, default=0.0005, help="Écart-type de fidélité (mm)")
+    p_syn.add_argument("--resolution", type=float, default=0.001)
+    p_syn.add_argument("--decimals", type=int, default=3)
+    p_syn.add_argument("--eol", default="CRLF", choices=["CR", "LF", "CRLF"])
+    p_syn.add_argument("--parity-bit", action="store_true", help="Force le bit 7 (teste le masque 7 bits)")
+    p_syn.add_argument("--interval", type=float, default=0.5, help="Intervalle entre trames en continu (s)")
+    p_syn.add_argument("--trigger", default=None, help="Mode « À la demande » : commande attendue (ex. M)")
+    p_syn.add_argument("--seed", type=int, default=None)
+    p_syn.add_argument("--loop", action="store_true")
+
+    p_rec = sub.add_parser("record", help="Enregistre une capture depuis un port réel")
+    p_rec.add_argument("port")
+    p_rec.add_argument("capture", type=Path)
+    p_rec.add_argument("--duration", type=float, default=10.0)
+
+    for p in (p_rep, p_syn, p_rec):
+        p.add_argument("--baudrate", type=int, default=None, help="Cadence octet de la ligne (défaut : sans)")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "record":
+        n = record_capture(args.port, args.capture, baudrate=args.baudrate or 4800, duration_s=args.duration)
+        print(f"{n} octets enregistrés dans {args.capture}")
+        return 0
+
+    if args.cmd == "replay":
+        inst = VirtualTesa(chunks=read_capture(args.capture), speed=args.speed,
+                           baudrate=args.baudrate, loop=args.loop)
+    else:
+        model = ComparatorErrorModel(
+            gain_error=args.gain, periodic_amplitude=args.periodic, hysteresis=args.hysteresis,
+            noise_std=args.noise, resolution=args.resolution, seed=args.seed,
+        )
+        targets = [float(t) for t in args.targets.split(",") if t.strip()]
+        frames = [format_frame(v, decimals=args.decimals, eol=_parse_eol(args.eol), parity_bit=args.parity_bit)
+                  for _, _, v in campaign_readings(targets, model, args.cycles)]
+        inst = VirtualTesa(frames=frames, interval_s=args.interval,
+                           trigger=args.trigger.encode() if args.trigger else None,
+                           baudrate=args.baudrate, loop=args.loop)
+    try:
+        inst.open()
+    except RuntimeError as exc:
+        print(exc)
+        return 1
+    print(f"Instrument virtuel prêt : {inst.device}  (Ctrl+C pour arrêter)")
+    print(f"Astuce : ETACOMP_EXTRA_SERIAL_PORTS={inst.device} pour le proposer dans l'onglet Session.")
+    try:
+        if args.cmd == "replay" or not args.trigger:
+            input("Entrée pour démarrer l'émission (une fois le port ouvert côté lecteur)…")
+        inst.start()
+        while not inst.wait_done(0.5):
+            pass
+        print(f"Terminé : {inst.frames_sent} trames, {inst.bytes_sent} octets"
+              f" ({inst.triggers} déclenchements, {inst.bytes_dropped} octets perdus)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        inst.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -26,11 +27,13 @@ from ..io.backup import (
     category_stats,
     default_backup_filename,
     export_backup,
+    export_incremental_backup,
     format_bytes,
     list_removable_mounts,
     read_manifest,
     restore_backup,
 )
+from .task_runner import TaskHandle, task_runner
 
 
 class BackupWindow(QWidget):
@@ -42,6 +45,7 @@ class BackupWindow(QWidget):
         self.setMinimumHeight(520)
         self._checkboxes: dict[str, QCheckBox] = {}
         self._mount_paths: dict[str, Path] = {}
+        self._task: TaskHandle | None = None
         self._build_ui()
         self._refresh_stats()
         self._refresh_mounts()
@@ -75,6 +79,13 @@ class BackupWindow(QWidget):
         self.filename_edit = QLineEdit(default_backup_filename())
         name_row.addWidget(self.filename_edit, stretch=1)
         dest_layout.addLayout(name_row)
+        self.incremental_cb = QCheckBox(
+            "Incrémentale : seulement les fichiers modifiés depuis la dernière sauvegarde de la destination"
+        )
+        self.incremental_cb.setToolTip(
+            "Les archives précédentes du même dossier restent nécessaires à la restauration."
+        )
+        dest_layout.addWidget(self.incremental_cb)
         layout.addWidget(dest_group)
 
         cat_group = QGroupBox("Données à exporter / restaurer")
@@ -119,10 +130,14 @@ class BackupWindow(QWidget):
         self.btn_export.clicked.connect(self._on_export)
         self.btn_restore = QPushButton("Restaurer…")
         self.btn_restore.clicked.connect(self._on_restore)
+        self.btn_cancel = QPushButton("Annuler")
+        self.btn_cancel.setVisible(False)
+        self.btn_cancel.clicked.connect(self._on_cancel)
         btn_close = QPushButton("Fermer")
         btn_close.clicked.connect(self.close)
         actions.addWidget(self.btn_export)
         actions.addWidget(self.btn_restore)
+        actions.addWidget(self.btn_cancel)
         actions.addStretch()
         actions.addWidget(btn_close)
         layout.addLayout(actions)
@@ -180,10 +195,37 @@ class BackupWindow(QWidget):
             name += ".zip"
         return dest_dir / name
 
-    def _set_busy(self, busy: bool) -> None:
+    def _set_busy(self, busy: bool, *, cancellable: bool = False) -> None:
         self.progress.setVisible(busy)
         self.btn_export.setEnabled(not busy)
         self.btn_restore.setEnabled(not busy)
+        self.btn_cancel.setVisible(busy and cancellable)
+        self.btn_cancel.setEnabled(True)
+
+    def _start_task(self, name: str, fn, *args, cancellable: bool, **kwargs) -> TaskHandle:
+        """Lance fn en arrière-plan (TaskRunner) : journal de progression, interface verrouillée."""
+        self._set_busy(True, cancellable=cancellable)
+        self.log.clear()
+        self._task = task_runner.submit(
+            name, fn, *args, with_progress=True, cancellable=cancellable, on_progress=self._append_log, **kwargs
+        )
+        return self._task
+
+    def _end_task(self) -> None:
+        self._task = None
+        self._set_busy(False)
+
+    def _on_cancel(self) -> None:
+        if self._task is not None and self._task.cancel():
+            self.btn_cancel.setEnabled(False)
+            self._append_log("Annulation demandée…")
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        if self._task is not None and not self._task.is_done():
+            QMessageBox.information(self, "Opération en cours", "Attendez la fin de l'opération (ou annulez l'export).")
+            event.ignore()
+            return
+        super().closeEvent(event)
 
     def _on_export(self) -> None:
         categories = self._selected_categories()
@@ -203,23 +245,34 @@ class BackupWindow(QWidget):
             if ans != QMessageBox.StandardButton.Yes:
                 return
 
-        self._set_busy(True)
-        self.log.clear()
-        try:
-            result = export_backup(
-                archive,
-                categories,
-                progress=self._append_log,
-            )
-            QMessageBox.information(
-                self,
-                "Export réussi",
-                f"{result.file_count} fichier(s) exporté(s)\n{archive}",
-            )
-        except Exception as exc:
-            QMessageBox.critical(self, "Erreur export", str(exc))
-        finally:
-            self._set_busy(False)
+        def _done(result) -> None:
+            self._end_task()
+            detail = f"{result.file_count} fichier(s) exporté(s)\n{archive}"
+            if result.parent is not None:
+                detail = (
+                    f"{result.stored_count} fichier(s) nouveau(x) ou modifié(s) sur {result.file_count}\n"
+                    f"{archive}\nBase : {result.parent.name}"
+                )
+            QMessageBox.information(self, "Export réussi", detail)
+
+        def _failed(message: str) -> None:
+            self._end_task()
+            QMessageBox.critical(self, "Erreur export", message)
+
+        def _cancelled() -> None:
+            # Archive incomplète : supprimée
+            try:
+                archive.unlink(missing_ok=True)
+            except OSError:
+                pass
+            self._end_task()
+            self._append_log("Export annulé.")
+
+        export_fn = export_incremental_backup if self.incremental_cb.isChecked() else export_backup
+        self._start_task(
+            "Export sauvegarde", export_fn, archive, categories, cancellable=True,
+            on_finished=_done, on_failed=_failed, on_cancelled=_cancelled,
+        )
 
     def _on_restore(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -244,26 +297,30 @@ class BackupWindow(QWidget):
         msg = (
             f"Archive : {Path(path).name}\n"
             f"Créée le : {manifest.created_at}\n"
-            f"Version : {manifest.app_version}\n\n"
-            f"Les données actuelles seront sauvegardées avant restauration.\n"
+            f"Version : {manifest.app_version}\n"
+            + (f"Incrémentale (archive précédente : {manifest.parent})\n" if manifest.incremental else "")
+            + "\n"
+            f"Les fichiers remplacés seront sauvegardés avant restauration.\n"
             f"Continuer ?"
         )
         if QMessageBox.question(self, "Confirmer la restauration", msg) != QMessageBox.StandardButton.Yes:
             return
 
-        self._set_busy(True)
-        self.log.clear()
-        try:
-            result = restore_backup(
-                Path(path),
-                categories,
-                progress=self._append_log,
-            )
+        def _done(result) -> None:
+            self._end_task()
             detail = f"{result.file_count} fichier(s) restauré(s)."
+            if result.skipped_count:
+                detail += f"\n{result.skipped_count} fichier(s) déjà identique(s), non réécrit(s)."
             if result.safety_backup_path:
                 detail += f"\nSauvegarde de sécurité :\n{result.safety_backup_path}"
             QMessageBox.information(self, "Restauration réussie", detail)
-        except Exception as exc:
-            QMessageBox.critical(self, "Erreur restauration", str(exc))
-        finally:
-            self._set_busy(False)
+
+        def _failed(message: str) -> None:
+            self._end_task()
+            QMessageBox.critical(self, "Erreur restauration", message)
+
+        # Non annulable : une restauration interrompue laisserait un mélange d'anciennes et de nouvelles données
+        self._start_task(
+            "Restauration sauvegarde", restore_backup, Path(path), categories, cancellable=False,
+            on_finished=_done, on_failed=_failed,
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox, QTableWidget,
+    QTableWidgetItem, QFileDialog, QMessageBox, QPlainTextEdit
+)
+
+from ..core.latency import BUDGET_MS, STAGE_LABELS, TOTAL, latency_tracker
+
+
+class LatencyDialog(QDialog):
+    """Latence octet → cellule : percentiles par étape, histogramme du total, export des échantillons."""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Latence de la chaîne de mesure")
+        self.resize(640, 520)
+        root = QVBoxLayout(self)
+
+        self.chk_enabled = QCheckBox("Instrumenter les lectures (horodatage à chaque étape)")
+        self.chk_enabled.setChecked(latency_tracker.enabled)
+        self.lbl_budget = QLabel()
+        root.addWidget(self.chk_enabled)
+        root.addWidget(self.lbl_budget)
+
+        self.table = QTableWidget(0, 6)
+        self.table.setHorizontalHeaderLabels(["Étape", "n", "p50 (ms)", "p95 (ms)", "p99 (ms)", "max (ms)"])
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        root.addWidget(self.table, stretch=2)
+
+        root.addWidget(QLabel("Histogramme du total (ms)"))
+        self.hist_view = QPlainTextEdit(); self.hist_view.setReadOnly(True)
+        root.addWidget(self.hist_view, stretch=1)
+
+        bar = QHBoxLayout()
+        self.btn_export = QPushButton("Exporter les échantillons…")
+        self.btn_clear = QPushButton("Réinitialiser")
+        self.btn_close = QPushButton("Fermer")
+        bar.addWidget(self.btn_export); bar.addWidget(self.btn_clear)
+        bar.addStretch(); bar.addWidget(self.btn_close)
+        root.addLayout(bar)
+
+        self.chk_enabled.toggled.connect(self._set_enabled)
+        self.btn_export.clicked.connect(self._export)
+        self.btn_clear.clicked.connect(self._clear)
+        self.btn_close.clicked.connect(self.accept)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(self.REFRESH_MS)
+        self.refresh()
+
+    def _set_enabled(self, on: bool):
+        latency_tracker.enabled = bool(on)
+
+    def _clear(self):
+        latency_tracker.clear()
+        self.refresh()
+
+    def refresh(self):
+        rows = latency_tracker.summary()
+        self.table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            label = "Total (octet → bip)" if row["stage"] == TOTAL else STAGE_LABELS.get(row["stage"], row["stage"])
+            cells = [label, str(row["n"])] + [f"{row[k]:.2f}" for k in ("p50", "p95", "p99", "max")]
+            for c, text in enumerate(cells):
+                self.table.setItem(r, c, QTableWidgetItem(text))
+        self.table.resizeColumnsToContents()
+
+        total = next((row for row in rows if row["stage"] == TOTAL), None)
+        if total is None:
+            self.lbl_budget.setText(f"Budget : {BUDGET_MS:.0f} ms — aucune lecture instrumentée.")
+        else:
+            ok = total["p99"] <= BUDGET_MS
+            self.lbl_budget.setText(
+                f"Budget : {BUDGET_MS:.0f} ms — p99 {total['p99']:.1f} ms "
+                f"({'respecté' if ok else 'dépassé'}), {total['over_budget']} / {total['n']} lectures hors budget."
+            )
+        hist = latency_tracker.histogram(TOTAL)
+        peak = max((n for _, _, n in hist), default=0)
+        lines = [f"{lo:7.1f} – {hi:7.1f} | {'█' * (round(40 * n / peak) if peak else 0)} {n}" for lo, hi, n in hist]
+        self.hist_view.setPlainText("\n".join(lines))
+
+    def _export(self):
+        if not len(latency_tracker):
+            QMessageBox.information(self, "Latence", "Aucun échantillon à exporter.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Exporter les échantillons", "latence.csv", "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            latency_tracker.export_csv(path)
+        except Exception as e:
+            QMessageBox.warning(self, "Latence", f"Export impossible :\n{e}")
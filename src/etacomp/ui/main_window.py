@@ -1,111 +1,186 @@
+from typing import Dict, Optional
+
 from PySide6.QtWidgets import (
     QMainWindow, QTabWidget, QDialog, QLabel,
-    QVBoxLayout, QPushButton
+    QVBoxLayout, QPushButton, QMessageBox, QWidget
 )
 from PySide6.QtGui import QAction, QPixmap, QCloseEvent
-from PySide6.QtCore import Qt, QTimer
-
-from .tabs.session import SessionTab
-from .tabs.measures import MeasuresTab
-from .tabs.library import LibraryTab
-from .tabs.settings import SettingsTab
-from .tabs.fidelity_deviations import FidelityDeviationsTab
-from .tabs.finalization import FinalizationTab
-from .tabs.calibration_curve import CalibrationCurveTab
+from PySide6.QtCore import Qt, QTimer, Signal
+
 from ..config.defaults import APP_TITLE
 from .. import __version__
 from ..config.prefs import load_prefs
 from .themes import apply_theme
 from .help_dialog import HelpDialog
 from ..state.session_store import session_store
+from ..io.serial_hub import serial_hub
 from ..io.serial_manager import serial_manager
-from ..io.storage import save_autosave_session
+from ..config.tesa import load_tesa_config, DEFAULT_SEND_CONFIG, DEFAULT_ASCII_CONFIG
+from ..io.storage import autosave_journal
 from ..package_resources import resource_path
 
 
+class _TabPlaceholder(QWidget):
+    """Emplacement d'un onglet construit à sa première activation."""
+
+    def __init__(self, title: str):
+        super().__init__()
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        self._label = QLabel(f"Chargement de l'onglet « {title} »…")
+        self._label.setAlignment(Qt.AlignCenter)
+        lay.addWidget(self._label)
+        self.content: Optional[QWidget] = None
+
+    def set_content(self, widget: QWidget) -> None:
+        self._label.deleteLater()
+        self.layout().addWidget(widget)
+        self.content = widget
+
+
 class MainWindow(QMainWindow):
+    # Onglets (attribut, titre) : seul l'onglet courant est construit au démarrage ; les
+    # autres (matplotlib, règles, bibliothèque…) le sont à leur première activation.
+    TABS = (
+        ("session_tab", "Session"),
+        ("measures_tab", "Mesures"),
+        ("fidelity_tab", "Écarts de fidélité"),
+        ("calibration_tab", "Courbe d'étalonnage"),
+        ("finalization_tab", "Finalisation"),
+        ("library_tab", "Bibliothèque des comparateurs"),
+        ("settings_tab", "Paramètres"),
+    )
+
+    tab_built = Signal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
         self.resize(1200, 800)
         self.statusBar().showMessage("")  # barre de statut pour feedback (export PDF, etc.)
 
+        # Configuration série enregistrée : appliquée sans attendre l'ouverture de Paramètres
+        self._apply_serial_config()
+
         # --- Onglets ---
         self.tabs = QTabWidget()
-        self.session_tab = SessionTab()
-        self.measures_tab = MeasuresTab()
-        self.fidelity_tab = FidelityDeviationsTab(
-            get_runtime_session=self.get_rt_session,
-            go_to_session_tab=self.select_session_tab,
-        )
-        self.calibration_tab = CalibrationCurveTab(
-            get_runtime_session=self.get_rt_session
-        )
-        self.finalization_tab = FinalizationTab()
-        self.library_tab = LibraryTab()
-        self.settings_tab = SettingsTab()
-
-        self.tabs.addTab(self.session_tab, "Session")
-        self.tabs.addTab(self.measures_tab, "Mesures")
-        self.tabs.addTab(self.fidelity_tab, "Écarts de fidélité")
-        self.tabs.addTab(self.calibration_tab, "Courbe d'étalonnage")
-        self.tabs.addTab(self.finalization_tab, "Finalisation")
-        self.tabs.addTab(self.library_tab, "Bibliothèque des comparateurs")
-        self.tabs.addTab(self.settings_tab, "Paramètres")
+        self._placeholders: Dict[str, _TabPlaceholder] = {}
+        for name, title in self.TABS:
+            setattr(self, name, None)
+            self._placeholders[name] = _TabPlaceholder(title)
+            self.tabs.addTab(self._placeholders[name], title)
         self.setCentralWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
+        self.tab("session_tab")
 
         # --- Appliquer le thème au démarrage ---
         prefs = load_prefs()
         apply_theme(self, getattr(prefs, "theme", "dark"))
 
-        # Rafraîchir Bibliothèque quand un comparateur est créé depuis Session
-        try:
-            self.session_tab.comparator_created.connect(lambda _ref: self.library_tab.reload())
-        except Exception:
-            pass
+        self._setup_menus()
 
+        # --- Autosave (Paramètres > Sauvegarde) ---
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.timeout.connect(self._run_autosave)
+        self._reload_autosave_timer()
+        QTimer.singleShot(0, self._offer_autosave_recovery)
+
+    @staticmethod
+    def _apply_serial_config() -> None:
+        serial_manager.set_send_config(**DEFAULT_SEND_CONFIG)
+        serial_manager.set_ascii_config(**DEFAULT_ASCII_CONFIG)
+        serial_manager.apply_config(load_tesa_config())
+
+    # ===== Onglets différés =====
+    def tab(self, name: str) -> QWidget:
+        """Onglet `name` (attribut de TABS), construit si nécessaire."""
+        widget = getattr(self, name)
+        if widget is not None:
+            return widget
+        widget = getattr(self, f"_create_{name}")()
+        setattr(self, name, widget)
+        self._placeholders[name].set_content(widget)
+        self._wire_tab(name)
+        self.tab_built.emit(name)
+        return widget
+
+    def build_all_tabs(self) -> None:
+        for name, _title in self.TABS:
+            self.tab(name)
+
+    def _on_current_tab_changed(self, index: int):
+        if 0 <= index < len(self.TABS):
+            self.tab(self.TABS[index][0])
+
+    def _create_session_tab(self):
+        from .tabs.session import SessionTab
+        return SessionTab()
+
+    def _create_measures_tab(self):
+        from .tabs.measures import MeasuresTab
+        return MeasuresTab()
+
+    def _create_fidelity_tab(self):
+        from .tabs.fidelity_deviations import FidelityDeviationsTab
+        return FidelityDeviationsTab(
+            get_runtime_session=self.get_rt_session,
+            go_to_session_tab=self.select_session_tab,
+        )
+
+    def _create_calibration_tab(self):
+        from .tabs.calibration_curve import CalibrationCurveTab  # importe matplotlib
+        return CalibrationCurveTab(get_runtime_session=self.get_rt_session)
+
+    def _create_finalization_tab(self):
+        from .tabs.finalization import FinalizationTab
+        return FinalizationTab()
+
+    def _create_library_tab(self):
+        from .tabs.library import LibraryTab
+        return LibraryTab()
+
+    def _create_settings_tab(self):
+        from .tabs.settings import SettingsTab
+        return SettingsTab()
+
+    def _wire_tab(self, name: str) -> None:
+        """Connexions entre onglets, établies dès que les deux extrémités existent."""
+        session, settings = self.session_tab, self.settings_tab
+        if name == "settings_tab":
+            # --- Écouter les changements de thème et d'autosave depuis Paramètres ---
+            try:
+                settings.themeChanged.connect(self._on_theme_changed)
+            except Exception:
+                pass
+            try:
+                settings.autosaveChanged.connect(self._reload_autosave_timer)
+            except Exception:
+                pass
+        if session is None or settings is None or name not in ("session_tab", "settings_tab"):
+            return
         # Rafraîchir la liste des détenteurs dans Session quand modifiée depuis Paramètres
         try:
-            self.settings_tab.detenteurs_tab.detenteurs_changed.connect(self.session_tab.reload_detenteurs)
+            settings.detenteurs_tab.detenteurs_changed.connect(session.reload_detenteurs)
         except Exception:
             pass
-
         # Rafraîchir le tableau Détenteurs quand créé depuis Session
         try:
-            self.session_tab.detenteur_created.connect(self.settings_tab.detenteurs_tab.refresh)
+            session.detenteur_created.connect(settings.detenteurs_tab.refresh)
         except Exception:
             pass
-
         # Rafraîchir la liste des bancs dans Session quand modifiée depuis Paramètres
         try:
-            self.settings_tab.bancs_etalon_tab.bancs_changed.connect(self.session_tab.reload_bancs)
+            settings.bancs_etalon_tab.bancs_changed.connect(session.reload_bancs)
         except Exception:
             pass
 
-        # --- Écouter les changements de thème depuis Paramètres ---
-        try:
-            self.settings_tab.themeChanged.connect(self._on_theme_changed)
-        except Exception:
-            pass
-
-        self._setup_menus()
-
-        # --- Autosave (Paramètres > Sauvegarde) ---
-        self._autosave_timer = QTimer(self)
-        self._autosave_timer.timeout.connect(self._run_autosave)
-        try:
-            self.settings_tab.autosaveChanged.connect(self._reload_autosave_timer)
-        except Exception:
-            pass
-        self._reload_autosave_timer()
-
     # ===== Session runtime accessors =====
     def get_rt_session(self):
         return session_store.current
 
     def select_session_tab(self):
         try:
-            self.tabs.setCurrentWidget(self.session_tab)
+            self.tabs.setCurrentWidget(self._placeholders["session_tab"])
         except Exception:
             pass
 
@@ -133,7 +208,7 @@ class MainWindow(QMainWindow):
         fichier_menu.addSeparator()
 
         export_pdf_action = QAction("Exporter le rapport &PDF…", self)
-        export_pdf_action.triggered.connect(self.finalization_tab._export_pdf)
+        export_pdf_action.triggered.connect(lambda: self.tab("finalization_tab")._export_pdf())
         fichier_menu.addAction(export_pdf_action)
 
         fichier_menu.addSeparator()
@@ -201,28 +276,62 @@ class MainWindow(QMainWindow):
 
     def _reload_autosave_timer(self):
         prefs = load_prefs()
+        if prefs.autosave_enabled:
+            # Chaque modification est journalisée ; la minuterie ne fait que forcer le fsync
+            session_store.attach_journal(autosave_journal)
+        else:
+            session_store.attach_journal(None)
         if prefs.autosave_enabled and prefs.autosave_interval_s > 0:
             self._autosave_timer.start(int(prefs.autosave_interval_s) * 1000)
         else:
             self._autosave_timer.stop()
 
     def _run_autosave(self):
-        prefs = load_prefs()
-        if not prefs.autosave_enabled:
-            return
-        if not session_store.can_save():
+        if session_store.journal is None:
             return
         try:
-            path = save_autosave_session(session_store.current)
-            if path:
-                self.statusBar().showMessage(f"Sauvegarde auto : {path.name}", 5000)
+            if session_store.journal.sync():
+                self.statusBar().showMessage("Sauvegarde auto : journal synchronisé", 5000)
         except Exception:
             pass
 
+    def _offer_autosave_recovery(self):
+        """Après un arrêt non propre, propose de reprendre la session du journal autosave."""
+        if not autosave_journal.has_pending():
+            return
+        try:
+            recovered = autosave_journal.recover()
+        except Exception:
+            recovered = None
+        if recovered is None or not recovered.has_measures():
+            autosave_journal.discard()
+            return
+        answer = QMessageBox.question(
+            self,
+            "Session non enregistrée",
+            "L'application ne s'est pas fermée normalement.\n"
+            f"Une session en cours ({recovered.total_readings()} mesure(s), "
+            f"comparateur {recovered.comparator_ref or '—'}) peut être restaurée.\n\n"
+            "Restaurer cette session ?",
+        )
+        if answer == QMessageBox.Yes:
+            session_store.restore(recovered)
+            self.select_session_tab()
+        if not autosave_journal.started:
+            autosave_journal.discard()
+
     def closeEvent(self, event: QCloseEvent):
         """Issue #9 — libère le port COM (close() est idempotent ; aussi via aboutToQuit)."""
         try:
-            serial_manager.close()
+            serial_hub.close_all()
+        except Exception:
+            pass
+        try:
+            session_store.attach_journal(None)
         except Exception:
             pass
+        # Laisser finir un export / une sauvegarde en cours (fichier complet)
+        from .task_runner import task_runner
+        task_runner.cancel_all()
+        task_runner.wait(10000)
         super().closeEvent(event)
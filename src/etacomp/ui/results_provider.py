@@ -4,7 +4,14 @@ from __future__ import annotations
 ResultsProvider — point d'entrée unique pour les onglets d'analyse.
 
 Fournit:
+  compute(rt_session) -> (CalculatedResults, Verdict|None)   [calcul incrémental, sans SessionV2]
   compute_all(rt_session) -> (SessionV2, CalculatedResults, Verdict|None)
+  results_provider : instance partagée par les onglets (cache commun)
+
+Cache:
+  LRU indexé par le contenu de la session (lectures, série 5, snapshot comparateur)
+  et la version des règles chargées : changer d'onglet sans modifier la session ne
+  recalcule rien. Compteurs dans cache_info().
 
 Sources:
   - runtime_session (UI) → SessionV2 via session_adapter
@@ -12,10 +19,13 @@ Sources:
   - ToleranceRuleEngine (+ evaluate_tolerances) → Verdict (optionnel si règles absentes)
 """
 
-from typing import Optional, Tuple, List
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, List
 from pathlib import Path
 
-from ..core.session_adapter import build_session_from_runtime
+from ..core.session_adapter import build_session_from_runtime, resolve_comparator_snapshot
+from ..core.incremental_calculation import IncrementalCalculation
 from ..core.datetime_utils import utc_now_iso
 from ..core.calculation_engine import CalculationEngine, CalculatedResults
 from ..models.session import SessionV2, Series, SeriesKind, Direction, Measurement
@@ -24,15 +34,53 @@ from ..rules.verdict import evaluate_tolerances, Verdict
 from ..rules.tolerances import get_default_rules_path
 
 
+def _measures_key(rt) -> tuple:
+    """Tout ce dont dépendent les résultats : cycles, lectures par cible, série 5."""
+    series = tuple((float(ms.target), tuple(ms.readings or ())) for ms in (rt.series or []))
+    fid = getattr(rt, "fidelity", None)
+    fid_key = None
+    if fid and fid.samples:
+        fid_key = (float(fid.target), str(fid.direction), tuple(fid.samples), tuple(fid.timestamps or ()))
+    return (rt.series_count, series, fid_key)
+
+
+def _meta_key(rt) -> tuple:
+    """Métadonnées recopiées dans la SessionV2 (sans effet sur les résultats)."""
+    return (
+        rt.date, rt.operator, rt.temperature_c, rt.humidity_pct,
+        rt.comparator_ref, rt.observations,
+    )
+
+
+def _snapshot_key(snapshot: dict) -> str:
+    return json.dumps(snapshot or {}, sort_keys=True, default=str)
+
+
 class ResultsProvider:
     """Agrège la construction de SessionV2, les calculs et le verdict de tolérances."""
 
+    CACHE_SIZE = 8
+
     def __init__(self, rules_path: Optional[Path] = None) -> None:
         self.rules_path = rules_path or get_default_rules_path()
         self._tol_engine: Optional[ToleranceRuleEngine] = None
+        self._rules_version = 0
+        self._rules_stamp: Optional[Tuple[int, int]] = None
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
         self._load_rules()
 
+    def _rules_file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.rules_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _load_rules(self) -> None:
+        self._rules_stamp = self._rules_file_stamp()
+        self._rules_version += 1
         try:
             if self.rules_path.exists():
                 self._tol_engine = ToleranceRuleEngine.load(self.rules_path)
@@ -42,20 +90,79 @@ class ResultsProvider:
             # En cas d'erreur de lecture, désactiver les tolérances pour ne pas bloquer l'UI
             self._tol_engine = None
 
+    def _check_rules(self) -> None:
+        """Recharge les règles si le fichier a changé (édition dans Paramètres ▸ Règles)."""
+        if self._rules_file_stamp() != self._rules_stamp:
+            self._load_rules()
+
+    # ----- Cache -----
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "maxsize": self.CACHE_SIZE}
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, rt_session) -> Tuple[tuple, Optional[Dict[str, Any]], dict]:
+        self._check_rules()
+        snapshot = resolve_comparator_snapshot(rt_session)
+        key = (_measures_key(rt_session), _snapshot_key(snapshot), self._rules_version)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return key, entry, snapshot
+
+    def _store(self, key: tuple, entry: Dict[str, Any]) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _verdict(self, snapshot: dict, results: CalculatedResults) -> Optional[Verdict]:
+        if self._tol_engine is None:
+            return None
+        try:
+            return evaluate_tolerances(snapshot or {}, results, self._tol_engine)
+        except Exception:
+            return None
+
+    def compute(self, rt_session) -> Tuple[CalculatedResults, Optional[Verdict]]:
+        """
+        Résultats et verdict de la session runtime. Pour la session courante, lit le
+        calcul incrémental du SessionStore (aucun recalcul si rien n'a changé).
+        """
+        from ..state.session_store import session_store
+
+        key, entry, snapshot = self._entry(rt_session)
+        if entry is None:
+            if rt_session is session_store.current:
+                results = session_store.results()
+            else:
+                results = IncrementalCalculation.from_runtime(rt_session).results()
+            entry = {"results": results, "verdict": self._verdict(snapshot, results)}
+            self._store(key, entry)
+        return entry["results"], entry["verdict"]
+
     def compute_all(self, rt_session) -> Tuple[SessionV2, CalculatedResults, Optional[Verdict]]:
         """
         Construit une SessionV2, calcule les résultats et tente une évaluation de tolérances.
+        Session inchangée depuis le dernier appel : triplet servi par le cache.
         """
+        key, entry, _ = self._entry(rt_session)
+        meta = _meta_key(rt_session)
+        if entry is not None and entry.get("meta") == meta:
+            return entry["v2"], entry["results"], entry["verdict"]
         v2 = build_session_from_runtime(rt_session)
-        calc = CalculationEngine()
-        results = calc.compute(v2)
-        verdict = None
-        if self._tol_engine is not None:
-            try:
-                verdict = evaluate_tolerances(v2.comparator_snapshot or {}, results, self._tol_engine)
-            except Exception:
-                verdict = None
-        return v2, results, verdict
+        if entry is None:
+            results = CalculationEngine().compute(v2)
+            entry = {"results": results, "verdict": self._verdict(v2.comparator_snapshot, results)}
+        entry["v2"], entry["meta"] = v2, meta
+        self._store(key, entry)
+        return v2, entry["results"], entry["verdict"]
 
     def compute_with_fidelity(
         self,
@@ -88,10 +195,7 @@ class ResultsProvider:
         v2.series.append(s5)
         calc = CalculationEngine()
         results = calc.compute(v2)
-        verdict = None
-        if self._tol_engine is not None:
-            try:
-                verdict = evaluate_tolerances(v2.comparator_snapshot or {}, results, self._tol_engine)
-            except Exception:
-                verdict = None
-        return v2, results, verdict
+        return v2, results, self._verdict(v2.comparator_snapshot, results)
+
+
+results_provider = ResultsProvider()
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable, Optional, List, Dict
+import math
+from typing import Callable, Optional, List, Dict, Tuple
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QFormLayout, QComboBox, QSpinBox, QLabel, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QSizePolicy
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QBrush
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-from ..results_provider import ResultsProvider
+from ..results_provider import results_provider
+from ...state.session_store import session_store
 
 REMINDER_TEXT = (
     "Déroulement de cette phase :\n"
@@ -24,11 +27,18 @@ class CalibrationCurveTab(QWidget):
     """
     Onglet “Courbe d’étalonnage”.
     Trace la courbe (erreurs ou mesures) + tableau récapitulatif, avec seuils si disponibles.
+
+    Les artistes matplotlib sont créés une fois puis mis à jour en place (set_data) :
+    courbes, point critique et étiquette sont animés et recomposés par blitting sur un
+    fond mémorisé ; le fond (axes, grille, lignes guides, seuils ±Emt) n'est redessiné
+    que si la mise en page change (mode, cibles, seuils, échelle Y).
     """
+    # Regroupe les lectures rapprochées en un seul rafraîchissement pendant une campagne
+    LIVE_REFRESH_MS = 50
     def __init__(self, *, get_runtime_session: Callable[[], object]):
         super().__init__()
         self.get_runtime_session = get_runtime_session
-        self.provider = ResultsProvider()
+        self.provider = results_provider
         self.mode_errors = True  # défaut: courbe des erreurs
 
         root = QVBoxLayout(self)
@@ -47,6 +57,7 @@ class CalibrationCurveTab(QWidget):
         self.canvas = FigureCanvas(self.fig)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         v2.addWidget(self.canvas)
+        self._init_artists()
 
         # Tableau sous le graphe
         self.table = QTableWidget(0, 6)
@@ -78,91 +89,201 @@ class CalibrationCurveTab(QWidget):
         self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         self.btn_refresh.clicked.connect(self.refresh)
 
+        # Suivi en direct : rafraîchissement différé (onglet visible) ou à l'affichage
+        self._dirty = True
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.LIVE_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        session_store.measures_updated.connect(self._on_measures_updated)
+        session_store.session_changed.connect(self._on_measures_updated)
+
+    # ------------- Artistes persistants -------------
+    def _init_artists(self):
+        ax = self.ax = self.fig.add_subplot(111)
+        ax.set_xlabel("Cible (mm)")
+        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.5)
+        self.line_up, = ax.plot([], [], marker="o", animated=True)
+        self.line_down, = ax.plot([], [], marker="s", animated=True)
+        self.zero_line = ax.axhline(0.0, color="gray", linewidth=1, linestyle="--")
+        self.emt_lines = (
+            ax.axhline(0.0, color="red", linewidth=1, linestyle=":", visible=False),
+            ax.axhline(0.0, color="red", linewidth=1, linestyle=":", visible=False),
+        )
+        # Lignes verticales légères sur chaque cible (reconstruites si les cibles changent)
+        self.guides = []
+        self.crit_marker, = ax.plot([], [], linestyle="none", marker="o", color="orange",
+                                    markersize=9, zorder=5, animated=True)
+        self.crit_label = ax.annotate("", (0.0, 0.0), textcoords="offset points", xytext=(6, 6),
+                                      animated=True, visible=False)
+        self._animated = (self.line_up, self.line_down, self.crit_marker, self.crit_label)
+        self._background = None
+        self._layout_key = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, _event):
+        """Après un rendu complet : mémorise le fond puis dessine les artistes animés."""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _blit(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+    def _fit_ylim(self, values: List[float]) -> Tuple[float, float]:
+        """
+        Échelle Y : conservée tant qu'elle contient les données sans être trop lâche
+        (au plus 4× l'étendue utile) — la plupart des lectures ne redessinent pas le fond.
+        """
+        finite = [v for v in values if v is not None and math.isfinite(v)]
+        if not finite:
+            return (-1.0, 1.0) if self.mode_errors else (0.0, 1.0)
+        lo, hi = min(finite), max(finite)
+        span = hi - lo
+        pad = span * 0.1 if span > 0 else max(abs(hi) * 0.1, 1.0 if self.mode_errors else 0.01)
+        needed = (lo - pad, hi + pad)
+        if self._layout_key is not None:
+            cur_lo, cur_hi = self._layout_key[-1]
+            if cur_lo <= lo and hi <= cur_hi and (cur_hi - cur_lo) <= 4 * (needed[1] - needed[0]):
+                return cur_lo, cur_hi
+        return needed
+
+    def _apply_layout(self, xs: List[float], ylim: Tuple[float, float]):
+        """Fond statique : libellés, graduations et lignes guides sur les cibles, échelles."""
+        ax = self.ax
+        if self.mode_errors:
+            self.line_up.set_label("Erreur montée (µm)")
+            self.line_down.set_label("Erreur descente (µm)")
+            ax.set_ylabel("Erreur (µm)")
+        else:
+            self.line_up.set_label("Mesuré montée")
+            self.line_down.set_label("Mesuré descente")
+            ax.set_ylabel("Mesuré (mm)")
+        ax.legend(handles=[self.line_up, self.line_down], loc="best")
+
+        for g in self.guides:
+            g.remove()
+        self.guides = [ax.axvline(x, color="gray", linestyle=":", linewidth=0.6, alpha=0.3, zorder=0) for x in xs]
+        if xs:
+            try:
+                ax.set_xticks(xs)
+                ax.set_xticklabels([f"{x:.1f}" for x in xs])
+            except Exception:
+                pass
+            span = (max(xs) - min(xs)) or 1.0
+            ax.set_xlim(min(xs) - 0.05 * span, max(xs) + 0.05 * span)
+        ax.set_ylim(*ylim)
+
     def _on_mode_changed(self, _i: int):
         self.mode_errors = (self.mode_combo.currentIndex() == 0)
         self.refresh()
 
+    def _on_measures_updated(self, _s):
+        self._dirty = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_timer.start()
+
     def refresh(self):
         """Recalcule et met à jour le graphe/tableau à partir de la session courante."""
+        self._dirty = False
         rt = self.get_runtime_session()
-        v2, results, verdict = self.provider.compute_all(rt)
+        results, verdict = self.provider.compute(rt)
 
         points: List[Dict] = results.calibration_points or []
         xs = [p["target_mm"] for p in points]
-        up_mean = [p["up_mean_mm"] for p in points]
-        down_mean = [p["down_mean_mm"] for p in points]
-        up_err = [p["up_error_mm"] for p in points]
-        down_err = [p["down_error_mm"] for p in points]
-
-        # Graphe
-        self.fig.clear()
-        ax = self.fig.add_subplot(111)
+
+        def _series(key: str, scale: float) -> List[float]:
+            # None → NaN pour matplotlib
+            return [math.nan if p[key] is None else p[key] * scale for p in points]
+
         if self.mode_errors:
             # Tracer erreurs en µm
-            up_err_um = [None if v is None else v * 1000.0 for v in up_err]
-            down_err_um = [None if v is None else v * 1000.0 for v in down_err]
-            # Remplacer None par NaN pour matplotlib
-            import math
-            up_plot = [math.nan if v is None else v for v in up_err_um]
-            dn_plot = [math.nan if v is None else v for v in down_err_um]
-            ax.plot(xs, up_plot, marker="o", label="Erreur montée (µm)")
-            ax.plot(xs, dn_plot, marker="s", label="Erreur descente (µm)")
-            ax.axhline(0.0, color="gray", linewidth=1, linestyle="--")
-            # Seuils ±Emt si dispo
-            if verdict and verdict.rule and ("Emt" in verdict.limits):
-                emt = verdict.limits["Emt"] * 1000.0
-                ax.axhline(+emt, color="red", linewidth=1, linestyle=":")
-                ax.axhline(-emt, color="red", linewidth=1, linestyle=":")
-            ax.set_ylabel("Erreur (µm)")
+            up_plot, dn_plot = _series("up_error_mm", 1000.0), _series("down_error_mm", 1000.0)
         else:
-            ax.plot(xs, up_mean, marker="o", label="Mesuré montée")
-            ax.plot(xs, down_mean, marker="s", label="Mesuré descente")
-            ax.set_ylabel("Mesuré (mm)")
-        ax.set_xlabel("Cible (mm)")
-        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.5)
-        ax.legend(loc="best")
+            up_plot, dn_plot = _series("up_mean_mm", 1.0), _series("down_mean_mm", 1.0)
+        self.line_up.set_data(xs, up_plot)
+        self.line_down.set_data(xs, dn_plot)
 
-        # Rendre les cibles explicites sur l'axe X et par lignes guides
-        if xs:
-            try:
-                ax.set_xticks(xs)
-                ax.set_xticklabels([f"{x:.1f}" for x in xs])
-            except Exception:
-                pass
-            # Lignes verticales légères sur chaque cible
-            for x in xs:
-                ax.axvline(x, color="gray", linestyle=":", linewidth=0.6, alpha=0.3, zorder=0)
+        # Seuils ±Emt si dispo (mis à jour en place)
+        emt = None
+        if self.mode_errors and verdict and verdict.rule and ("Emt" in verdict.limits):
+            emt = verdict.limits["Emt"] * 1000.0
+        for sign, line in zip((1.0, -1.0), self.emt_lines):
+            line.set_ydata([sign * (emt or 0.0)] * 2)
+            line.set_visible(emt is not None)
+        self.zero_line.set_visible(self.mode_errors)
 
         # Marquer le point critique
-        if results.total_error_location:
-            loc = results.total_error_location
-            xt = loc.get("target_mm"); yt = None
+        xt = yt = None
+        loc = results.total_error_location
+        if loc:
+            xt = loc.get("target_mm")
             if self.mode_errors:
                 err_mm = loc.get("error_mm")
                 yt = (err_mm * 1000.0) if err_mm is not None else None
             else:
                 yt = loc.get("measured_mm")
-            if xt is not None and yt is not None:
-                ax.scatter([xt], [yt], color="orange", s=80, zorder=5)
-                ax.annotate(f"Critique ({xt:.1f})", (xt, yt), textcoords="offset points", xytext=(6, 6))
-
-        self.canvas.draw_idle()
-
-        # Tableau
-        self.table.setRowCount(0)
-        for p in points:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(f"{p['target_mm']:.3f}"))
-            self.table.setItem(row, 1, QTableWidgetItem("" if p["up_mean_mm"] is None else f"{p['up_mean_mm']:.6f}"))
-            self.table.setItem(row, 2, QTableWidgetItem("" if p["down_mean_mm"] is None else f"{p['down_mean_mm']:.6f}"))
-            # Erreurs/hystérésis en µm (1 décimale)
-            self.table.setItem(row, 3, QTableWidgetItem("" if p["up_error_mm"] is None else f"{p['up_error_mm']*1000.0:.1f}"))
-            self.table.setItem(row, 4, QTableWidgetItem("" if p["down_error_mm"] is None else f"{p['down_error_mm']*1000.0:.1f}"))
-            self.table.setItem(row, 5, QTableWidgetItem("" if p["hysteresis_mm"] is None else f"{p['hysteresis_mm']*1000.0:.1f}"))
+        if xt is not None and yt is not None:
+            self.crit_marker.set_data([xt], [yt])
+            self.crit_label.xy = (xt, yt)
+            self.crit_label.set_text(f"Critique ({xt:.1f})")
+            self.crit_marker.set_visible(True)
+            self.crit_label.set_visible(True)
+        else:
+            self.crit_marker.set_visible(False)
+            self.crit_label.set_visible(False)
+
+        extra = [yt] + ([emt, -emt] if emt is not None else [])
+        ylim = self._fit_ylim(up_plot + dn_plot + extra)
+        key = (self.mode_errors, tuple(xs), emt, ylim)
+        if key != self._layout_key:
+            self._layout_key = key
+            self._apply_layout(xs, ylim)
+            self.canvas.draw_idle()   # fond recapturé dans _on_draw
+        else:
+            self._blit()
+
+        self._fill_table(points, loc.get("target_mm") if loc else None)
+
+    def _fill_table(self, points: List[Dict], crit_target: Optional[float]):
+        """Tableau mis à jour en place (les items existants sont réutilisés)."""
+        if self.table.rowCount() != len(points):
+            self.table.setRowCount(len(points))
+
+        def _fmt(v: Optional[float], spec: str, scale: float = 1.0) -> str:
+            return "" if v is None else format(v * scale, spec)
+
+        for row, p in enumerate(points):
+            texts = [
+                f"{p['target_mm']:.3f}",
+                _fmt(p["up_mean_mm"], ".6f"),
+                _fmt(p["down_mean_mm"], ".6f"),
+                # Erreurs/hystérésis en µm (1 décimale)
+                _fmt(p["up_error_mm"], ".1f", 1000.0),
+                _fmt(p["down_error_mm"], ".1f", 1000.0),
+                _fmt(p["hysteresis_mm"], ".1f", 1000.0),
+            ]
             # Surligner la ligne du point critique
-            if results.total_error_location and abs(p["target_mm"] - results.total_error_location.get("target_mm", -999)) < 1e-9:
-                for c in range(self.table.columnCount()):
-                    it = self.table.item(row, c)
-                    if it:
-                        it.setBackground(Qt.yellow)
+            critical = crit_target is not None and abs(p["target_mm"] - crit_target) < 1e-9
+            for c, text in enumerate(texts):
+                it = self.table.item(row, c)
+                if it is None:
+                    it = QTableWidgetItem()
+                    self.table.setItem(row, c, it)
+                if it.text() != text:
+                    it.setText(text)
+                it.setBackground(QBrush(Qt.yellow) if critical else QBrush())
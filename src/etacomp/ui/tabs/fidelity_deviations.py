@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer
 import time
 
-from ..results_provider import ResultsProvider
+from ..results_provider import results_provider
 from ...core.measure_reading import normalize_measured_mm
 from ...io.serial_manager import serial_manager
 from ...state.session_store import session_store
@@ -39,7 +39,7 @@ class FidelityDeviationsTab(QWidget):
         super().__init__()
         self.get_runtime_session = get_runtime_session
         self.go_to_session_tab = go_to_session_tab
-        self.provider = ResultsProvider()
+        self.provider = results_provider
 
         root = QVBoxLayout(self)
 
@@ -129,7 +129,7 @@ class FidelityDeviationsTab(QWidget):
     def refresh(self):
         """Recalcule et met à jour l'UI à partir de la session courante."""
         rt = self.get_runtime_session()
-        v2, results, verdict = self.provider.compute_all(rt)
+        results, verdict = self.provider.compute(rt)
 
         # Contexte point critique
         if results.total_error_location:
@@ -299,7 +299,7 @@ class FidelityDeviationsTab(QWidget):
                     timestamps=list(self._timestamps[:5]),
                 )
                 rt = self.get_runtime_session()
-                _, results, verdict = self.provider.compute_all(rt)
+                results, verdict = self.provider.compute(rt)
                 # Mettre à jour stats/limites comme dans refresh()
                 if results.fidelity_context and results.fidelity_context.get("samples"):
                     samples = results.fidelity_context["samples"]
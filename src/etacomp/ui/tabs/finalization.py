@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from typing import Optional, Union
 
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QLabel, QPushButton, QHBoxLayout,
@@ -13,11 +13,12 @@ from PySide6.QtWidgets import (
 )
 
 from ...core.calculation_engine import CalculatedResults
-from ..results_provider import ResultsProvider
+from ..results_provider import results_provider
 from ...rules.verdict import VerdictStatus
 from ...state.session_store import session_store
-from ...io.storage import get_default_banc_etalon, list_comparators
+from ...io.storage import get_default_banc_etalon
 from ...config.export_config import load_export_config
+from ..task_runner import task_runner
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class FinalizationTab(QWidget):
     def __init__(self):
         super().__init__()
         self.current_results: Optional[CalculatedResults] = None
-        self.provider = ResultsProvider()
+        self.provider = results_provider
         
         layout = QVBoxLayout(self)
         
@@ -151,7 +152,7 @@ class FinalizationTab(QWidget):
             QMessageBox.warning(self, "Erreur", "Aucune session active ou aucune mesure.")
             return
         try:
-            v2, results, verdict = self.provider.compute_all(rt)
+            results, verdict = self.provider.compute(rt)
             self.current_results = results
             # Afficher erreurs et verdict/limites
             self._display_results()
@@ -250,7 +251,7 @@ class FinalizationTab(QWidget):
         logger.info("Export PDF : calcul des erreurs (n°=%d)", doc_no)
         self._status("Export PDF : calcul en cours…")
         try:
-            v2, results, verdict = self.provider.compute_all(rt)
+            results, verdict = self.provider.compute(rt)
             logger.info("Export PDF : calcul terminé")
         except Exception as e:
             logger.exception("Export PDF : erreur de calcul")
@@ -265,23 +266,32 @@ class FinalizationTab(QWidget):
         logger.info("Export PDF : génération du PDF")
         self._status("Export PDF : génération…")
         exp_cfg = load_export_config()
-        try:
-            from ...io.pdf_exporter import export_pdf
-            path = export_pdf(rt, exp_cfg, results, verdict, doc_no=doc_no)
-            logger.info("Export PDF : terminé → %s", path)
-            self._show_export_pdf_success(path)
-            self._status("Export PDF terminé")
-        except Exception as e:
-            logger.exception("Export PDF : erreur de génération")
-            QMessageBox.critical(
-                self,
-                "Export PDF",
-                f"Erreur lors de l'export :\n{e}",
-            )
-            self._status("Export PDF : erreur")
-        finally:
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(3000, lambda: self._status(""))
+        from ...io.pdf_exporter import export_pdf
+
+        # Génération hors du thread GUI, sur une copie figée de la session
+        self.btn_export_pdf.setEnabled(False)
+        task_runner.submit(
+            "Export PDF", export_pdf, rt.model_copy(deep=True), exp_cfg, results, verdict, doc_no=doc_no,
+            on_finished=self._on_export_pdf_done, on_failed=self._on_export_pdf_failed,
+        )
+
+    def _on_export_pdf_done(self, path) -> None:
+        logger.info("Export PDF : terminé → %s", path)
+        self.btn_export_pdf.setEnabled(True)
+        self._status("Export PDF terminé")
+        self._show_export_pdf_success(path)
+        QTimer.singleShot(3000, lambda: self._status(""))
+
+    def _on_export_pdf_failed(self, message: str) -> None:
+        logger.warning("Export PDF : erreur de génération : %s", message)
+        self.btn_export_pdf.setEnabled(True)
+        self._status("Export PDF : erreur")
+        QMessageBox.critical(
+            self,
+            "Export PDF",
+            f"Erreur lors de l'export :\n{message}",
+        )
+        QTimer.singleShot(3000, lambda: self._status(""))
 
     def _status(self, msg: str) -> None:
         """Affiche un message dans la barre de statut de la fenêtre principale."""
@@ -7,7 +7,9 @@ from PySide6.QtWidgets import (
 )
 from pydantic import ValidationError
 
-from ...io.storage import list_comparators, upsert_comparator, delete_comparator_by_reference
+from ...io.storage import (
+    comparator_registry, delete_comparator_by_reference, get_comparator, list_comparators, upsert_comparator,
+)
 from ...models.comparator import Comparator, RangeType
 
 TARGET_COUNT_REQUIRED = 11
@@ -214,8 +216,10 @@ class LibraryTab(QWidget):
         self.btn_edit.clicked.connect(self.on_edit)
         self.btn_del.clicked.connect(self.on_delete)
 
-        # Initial load
+        # Initial load ; ensuite le registre notifie toute création/édition/suppression
+        # (y compris depuis l'onglet Session)
         self.reload()
+        comparator_registry.changed.connect(self.reload)
 
     # --------- helpers ---------
     def current_reference(self) -> str | None:
@@ -249,7 +253,6 @@ class LibraryTab(QWidget):
             if model is None:
                 return
             upsert_comparator(model)
-            self.reload()
             self.comparators_changed.emit()
             QMessageBox.information(self, "Bibliothèque", f"Comparateur {model.reference} enregistré.")
 
@@ -260,11 +263,7 @@ class LibraryTab(QWidget):
             return
 
         # Charger le modèle existant pour pré-remplir
-        existing = None
-        for c in list_comparators():
-            if c.reference == ref:
-                existing = c
-                break
+        existing = get_comparator(ref)
         dlg = ComparatorEditDialog(self, initial=existing)
         if dlg.exec() != QDialog.Accepted:
             return
@@ -274,7 +273,6 @@ class LibraryTab(QWidget):
         if model.reference != ref:
             delete_comparator_by_reference(ref)
         upsert_comparator(model)
-        self.reload()
         self.comparators_changed.emit()
         QMessageBox.information(self, "Bibliothèque", f"Comparateur {model.reference} enregistré.")
 
@@ -285,6 +283,5 @@ class LibraryTab(QWidget):
             return
         if QMessageBox.question(self, "Confirmer", f"Supprimer '{ref}' ?") == QMessageBox.StandardButton.Yes:
             delete_comparator_by_reference(ref)
-            self.reload()
             self.comparators_changed.emit()
             QMessageBox.information(self, "Bibliothèque", "Comparateur supprimé.")
@@ -4,21 +4,22 @@ import time
 from typing import List, Dict, Optional, Tuple
 
 from PySide6.QtCore import QTimer, QCoreApplication
-from PySide6.QtGui import QColor, QBrush, QTextCursor, QGuiApplication
+from PySide6.QtGui import QTextCursor, QGuiApplication
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, QPushButton,
-    QMessageBox, QTextEdit, QLabel, QTableWidget, QTableWidgetItem, QCheckBox,
-    QStyledItemDelegate
+    QMessageBox, QTextEdit, QLabel, QTableView, QCheckBox, QAbstractItemView
 )
 
 from ...models.session import MeasureSeries
 from ...core.campaign_cycles import MAX_CAMPAIGN_CYCLES, clamp_series_count
 from ...core.critical_point import find_critical_point
 from ...core.measure_reading import normalize_measured_mm, is_near_origin_mm
+from ...core.latency import latency_tracker
 from ...state.session_store import session_store
 from ...io.serial_manager import serial_manager
-from ...io.storage import list_comparators
+from ...io.storage import get_comparator
 from ..sound import play_beep
+from .measures_model import MeasuresDelegate, MeasuresTableModel
 
 
 BTN_PRIMARY_CSS = (
@@ -30,9 +31,6 @@ BTN_DANGER_CSS = (
     "QPushButton:hover{background:#bb2d3b;}"
 )
 
-# Texte foncé pour cellules à fond clair (vert, jaune, gris) — lisible en mode dark
-TEXT_ON_LIGHT_BG = QColor(33, 37, 41)
-
 
 class MeasuresTab(QWidget):
     # Conservé pour compatibilité tests / docs ; la détection zéro utilise is_near_origin_mm.
@@ -62,11 +60,12 @@ class MeasuresTab(QWidget):
         # ===== Tableau mesures =====
         g_table = QGroupBox("Mesures")
         vtab = QVBoxLayout(g_table)
-        self.table = QTableWidget(0, 0)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        # Délégué pour encadrer la cellule en override
-        self._override_delegate = self._OverrideCellDelegate(self.table)
-        self.table.setItemDelegate(self._override_delegate)
+        # Modèle NumPy (source de vérité de l'affichage) + délégué de style (cellules, override)
+        self.model = MeasuresTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setItemDelegate(MeasuresDelegate(self.table))
         vtab.addWidget(self.table)
 
         # ===== Logger brut =====
@@ -76,8 +75,9 @@ class MeasuresTab(QWidget):
         self.log_view = QTextEdit(); self.log_view.setReadOnly(True); self.log_view.setMaximumHeight(160)
         self.chk_raw_debug = QCheckBox("Mode debug (flux brut)"); self.chk_raw_debug.setToolTip("Affiche le flux série brut, sans parsing ni normalisation (non actif par défaut).")
         self.btn_clear_log = QPushButton("Effacer le log")
+        self.btn_latency = QPushButton("Latence…"); self.btn_latency.setToolTip("Latence octet → cellule par étape (p50/p95/p99), export des échantillons.")
         log_bar.addWidget(self.chk_raw_debug)
-        log_bar.addStretch(); log_bar.addWidget(self.btn_clear_log)
+        log_bar.addStretch(); log_bar.addWidget(self.btn_latency); log_bar.addWidget(self.btn_clear_log)
         v3.addWidget(self.log_view)
         v3.addLayout(log_bar)
 
@@ -119,11 +119,12 @@ class MeasuresTab(QWidget):
         self.btn_stop.clicked.connect(self._stop_campaign)
         self.btn_clear.clicked.connect(self._clear_all)
         self.btn_clear_log.clicked.connect(self._clear_log)
+        self.btn_latency.clicked.connect(self._show_latency)
         self.btn_probe.clicked.connect(self._probe_3s)
         self.chk_raw_debug.toggled.connect(self._toggle_raw_debug)
         # Sélection cellule pour correction / repositionnement
         try:
-            self.table.cellClicked.connect(self._on_cell_clicked)
+            self.table.clicked.connect(lambda idx: self._on_cell_clicked(idx.row(), idx.column()))
         except Exception:
             pass
 
@@ -174,48 +175,14 @@ class MeasuresTab(QWidget):
 
         # Lignes : montantes (N), moyenne montantes, descendantes (N), moyenne descendantes, indices
         self.cycles, _ = clamp_series_count(s.series_count)
-        rows = self.cycles * 2 + 3
-        cols = len(self.targets)
-
-        self.table.clear()
-        self.table.setRowCount(rows)
-        self.table.setColumnCount(cols)
-        self.table.setHorizontalHeaderLabels([str(t) for t in self.targets])
-
-        # Entêtes de lignes: montantes (1..N), moyenne ↑, descendantes (1..N), moyenne ↓
-        for i in range(1, self.cycles + 1):
-            self.table.setVerticalHeaderItem(i - 1, QTableWidgetItem(f"{i}↑"))
-        self.row_avg_up_index = self.cycles
-        self.table.setVerticalHeaderItem(self.row_avg_up_index, QTableWidgetItem("Moyenne ↑ (µm)"))
-        for i in range(1, self.cycles + 1):
-            self.table.setVerticalHeaderItem(self.row_avg_up_index + i, QTableWidgetItem(f"{i}↓"))
-        self.row_avg_down_index = self.row_avg_up_index + self.cycles + 1
-        self.table.setVerticalHeaderItem(self.row_avg_down_index, QTableWidgetItem("Moyenne ↓ (µm)"))
-
-        # Ligne d'indices sous le tableau
-        self.row_index_line = self.row_avg_down_index + 1
-        self.table.setVerticalHeaderItem(self.row_index_line, QTableWidgetItem("Index"))
-
-        # Réinjecter éventuelles mesures
         self.by_target = {t: MeasureSeries(target=t, readings=[]) for t in self.targets}
         for ms in s.series:
             if ms.target in self.by_target:
-                for pos, val in enumerate(ms.readings):
-                    row = self._row_for_state((pos // 2) + 1, pos % 2 == 0)
-                    col = self._col_for_target(ms.target)
-                    if row is not None and col is not None and row not in (self.row_avg_up_index, self.row_avg_down_index, self.row_index_line):
-                        self._ensure_item(row, col).setText(str(val))
-                        self._color_filled_cell(row, col, self.targets[col], float(val))
                 self.by_target[ms.target].readings = list(ms.readings)
-
-        # Remplir la ligne d'indices (1..N) et appliquer un style différenciant
-        for c in range(self.table.columnCount()):
-            it = self._ensure_item(self.row_index_line, c)
-            it.setText(str(c + 1))
-            it.setBackground(QBrush(QColor(230, 230, 230)))  # gris clair
-            it.setForeground(QBrush(TEXT_ON_LIGHT_BG))
-            f = it.font(); f.setBold(True); it.setFont(f)
-            it.setToolTip("Index de colonne (cible #)")
+        self.model.reset(self.targets, self.cycles, {t: ms.readings for t, ms in self.by_target.items()})
+        self.row_avg_up_index = self.model.row_avg_up
+        self.row_avg_down_index = self.model.row_avg_down
+        self.row_index_line = self.model.row_index
 
         # Reset capture
         self.campaign_running = False
@@ -229,15 +196,13 @@ class MeasuresTab(QWidget):
         self._update_status()
 
     def _targets_from_comparator(self, comp_ref: Optional[str]) -> List[float]:
-        if not comp_ref:
+        c = get_comparator(comp_ref)
+        if c is None:
+            return []
+        try:
+            return sorted([float(x) for x in c.targets if x is not None])
+        except Exception:
             return []
-        for c in list_comparators():
-            if c.reference == comp_ref:
-                try:
-                    return sorted([float(x) for x in c.targets if x is not None])
-                except Exception:
-                    return []
-        return []
 
     # ------------- Campagne -------------
     def _start_campaign(self):
@@ -275,11 +240,7 @@ class MeasuresTab(QWidget):
         self._update_status()
 
     def _clear_all(self):
-        for r in range(self.table.rowCount()):
-            if r in (self.row_avg_up_index, self.row_avg_down_index, self.row_index_line):
-                continue
-            for c in range(self.table.columnCount()):
-                self.table.setItem(r, c, QTableWidgetItem(""))
+        self.model.clear_values()
         for t in self.by_target.values():
             t.readings.clear()
         self.campaign_running = False
@@ -342,9 +303,16 @@ class MeasuresTab(QWidget):
 
     # ------------- Réception série -------------
     def _on_line_from_serial(self, raw: str, value: float | None):
+        latency_tracker.mark(value, "slot")
         QTimer.singleShot(0, lambda: self._append_line(raw, value))
 
+    def _show_latency(self):
+        from ..latency_dialog import LatencyDialog
+
+        LatencyDialog(self).exec()
+
     def _append_line(self, raw: str, value: float | None):
+        latency_tracker.mark(value, "dispatch")
         self.log_view.append(raw)
 
         # Mode correction opérateur: si une cellule est ciblée, écrire ici en priorité
@@ -420,8 +388,7 @@ class MeasuresTab(QWidget):
                 )
                 return
             # Si clic sur une cellule REMPLIE: activer une correction dirigée
-            it = self.table.item(row, col)
-            if it and it.text().strip():
+            if not self._is_cell_empty(row, col):
                 self._set_override_visual(row, col)
                 self.lbl_next.setText(f"Correction sur R{row+1} C{col+1} — En attente d'une nouvelle valeur…")
                 return
@@ -436,8 +403,7 @@ class MeasuresTab(QWidget):
             # Sinon, ignorer
             return
         # Campagne non active: autoriser modification de toute cellule (override ponctuel)
-        it = self.table.item(row, col)
-        if it and it.text().strip():
+        if not self._is_cell_empty(row, col):
             self._set_override_visual(row, col)
             self.lbl_next.setText(f"Correction (campagne arrêtée) sur R{row+1} C{col+1} — En attente d'une nouvelle valeur…")
         else:
@@ -445,8 +411,7 @@ class MeasuresTab(QWidget):
             self._update_status()
 
     def _is_cell_empty(self, row: int, col: int) -> bool:
-        it = self.table.item(row, col)
-        return not (it and it.text().strip())
+        return self.model.is_empty(row, col)
 
     def _is_current_zero_cell(self, row: int, col: int) -> bool:
         if not self.waiting_zero or col != 0:
@@ -459,13 +424,8 @@ class MeasuresTab(QWidget):
         if not self.waiting_zero or not self._is_current_zero_cell(row, col):
             return False
         target0 = self.targets[0] if self.targets else 0.0
-        it = self.table.item(row, col)
-        if not it or not it.text().strip():
-            return False
-        try:
-            if not is_near_origin_mm(float(it.text()), target0):
-                return False
-        except ValueError:
+        value = self.model.value(row, col)
+        if value is None or not is_near_origin_mm(value, target0):
             return False
         self.waiting_zero = False
         finished = self._advance_after_write()
@@ -515,31 +475,9 @@ class MeasuresTab(QWidget):
         except ValueError:
             return None
 
-    def _ensure_item(self, row: int, col: int) -> QTableWidgetItem:
-        it = self.table.item(row, col)
-        if it is None:
-            it = QTableWidgetItem("")
-            self.table.setItem(row, col, it)
-        return it
-
-    def _color_filled_cell(self, row: int, col: int, target: float, measured: float):
-        it = self._ensure_item(row, col)
-        it.setBackground(QBrush(QColor(212, 237, 218)))  # vert doux
-        it.setForeground(QBrush(TEXT_ON_LIGHT_BG))
-        delta = measured - target
-        it.setToolTip(f"Cible: {target}\nMesuré: {measured}\nÉcart (mesuré - cible): {delta:+.6f}")
-
-    def _restore_cell_background(self, row: int, col: int):
-        it = self._ensure_item(row, col)
-        if it.text():
-            it.setBackground(QBrush(QColor(212, 237, 218)))
-            it.setForeground(QBrush(TEXT_ON_LIGHT_BG))
-        else:
-            it.setBackground(QBrush())
-            it.setForeground(QBrush())
-
     def _write_current_cell(self, value: float, *, force: bool = False) -> bool:
         """Enregistre la position absolue (mm) pour l'opérateur et le moteur de calcul."""
+        reading = value  # porte la trace de latence éventuelle (normalize_ retourne un float simple)
         try:
             col = self.current_col
             target = self.targets[col]
@@ -548,10 +486,9 @@ class MeasuresTab(QWidget):
             return False
         row = self._row_for_state(self.current_cycle, self.current_phase_up)
         col = self.current_col
-        it = self.table.item(row, col)
-        if force or it is None or not it.text():
-            self._ensure_item(row, col).setText(str(value))
-            self._color_filled_cell(row, col, self.targets[col], float(value))
+        if force or self.model.is_empty(row, col):
+            self.model.set_value(row, col, value)
+            latency_tracker.mark(reading, "cell")
             target = self.targets[col]
             readings = self.by_target[target].readings
             pos = (self.current_cycle - 1) * 2 + (0 if self.current_phase_up else 1)
@@ -560,10 +497,12 @@ class MeasuresTab(QWidget):
             readings[pos] = value
             while readings and readings[-1] is None:
                 readings.pop()
-            self._push_series_to_store()
+            self._push_reading_to_store(target, pos, value, override=force)
             self._recompute_means2()
+            latency_tracker.mark(reading, "means")
             # Son bref à chaque enregistrement
             play_beep()
+            latency_tracker.finish(reading)
             return True
         return False
 
@@ -576,6 +515,7 @@ class MeasuresTab(QWidget):
         if col < 0 or col >= len(self.targets):
             return False
         target = self.targets[col]
+        reading = value
         try:
             value = normalize_measured_mm(float(value), target)
         except Exception:
@@ -590,8 +530,8 @@ class MeasuresTab(QWidget):
         if cyc < 1:
             return False
         # Écrire dans la table
-        self._ensure_item(row, col).setText(str(value))
-        self._color_filled_cell(row, col, target, float(value))
+        self.model.set_value(row, col, value)
+        latency_tracker.mark(reading, "cell")
         # Mettre à jour readings
         readings = self.by_target[target].readings
         pos = (cyc - 1) * 2 + (0 if up else 1)
@@ -600,184 +540,61 @@ class MeasuresTab(QWidget):
         readings[pos] = value
         while readings and readings[-1] is None:
             readings.pop()
-        self._push_series_to_store()
+        self._push_reading_to_store(target, pos, value, override=True)
         self._recompute_means2()
+        latency_tracker.mark(reading, "means")
         play_beep()
+        latency_tracker.finish(reading)
         return True
 
     def _recompute_means2(self):
-        """Calcule les moyennes des écarts (µm) pour montée/descente et met à jour l'UI, puis surligne le point critique."""
-        # Conserver les valeurs numériques (µm) pour mise en évidence du point critique
-        self._mean_up_um = [None] * self.table.columnCount()
-        self._mean_down_um = [None] * self.table.columnCount()
-        for c in range(self.table.columnCount()):
-            target = self.targets[c] if c < len(self.targets) else 0.0
-            # Moyenne montantes
-            vals_up = []
-            for r in range(0, self.row_avg_up_index):
-                it = self.table.item(r, c)
-                if it and it.text():
-                    try:
-                        vals_up.append(float(it.text()))
-                    except ValueError:
-                        pass
-            mean_up_txt = ""
-            if vals_up:
-                mean_abs_up = sum(vals_up) / len(vals_up)
-                mean_err_up = mean_abs_up - target
-                mean_up_um = mean_err_up * 1000.0
-                mean_up_txt = f"{mean_up_um:+.1f}"
-                self._mean_up_um[c] = mean_up_um
-            self._ensure_item(self.row_avg_up_index, c).setText(mean_up_txt)
-            it_up = self._ensure_item(self.row_avg_up_index, c)
-            f_up = it_up.font(); f_up.setBold(True); it_up.setFont(f_up)
-            it_up.setForeground(QBrush())  # reset couleur
-            if vals_up:
-                it_up.setToolTip(
-                    f"Moyenne absolue : {mean_abs_up:.6f} mm\nÉcart moyen : {mean_up_um:+.1f} µm"
-                )
-
-            # Moyenne descendantes
-            vals_down = []
-            for r in range(self.row_avg_up_index + 1, self.row_avg_down_index):
-                it = self.table.item(r, c)
-                if it and it.text():
-                    try:
-                        vals_down.append(float(it.text()))
-                    except ValueError:
-                        pass
-            mean_down_txt = ""
-            if vals_down:
-                mean_abs_down = sum(vals_down) / len(vals_down)
-                mean_err_down = mean_abs_down - target
-                mean_down_um = mean_err_down * 1000.0
-                mean_down_txt = f"{mean_down_um:+.1f}"
-                self._mean_down_um[c] = mean_down_um
-            self._ensure_item(self.row_avg_down_index, c).setText(mean_down_txt)
-            it_dn = self._ensure_item(self.row_avg_down_index, c)
-            f_dn = it_dn.font(); f_dn.setBold(True); it_dn.setFont(f_dn)
-            it_dn.setForeground(QBrush())  # reset couleur
-            if vals_down:
-                it_dn.setToolTip(
-                    f"Moyenne absolue : {mean_abs_down:.6f} mm\nÉcart moyen : {mean_down_um:+.1f} µm"
-                )
+        """Moyennes ↑/↓ tenues par le modèle (colonne modifiée seule) : seul le point critique est réévalué."""
         self._highlight_max_mean_error()
 
     def _recompute_means(self):
         """Alias — une seule implémentation (_recompute_means2)."""
         self._recompute_means2()
 
-    class _OverrideCellDelegate(QStyledItemDelegate):
-        """Délégué qui dessine un encadrement pointillé épais autour de la cellule en override."""
-        def __init__(self, parent=None):
-            super().__init__(parent)
-            self._row = None
-            self._col = None
-
-        def set_target(self, row: int, col: int):
-            self._row = int(row)
-            self._col = int(col)
-
-        def clear_target(self):
-            self._row = None
-            self._col = None
-
-        def paint(self, painter, option, index):
-            # Peinture standard
-            super().paint(painter, option, index)
-            try:
-                if self._row is None or self._col is None:
-                    return
-                if index.row() == self._row and index.column() == self._col:
-                    from PySide6.QtGui import QPen, QColor
-                    from PySide6.QtCore import Qt
-                    painter.save()
-                    pen = QPen(QColor(13, 110, 253))  # bleu primaire
-                    pen.setWidth(3)
-                    pen.setStyle(Qt.PenStyle.DotLine)
-                    painter.setPen(pen)
-                    r = option.rect.adjusted(2, 2, -2, -2)
-                    painter.drawRect(r)
-                    painter.restore()
-            except Exception:
-                # Ne pas bloquer l'affichage si un souci survient
-                pass
-
     # ----- Override visuals -----
     def _set_override_visual(self, row: int, col: int):
-        # Enregistrer
         self._override_cell = (row, col)
-        # Délégué: cible
-        try:
-            self._override_delegate.set_target(row, col)
-            self.table.viewport().update()
-        except Exception:
-            pass
-        # Tooltip "modification"
-        try:
-            it = self._ensure_item(row, col)
-            it.setToolTip("modification")
-        except Exception:
-            pass
+        self.model.set_override((row, col))
 
     def _clear_override_visual(self):
         if not self._override_cell:
             return
-        row, col = self._override_cell
-        try:
-            # Retirer tooltip
-            it = self._ensure_item(row, col)
-            it.setToolTip("")
-        except Exception:
-            pass
-        try:
-            self._override_delegate.clear_target()
-            self.table.viewport().update()
-        except Exception:
-            pass
+        self.model.set_override(None)
         self._override_cell = None
 
     def _push_series_to_store(self):
         ordered = [self.by_target[t] for t in self.targets]
         session_store.set_series(ordered)
 
-    def _clear_mean_highlights(self):
-        # Réinitialise le style des lignes de moyennes
-        for c in range(self.table.columnCount()):
-            for r in (self.row_avg_up_index, self.row_avg_down_index):
-                it = self._ensure_item(r, c)
-                it.setForeground(QBrush())  # couleur par défaut
+    def _push_reading_to_store(self, target: float, pos: int, value: float, *, override: bool = False):
+        ordered = [self.by_target[t] for t in self.targets]
+        session_store.record_reading(ordered, target, pos, value, override=override)
 
     def _highlight_max_mean_error(self):
-        self._clear_mean_highlights()
-        targets = [
-            self.targets[c] if c < len(self.targets) else 0.0
-            for c in range(self.table.columnCount())
-        ]
+        targets = self.model.targets
         up_errors: List[Tuple[float, float]] = []
         down_errors: List[Tuple[float, float]] = []
-        for c, t in enumerate(targets):
-            if self._mean_up_um[c] is not None:
-                up_errors.append((t, self._mean_up_um[c] / 1000.0))
-            if self._mean_down_um[c] is not None:
-                down_errors.append((t, self._mean_down_um[c] / 1000.0))
+        for errors, means in ((up_errors, self.model.mean_errors_mm(True)),
+                              (down_errors, self.model.mean_errors_mm(False))):
+            errors.extend((t, e) for t, e in zip(targets, means) if e is not None)
         cp = find_critical_point(targets, up_errors, down_errors)
         if not cp:
+            self.model.set_critical(None)
             return
         try:
             col = targets.index(cp.target_mm)
         except ValueError:
             col = min(range(len(targets)), key=lambda i: abs(targets[i] - cp.target_mm))
         r = self.row_avg_up_index if cp.direction == "up" else self.row_avg_down_index
-        it = self._ensure_item(r, col)
-        f = it.font()
-        f.setBold(True)
-        it.setFont(f)
-        it.setForeground(QBrush(QColor(220, 53, 69)))
+        self.model.set_critical((r, col))
 
     # ------------- Avancement & Highlight -------------
     def _advance_after_write(self) -> bool:
-        last_col = self.table.columnCount() - 1
+        last_col = self.model.columnCount() - 1
         if self.current_phase_up:
             if self.current_col < last_col:
                 self.current_col += 1
@@ -800,14 +617,11 @@ class MeasuresTab(QWidget):
                     return True
 
     def _clear_highlight(self):
-        if not self._hl_last:
-            return
-        r, c = self._hl_last
-        self._restore_cell_background(r, c)
+        self.model.set_current(None)
         self._hl_last = None
 
     def _highlight_current_cell(self):
-        if self.table.rowCount() == 0 or self.table.columnCount() == 0:
+        if self.model.rowCount() == 0 or self.model.columnCount() == 0:
             self._clear_highlight(); return
         if not self.campaign_running:
             self._clear_highlight(); return
@@ -818,10 +632,7 @@ class MeasuresTab(QWidget):
             col = self.current_col
         if row in (self.row_avg_up_index, self.row_avg_down_index, self.row_index_line):
             self._clear_highlight(); return
-        self._clear_highlight()
-        it = self._ensure_item(row, col)
-        it.setBackground(QBrush(QColor(255, 249, 196)))  # jaune doux = prochaine mesure
-        it.setForeground(QBrush(TEXT_ON_LIGHT_BG))
+        self.model.set_current((row, col))  # jaune doux = prochaine mesure
         self._hl_last = (row, col)
 
     def _update_status(self):
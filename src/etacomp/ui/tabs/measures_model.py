@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor, QPen
+from PySide6.QtWidgets import QStyledItemDelegate
+
+from ...core.calculation_engine import mean_of
+
+# Texte foncé pour cellules à fond clair (vert, jaune, gris) — lisible en mode dark
+TEXT_ON_LIGHT_BG = QColor(33, 37, 41)
+
+# Pinceaux partagés (aucun objet de style créé par cellule)
+_BRUSH_FILLED = QBrush(QColor(212, 237, 218))    # vert doux = mesure enregistrée
+_BRUSH_CURRENT = QBrush(QColor(255, 249, 196))   # jaune doux = prochaine mesure
+_BRUSH_INDEX = QBrush(QColor(230, 230, 230))     # gris clair = ligne d'indices
+_COLOR_CRITICAL = QColor(220, 53, 69)
+_PEN_OVERRIDE = QPen(QColor(13, 110, 253), 3, Qt.PenStyle.DotLine)
+
+UP, DOWN = 0, 1
+
+
+class MeasuresTableModel(QAbstractTableModel):
+    """
+    Tableau des mesures sur un tableau NumPy (cycles × sens × cibles, NaN = vide).
+
+    Lignes : montées 1..N, moyenne ↑ (µm), descentes 1..N, moyenne ↓ (µm), indices.
+    Une lecture ne recalcule que la moyenne de sa colonne et de son sens (quelques cycles),
+    avec `mean_of` du moteur de calcul : mêmes flottants que CalculationEngine, donc même
+    point critique. Seules la cellule et cette moyenne sont signalées (dataChanged ciblés).
+    """
+
+    # Genres de cellules (lus par MeasuresDelegate)
+    EMPTY, FILLED, CURRENT, MEAN, MEAN_CRITICAL, INDEX = range(6)
+    KindRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.targets: List[float] = []
+        self.cycles = 0
+        self._values = np.full((0, 2, 0), np.nan)
+        self._means = np.full((2, 0), np.nan)
+        self._current: Optional[Tuple[int, int]] = None
+        self._critical: Optional[Tuple[int, int]] = None
+        self.override_cell: Optional[Tuple[int, int]] = None
+
+    # --------- GÉOMÉTRIE ---------
+    @property
+    def row_avg_up(self) -> int:
+        return self.cycles
+
+    @property
+    def row_avg_down(self) -> int:
+        return 2 * self.cycles + 1
+
+    @property
+    def row_index(self) -> int:
+        return 2 * self.cycles + 2
+
+    def row_for_state(self, cycle: int, up: bool) -> int:
+        return (cycle - 1) if up else self.row_avg_up + cycle
+
+    def state_for_row(self, row: int) -> Optional[Tuple[int, bool]]:
+        """(cycle, montée) d'une ligne de lecture ; None pour moyennes / indices / hors tableau."""
+        if 0 <= row < self.cycles:
+            return row + 1, True
+        if self.row_avg_up < row < self.row_avg_down:
+            return row - self.row_avg_up, False
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() or not self.targets else 2 * self.cycles + 3
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.targets)
+
+    # --------- DONNÉES ---------
+    def reset(self, targets: Sequence[float], cycles: int,
+              readings_by_target: Optional[Dict[float, Iterable[Optional[float]]]] = None) -> None:
+        """Nouvelle géométrie ; readings_by_target : lectures par cible à la position (cycle-1)*2 + sens."""
+        self.beginResetModel()
+        self.targets = [float(t) for t in targets]
+        self.cycles = max(0, int(cycles))
+        n = len(self.targets)
+        self._values = np.full((self.cycles, 2, n), np.nan)
+        for col, t in enumerate(self.targets):
+            for pos, v in enumerate((readings_by_target or {}).get(t, ()) or ()):
+                if v is not None and pos // 2 < self.cycles:
+                    self._values[pos // 2, pos % 2, col] = float(v)
+        self._means = np.full((2, n), np.nan)
+        for d in (UP, DOWN):
+            for col in range(n):
+                self._update_mean(d, col)
+        self._current = self._critical = self.override_cell = None
+        self.endResetModel()
+
+    def value(self, row: int, col: int) -> Optional[float]:
+        state = self.state_for_row(row)
+        if state is None or not (0 <= col < len(self.targets)):
+            return None
+        v = self._values[state[0] - 1, UP if state[1] else DOWN, col]
+        return None if np.isnan(v) else float(v)
+
+    def is_empty(self, row: int, col: int) -> bool:
+        return self.value(row, col) is None
+
+    def set_value(self, row: int, col: int, value: Optional[float]) -> bool:
+        """Écrit (ou efface avec None) une lecture ; met à jour la moyenne de la colonne."""
+        state = self.state_for_row(row)
+        if state is None or not (0 <= col < len(self.targets)):
+            return False
+        cyc, up = state
+        d = UP if up else DOWN
+        self._values[cyc - 1, d, col] = np.nan if value is None else float(value)
+        self._update_mean(d, col)
+        self._changed(row, col)
+        self._changed(self.row_avg_up if up else self.row_avg_down, col)
+        return True
+
+    def clear_values(self) -> None:
+        self._values[:] = np.nan
+        self._means[:] = np.nan
+        self._critical = None
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def _update_mean(self, d: int, col: int) -> None:
+        """Moyenne d'une colonne dans l'ordre des cycles, comme le moteur de calcul."""
+        m = mean_of([float(v) for v in self._values[:, d, col] if not np.isnan(v)])
+        self._means[d, col] = np.nan if m is None else m
+
+    def mean_abs(self, up: bool, col: int) -> Optional[float]:
+        m = self._means[UP if up else DOWN, col]
+        return None if np.isnan(m) else float(m)
+
+    def mean_errors_mm(self, up: bool) -> List[Optional[float]]:
+        """Écart moyen (mesuré - cible) par colonne, None si aucune lecture."""
+        out: List[Optional[float]] = []
+        for col, t in enumerate(self.targets):
+            m = self.mean_abs(up, col)
+            out.append(None if m is None else m - t)
+        return out
+
+    # --------- ÉTAT VISUEL ---------
+    def set_current(self, cell: Optional[Tuple[int, int]]) -> None:
+        """Cellule de la prochaine mesure (fond jaune)."""
+        if cell == self._current:
+            return
+        old, self._current = self._current, cell
+        for c in (old, cell):
+            if c is not None:
+                self._changed(*c)
+
+    def set_critical(self, cell: Optional[Tuple[int, int]]) -> None:
+        """Moyenne du point critique (texte rouge)."""
+        if cell == self._critical:
+            return
+        old, self._critical = self._critical, cell
+        for c in (old, cell):
+            if c is not None:
+                self._changed(*c)
+
+    def set_override(self, cell: Optional[Tuple[int, int]]) -> None:
+        """Cellule en correction dirigée (cadre pointillé, infobulle « modification »)."""
+        old, self.override_cell = self.override_cell, cell
+        for c in (old, cell):
+            if c is not None:
+                self._changed(*c)
+
+    def _changed(self, row: int, col: int) -> None:
+        if 0 <= row < self.rowCount() and 0 <= col < self.columnCount():
+            idx = self.index(row, col)
+            self.dataChanged.emit(idx, idx)
+
+    def cell_kind(self, row: int, col: int) -> int:
+        if row == self.row_index:
+            return self.INDEX
+        if row in (self.row_avg_up, self.row_avg_down):
+            return self.MEAN_CRITICAL if self._critical == (row, col) else self.MEAN
+        if self._current == (row, col):
+            return self.CURRENT
+        return self.EMPTY if self.is_empty(row, col) else self.FILLED
+
+    # --------- QT ---------
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == self.KindRole:
+            return self.cell_kind(row, col)
+        if row == self.row_index:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return str(col + 1)
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return "Index de colonne (cible #)"
+            return None
+        if row in (self.row_avg_up, self.row_avg_down):
+            mean_abs = self.mean_abs(row == self.row_avg_up, col)
+            if mean_abs is None:
+                return "" if role == Qt.ItemDataRole.DisplayRole else None
+            mean_um = (mean_abs - self.targets[col]) * 1000.0
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"{mean_um:+.1f}"
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Moyenne absolue : {mean_abs:.6f} mm\nÉcart moyen : {mean_um:+.1f} µm"
+            return None
+        v = self.value(row, col)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "" if v is None else str(v)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if self.override_cell == (row, col):
+                return "modification"
+            if v is not None:
+                t = self.targets[col]
+                return f"Cible: {t}\nMesuré: {v}\nÉcart (mesuré - cible): {v - t:+.6f}"
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self.targets[section]) if 0 <= section < len(self.targets) else None
+        if section == self.row_avg_up:
+            return "Moyenne ↑ (µm)"
+        if section == self.row_avg_down:
+            return "Moyenne ↓ (µm)"
+        if section == self.row_index:
+            return "Index"
+        state = self.state_for_row(section)
+        if state is None:
+            return None
+        return f"{state[0]}{'↑' if state[1] else '↓'}"
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+class MeasuresDelegate(QStyledItemDelegate):
+    """Style des cellules selon leur genre (MeasuresTableModel.KindRole) + cadre de correction."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        kind = index.data(MeasuresTableModel.KindRole)
+        if kind == MeasuresTableModel.FILLED:
+            option.backgroundBrush = _BRUSH_FILLED
+        elif kind == MeasuresTableModel.CURRENT:
+            option.backgroundBrush = _BRUSH_CURRENT
+        elif kind == MeasuresTableModel.INDEX:
+            option.backgroundBrush = _BRUSH_INDEX
+        if kind in (MeasuresTableModel.FILLED, MeasuresTableModel.CURRENT, MeasuresTableModel.INDEX):
+            option.palette.setColor(option.palette.ColorRole.Text, TEXT_ON_LIGHT_BG)
+        elif kind == MeasuresTableModel.MEAN_CRITICAL:
+            option.palette.setColor(option.palette.ColorRole.Text, _COLOR_CRITICAL)
+        if kind in (MeasuresTableModel.MEAN, MeasuresTableModel.MEAN_CRITICAL, MeasuresTableModel.INDEX):
+            option.font.setBold(True)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        model = index.model()
+        if getattr(model, "override_cell", None) == (index.row(), index.column()):
+            painter.save()
+            painter.setPen(_PEN_OVERRIDE)
+            painter.drawRect(option.rect.adjusted(2, 2, -2, -2))
+            painter.restore()
@@ -6,7 +6,9 @@ from PySide6.QtWidgets import (
 )
 
 from ...io.serial_manager import serial_manager
-from ...config.tesa import load_tesa_config, save_tesa_config, DEFAULT_TESA_CONFIG
+from ...config.tesa import (
+    load_tesa_config, save_tesa_config, DEFAULT_TESA_CONFIG, DEFAULT_SEND_CONFIG, DEFAULT_ASCII_CONFIG,
+)
 
 
 class ParametersTab(QWidget):
@@ -25,23 +27,25 @@ class ParametersTab(QWidget):
         # ENVOI
         self.combo_mode = QComboBox()
         self.combo_mode.addItems(["Manuel (opérateur)", "À la demande"])
+        self.combo_mode.setCurrentText(DEFAULT_SEND_CONFIG["mode"])
         self.combo_mode.setToolTip("Mode de déclenchement de la mesure.")
 
-        self.input_trigger = QLineEdit()
+        self.input_trigger = QLineEdit(DEFAULT_SEND_CONFIG["trigger_text"])
         self.input_trigger.setPlaceholderText("Commande (si 'À la demande'), ex: M")
         self.input_trigger.setToolTip("Commande ASCII envoyée pour demander une mesure, si 'À la demande'.")
 
         self.combo_eol = QComboBox()
         self.combo_eol.addItems(["Aucun", "CR (\\r)", "LF (\\n)", "CRLF (\\r\\n)"])
-        self.combo_eol.setCurrentText("CR (\\r)")
+        self.combo_eol.setCurrentText(DEFAULT_SEND_CONFIG["eol_mode"])
         self.combo_eol.setToolTip("Fin de ligne ajoutée à la commande envoyée.")
 
         # PARSE
         self.combo_decimal = QComboBox()
         self.combo_decimal.addItems(["Point (.)", "Virgule (,)"])
+        self.combo_decimal.setCurrentIndex(1 if DEFAULT_ASCII_CONFIG["decimal_comma"] else 0)
         self.combo_decimal.setToolTip("Caractère décimal attendu dans les nombres reçus.")
 
-        self.input_regex = QLineEdit(r"^\s*[+-]?\s*(?:\d*[.,]\d+|\d+)\s*$")
+        self.input_regex = QLineEdit(DEFAULT_ASCII_CONFIG["regex_pattern"])
         self.input_regex.setToolTip("Regex d’extraction de la valeur (conseillée: stricte).")
 
         ft.addRow("Mode", self.combo_mode)
@@ -66,6 +70,17 @@ class ParametersTab(QWidget):
         self.line_regex = QLineEdit(r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+")
         self.spin_decimals = QSpinBox(); self.spin_decimals.setRange(0, 6); self.spin_decimals.setValue(3)
         self.combo_decimal_disp = QComboBox(); self.combo_decimal_disp.addItems(["dot", "comma"])
+        self.combo_read_mode = QComboBox(); self.combo_read_mode.addItems(["event", "poll"])
+        self.combo_read_mode.setToolTip(
+            "event : attente bloquante sur le port (pas de CPU au repos, fin de trame à silence_ms).\n"
+            "poll : ancienne boucle de scrutation (5–10 ms)."
+        )
+        self.combo_acquisition = QComboBox(); self.combo_acquisition.addItems(["thread", "process"])
+        self.combo_acquisition.setToolTip(
+            "thread : lecteur dans l'application.\n"
+            "process : lecteur dans un processus dédié (mémoire partagée) ; le découpage des trames\n"
+            "ne dépend plus de l'activité de l'interface (export PDF, sauvegarde…)."
+        )
 
         # Bouton rétablir par défaut
         self.btn_tesa_defaults = QPushButton("Rétablir par défaut")
@@ -79,6 +94,8 @@ class ParametersTab(QWidget):
         ff.addRow("value_regex", self.line_regex)
         ff.addRow("decimals", self.spin_decimals)
         ff.addRow("decimal_display", self.combo_decimal_disp)
+        ff.addRow("read_mode", self.combo_read_mode)
+        ff.addRow("acquisition", self.combo_acquisition)
         ff.addRow("", self.btn_tesa_defaults)
 
         root.addWidget(grp_tesa)
@@ -101,6 +118,8 @@ class ParametersTab(QWidget):
         self.line_regex.textChanged.connect(lambda _: self._apply_tesa_reader())
         self.spin_decimals.valueChanged.connect(lambda _: self._apply_tesa_reader())
         self.combo_decimal_disp.currentTextChanged.connect(lambda _: self._apply_tesa_reader())
+        self.combo_read_mode.currentTextChanged.connect(lambda _: self._apply_tesa_reader())
+        self.combo_acquisition.currentTextChanged.connect(lambda _: self._apply_tesa_reader())
         self.btn_tesa_defaults.clicked.connect(self._restore_tesa_defaults)
 
         # Charger config TESA depuis disque et appliquer
@@ -134,6 +153,8 @@ class ParametersTab(QWidget):
             value_regex=self.line_regex.text().strip() or r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+",
             decimals=int(self.spin_decimals.value()),
             decimal_display=self.combo_decimal_disp.currentText(),
+            read_mode=self.combo_read_mode.currentText(),
+            acquisition=self.combo_acquisition.currentText(),
         )
         # Sauvegarder la config
         cfg = {
@@ -146,6 +167,8 @@ class ParametersTab(QWidget):
             "value_regex": self.line_regex.text().strip() or r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+",
             "decimals": int(self.spin_decimals.value()),
             "decimal_display": self.combo_decimal_disp.currentText(),
+            "read_mode": self.combo_read_mode.currentText(),
+            "acquisition": self.combo_acquisition.currentText(),
         }
         save_tesa_config(cfg)
 
@@ -162,6 +185,8 @@ class ParametersTab(QWidget):
         self.line_regex.setText(str(cfg.get("value_regex", r"[-+]?\d+(?:[.,]\d+)?|[-+]?[.,]\d+")))
         self.spin_decimals.setValue(int(cfg.get("decimals", 3)))
         self.combo_decimal_disp.setCurrentText(str(cfg.get("decimal_display", "dot")))
+        self.combo_read_mode.setCurrentText(str(cfg.get("read_mode", "event")))
+        self.combo_acquisition.setCurrentText(str(cfg.get("acquisition", "thread")))
 
     def _restore_tesa_defaults(self):
         # Revenir sur DEFAULT_TESA_CONFIG
@@ -175,5 +200,7 @@ class ParametersTab(QWidget):
         self.line_regex.setText(d["value_regex"])
         self.spin_decimals.setValue(int(d["decimals"]))
         self.combo_decimal_disp.setCurrentText(d["decimal_display"])
+        self.combo_read_mode.setCurrentText(d["read_mode"])
+        self.combo_acquisition.setCurrentText(d["acquisition"])
         self._apply_tesa_reader()
         QMessageBox.information(self, "TESA ASCII", "Valeurs par défaut rétablies et enregistrées.")
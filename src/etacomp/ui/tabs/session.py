@@ -344,13 +344,8 @@ class SessionTab(QWidget):
             return
         ref = s.comparator_ref or ""
         # Vérifier existence
-        exists = False
-        from ...io.storage import list_comparators, upsert_comparator
-        for c in list_comparators():
-            if c.reference == ref:
-                exists = True
-                break
-        if exists:
+        from ...io.storage import get_comparator
+        if get_comparator(ref) is not None:
             return
         # Déduire cibles depuis la session
         targets = []
@@ -72,8 +72,10 @@ class SettingsTab(QWidget):
 
         self.chk_autosave = QCheckBox("Activer la sauvegarde automatique")
         self.chk_autosave.setToolTip(
-            "Enregistre la session en cours dans le dossier autosave/ du répertoire données "
-            "(sans confirmation), si des mesures sont présentes."
+            "Journalise chaque mesure de la session en cours dans le dossier autosave/ du "
+            "répertoire données (sans confirmation), si des mesures sont présentes. "
+            "L'intervalle fixe la synchronisation forcée sur disque ; après un arrêt "
+            "non propre, la session est proposée à la restauration au démarrage."
         )
         self.chk_autosave.setChecked(self.prefs.autosave_enabled)
         self.spin_autosave = QSpinBox()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,7 @@ from PySide6.QtWidgets import (
 
 from ...rules.tolerances import ToleranceRuleEngine, ToleranceRule
 from ...config.paths import get_data_dir
+from ..task_runner import task_runner
 
 
 class RuleEditDialog(QDialog):
@@ -245,17 +247,24 @@ class SettingsRulesTab(QWidget):
         btn_import = QPushButton("Importer JSON…")
         btn_export = QPushButton("Exporter JSON…")
         btn_default = QPushButton("Restaurer par défaut")
+        btn_impact = QPushButton("Impact sur l'historique…")
+        btn_impact.setToolTip(
+            "Compte les verdicts des sessions archivées qui changeraient avec les règles affichées (avant sauvegarde)"
+        )
         btn_save = QPushButton("Sauvegarder")
         
         btn_import.clicked.connect(self._import_json)
         btn_export.clicked.connect(self._export_json)
         btn_default.clicked.connect(self._restore_default)
+        btn_impact.clicked.connect(self._analyze_impact)
+        self.btn_impact = btn_impact
         btn_save.clicked.connect(self._save_rules)
         
         global_layout.addWidget(btn_import)
         global_layout.addWidget(btn_export)
         global_layout.addWidget(btn_default)
         global_layout.addStretch()
+        global_layout.addWidget(btn_impact)
         global_layout.addWidget(btn_save)
         layout.addLayout(global_layout)
         
@@ -447,6 +456,30 @@ class SettingsRulesTab(QWidget):
             self.rules_changed.emit()
             QMessageBox.information(self, "Règles", "Règles par défaut restaurées. Cliquez sur Sauvegarder pour les enregistrer.")
     
+    def _analyze_impact(self):
+        """Compare les règles affichées aux règles sauvegardées sur l'archive des sessions."""
+        errors = self.engine.validate()
+        if errors:
+            QMessageBox.warning(self, "Impact des règles", f"Règles invalides : {'; '.join(errors)}")
+            return
+        from ...rules.impact import analyze_rule_change
+
+        # Réévaluation de l'archive en arrière-plan (peut durer plusieurs secondes)
+        self.btn_impact.setEnabled(False)
+
+        def _done(report) -> None:
+            self.btn_impact.setEnabled(True)
+            QMessageBox.information(self, "Impact des règles", "\n".join(report.summary_lines()))
+
+        def _failed(message: str) -> None:
+            self.btn_impact.setEnabled(True)
+            QMessageBox.warning(self, "Impact des règles", f"Analyse impossible : {message}")
+
+        task_runner.submit(
+            "Impact des règles", analyze_rule_change, copy.deepcopy(self.engine),
+            on_finished=_done, on_failed=_failed,
+        )
+
     def _save_rules(self):
         """Sauvegarde les règles."""
         errors = self.engine.validate()
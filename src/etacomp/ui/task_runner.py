@@ -0,0 +1,174 @@
+"""
+TaskRunner — tâches longues (export PDF, sauvegarde/restauration, recalcul d'archive)
+hors du thread Qt principal, sur un QThreadPool dédié.
+
+- Progression : la tâche reçoit un `ProgressCallback` (io/backup.py) si with_progress=True ;
+  chaque message est relayé au thread GUI par `TaskHandle.progress`.
+- Annulation : `TaskHandle.cancel()` ; la tâche s'interrompt au prochain message de
+  progression (TaskCancelled levée dans le callback) ou via `handle.check_cancelled()`.
+- Résultat : `finished(objet)`, `failed(message)` ou `cancelled()`, délivrés dans le thread
+  GUI (le TaskHandle y est créé ; connexion automatique → file d'événements Qt). Les slots
+  sont passés à submit(on_finished=…) : connectés avant le démarrage de la tâche. Le runner
+  garde le handle jusqu'à la livraison du signal final : l'appelant peut l'ignorer.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import traceback
+from typing import Any, Callable, Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+
+from ..io.backup import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(Exception):
+    """Levée dans la tâche quand l'annulation a été demandée."""
+
+
+class TaskHandle(QObject):
+    """Suivi d'une tâche soumise : signaux de progression / fin, annulation."""
+
+    progress = Signal(str)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, name: str, *, cancellable: bool = True):
+        super().__init__()
+        self.name = name
+        self.cancellable = cancellable
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    # --------- CÔTÉ GUI ---------
+    def cancel(self) -> bool:
+        """Demande l'annulation (sans effet si la tâche n'est pas annulable ou terminée)."""
+        if not self.cancellable or self._done.is_set():
+            return False
+        self._cancel.set()
+        return True
+
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    # --------- CÔTÉ TÂCHE ---------
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def check_cancelled(self) -> None:
+        if self._cancel.is_set():
+            raise TaskCancelled(self.name)
+
+    def report(self, message: str) -> None:
+        """ProgressCallback transmis à la tâche : relais + point d'annulation."""
+        self.check_cancelled()
+        self.progress.emit(message)
+
+
+class _Task(QRunnable):
+    def __init__(self, handle: TaskHandle, fn: Callable, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._handle = handle
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        h = self._handle
+        try:
+            h.check_cancelled()
+            h.result = self._fn(*self._args, **self._kwargs)
+        except TaskCancelled:
+            logger.info("Tâche « %s » annulée", h.name)
+            h.cancelled.emit()
+            h._done.set()
+        except Exception as exc:
+            h.error = exc
+            logger.warning("Tâche « %s » en échec : %s\n%s", h.name, exc, traceback.format_exc())
+            h.failed.emit(str(exc))
+            h._done.set()
+        else:
+            h.finished.emit(h.result)
+            h._done.set()
+
+
+class TaskRunner(QObject):
+    """File de tâches d'arrière-plan partagée par l'application."""
+
+    MAX_THREADS = 2
+
+    def __init__(self, max_threads: int = MAX_THREADS):
+        super().__init__()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        self._active: Set[TaskHandle] = set()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args,
+        with_progress: bool = False,
+        cancellable: bool = True,
+        on_progress: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[Any], None]] = None,
+        on_failed: Optional[Callable[[str], None]] = None,
+        on_cancelled: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> TaskHandle:
+        """
+        Exécute fn(*args, **kwargs) dans le pool ; with_progress=True ajoute
+        `progress=handle.report` (signature des fonctions de io/backup.py).
+        Les on_* sont connectés avant le démarrage (aucun signal perdu).
+        """
+        handle = TaskHandle(name, cancellable=cancellable)
+        for signal, slot in ((handle.progress, on_progress), (handle.finished, on_finished),
+                             (handle.failed, on_failed), (handle.cancelled, on_cancelled)):
+            if slot is not None:
+                signal.connect(slot)
+        # Référence conservée jusqu'à la livraison du signal final dans le thread GUI (après les
+        # slots ci-dessus) : l'appelant peut ignorer le handle sans perdre ses callbacks.
+        for signal in (handle.finished, handle.failed, handle.cancelled):
+            signal.connect(self._release, Qt.ConnectionType.QueuedConnection)
+        if with_progress:
+            progress: ProgressCallback = handle.report
+            kwargs["progress"] = progress
+        with self._lock:
+            self._active.add(handle)
+        self._pool.start(_Task(handle, fn, args, kwargs))
+        return handle
+
+    def _release(self, *_args) -> None:
+        handle = self.sender()
+        with self._lock:
+            self._active.discard(handle)
+
+    def active(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def cancel_all(self) -> None:
+        with self._lock:
+            handles = list(self._active)
+        for h in handles:
+            h.cancel()
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """Attend la fin de toutes les tâches (arrêt de l'application, tests)."""
+        return self._pool.waitForDone(timeout_ms)
+
+
+# Singleton global
+task_runner = TaskRunner()
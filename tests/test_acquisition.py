@@ -0,0 +1,81 @@
+"""Acquisition en processus séparé : anneau en mémoire partagée, compteurs de dépassement."""
+
+import os
+import sys
+import threading
+
+import pytest
+from PySide6.QtCore import Qt
+
+from src.etacomp.io.acquisition import FrameRing
+from src.etacomp.io.serial_manager import SerialManager
+
+
+def test_ring_overrun_keeps_newest_and_counts():
+    ring = FrameRing.create(capacity=4)
+    try:
+        for i in range(3):
+            ring.push(float(i), f"{i}", "30", f"+{i}", 100.0 + i)
+        assert [f[0] for f in ring.drain()] == [0.0, 1.0, 2.0]
+        assert ring.drain() == []
+
+        for i in range(10):
+            ring.push(float(i), f"{i}", "30", f"+{i}", 200.0 + i)
+        frames = ring.drain()
+        assert [f[0] for f in frames] == [6.0, 7.0, 8.0, 9.0]
+        assert frames[-1] == (9.0, "9", "30", "+9", 209.0)
+        assert ring.overruns == 6 and ring.lost == 6 and ring.written == 13
+
+        reader = FrameRing.attach(ring.name)   # vue d'un autre processus
+        ring.push(1.5, "1.500", "31", "+1.5", 300.0)
+        assert [f[0] for f in reader.drain()] == [1.5]
+        reader.close()
+    finally:
+        ring.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="pty Linux")
+def test_serial_manager_process_mode_end_to_end(monkeypatch):
+    import tty
+
+    import src.etacomp.io.serial_manager as sm_mod
+    from src.etacomp.core.latency import LatencyTracker, TracedReading
+
+    tracker = LatencyTracker()
+    tracker.enabled = True
+    monkeypatch.setattr(sm_mod, "latency_tracker", tracker)
+
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    mgr = SerialManager()
+    mgr.set_tesa_reader_config(enabled=True, frame_mode="eol", eol="CRLF", acquisition="process")
+    values, got = [], threading.Event()
+
+    def _on_value(value, *_):
+        values.append(value)
+        if len(values) == 3:
+            got.set()
+
+    mgr.tesa_value.connect(_on_value, Qt.ConnectionType.DirectConnection)
+    lines = []
+    mgr.line_received.connect(lambda _raw, v: lines.append(v), Qt.ConnectionType.DirectConnection)
+    try:
+        mgr.open(os.ttyname(slave), 4800)
+        assert mgr._reader.wait_ready(10.0)
+        assert mgr.is_open() and not mgr._conn.is_open()   # port tenu par le processus
+        mgr.send_text("M", b"\r")
+        assert os.read(master, 16) == b"M\r"
+        os.write(master, b"+0.012\r\n-1.500\r\n+2.000\r\n")
+        assert got.wait(5.0)
+        assert values == [0.012, -1.5, 2.0]
+        assert mgr.acquisition_stats()["written"] == 3
+        # Lectures de l'anneau (float) tracées à partir de l'émission SerialManager (line_received)
+        assert all(isinstance(v, TracedReading) and "signal" in v.stamps for v in lines)
+        for v in lines:
+            tracker.finish(v, "cell")
+        assert len(tracker) == 3
+    finally:
+        mgr.close()
+        os.close(master)
+        os.close(slave)
+    assert not mgr.is_open()
@@ -0,0 +1,84 @@
+"""Journal d'autosave — ajout par lecture, compaction et reprise après arrêt non propre."""
+
+from datetime import datetime
+
+from src.etacomp.io.autosave_journal import AutosaveJournal
+from src.etacomp.models.session import MeasureSeries
+from src.etacomp.state.session_store import SessionStore
+
+
+def _store_with_journal(tmp_path, **kw):
+    journal = AutosaveJournal(lambda: tmp_path, "autosave_session.json", **kw)
+    store = SessionStore()
+    store._current.operator = "op"
+    store._current.date = datetime(2025, 6, 2, 12, 0, 0)
+    store._current.series_count = 2
+    store.attach_journal(journal)
+    return store, journal
+
+
+def _fill(store, n_targets=3):
+    series = [MeasureSeries(target=float(t), readings=[]) for t in range(n_targets)]
+    for pos in range(4):
+        for ms in series:
+            ms.readings.append(ms.target + 0.001 * pos)
+            store.record_reading(series, ms.target, pos, ms.readings[pos])
+    return series
+
+
+def test_readings_are_appended_not_rewritten(tmp_path):
+    store, journal = _store_with_journal(tmp_path)
+    series = _fill(store)
+
+    snap = journal.snapshot_path
+    snap_mtime = snap.stat().st_mtime_ns
+    # 1re mesure → instantané ; les 11 suivantes → une ligne de journal chacune
+    assert journal.pending_records == 11
+    assert len(journal.journal_path.read_text(encoding="utf-8").splitlines()) == 11
+
+    series[0].readings[1] = 0.5
+    store.record_reading(series, 0.0, 1, 0.5, override=True)
+    assert snap.stat().st_mtime_ns == snap_mtime
+    assert '"override":true' in journal.journal_path.read_text(encoding="utf-8").splitlines()[-1]
+
+
+def test_recover_replays_journal_after_crash(tmp_path):
+    store, journal = _store_with_journal(tmp_path, fsync_every=1)
+    _fill(store)
+    store.update_observations("capteur remplacé")
+    store.set_fidelity(1.0, "up", [1.0, 1.001, 0.999, 1.0, 1.0])
+
+    # Arrêt brutal : pas de close(), une ligne à moitié écrite en fin de journal
+    with open(journal.journal_path, "a", encoding="utf-8") as fh:
+        fh.write('{"op":"reading","target":2.0,')
+
+    fresh = AutosaveJournal(lambda: tmp_path, "autosave_session.json")
+    assert fresh.has_pending()
+    rec = fresh.recover()
+    cur = store.current
+    assert [ms.readings for ms in rec.series] == [ms.readings for ms in cur.series]
+    assert rec.observations == "capteur remplacé"
+    assert rec.fidelity.samples == cur.fidelity.samples
+
+
+def test_compaction_and_clean_close(tmp_path):
+    store, journal = _store_with_journal(tmp_path, compact_every=5)
+    _fill(store)
+    assert journal.pending_records < 5
+
+    store.attach_journal(None)
+    assert not journal.journal_path.exists()
+    rec = AutosaveJournal(lambda: tmp_path, "autosave_session.json").recover()
+    assert rec.total_readings() == 12
+
+
+def test_new_session_drops_journal_and_empty_session_writes_nothing(tmp_path):
+    store, journal = _store_with_journal(tmp_path)
+    store.update_observations("rien")
+    assert not journal.snapshot_path.exists()
+
+    _fill(store)
+    assert journal.journal_path.exists()
+    store.new_session()
+    assert not journal.journal_path.exists()
+    assert journal.snapshot_path.exists()  # dernier brouillon conservé
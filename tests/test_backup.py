@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import zipfile
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from src.etacomp.io import backup as backup_mod
 from src.etacomp.io.backup import (
     BACKUP_VERSION,
     export_backup,
+    export_incremental_backup,
     read_manifest,
+    resolve_entries,
     restore_backup,
 )
 
@@ -84,3 +87,178 @@ def test_list_removable_mounts_under_media_user(tmp_path: Path, monkeypatch):
     assert len(mounts) == 1
     assert "A8FF-1F3B" in mounts[0][0]
     assert mounts[0][1] == usb.resolve()
+
+
+def _write_session(base: Path, name: str, value: float) -> Path:
+    fp = base / "sessions" / name
+    fp.write_text(json.dumps({"operator": "op", "value": value}), encoding="utf-8")
+    return fp
+
+
+def test_incremental_chain_stores_only_changes_and_restores_any_point(data_dir: Path, tmp_path: Path):
+    usb = tmp_path / "usb"
+    s1 = _write_session(data_dir, "S1.json", 1.0)
+    _write_session(data_dir, "S2.json", 2.0)
+    cats = ["config", "comparators", "sessions"]
+    full = export_backup(usb / "b1.zip", cats)
+    assert full.stored_count == full.file_count == 4
+
+    # Une session modifiée, une ajoutée, une simplement « touchée » (mtime seul)
+    _write_session(data_dir, "S2.json", 2.5)
+    _write_session(data_dir, "S3.json", 3.0)
+    os.utime(s1, ns=(s1.stat().st_atime_ns, s1.stat().st_mtime_ns + 10**9))
+    inc = export_backup(usb / "b2.zip", cats, base=usb / "b1.zip")
+    assert inc.file_count == 5 and inc.stored_count == 2
+    with zipfile.ZipFile(usb / "b2.zip") as zf:
+        assert sorted(zf.namelist()) == ["manifest.json", "sessions/S2.json", "sessions/S3.json"]
+    m2 = read_manifest(usb / "b2.zip")
+    # Manifeste incrémental : différences seulement (S1 : mtime mis à jour, contenu dans b1)
+    assert m2.parent == "b1.zip" and sorted(m2.entries) == ["sessions/S1.json", "sessions/S2.json", "sessions/S3.json"]
+    assert m2.entries["sessions/S1.json"].archive == "b1.zip"
+    state = resolve_entries(usb / "b2.zip")
+    assert state["config.json"].archive == "b1.zip" and state["sessions/S2.json"].archive == "b2.zip"
+
+    (data_dir / "sessions" / "S3.json").unlink()
+    inc2 = export_incremental_backup(usb / "b3.zip", cats)
+    assert inc2.parent == usb / "b2.zip" and inc2.stored_count == 0
+    m3 = read_manifest(usb / "b3.zip")
+    assert m3.entries == {} and m3.removed == ["sessions/S3.json"]
+    assert "sessions/S3.json" not in resolve_entries(usb / "b3.zip")
+
+    # Restauration de l'état intermédiaire (b2) depuis la chaîne
+    target = tmp_path / "restored"
+    target.mkdir()
+    restore_backup(usb / "b2.zip", cats, data_dir=target, create_safety_backup=False)
+    assert json.loads((target / "sessions" / "S2.json").read_text(encoding="utf-8"))["value"] == 2.5
+    assert (target / "sessions" / "S3.json").is_file()
+    assert (target / "comparators" / "C1.json").is_file()
+
+    (usb / "b1.zip").unlink()
+    with pytest.raises(ValueError, match="b1.zip"):
+        restore_backup(usb / "b3.zip", cats, data_dir=target, create_safety_backup=False)
+
+
+def test_incremental_requires_hashed_base(data_dir: Path, tmp_path: Path):
+    old = tmp_path / "v1.zip"
+    with zipfile.ZipFile(old, "w") as zf:
+        zf.writestr("manifest.json", json.dumps({"app": "EtaComp2K25", "backup_version": 1, "categories": ["config"]}))
+        zf.writestr("config.json", "{}")
+    with pytest.raises(ValueError, match="complète"):
+        export_backup(tmp_path / "inc.zip", ["config"], base=old)
+    # Une archive version 1 reste restaurable
+    target = tmp_path / "t"
+    target.mkdir()
+    assert restore_backup(old, ["config"], data_dir=target, create_safety_backup=False).file_count == 1
+
+
+def test_parallel_packing_policy_and_byte_progress(data_dir: Path, tmp_path: Path):
+    exports = data_dir / "exports"
+    exports.mkdir()
+    (exports / "C1_250602001.pdf").write_bytes(b"%PDF-1.4\n" + bytes(range(256)) * 40)
+    for i in range(40):
+        _write_session(data_dir, f"S{i:02d}.json", float(i))
+    big = data_dir / "sessions" / "big.json"
+    big.write_text(json.dumps({"values": list(range(5000))}), encoding="utf-8")
+    cats = ["config", "sessions", "exports"]
+
+    messages: list[str] = []
+    export_backup(tmp_path / "par.zip", cats, workers=4, compresslevel=9, progress=messages.append)
+    export_backup(tmp_path / "ser.zip", cats, workers=1)
+    with zipfile.ZipFile(tmp_path / "par.zip") as par, zipfile.ZipFile(tmp_path / "ser.zip") as ser:
+        assert par.testzip() is None
+        assert par.namelist()[:-1] == ser.namelist()[:-1]   # ordre conservé (manifeste en dernier)
+        for name in par.namelist()[:-1]:
+            assert par.read(name) == ser.read(name)
+        assert par.getinfo("exports/C1_250602001.pdf").compress_type == zipfile.ZIP_STORED
+        assert par.getinfo("sessions/big.json").compress_type == zipfile.ZIP_DEFLATED
+
+    pct = [m for m in messages if "%)" in m]
+    assert pct and "(100 %)" in pct[-1] and len(pct) <= 101
+    target = tmp_path / "restored"
+    target.mkdir()
+    restore_backup(tmp_path / "par.zip", cats, data_dir=target, create_safety_backup=False)
+    assert (target / "sessions" / "big.json").read_bytes() == big.read_bytes()
+
+
+def test_streamed_members_and_byte_bounded_pack_window(data_dir: Path, tmp_path: Path, monkeypatch):
+    for i in range(12):
+        (data_dir / "sessions" / f"S{i:02d}.json").write_text("x" * 3000 + str(i), encoding="utf-8")
+    (data_dir / "sessions" / "é_big.json").write_text(json.dumps(list(range(3000))), encoding="utf-8")
+    monkeypatch.setattr(backup_mod, "LARGE_FILE", 5000)   # é_big.json écrit en flux
+
+    in_flight = {"now": 0, "max": 0}
+    pack = backup_mod._pack
+
+    def counting_pack(fp, name, level, known):
+        in_flight["now"] += fp.stat().st_size
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        return pack(fp, name, level, known)
+
+    monkeypatch.setattr(backup_mod, "_pack", counting_pack)
+    items = [(fp, f"sessions/{fp.name}") for fp in sorted((data_dir / "sessions").glob("S*.json"))]
+    for fp, _name, _packed in backup_mod._pack_ordered(items, 6, frozenset(), 4, window_bytes=7000):
+        in_flight["now"] -= fp.stat().st_size
+    assert 0 < in_flight["max"] <= 7000
+
+    archive = tmp_path / "b.zip"
+    export_backup(archive, ["sessions"], workers=4)
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        info = zf.getinfo("sessions/é_big.json")
+        assert info.flag_bits & 0x08 and info.compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read(info) == (data_dir / "sessions" / "é_big.json").read_bytes()
+    entries = resolve_entries(archive)
+    assert entries["sessions/é_big.json"].size == (data_dir / "sessions" / "é_big.json").stat().st_size
+
+
+def test_restore_skips_identical_files_and_snapshots_only_replaced(data_dir: Path, tmp_path: Path):
+    _write_session(data_dir, "S1.json", 1.0)
+    _write_session(data_dir, "S2.json", 2.0)
+    archive = tmp_path / "b.zip"
+    export_backup(archive, ["config", "comparators", "sessions"])
+
+    # Rien n'a changé : aucune écriture, aucune sauvegarde de sécurité
+    same = restore_backup(archive, ["sessions"])
+    assert same.file_count == 0 and same.skipped_count == 2 and same.safety_backup_path is None
+
+    s2 = data_dir / "sessions" / "S2.json"
+    _write_session(data_dir, "S2.json", 9.0)
+    edited = s2.read_bytes()
+    messages: list[str] = []
+    result = restore_backup(archive, ["sessions"], progress=messages.append)
+    assert result.file_count == 1 and result.skipped_count == 1
+    assert json.loads(s2.read_text(encoding="utf-8"))["value"] == 2.0
+
+    # Instantané limité à la catégorie restaurée : S2 copié (contenu d'avant), S1 lié
+    snap = result.safety_backup_path
+    assert sorted(p.relative_to(snap).as_posix() for p in snap.rglob("*") if p.is_file()) == [
+        "sessions/S1.json", "sessions/S2.json",
+    ]
+    assert (snap / "sessions" / "S2.json").read_bytes() == edited
+    assert (snap / "sessions" / "S1.json").stat().st_ino == (data_dir / "sessions" / "S1.json").stat().st_ino
+    assert any("1 fichier(s) copié(s), 1 lié(s)" in m for m in messages)
+
+
+def test_app_writers_do_not_alter_hard_linked_snapshot(data_dir: Path, monkeypatch):
+    import src.etacomp.config.prefs as prefs_mod
+    import src.etacomp.config.tesa as tesa_mod
+
+    monkeypatch.setattr(tesa_mod, "get_data_dir", lambda: data_dir)
+    monkeypatch.setattr(prefs_mod, "get_data_dir", lambda: data_dir)
+    tesa_mod.save_tesa_config({"silence_ms": 120})
+    archive = data_dir.parent / "cfg.zip"
+    export_backup(archive, ["config"])
+
+    # config.json remplacé par la restauration (copié), tesa_config.json lié
+    (data_dir / "config.json").write_text('{"theme": "dark"}', encoding="utf-8")
+    snap = restore_backup(archive, ["config"]).safety_backup_path
+    linked = snap / "tesa_config.json"
+    assert linked.stat().st_ino == (data_dir / "tesa_config.json").stat().st_ino
+    before = linked.read_bytes()
+
+    # Enregistrements ultérieurs de l'application : remplacement, pas de réécriture en place
+    tesa_mod.save_tesa_config({"silence_ms": 300})
+    prefs_mod.save_prefs(prefs_mod.Preferences(theme="dark"))
+    assert linked.read_bytes() == before
+    assert json.loads((snap / "config.json").read_text(encoding="utf-8"))["theme"] == "dark"
+    assert tesa_mod.load_tesa_config()["silence_ms"] == 300
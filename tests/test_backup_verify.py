@@ -0,0 +1,78 @@
+"""Vérification d'archive de sauvegarde (etacomp-backup verify)."""
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.etacomp.io import backup as backup_mod
+from src.etacomp.io.backup import export_backup, export_incremental_backup
+from src.etacomp.io.backup_verify import main, verify_backup
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch) -> Path:
+    base = tmp_path / "data"
+    (base / "sessions").mkdir(parents=True)
+    (base / "exports").mkdir()
+    (base / "config.json").write_text('{"theme": "light"}', encoding="utf-8")
+    for i in range(30):
+        (base / "sessions" / f"S{i:02d}.json").write_text(json.dumps({"value": i}), encoding="utf-8")
+    (base / "exports" / "C1.pdf").write_bytes(b"%PDF-1.4\n" + bytes(range(256)) * 100)
+    monkeypatch.setattr(backup_mod, "get_data_dir", lambda: base)
+    return base
+
+
+def _rewrite_member(archive: Path, name: str, data: bytes) -> None:
+    """Réécrit l'archive avec un membre altéré (manifeste inchangé)."""
+    tmp = archive.with_suffix(".tmp")
+    with zipfile.ZipFile(archive) as src, zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(info, data if info.filename == name else src.read(info))
+    tmp.replace(archive)
+
+
+def test_verify_chain_reports_throughput(data_dir: Path, tmp_path: Path):
+    usb = tmp_path / "usb"
+    cats = ["config", "sessions", "exports"]
+    export_backup(usb / "b1.zip", cats)
+    (data_dir / "sessions" / "S00.json").write_text('{"value": -1}', encoding="utf-8")
+    export_incremental_backup(usb / "b2.zip", cats)
+
+    messages: list[str] = []
+    report = verify_backup(usb / "b2.zip", workers=3, progress=messages.append)
+    assert report.ok and report.checked == 32
+    assert report.archives == ["b2.zip", "b1.zip"]
+    assert report.total_bytes == sum(p.stat().st_size for p in data_dir.rglob("*") if p.is_file())
+    assert report.throughput > 0 and "(100 %)" in messages[-1]
+    assert report.summary_lines()[-1] == "Archive valide."
+
+
+def test_verify_detects_corruption_and_missing_chain(data_dir: Path, tmp_path: Path, capsys):
+    usb = tmp_path / "usb"
+    export_backup(usb / "b1.zip", ["config", "sessions"])
+    export_incremental_backup(usb / "b2.zip", ["config", "sessions"])
+
+    # Contenu différent du manifeste (CRC du ZIP cohérent) et JSON illisible
+    _rewrite_member(usb / "b1.zip", "sessions/S03.json", b'{"value": 99}')
+    _rewrite_member(usb / "b1.zip", "config.json", b"{pas du json")
+    report = verify_backup(usb / "b2.zip", workers=1)
+    reasons = dict(report.failures)
+    assert set(reasons) == {"sessions/S03.json", "config.json"}
+    assert "SHA-256" in reasons["sessions/S03.json"] or "taille" in reasons["sessions/S03.json"]
+    assert main([str(usb / "b2.zip"), "--quiet"]) == 3
+    assert "INVALIDE" in capsys.readouterr().out
+
+    (usb / "b1.zip").unlink()
+    assert main([str(usb / "b2.zip"), "--quiet"]) == 2
+    assert main([str(usb / "absente.zip")]) == 2
+
+
+def test_verify_version1_archive_checks_crc_and_json(tmp_path: Path):
+    old = tmp_path / "v1.zip"
+    with zipfile.ZipFile(old, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", json.dumps({"app": "EtaComp2K25", "backup_version": 1, "categories": ["config"]}))
+        zf.writestr("config.json", "{}")
+        zf.writestr("sessions/bad.json", "[1,")
+    report = verify_backup(old)
+    assert report.checked == 2 and [n for n, _ in report.failures] == ["sessions/bad.json"]
@@ -0,0 +1,56 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.etacomp.models.session import Session as RuntimeSession, MeasureSeries
+from src.etacomp.ui.tabs.calibration_curve import CalibrationCurveTab
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def make_rt():
+    targets = [0.0, 0.1, 0.2, 0.3]
+    series = [MeasureSeries(target=t, readings=[t + 0.001, t - 0.001, t + 0.002, t - 0.002]) for t in targets]
+    return RuntimeSession(operator="test", series_count=2, measures_per_series=11,
+                          comparator_ref=None, series=series)
+
+
+def test_refresh_reuses_artists_and_blits(app):
+    rt = make_rt()
+    tab = CalibrationCurveTab(get_runtime_session=lambda: rt)
+    tab.resize(800, 600)
+    tab.show()
+    tab.refresh()
+    tab.canvas.draw()
+    app.processEvents()
+    ax, line_up, marker = tab.ax, tab.line_up, tab.crit_marker
+    assert tab._background is not None
+    assert tab.table.rowCount() == 4
+
+    full_draws = []
+    orig_draw = tab.canvas.draw
+    tab.canvas.draw = lambda *a: (full_draws.append(1), orig_draw())
+    orig_idle = tab.canvas.draw_idle
+    tab.canvas.draw_idle = lambda *a: (full_draws.append(1), orig_idle())
+
+    # Lecture dans l'échelle courante : blitting seul, mêmes artistes
+    rt.series[1].readings[0] = 0.1012
+    tab.refresh()
+    app.processEvents()
+    assert full_draws == []
+    assert tab.ax is ax and tab.line_up is line_up and tab.crit_marker is marker
+    assert line_up.get_ydata()[1] == pytest.approx(1.6)
+    assert len(ax.lines) == 2 + 1 + 2 + 4 + 1   # courbes, zéro, ±Emt, guides, point critique
+    assert tab.table.item(1, 3).text() == "1.6"
+
+    # Changement de mode : fond redessiné, artistes conservés
+    tab.mode_combo.setCurrentIndex(1)
+    assert full_draws
+    assert tab.line_up is line_up and not tab.zero_line.get_visible()
+    assert len(ax.lines) == 2 + 1 + 2 + 4 + 1
@@ -0,0 +1,151 @@
+"""Registre des comparateurs — chargement unique et invalidation par fichier."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.etacomp.core.session_adapter import capture_comparator_snapshot
+from src.etacomp.io.comparator_registry import ComparatorRegistry
+from src.etacomp.models.comparator import Comparator
+
+
+def _comparator(ref: str, graduation: float = 0.01) -> Comparator:
+    return Comparator(
+        reference=ref,
+        graduation=graduation,
+        course=10.0,
+        targets=[float(i) for i in range(11)],
+        range_type="normale",
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch):
+    import src.etacomp.io.storage as storage_mod
+
+    monkeypatch.setattr(storage_mod, "get_data_dir", lambda: tmp_path)
+    storage_mod.comparator_registry.invalidate()
+    yield storage_mod
+    storage_mod.comparator_registry.invalidate()
+
+
+def test_get_and_list_after_save_and_delete(storage):
+    storage.save_comparator(_comparator("B-REF"))
+    storage.save_comparator(_comparator("A-REF"))
+    assert [c.reference for c in storage.list_comparators()] == ["A-REF", "B-REF"]
+    assert storage.get_comparator("A-REF").graduation == 0.01
+
+    storage.save_comparator(_comparator("A-REF", graduation=0.001))
+    assert storage.get_comparator("A-REF").graduation == 0.001
+
+    assert storage.delete_comparator_by_reference("A-REF")
+    assert storage.get_comparator("A-REF") is None
+    assert storage.get_comparator(None) is None
+
+
+def test_only_modified_files_are_revalidated(tmp_path: Path, monkeypatch):
+    d = tmp_path / "comparators"
+    d.mkdir()
+    for ref in ("C1", "C2"):
+        (d / f"{ref}.json").write_text(_comparator(ref).model_dump_json(), encoding="utf-8")
+
+    calls: list[str] = []
+    original = Comparator.model_validate
+
+    def _counting(data, *a, **kw):
+        calls.append(data.get("reference"))
+        return original(data, *a, **kw)
+
+    monkeypatch.setattr(Comparator, "model_validate", _counting)
+    reg = ComparatorRegistry(lambda: d)
+    assert reg.get("C1") is not None
+    assert sorted(calls) == ["C1", "C2"]
+
+    calls.clear()
+    reg.get("C2")
+    reg.all()
+    assert calls == []
+
+    # Modification hors application (ex. copie manuelle) : seul C2 est relu
+    data = json.loads((d / "C2.json").read_text(encoding="utf-8"))
+    data["graduation"] = 0.1
+    (d / "C2.json").write_text(json.dumps(data), encoding="utf-8")
+    st = (d / "C2.json").stat()
+    os.utime(d / "C2.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert reg.refresh(force=True)
+    assert calls == ["C2"]
+    assert reg.get("C2").graduation == 0.1
+
+
+def test_invalid_file_is_skipped_and_change_signal_emitted(tmp_path: Path):
+    d = tmp_path / "comparators"
+    d.mkdir()
+    (d / "broken.json").write_text("{not json", encoding="utf-8")
+    reg = ComparatorRegistry(lambda: d)
+    events: list[bool] = []
+    reg.changed.connect(lambda: events.append(True))
+
+    assert reg.all() == []
+    (d / "OK.json").write_text(_comparator("OK").model_dump_json(), encoding="utf-8")
+    reg.refresh(force=True)
+    assert reg.references() == ["OK"]
+    assert events
+
+
+def test_snapshot_uses_registry(storage):
+    storage.save_comparator(_comparator("SNAP"))
+    snap = capture_comparator_snapshot("SNAP")
+    assert snap["reference"] == "SNAP"
+    assert snap["targets"] == [float(i) for i in range(11)]
+    assert capture_comparator_snapshot("UNKNOWN") is None
+
+
+def test_in_place_edit_is_picked_up_without_forced_refresh(tmp_path: Path):
+    d = tmp_path / "comparators"
+    d.mkdir()
+    for ref in ("C1", "C2"):
+        (d / f"{ref}.json").write_text(_comparator(ref).model_dump_json(), encoding="utf-8")
+    reg = ComparatorRegistry(lambda: d)
+    events: list[bool] = []
+    reg.changed.connect(lambda: events.append(True))
+    assert reg.get("C1").graduation == 0.01
+    events.clear()
+
+    # Réécriture en place (même inode) : le mtime du répertoire ne bouge pas
+    dir_mtime = d.stat().st_mtime_ns
+    with open(d / "C1.json", "r+", encoding="utf-8") as fh:
+        fh.truncate(0)
+        fh.write(_comparator("C1", graduation=0.005).model_dump_json())
+    assert d.stat().st_mtime_ns == dir_mtime
+    assert reg.get("C1").graduation == 0.005
+    assert events == [True]
+
+    with open(d / "C2.json", "r+", encoding="utf-8") as fh:
+        fh.truncate(0)
+        fh.write(_comparator("C2", graduation=0.002).model_dump_json())
+    assert {c.reference: c.graduation for c in reg.all()} == {"C1": 0.005, "C2": 0.002}
+
+
+def test_unknown_reference_does_not_rescan_directory(tmp_path: Path, monkeypatch):
+    d = tmp_path / "comparators"
+    d.mkdir()
+    for ref in ("C1", "C2"):
+        (d / f"{ref}.json").write_text(_comparator(ref).model_dump_json(), encoding="utf-8")
+    reg = ComparatorRegistry(lambda: d)
+    assert reg.get("C1") is not None
+
+    scans: list[Path] = []
+    original = reg._rescan
+    monkeypatch.setattr(reg, "_rescan", lambda path: scans.append(path) or original(path))
+    for _ in range(3):
+        assert reg.get("DELETED") is None
+    assert scans == []
+
+    # Nouveau profil écrit par remplacement atomique : le mtime du répertoire change
+    tmp = d / "C3.json.tmp"
+    tmp.write_text(_comparator("C3").model_dump_json(), encoding="utf-8")
+    os.replace(tmp, d / "C3.json")
+    assert reg.get("C3") is not None
+    assert len(scans) == 1
@@ -0,0 +1,54 @@
+"""Découpage incrémental des trames série (LineFramer) et masque 7 bits."""
+
+import random
+
+from src.etacomp.io.framing import LineFramer, hex_dump, mask_7bit
+
+
+def _reference_lines(data: bytes) -> list[bytes]:
+    """Découpage de référence : CRLF → LF puis séparation sur CR/LF, lignes vides ignorées."""
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return [p for p in data.split(b"\n") if p]
+
+
+def _reference_frames(data: bytes, term: bytes) -> tuple[list[bytes], bytes]:
+    out, buf = [], bytearray(data)
+    while (i := buf.find(term)) >= 0:
+        out.append(bytes(buf[: i + len(term)]))
+        del buf[: i + len(term)]
+    return out, bytes(buf)
+
+
+def _chunks(data: bytes, rng: random.Random):
+    i = 0
+    while i < len(data):
+        n = rng.choice([1, 2, 3, 7, 64])
+        yield data[i:i + n]
+        i += n
+
+
+def test_lines_any_eol_across_chunk_boundaries():
+    rng = random.Random(3)
+    pieces = [b"+0.012", b"-1.5", b"", b"abc", b"\x00x"]
+    data = b"".join(rng.choice(pieces) + rng.choice([b"\r", b"\n", b"\r\n", b"\n\r"]) for _ in range(500)) + b"tail"
+    framer = LineFramer()
+    got = [line for c in _chunks(data, rng) for line in framer.feed(c)]
+    assert got == _reference_lines(data[:-4])
+    assert framer.pending() == b"tail"
+
+
+def test_exact_terminator_keeps_terminator():
+    rng = random.Random(4)
+    for term in (b"\r\n", b"\r", b"\n"):
+        data = b"".join(rng.choice([b"+0.01", b"\r", b"\n", b"\r\n", b"7"]) for _ in range(400))
+        framer = LineFramer(term)
+        got = [f for c in _chunks(data, rng) for f in framer.feed(c)]
+        expected, rest = _reference_frames(data, term)
+        assert got == expected
+        assert framer.pending() == rest
+
+
+def test_mask_and_hex_match_per_byte_versions():
+    data = bytes(range(256))
+    assert mask_7bit(data) == bytes(b & 0x7F for b in data)
+    assert hex_dump(b"\xab+0") == " ".join(f"{b:02X}" for b in b"\xab+0")
@@ -0,0 +1,65 @@
+"""Calcul incrémental — mêmes résultats que le calcul complet après chaque lecture."""
+
+import random
+from datetime import datetime
+
+from src.etacomp.core.calculation_engine import CalculationEngine
+from src.etacomp.core.incremental_calculation import IncrementalCalculation
+from src.etacomp.core.session_adapter import build_session_from_runtime
+from src.etacomp.models.session import FidelitySeries, MeasureSeries, Session
+from src.etacomp.state.session_store import SessionStore
+
+
+def _full(rt: Session):
+    return CalculationEngine().compute(build_session_from_runtime(rt))
+
+
+def _snapshot(targets):
+    return {"reference": "CMP", "graduation": 0.01, "course": 10.0, "range_type": "normale", "targets": targets}
+
+
+def test_random_edits_match_full_computation():
+    rng = random.Random(5)
+    targets = [float(i) for i in range(11)]
+    rt = Session(
+        operator="op", date=datetime(2025, 6, 2), series_count=2,
+        comparator_snapshot=_snapshot(targets),
+        series=[MeasureSeries(target=t, readings=[]) for t in targets],
+    )
+    inc = IncrementalCalculation.from_runtime(rt)
+    assert inc.results() == _full(rt)
+
+    for step in range(300):
+        ms = rng.choice(rt.series)
+        pos = rng.randrange(5)  # pos 4 : au-delà des 2 cycles, ignorée
+        value = None if rng.random() < 0.15 else ms.target + rng.uniform(-0.02, 0.02)
+        while len(ms.readings) <= pos:
+            ms.readings.append(None)
+        ms.readings[pos] = value
+        inc.set_reading(ms.target, pos, value)
+        if step % 50 == 49:
+            rt.fidelity = FidelitySeries(target=5.0, direction="down", samples=[5.0 + rng.uniform(-0.01, 0.01) for _ in range(6)])
+            inc.set_fidelity(rt.fidelity)
+        assert inc.results() == _full(rt)
+
+
+def test_store_keeps_calculation_in_sync():
+    store = SessionStore()
+    store._current.series_count = 2
+    store._current.comparator_snapshot = _snapshot([0.0, 1.0, 2.0])
+    series = [MeasureSeries(target=float(t), readings=[]) for t in range(3)]
+    for pos in range(4):
+        for ms in series:
+            ms.readings.append(ms.target + 0.001 * (pos + ms.target))
+            store.record_reading(series, ms.target, pos, ms.readings[pos])
+            assert store.results() == _full(store.current)
+    calc = store.calculation
+    assert calc.mean(2.0, "down") == (2.0 + 0.001 * 3 + 2.0 + 0.001 * 5) / 2
+
+    store.set_fidelity(0.0, "up", [2.0, 2.001, 2.0, 1.999, 2.0])
+    assert store.results() == _full(store.current)
+    assert store.results().fidelity_std_mm is not None
+
+    # Remplacement direct des séries hors API : resynchronisation à la lecture suivante
+    store._current.series = [MeasureSeries(target=1.0, readings=[1.004, 1.0])]
+    assert store.results() == _full(store.current)
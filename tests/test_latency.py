@@ -0,0 +1,62 @@
+"""Traces de latence octet → cellule : horodatages par étape, percentiles, export."""
+
+import csv
+
+import pytest
+
+from src.etacomp.core.latency import BUDGET_MS, STAGES, TOTAL, LatencyTracker, TracedReading
+from src.etacomp.io.tesa_reader import TesaSerialReader
+
+
+def _sample(tracker, deltas_ms):
+    t = 100.0
+    stamps = {}
+    for stage, d in zip(STAGES, deltas_ms):
+        t += d / 1000.0
+        stamps[stage] = t
+    v = TracedReading(0.012, stamps)
+    tracker.finish(v, "beep")
+    tracker.finish(v, "beep")   # une seule fois par lecture
+    return v
+
+
+def test_summary_histogram_and_export(tmp_path):
+    tr = LatencyTracker()
+    for i in range(100):
+        # rx, decode, signal, slot, dispatch, cell, means, beep
+        _sample(tr, [0, 1, 0.1, 2 + (60 if i == 99 else 0), 0.5, 1, 3, 0.4])
+    assert len(tr) == 100
+    rows = {r["stage"]: r for r in tr.summary()}
+    assert rows["slot"]["p50"] == pytest.approx(2.0)
+    assert rows["slot"]["max"] == pytest.approx(62.0)
+    assert rows[TOTAL]["p50"] == pytest.approx(8.0)
+    assert rows[TOTAL]["over_budget"] == 1
+    hist = tr.histogram(TOTAL)
+    assert sum(n for _, _, n in hist) == 100
+    assert sum(n for lo, _, n in hist if lo >= BUDGET_MS) == 1
+
+    path = tr.export_csv(tmp_path / "lat.csv")
+    rows = list(csv.reader(path.open(encoding="utf-8"), delimiter=";"))
+    assert rows[0] == ["index", *[f"{s}_ms" for s in STAGES]]
+    assert len(rows) == 101 and rows[1][1] == "0.000" and float(rows[1][-1]) == pytest.approx(8.0)
+
+
+def test_reader_emits_traced_reading_only_when_enabled(monkeypatch):
+    import src.etacomp.io.tesa_reader as tesa_mod
+
+    tr = LatencyTracker()
+    monkeypatch.setattr(tesa_mod, "latency_tracker", tr)
+    got = []
+    reader = TesaSerialReader(conn=None, on_value=lambda v, *_: got.append(v))
+
+    reader._emit_frame(b"+0.012\r\n", rx=1.0)
+    assert type(got[-1]) is float
+
+    tr.enabled = True
+    reader._emit_frame(b"+0.012\r\n", rx=1.0)
+    v = got[-1]
+    assert isinstance(v, TracedReading) and v == 0.012
+    assert v.stamps["rx"] == 1.0 and v.stamps["decode"] > 1.0
+    tr.mark(v, "signal")
+    tr.finish(v)
+    assert set(tr._samples[0]) == {"rx", "decode", "signal", "beep"}
@@ -0,0 +1,93 @@
+import numpy as np
+from PySide6.QtCore import Qt
+
+from src.etacomp.ui.tabs.measures_model import MeasuresTableModel
+
+
+def make_model(cycles=3, targets=(0.0, 0.5, 1.0)):
+    m = MeasuresTableModel()
+    readings = {0.0: [0.001, -0.002, 0.003], 1.0: [None, 1.004]}
+    m.reset(targets, cycles, readings)
+    return m
+
+
+def record_changes(model):
+    changes = []
+    model.dataChanged.connect(
+        lambda a, b, *_: changes.append((a.row(), a.column(), b.row(), b.column())),
+        Qt.ConnectionType.DirectConnection,
+    )
+    return changes
+
+
+def test_geometry_and_reset():
+    m = make_model()
+    assert m.rowCount() == 2 * 3 + 3
+    assert m.columnCount() == 3
+    assert (m.row_avg_up, m.row_avg_down, m.row_index) == (3, 7, 8)
+    assert m.row_for_state(2, True) == 1 and m.row_for_state(2, False) == 5
+    assert m.state_for_row(5) == (2, False)
+    assert m.state_for_row(m.row_avg_up) is None
+    # pos = (cycle-1)*2 + sens
+    assert m.value(0, 0) == 0.001          # 1↑
+    assert m.value(4, 0) == -0.002         # 1↓
+    assert m.value(1, 0) == 0.003          # 2↑
+    assert m.is_empty(0, 2) and m.value(4, 2) == 1.004
+
+
+def test_means_match_engine_bit_for_bit():
+    m = make_model(cycles=4)
+    rng = np.random.default_rng(3)
+    ref = np.full((4, 2, 3), np.nan)
+    for cyc, d, col in np.ndindex(ref.shape):
+        m.set_value(m.row_for_state(cyc + 1, d == 0), col, None)
+    for _ in range(200):
+        cyc, d, col = rng.integers(4), rng.integers(2), rng.integers(3)
+        v = None if rng.random() < 0.2 else float(m.targets[col] + rng.normal(0, 0.01))
+        m.set_value(m.row_for_state(int(cyc) + 1, d == 0), int(col), v)
+        ref[cyc, d, col] = np.nan if v is None else v
+    for d, up in ((0, True), (1, False)):
+        for col in range(3):
+            present = [float(v) for v in ref[:, d, col] if not np.isnan(v)]
+            # Même calcul que CalculationEngine (sum() dans l'ordre des cycles), pas d'écart d'arrondi
+            expected = sum(present) / len(present) if present else None
+            assert m.mean_abs(up, col) == expected
+
+
+def test_override_does_not_drift_mean():
+    m = MeasuresTableModel()
+    m.reset([0.0], 2, {0.0: [0.07, None, 0.01]})
+    m.set_value(m.row_for_state(1, True), 0, 0.02)       # correction de 1↑
+    assert m.mean_abs(True, 0) == (0.02 + 0.01) / 2
+
+
+def test_set_value_only_touches_cell_and_column_mean():
+    m = make_model()
+    changes = record_changes(m)
+    m.set_value(m.row_for_state(3, False), 1, 0.51)
+    assert changes == [(6, 1, 6, 1), (m.row_avg_down, 1, m.row_avg_down, 1)]
+    assert m.data(m.index(m.row_avg_down, 1)) == "+10.0"
+    assert m.data(m.index(m.row_avg_up, 1)) == ""
+
+
+def test_visual_state_changes_are_targeted():
+    m = make_model()
+    changes = record_changes(m)
+    m.set_current((2, 2))
+    m.set_current((2, 2))                    # inchangé : aucun signal
+    m.set_current((5, 0))
+    assert changes == [(2, 2, 2, 2), (2, 2, 2, 2), (5, 0, 5, 0)]
+    assert m.cell_kind(5, 0) == MeasuresTableModel.CURRENT
+    assert m.cell_kind(0, 0) == MeasuresTableModel.FILLED
+    assert m.cell_kind(2, 2) == MeasuresTableModel.EMPTY
+    m.set_critical((m.row_avg_up, 0))
+    assert m.cell_kind(m.row_avg_up, 0) == MeasuresTableModel.MEAN_CRITICAL
+    m.set_override((1, 0))
+    assert m.data(m.index(1, 0), Qt.ItemDataRole.ToolTipRole) == "modification"
+
+
+def test_clear_values_resets_means():
+    m = make_model()
+    m.clear_values()
+    assert all(m.is_empty(r, c) for r in range(m.rowCount()) if m.state_for_row(r) for c in range(3))
+    assert m.mean_errors_mm(True) == [None, None, None]
@@ -0,0 +1,64 @@
+"""Export PDF par lots (etacomp-export)."""
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.etacomp.io import pdf_batch
+from src.etacomp.models.session import MeasureSeries, Session
+
+
+def _session(ref: str, day: int, holder: str = "ES1", readings=True) -> Session:
+    targets = [0.0, 0.5, 1.0]
+    series = [MeasureSeries(target=t, readings=[t + 0.001, t - 0.001, t + 0.002, t - 0.002] if readings else [])
+              for t in targets]
+    return Session(operator="lot", date=datetime(2025, 3, day, 9, 0, 0), comparator_ref=ref,
+                   holder_ref=holder, series_count=2, measures_per_series=3, series=series)
+
+
+@pytest.fixture
+def sessions_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    d = tmp_path / "archive"
+    d.mkdir()
+    for s in (_session("CMP-A", 1), _session("CMP-B", 5, holder="ES2"), _session("CMP-A", 9)):
+        (d / f"{s.comparator_ref}_{s.date:%Y%m%d}.json").write_text(s.model_dump_json(), encoding="utf-8")
+    empty = _session("CMP-A", 7, readings=False)
+    (d / "CMP-A_vide.json").write_text(empty.model_dump_json(), encoding="utf-8")
+    return d
+
+
+def test_select_sessions_filters_and_orders(sessions_dir: Path):
+    names = lambda ps: [p.name for p in ps]
+    assert names(pdf_batch.select_sessions(directory=sessions_dir, comparator_refs=["CMP-A"],
+                                           date_to=date(2025, 3, 7))) == ["CMP-A_20250301.json", "CMP-A_vide.json"]
+    assert names(pdf_batch.select_sessions(directory=sessions_dir, holder_ref="ES2")) == ["CMP-B_20250305.json"]
+    assert len(pdf_batch.select_sessions(directory=sessions_dir, date_from=date(2025, 3, 5))) == 3
+
+
+def test_export_batch_reports_failures_in_process(sessions_dir: Path, tmp_path: Path):
+    sessions = pdf_batch.select_sessions(directory=sessions_dir)
+    seen = []
+    report = pdf_batch.export_batch(sessions, output_dir=tmp_path / "pdf", first_no=10,
+                                    workers=0, progress=seen.append)
+    assert report.workers == 0 and len(seen) == 4
+    assert len(report.exported) == 3
+    assert [(p.name, r) for p, r in report.failures] == [("CMP-A_vide.json", "session sans mesures")]
+    assert all(pdf.exists() and pdf.parent == tmp_path / "pdf" for _src, pdf in report.exported)
+    assert report.exported[0][1].name.endswith("010.pdf")
+    assert report.throughput > 0
+    assert "échecs : 1" in report.summary_lines()[0]
+
+
+def test_export_batch_process_pool(sessions_dir: Path, tmp_path: Path):
+    sessions = pdf_batch.select_sessions(directory=sessions_dir, comparator_refs=["CMP-A", "CMP-B"])
+    report = pdf_batch.export_batch(sessions * 2, output_dir=tmp_path / "pdf", workers=2)
+    assert report.total == 8 and report.workers == 2
+    assert len(report.exported) == 6 and len(report.failures) == 2
+    assert len({pdf for _src, pdf in report.exported}) == 6
+
+
+def test_cli_dry_run_and_empty_selection(sessions_dir: Path, capsys):
+    assert pdf_batch.main(["--dir", str(sessions_dir), "--comparator", "CMP-B", "--dry-run"]) == 0
+    assert "1 session(s)" in capsys.readouterr().out
+    assert pdf_batch.main(["--dir", str(sessions_dir), "--detenteur", "es9"]) == 1
@@ -18,7 +18,7 @@ from src.etacomp.config.export_config import ExportConfig
 
 from src.etacomp.core.calculation_engine import CalculatedResults
 
-from src.etacomp.io.pdf_exporter import export_pdf, _metrology_table_rows
+from src.etacomp.io.pdf_exporter import ExportContext, export_fingerprint, export_pdf, _metrology_table_rows, _nice_step
 
 from src.etacomp.models.session import Session, MeasureSeries
 
@@ -386,3 +386,124 @@ def test_pdf_export_no_verdict_still_has_table(tmp_path: Path):
 
     assert "Appareil : Indéterminé" in text or "Appareil : Indetermine" in text
 
+def _has_images(path: Path) -> bool:
+
+    reader = PdfReader(str(path))
+
+    return any(
+
+        obj.get_object().get("/Subtype") == "/Image"
+
+        for page in reader.pages
+
+        for obj in (page["/Resources"].get("/XObject") or {}).values()
+
+    )
+
+
+
+
+
+def test_pdf_export_vector_plot_without_image(tmp_path: Path):
+
+    results = _results(calibration_points=[
+
+        {"target_mm": 0.0, "up_error_mm": 0.001, "down_error_mm": -0.001},
+
+        {"target_mm": 1.0, "up_error_mm": None, "down_error_mm": 0.002},
+
+        {"target_mm": 2.0, "up_error_mm": 0.003, "down_error_mm": 0.0},
+
+    ])
+
+    path = export_pdf(_runtime_session(), _export_config(), results, None, doc_no=5,
+
+                      output_path=tmp_path / "vector.pdf")
+
+    text = _pdf_text(path)
+
+    assert "Cible (mm)" in text and "Montée (µm)" in text
+
+    assert not _has_images(path)
+
+
+
+    png = export_pdf(_runtime_session(), _export_config(), results, None, doc_no=6,
+
+                     output_path=tmp_path / "png.pdf", plot_backend="matplotlib")
+
+    assert _has_images(png)
+
+    assert path.stat().st_size < png.stat().st_size
+
+
+
+
+
+def test_nice_step():
+
+    assert _nice_step(7.0) == 2.0
+
+    assert _nice_step(0.03) == 0.005
+
+    assert _nice_step(0.0) == 1.0
+
+def test_pdf_export_reuses_unchanged_document(tmp_path: Path):
+
+    rt, results = _runtime_session(), _results()
+
+    ctx = ExportContext()
+
+    first = export_pdf(rt, _export_config(), results, None, doc_no=7, output_dir=tmp_path, context=ctx)
+
+    mtime = first.stat().st_mtime_ns
+
+    again = export_pdf(rt, _export_config(), results, None, doc_no=7, output_dir=tmp_path, context=ctx)
+
+    assert again == first and first.stat().st_mtime_ns == mtime
+
+
+
+    rt.observations = "Observation corrigée"
+
+    changed = export_pdf(rt, _export_config(), results, None, doc_no=7, output_dir=tmp_path, context=ctx)
+
+    assert changed != first and changed.name.endswith("_1.pdf")
+
+    assert export_pdf(rt, _export_config(), results, None, doc_no=7, output_dir=tmp_path, context=ctx) == changed
+
+    forced = export_pdf(rt, _export_config(), results, None, doc_no=7, output_dir=tmp_path, context=ctx,
+
+                        use_cache=False)
+
+    assert forced.name.endswith("_2.pdf")
+
+
+
+
+
+def test_pdf_export_deterministic_bytes(tmp_path: Path):
+
+    args = (_runtime_session(), _export_config(), _results(), None)
+
+    a = export_pdf(*args, doc_no=8, output_path=tmp_path / "a.pdf", context=ExportContext(), deterministic=True)
+
+    b = export_pdf(*args, doc_no=8, output_path=tmp_path / "b.pdf", context=ExportContext(), deterministic=True)
+
+    assert a.read_bytes() == b.read_bytes()
+
+
+
+
+
+def test_export_fingerprint_tracks_inputs():
+
+    base = dict(session=_runtime_session(), results=_results(), doc_ref="250602001")
+
+    assert export_fingerprint(**base) == export_fingerprint(**dict(base, session=_runtime_session()))
+
+    assert export_fingerprint(**base) != export_fingerprint(**dict(base, doc_ref="250602002"))
+
+    assert export_fingerprint(**base) != export_fingerprint(**dict(base, results=_results(total_error_mm=0.02)))
+
+
@@ -0,0 +1,65 @@
+"""Analyse d'impact d'un changement de règles sur l'archive des sessions."""
+
+from src.etacomp.rules import impact as impact_mod
+from src.etacomp.rules.impact import analyze_rule_change
+from src.etacomp.rules.tolerance_engine import ToleranceRule, ToleranceRuleEngine
+
+
+def _engine(emt_0_5: float) -> ToleranceRuleEngine:
+    return ToleranceRuleEngine({
+        "normale": [
+            ToleranceRule(0.01, Emt=emt_0_5, Ef=0.005, Eh=0.01, Eml=0.01, course_min=0.0, course_max=5.0),
+            ToleranceRule(0.01, Emt=0.02, Ef=0.005, Eh=0.01, Eml=0.01, course_min=5.0, course_max=10.0),
+        ],
+        "grande": [], "faible": [], "limitee": [],
+    })
+
+
+# (comparator_ref, range_type, graduation, course, emt, eml, eh, ef)
+ROWS = [
+    ("CMP-A", "normale", 0.01, 5.0, 0.012, 0.004, 0.003, 0.001),   # 0.015 → 0.010 : bascule
+    ("CMP-B", "normale", 0.01, 5.0, 0.008, 0.004, 0.003, 0.001),   # reste conforme
+    ("CMP-C", "normale", 0.01, 10.0, 0.025, 0.004, 0.003, 0.001),  # règle inchangée
+    ("CMP-D", "normale", 0.01, 5.0, 0.012, 0.004, 0.003, None),    # indéterminé (pas d'Ef)
+]
+
+
+def test_transitions_by_group_and_comparators():
+    report = analyze_rule_change(_engine(0.010), _engine(0.015), rows=ROWS, workers=0)
+    assert report.sessions == 4
+    assert report.evaluated == 3  # le profil course 10 n'est pas réévalué
+    assert dict(report.transitions) == {("conforme", "non_conforme"): 1}
+    assert dict(report.by_group[("normale", 0.01)]) == {("conforme", "non_conforme"): 1}
+    assert report.affected_comparators == ["CMP-A"]
+    assert any("CMP-A" in line for line in report.summary_lines())
+
+
+def test_process_pool_matches_local(monkeypatch):
+    rows = ROWS * 50
+    local = analyze_rule_change(_engine(0.010), _engine(0.015), rows=rows, workers=0)
+    monkeypatch.setattr(impact_mod, "PARALLEL_MIN_ROWS", 10)
+    monkeypatch.setattr(impact_mod, "CHUNK_ROWS", 40)
+    pooled = analyze_rule_change(_engine(0.010), _engine(0.015), rows=rows, workers=2)
+    assert pooled.transitions == local.transitions
+    assert pooled.transitions[("conforme", "non_conforme")] == 50
+
+
+def test_catalog_rows_carry_profile(tmp_path, monkeypatch):
+    from datetime import datetime
+
+    import src.etacomp.io.storage as storage_mod
+    from src.etacomp.models.session import MeasureSeries, Session
+
+    monkeypatch.setattr(storage_mod, "get_data_dir", lambda: tmp_path)
+    monkeypatch.setattr(storage_mod.session_catalog, "_tol_engine_factory", lambda: None)
+    targets = [float(i) for i in range(6)]
+    storage_mod.save_session_file(Session(
+        operator="op", date=datetime(2025, 6, 2, 9), comparator_ref="CMP-A", series_count=2,
+        comparator_snapshot={"reference": "CMP-A", "graduation": 0.01, "course": 5.0,
+                             "range_type": "normale", "targets": targets},
+        series=[MeasureSeries(target=t, readings=[t + 0.012, t, t + 0.012, t]) for t in targets],
+    ))
+    rows = storage_mod.session_catalog.results_rows()
+    assert [r[:4] for r in rows] == [("CMP-A", "normale", 0.01, 5.0)]
+    report = analyze_rule_change(_engine(0.010), _engine(0.015), workers=0)
+    assert report.sessions == 1 and report.evaluated == 1
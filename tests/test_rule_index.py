@@ -0,0 +1,84 @@
+"""Index compilé des règles — mêmes correspondances que le filtrage linéaire, invalidation."""
+
+import random
+
+import pytest
+
+from src.etacomp.rules.interval_match import EPS, feq, match_course_group_strict
+from src.etacomp.rules.tolerance_engine import OverlapError, ToleranceRule, ToleranceRuleEngine
+from src.etacomp.rules.tolerances import ToleranceRule as EditableRule, create_default_rules
+
+
+def _linear(rules, family, graduation, course):
+    same_grad = [r for r in rules.get(family, []) if feq(r.graduation, graduation, EPS)]
+    if family in ("normale", "grande"):
+        if course is None:
+            return []
+        return match_course_group_strict(same_grad, course, EPS)
+    return same_grad
+
+
+def test_compiled_match_equals_linear_scan():
+    rng = random.Random(7)
+    grads = [0.001, 0.002, 0.01, 0.01 + EPS / 2, 0.1]
+    bounds = [0.0, 0.5, 1.0, 1.0, 5.0, 10.0, 30.0]
+    rules = {"normale": [], "grande": [], "faible": [], "limitee": []}
+    for fam in rules:
+        for _ in range(40):
+            g = rng.choice(grads)
+            if fam in ("normale", "grande"):
+                lo, hi = sorted(rng.sample(bounds, 2))
+                rules[fam].append(ToleranceRule(g, 1, 1, 1, course_min=lo, course_max=hi))
+            else:
+                rules[fam].append(ToleranceRule(g, 1, 1, 1))
+    eng = ToleranceRuleEngine(rules)
+
+    for _ in range(3000):
+        fam = rng.choice(list(rules))
+        g = rng.choice(grads) + rng.choice([0.0, EPS * 0.9, -EPS * 1.1])
+        course = rng.choice([None, rng.uniform(-1, 35), rng.choice(bounds) + rng.choice([0, EPS, -EPS])])
+        expected = _linear(rules, fam, g, course)
+        if len(expected) > 1:
+            with pytest.raises(OverlapError):
+                eng.match(fam, g, course)
+        else:
+            assert eng.match(fam, g, course) == (expected[0] if expected else None)
+
+
+def test_direct_rules_mutation_invalidates_index():
+    eng = create_default_rules()
+    assert eng.match("normale", 0.01, 7.0).Emt == 0.015
+    assert eng.match("faible", 0.01, None) is None
+
+    eng.rules["faible"].append(EditableRule(graduation=0.01, Emt=0.02, Ef=0.001, Eh=0.002))
+    assert eng.match("faible", 0.01, None).Emt == 0.02
+
+    idx = next(i for i, r in enumerate(eng.rules["normale"]) if r.graduation == 0.01 and r.course_max == 10.0)
+    eng.rules["normale"][idx] = EditableRule(graduation=0.01, course_min=5.0, course_max=10.0, Emt=0.5)
+    assert eng.match("normale", 0.01, 7.0).Emt == 0.5
+
+    del eng.rules["normale"][idx]
+    assert eng.match("normale", 0.01, 7.0) is None
+
+    eng.rules = {"normale": [], "grande": [], "faible": [], "limitee": []}
+    assert eng.match("limitee", 0.001, None) is None
+
+
+def test_rule_list_mutators_bump_version():
+    from src.etacomp.rules.interval_match import RuleSet
+
+    rs = RuleSet({"faible": [3, 1, 2]})
+    lst = rs["faible"]
+    ops = [
+        lambda l: l.append(4), lambda l: l.extend([5]), lambda l: l.insert(0, 6),
+        lambda l: l.pop(), lambda l: l.remove(6), lambda l: l.sort(), lambda l: l.reverse(),
+        lambda l: l.__setitem__(0, 9), lambda l: l.__delitem__(0), lambda l: l.__iadd__([7]),
+        lambda l: l.__imul__(2), lambda l: l.clear(),
+    ]
+    for op in ops:
+        before = rs.version
+        op(lst)
+        assert rs.version == before + 1
+    lst.extend([2, 1])
+    lst.sort(key=lambda v: -v)
+    assert lst == [2, 1]
@@ -0,0 +1,107 @@
+"""SerialHub — plusieurs ports nommés, configuration par port, signaux étiquetés."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import Qt
+
+import src.etacomp.config.tesa as tesa_mod
+from src.etacomp.io.serial_hub import SerialHub
+
+
+def test_port_config_overrides_global(tmp_path, monkeypatch):
+    monkeypatch.setattr(tesa_mod, "get_data_dir", lambda: tmp_path)
+    tesa_mod.save_tesa_config({"silence_ms": 200})
+    tesa_mod.save_port_config("banc2", {"device": "COM4", "enabled": False, "decimal_comma": True})
+    tesa_mod.save_tesa_config({"silence_ms": 150})  # la section ports survit
+
+    cfg = tesa_mod.load_port_config("banc2")
+    assert cfg["silence_ms"] == 150 and cfg["device"] == "COM4" and cfg["enabled"] is False
+    assert cfg["decimal_comma"] is True
+    assert tesa_mod.load_port_config("banc1")["device"] == ""
+
+    hub = SerialHub()
+    mgr = hub.add_port("banc2")
+    assert mgr._tesa_enabled is False and mgr.get_ascii_config()[1] is True
+    with pytest.raises(ValueError):
+        hub.add_port("banc2")
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="pty Linux")
+def test_slow_consumer_does_not_delay_other_port():
+    hub = SerialHub()
+    common = {"frame_mode": "eol", "eol": "CRLF", "read_mode": "event"}
+    hub.add_port("a", config={**common, "enabled": True})
+    hub.add_port("b", config={**common, "enabled": False})   # parse ASCII
+    ptys = {pid: os.openpty() for pid in ("a", "b")}
+    got: dict[str, list] = {"a": [], "b": []}
+    seen_b = threading.Event()
+
+    def _on_line(pid, raw, value):
+        got[pid].append((value, time.perf_counter()))
+        if pid == "a":
+            time.sleep(0.5)   # consommateur lent sur le port a
+        else:
+            seen_b.set()
+
+    # Connexion directe : appel dans le thread lecteur du port (pas de boucle Qt ici)
+    hub.line_received.connect(_on_line, Qt.ConnectionType.DirectConnection)
+    try:
+        for pid, (_, slave) in ptys.items():
+            hub.open(pid, os.ttyname(slave), 4800)
+        assert sorted(hub.open_ports()) == ["a", "b"]
+        os.write(ptys["a"][0], b"+0.012\r\n")
+        time.sleep(0.05)
+        t0 = time.perf_counter()
+        os.write(ptys["b"][0], b"-1.500\r\n")
+        assert seen_b.wait(2.0)
+        assert time.perf_counter() - t0 < 0.3
+        assert got["a"][0][0] == 0.012 and got["b"][0][0] == -1.5
+    finally:
+        hub.close_all()
+        for master, slave in ptys.values():
+            os.close(master)
+            os.close(slave)
+    assert hub.open_ports() == []
+
+
+def test_remove_port_keeps_direct_subscribers():
+    from src.etacomp.io.serial_manager import SerialManager
+
+    hub = SerialHub()
+    mgr = SerialManager()
+    hub.add_port("a", mgr)
+    direct, tagged = [], []
+    mgr.debug.connect(direct.append, Qt.ConnectionType.DirectConnection)
+    hub.debug.connect(lambda pid, m: tagged.append((pid, m)), Qt.ConnectionType.DirectConnection)
+    mgr.debug.emit("x")
+    hub.remove_port("a")
+    mgr.debug.emit("y")
+    assert direct == ["x", "y"] and tagged == [("a", "x")]
+    assert "a" not in hub
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="pty Linux")
+def test_apply_config_on_open_port_starts_one_reader():
+    from src.etacomp.io.serial_manager import SerialManager
+
+    mgr = SerialManager()
+    master, slave = os.openpty()
+    try:
+        mgr.open(os.ttyname(slave), 4800)
+        first = mgr._reader
+        starts = []
+        original = mgr._start_reader
+        mgr._start_reader = lambda: (starts.append(1), original())
+        mgr.apply_config({"enabled": True, "frame_mode": "eol", "silence_ms": 40})
+        assert len(starts) == 1
+        assert mgr._reader is not first and mgr._reader._th.is_alive()
+        assert first._th is None   # ancien lecteur arrêté
+        assert mgr._tesa_silence_ms == 40
+    finally:
+        mgr.close()
+        os.close(master)
+        os.close(slave)
@@ -0,0 +1,172 @@
+"""Catalogue SQLite des sessions — indexation incrémentale et requêtes d'historique."""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from src.etacomp.io.session_catalog import SessionCatalog
+from src.etacomp.models.comparator import Comparator
+from src.etacomp.models.session import FidelitySeries, MeasureSeries, Session
+
+
+def _session(ref: str, day: int, holder: str = "ES1") -> Session:
+    targets = [float(i) for i in range(11)]
+    return Session(
+        operator="op",
+        date=datetime(2025, 6, day, 9, 0, 0),
+        comparator_ref=ref,
+        holder_ref=holder,
+        series_count=2,
+        comparator_snapshot={
+            "reference": ref,
+            "graduation": 0.01,
+            "course": 10.0,
+            "range_type": "normale",
+            "targets": targets,
+        },
+        series=[MeasureSeries(target=t, readings=[t + 0.002, t - 0.001, t + 0.001, t]) for t in targets],
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    import src.etacomp.io.storage as storage_mod
+
+    monkeypatch.setattr(storage_mod, "get_data_dir", lambda: tmp_path)
+    monkeypatch.setattr(storage_mod.session_catalog, "_tol_engine_factory", lambda: None)
+    return storage_mod
+
+
+def test_save_session_file_indexes_metadata_and_results(storage):
+    path = storage.save_session_file(_session("CMP-A", 2))
+    entries = storage.session_catalog.query()
+    assert len(entries) == 1
+    e = entries[0]
+    assert e.path == path
+    assert (e.comparator_ref, e.holder_ref, e.operator) == ("CMP-A", "ES1", "op")
+    assert e.date == datetime(2025, 6, 2, 9, 0, 0)
+    assert e.readings == 44
+    assert e.emt == pytest.approx(0.0015)
+    assert e.eh is not None and e.ef is None
+
+
+def test_query_filters_and_latest(storage):
+    storage.save_session_file(_session("CMP-A", 2))
+    storage.save_session_file(_session("CMP-B", 5, holder="ES2"))
+    storage.save_session_file(_session("CMP-A", 9))
+    cat = storage.session_catalog
+
+    assert [e.date.day for e in cat.query(comparator_refs=["CMP-A"])] == [9, 2]
+    assert [e.comparator_ref for e in cat.query(holder_ref="ES2")] == ["CMP-B"]
+    window = cat.query(date_from=datetime(2025, 6, 3), date_to=datetime(2025, 6, 9, 9, 0, 0))
+    assert [e.date.day for e in window] == [9, 5]
+    assert cat.latest().date.day == 9
+    assert cat.latest("CMP-B").holder_ref == "ES2"
+    assert cat.query(comparator_refs=[]) == []
+
+
+def test_refresh_only_reparses_changed_files(storage, monkeypatch):
+    import src.etacomp.io.session_catalog as catalog_mod
+
+    p1 = storage.save_session_file(_session("CMP-A", 2))
+    p2 = storage.save_session_file(_session("CMP-B", 3))
+    cat = storage.session_catalog
+    assert len(cat) == 2
+
+    parsed: list[str] = []
+    original = catalog_mod._summarize_many
+
+    def _counting(sessions, eng=None):
+        parsed.extend(s.comparator_ref for s in sessions)
+        return original(sessions, eng)
+
+    monkeypatch.setattr(catalog_mod, "_summarize_many", _counting)
+
+    assert cat.refresh(force=True) == 0
+    assert parsed == []
+
+    # Édition hors application de p2, suppression de p1
+    data = json.loads(p2.read_text(encoding="utf-8"))
+    data["holder_ref"] = "ES9"
+    p2.write_text(json.dumps(data), encoding="utf-8")
+    st = p2.stat()
+    os.utime(p2, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    p1.unlink()
+
+    assert cat.refresh(force=True) == 2
+    assert parsed == ["CMP-B"]
+    assert [(e.comparator_ref, e.holder_ref) for e in cat.query()] == [("CMP-B", "ES9")]
+
+
+def test_corrupt_catalog_is_rebuilt(tmp_path):
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    (sessions / "a.json").write_text(_session("CMP-A", 2).model_dump_json(), encoding="utf-8")
+    (sessions / "broken.json").write_text("{", encoding="utf-8")
+    db = tmp_path / "catalog.sqlite"
+    db.write_bytes(b"pas une base sqlite" * 10)
+
+    cat = SessionCatalog(lambda: sessions, lambda: db)
+    cat._tol_engine_factory = lambda: None
+    assert [e.comparator_ref for e in cat.query()] == ["CMP-A"]
+
+
+def _rules_file(path, emt: float) -> None:
+    data = {"normale": [{"graduation": 0.01, "course_min": 0.0, "course_max": 10.0,
+                         "Emt": emt, "Eml": 0.01, "Ef": 0.005, "Eh": 0.01}],
+            "grande": [], "faible": [], "limitee": []}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_rules_change_reevaluates_verdicts_without_reparsing(tmp_path, monkeypatch):
+    import src.etacomp.io.session_catalog as catalog_mod
+    from src.etacomp.io.atomic_write import atomic_write
+
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    from src.etacomp.core.calculation_engine import CalculationEngine
+
+    s = _session("CMP-A", 2)
+    crit = CalculationEngine().compute_batch([s])[0].total_error_location
+    t = crit["target_mm"]
+    s.fidelity = FidelitySeries(target=t, direction=crit["direction"], samples=[t, t + 0.001, t, t + 0.001, t])
+    (sessions / "a.json").write_text(s.model_dump_json(), encoding="utf-8")
+    rules = tmp_path / "rules.json"
+    _rules_file(rules, emt=0.015)
+    cat = SessionCatalog(lambda: sessions, lambda: tmp_path / "catalog.sqlite", rules_path=lambda: rules)
+    assert [e.verdict for e in cat.query()] == ["conforme"]
+
+    parsed: list = []
+    original = catalog_mod._summarize_many
+    monkeypatch.setattr(catalog_mod, "_summarize_many",
+                        lambda ss, eng=None: parsed.extend(ss) or original(ss, eng))
+    atomic_write(rules, rules.read_text(encoding="utf-8").replace("0.015", "0.001"))
+    assert [e.verdict for e in cat.query(verdict="non_conforme")] == ["non_conforme"]
+    assert cat.query(verdict="conforme") == [] and parsed == []
+
+    rules.unlink()
+    assert [e.verdict for e in cat.query()] == [None]
+
+
+def test_library_change_reindexes_only_sessions_without_snapshot(storage, monkeypatch):
+    import src.etacomp.io.session_catalog as catalog_mod
+
+    storage.save_comparator(Comparator(reference="CMP-L", graduation=0.01, course=10.0,
+                                       targets=[float(i) for i in range(11)], range_type="normale"))
+    live = _session("CMP-L", 2)
+    live.comparator_snapshot = {}
+    storage.save_model(live, storage.SESSIONS_DIR, "live.json")
+    storage.save_session_file(_session("CMP-A", 3))
+    cat = storage.session_catalog
+    assert {e.comparator_ref: e.graduation for e in cat.query()} == {"CMP-L": 0.01, "CMP-A": 0.01}
+
+    parsed: list = []
+    original = catalog_mod._summarize_many
+    monkeypatch.setattr(catalog_mod, "_summarize_many",
+                        lambda ss, eng=None: parsed.extend(x.comparator_ref for x in ss) or original(ss, eng))
+    storage.upsert_comparator(Comparator(reference="CMP-L", graduation=0.001, course=10.0,
+                                         targets=[float(i) for i in range(11)], range_type="normale"))
+    assert {e.comparator_ref: e.graduation for e in cat.query()} == {"CMP-L": 0.001, "CMP-A": 0.01}
+    assert parsed == ["CMP-L"]
@@ -0,0 +1,78 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.etacomp.tools.startup_profile import import_breakdown, parse_importtime
+
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:      1200 |       1200 |   numpy.core
+import time:       300 |       1500 | numpy
+import time:       800 |        800 |     src.etacomp.ui.themes
+import time:       200 |       1000 |   src.etacomp.ui
+import time:       100 |       1100 | src.etacomp
+"""
+
+
+def test_parse_importtime_skips_header():
+    entries = parse_importtime(IMPORTTIME)
+    assert entries[0] == ("numpy.core", 1200, 1200)
+    assert len(entries) == 5
+
+
+def test_import_breakdown_groups_app_subpackages():
+    groups = dict(import_breakdown(parse_importtime(IMPORTTIME), "src.etacomp"))
+    assert groups == {"numpy": pytest.approx(1.5), "etacomp.ui": pytest.approx(1.0), "etacomp": pytest.approx(0.1)}
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_main_window_builds_tabs_on_first_activation(app):
+    from src.etacomp.ui.main_window import MainWindow
+
+    w = MainWindow()
+    try:
+        built = []
+        w.tab_built.connect(built.append)
+        assert w.session_tab is not None
+        assert all(getattr(w, name) is None for name, _ in w.TABS[1:])
+
+        w.tabs.setCurrentIndex(3)   # Courbe d'étalonnage
+        assert built == ["calibration_tab"]
+        assert w.calibration_tab is not None and w.measures_tab is None
+
+        w.build_all_tabs()
+        assert all(getattr(w, name) is not None for name, _ in w.TABS)
+        assert w.tab("settings_tab") is w.settings_tab
+    finally:
+        w.close()
+        w.deleteLater()
+
+
+def test_main_window_applies_saved_serial_config_without_parameters_tab(app, tmp_path, monkeypatch):
+    import src.etacomp.config.tesa as tesa_mod
+    from src.etacomp.io.serial_manager import serial_manager
+    from src.etacomp.ui.main_window import MainWindow
+
+    monkeypatch.setattr(tesa_mod, "get_data_dir", lambda: tmp_path)
+    tesa_mod.save_tesa_config({**tesa_mod.DEFAULT_TESA_CONFIG, "frame_mode": "eol", "silence_ms": 80,
+                               "eol": "LF", "decimals": 4, "read_mode": "poll"})
+    serial_manager.set_send_config(mode="À la demande", trigger_text="X", eol_mode="Aucun")
+    w = MainWindow()
+    try:
+        assert w.settings_tab is None
+        assert serial_manager._tesa_frame_mode == "eol" and serial_manager._tesa_silence_ms == 80
+        assert serial_manager._tesa_eol == "LF" and serial_manager._tesa_decimals == 4
+        assert serial_manager._read_mode == "poll"
+        assert (serial_manager._send_mode, serial_manager._trigger_text, serial_manager._eol_mode) == ("Manuel", "", "CR")
+    finally:
+        w.close()
+        w.deleteLater()
+        serial_manager.apply_config(tesa_mod.DEFAULT_TESA_CONFIG)
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from src.etacomp.io.backup import export_backup
+from src.etacomp.ui.task_runner import TaskRunner
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def wait_events(app, handle, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if handle.is_done():
+            app.processEvents()
+            return
+        time.sleep(0.005)
+    raise AssertionError("tâche non terminée")
+
+
+def test_result_and_progress_delivered_to_gui_thread(app):
+    runner = TaskRunner()
+    gui = threading.get_ident()
+    seen = {}
+
+    def job(n, *, progress):
+        seen["worker"] = threading.get_ident()
+        for i in range(n):
+            progress(f"étape {i}")
+        return n * 2
+
+    messages, results = [], []
+    h = runner.submit(
+        "calcul", job, 3, with_progress=True,
+        on_progress=lambda m: messages.append((m, threading.get_ident())),
+        on_finished=lambda r: results.append((r, threading.get_ident())),
+    )
+    wait_events(app, h)
+    assert seen["worker"] != gui
+    assert results == [(6, gui)]
+    assert [m for m, _ in messages] == ["étape 0", "étape 1", "étape 2"]
+    assert all(t == gui for _, t in messages)
+    assert runner.active() == 0
+
+
+def test_failure_reported(app):
+    runner = TaskRunner()
+
+    def job():
+        raise ValueError("boom")
+
+    errors = []
+    h = runner.submit("échec", job, on_failed=errors.append)
+    wait_events(app, h)
+    assert errors == ["boom"]
+    assert isinstance(h.error, ValueError)
+
+
+def test_cancel_stops_backup_export_at_next_progress(app, tmp_path):
+    data = tmp_path / "data"
+    (data / "comparators").mkdir(parents=True)
+    for i in range(50):
+        (data / "comparators" / f"c{i}.json").write_text("{}", encoding="utf-8")
+    runner = TaskRunner()
+    gate = threading.Event()
+    started = threading.Event()
+
+    def slow_progress_export(*args, progress, **kwargs):
+        def _progress(msg):
+            started.set()
+            gate.wait(2.0)
+            progress(msg)
+        return export_backup(*args, progress=_progress, **kwargs)
+
+    archive = tmp_path / "out.zip"
+    cancelled = []
+    h = runner.submit("export", slow_progress_export, archive, ["comparators"],
+                      data_dir=data, with_progress=True, on_cancelled=lambda: cancelled.append(True))
+    assert started.wait(2.0)
+    assert h.cancel()
+    gate.set()
+    wait_events(app, h)
+    assert cancelled == [True]
+    assert h.result is None
+    # Interrompu au premier message de progression, avant l'écriture de l'archive
+    assert not archive.exists()
+
+
+def test_non_cancellable_task_ignores_cancel(app):
+    runner = TaskRunner()
+    h = runner.submit("restauration", lambda: time.sleep(0.05) or "ok", cancellable=False)
+    assert not h.cancel()
+    wait_events(app, h)
+    assert h.result == "ok"
+
+
+def test_discarded_handle_still_delivers_callbacks(app):
+    import gc
+
+    runner = TaskRunner()
+    results, errors = [], []
+
+    def fail():
+        raise ValueError("boom")
+
+    # Handles ignorés par l'appelant (comme les onglets Finalisation et Règles)
+    for i in range(5):
+        runner.submit("instantanée", lambda i=i: i, on_finished=results.append)
+    runner.submit("échec", fail, on_failed=errors.append)
+    # Thread GUI occupé pendant que les tâches se terminent
+    assert runner.wait(2000)
+    gc.collect()
+    assert runner.active() == 6
+
+    deadline = time.monotonic() + 2.0
+    while (len(results) < 5 or not errors) and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    assert sorted(results) == [0, 1, 2, 3, 4] and errors == ["boom"]
+    app.processEvents()
+    assert runner.active() == 0
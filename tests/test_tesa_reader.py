@@ -1,6 +1,9 @@
 """Issue #6 — conservation du signe des valeurs série."""
 
 import math
+import sys
+
+import pytest
 
 from src.etacomp.io.tesa_reader import TesaSerialReader
 from src.etacomp.core.calculation_engine import CalculationEngine
@@ -62,3 +65,74 @@ def test_signed_readings_error_is_measured_minus_target():
     assert loc is not None
     assert math.isclose(loc["error_mm"], -0.015, rel_tol=0, abs_tol=1e-9)
     assert math.isclose(res.total_error_mm, 0.015, rel_tol=0, abs_tol=1e-9)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="pty Linux")
+def test_event_mode_frames_on_read_timeout():
+    """Mode event : la trame se clôt à l'expiration de l'attente (silence), sans scrutation."""
+    import os
+    import threading
+    import time
+
+    import serial
+
+    from src.etacomp.io.serialio import SerialConnection
+
+    master, slave = os.openpty()
+    conn = SerialConnection()
+    conn._ser = serial.Serial(os.ttyname(slave), timeout=0.05)
+    got = threading.Event()
+    captured: list[float] = []
+
+    def _on_value(v, *_):
+        captured.append(v)
+        got.set()
+
+    reader = TesaSerialReader(conn, on_value=_on_value, silence_ms=40, read_mode="event")
+    reader.start()
+    try:
+        t0 = time.perf_counter()
+        os.write(master, b"+0.0")
+        time.sleep(0.01)
+        os.write(master, b"12\r\n")  # même trame : écart < silence
+        assert got.wait(2.0)
+        assert captured == [0.012]
+        assert time.perf_counter() - t0 >= 0.04
+    finally:
+        reader.stop()
+        conn.close()
+        os.close(master)
+        os.close(slave)
+
+
+def test_read_wait_without_fileno_blocks_on_pyserial_timeout():
+    import threading
+    import time
+
+    import serial
+
+    from src.etacomp.io.serialio import SerialConnection
+
+    conn = SerialConnection()
+    conn._ser = serial.serial_for_url("loop://", timeout=0.05)   # fileno() non supporté
+    try:
+        t0 = time.perf_counter()
+        assert conn.read_wait(0.2) is None
+        assert time.perf_counter() - t0 >= 0.18   # attente réelle, pas un sleep de 50 ms
+
+        sent = {}
+
+        def _write():
+            time.sleep(0.03)
+            sent["t"] = time.perf_counter()
+            conn._ser.write(b"+0.012\r\n")
+
+        threading.Thread(target=_write).start()
+        data = conn.read_wait(1.0)
+        got = time.perf_counter()
+        while data is not None and not data.endswith(b"\n"):
+            data += conn.read_wait(0.1) or b""
+        assert data == b"+0.012\r\n"
+        assert got - sent["t"] < 0.03
+    finally:
+        conn.close()
@@ -39,3 +39,30 @@ def test_provider_compute_all_basic():
     # Verdict may be None if no rules file is present
     assert verdict is None or getattr(verdict, "status", None) is not None
 
+
+
+def test_provider_cache_hits_unchanged_session(tmp_path):
+    rules = tmp_path / "tolerances.json"
+    prov = ResultsProvider(rules_path=rules)
+    rt = make_runtime_session_basic()
+
+    v2, res, _ = prov.compute_all(rt)
+    assert prov.compute_all(rt)[1] is res
+    assert prov.compute(rt)[0] is res
+    assert prov.cache_info()["hits"] == 2 and prov.cache_info()["misses"] == 1
+
+    # Nouvelle lecture : clé différente → recalcul
+    rt.series[1].readings[3] = 0.97
+    _, res2, _ = prov.compute_all(rt)
+    assert res2 is not res
+    assert prov.cache_info()["misses"] == 2
+
+    # Métadonnées seules : résultats réutilisés, SessionV2 reconstruite
+    rt.operator = "autre"
+    v2b, res3, _ = prov.compute_all(rt)
+    assert res3 is res2 and v2b.operator == "autre"
+
+    # Fichier de règles créé : nouvelle version → recalcul
+    rules.write_text('{"rules": []}', encoding="utf-8")
+    prov.compute_all(rt)
+    assert prov.cache_info()["misses"] == 3
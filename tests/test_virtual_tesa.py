@@ -0,0 +1,83 @@
+"""Instrument TESA virtuel (pty) : synthèse, « À la demande », relecture de capture."""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from src.etacomp.io.serialio import SerialConnection
+from src.etacomp.io.tesa_reader import TesaSerialReader
+from src.etacomp.tools.virtual_tesa import (
+    ComparatorErrorModel, VirtualTesa, campaign_readings, format_frame, read_capture, write_capture,
+)
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="pty Linux")
+
+
+def _reader(device, values, got, **kw):
+    conn = SerialConnection()
+    conn.open(device, baudrate=4800)
+
+    def _on_value(v, *_):
+        values.append(v)
+        got.set()
+
+    reader = TesaSerialReader(conn, on_value=_on_value, frame_mode="eol", eol="CRLF", **kw)
+    reader.start()
+    return conn, reader
+
+
+def test_error_model_campaign_order_and_hysteresis():
+    model = ComparatorErrorModel(hysteresis=0.002, resolution=0.001)
+    seq = list(campaign_readings([2.0, 0.0, 1.0], model, cycles=2))
+    assert [(t, d) for t, d, _ in seq[:6]] == [(0.0, "up"), (1.0, "up"), (2.0, "up"),
+                                              (2.0, "down"), (1.0, "down"), (0.0, "down")]
+    assert len(seq) == 12
+    assert seq[3][2] == pytest.approx(2.002)
+    assert format_frame(-0.0123, decimals=3) == b"-0.012\r\n"
+    assert format_frame(0.5, parity_bit=True)[0] & 0x80
+
+
+@linux_only
+def test_on_demand_trigger_with_parity_bit():
+    values = list(v for _, _, v in campaign_readings([0.0, 1.0], ComparatorErrorModel(gain_error=0.01)))
+    frames = [format_frame(v, parity_bit=True) for v in values]
+    with VirtualTesa(frames=frames, trigger=b"M") as inst:
+        got_vals, got = [], threading.Event()
+        conn, reader = _reader(inst.device, got_vals, got, mask_7bit=True)
+        inst.start()
+        try:
+            time.sleep(0.1)
+            assert inst.frames_sent == 0  # rien sans commande
+            for i in range(len(frames)):
+                got.clear()
+                conn.write_text("M", append_eol=b"\r")
+                assert got.wait(2.0)
+            assert got_vals == pytest.approx(values)
+            assert inst.triggers == len(frames)
+        finally:
+            reader.stop()
+            conn.close()
+
+
+@linux_only
+def test_capture_roundtrip_and_accelerated_replay(tmp_path):
+    chunks = [(0.0, b"+0.0"), (0.005, b"12\r\n"), (0.5, b"-1.250\r\n"), (1.0, b"+2.000\r\n")]
+    path = write_capture(tmp_path / "c.tcap", chunks)
+    assert read_capture(path) == chunks
+
+    with VirtualTesa(chunks=read_capture(path), speed=10.0) as inst:
+        got_vals, got = [], threading.Event()
+        conn, reader = _reader(inst.device, got_vals, got)
+        inst.start()
+        try:
+            assert inst.wait_done(2.0)
+            assert 0.09 <= inst.finished_at - inst.started_at < 0.5   # 1 s relu à ×10
+            deadline = time.perf_counter() + 2.0
+            while len(got_vals) < 3 and time.perf_counter() < deadline:
+                time.sleep(0.01)
+            assert got_vals == [0.012, -1.25, 2.0]
+        finally:
+            reader.stop()
+            conn.close()